@@ -0,0 +1,84 @@
+"""Benchmark test-level filter evaluation in pytest_insight.core.query.
+
+Compares the per-filter chain (``all(f.matches(test) for f in filters)``) with
+the fused predicate produced by ``compile_test_filters``.
+
+Usage:
+    python benchmarks/bench_test_filters.py --results 10000000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from pytest_insight.core.models import TestOutcome, TestResult
+from pytest_insight.core.query import (
+    DurationFilter,
+    OutcomeFilter,
+    RegexPatternFilter,
+    ShellPatternFilter,
+    compile_test_filters,
+)
+
+OUTCOMES = [TestOutcome.PASSED] * 8 + [TestOutcome.FAILED, TestOutcome.SKIPPED]
+
+
+def build_pool(size: int):
+    """Build a pool of distinct test results to cycle through."""
+    base = datetime(2023, 1, 1)
+    return [
+        TestResult(
+            nodeid=f"tests/test_module_{i % 50}.py::test_case_{i}",
+            outcome=OUTCOMES[i % len(OUTCOMES)],
+            start_time=base + timedelta(seconds=i),
+            duration=(i % 97) / 10.0,
+            caplog="connection timeout" if i % 7 == 0 else "",
+        )
+        for i in range(size)
+    ]
+
+
+def build_filters():
+    """Filters in the order a typical builder chain adds them."""
+    return [
+        ShellPatternFilter(pattern="test_module_1", field_name="nodeid"),
+        RegexPatternFilter(pattern="timeout", field_name="caplog"),
+        RegexPatternFilter(pattern=r"test_case_\d+7$"),
+        DurationFilter(min_seconds=1.0, max_seconds=8.0),
+        OutcomeFilter(outcome=TestOutcome.PASSED),
+    ]
+
+
+def run(label, predicate, pool, total):
+    """Evaluate predicate over ``total`` results and print throughput."""
+    pool_size = len(pool)
+    matched = 0
+    start = time.perf_counter()
+    for offset in range(0, total, pool_size):
+        chunk = pool if total - offset >= pool_size else pool[: total - offset]
+        for test in chunk:
+            if predicate(test):
+                matched += 1
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<10} {total:>12,} results  {elapsed:8.2f}s  {total / elapsed:>14,.0f} results/s  matched={matched:,}"
+    )
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=10_000_000, help="Number of results to evaluate")
+    parser.add_argument("--pool", type=int, default=100_000, help="Distinct results to cycle through")
+    args = parser.parse_args()
+
+    pool = build_pool(min(args.pool, args.results))
+    filters = build_filters()
+
+    naive = run("chain", lambda test: all(f.matches(test) for f in filters), pool, args.results)
+    fused = run("compiled", compile_test_filters(filters), pool, args.results)
+    print(f"speedup    {naive / fused:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -158,11 +158,29 @@ def create_new_profile(
     activate: bool = typer.Option(
         False, "--activate", "-a", help="Set as active profile after creation"
     ),
+    hot_days: Optional[int] = typer.Option(
+        None,
+        "--hot-days",
+        help="Keep only the last N days in the hot tier; older sessions move to compressed cold segments",
+    ),
+    cold_dir: Optional[str] = typer.Option(
+        None, "--cold-dir", help="Directory for cold-tier segments (requires --hot-days)"
+    ),
+    text_index: bool = typer.Option(
+        False,
+        "--text-index",
+        help="Maintain a full-text index over captured output and tracebacks for faster searches",
+    ),
 ):
     """Create a new storage profile."""
     console = Console()
     try:
-        profile = create_profile(name, storage_type, file_path)
+        options = {}
+        if hot_days is not None:
+            options.update(hot_days=hot_days, cold_dir=cold_dir)
+        if text_index:
+            options["text_index"] = True
+        profile = create_profile(name, storage_type, file_path, **options)
 
         success_msg = f"Created profile [cyan]'{name}'[/cyan] ([green]{profile.storage_type}[/green]): [blue]{profile.file_path}[/blue]"
 
@@ -213,6 +231,11 @@ def show_active_profile():
     table.add_row("Name", profile.name)
     table.add_row("Type", profile.storage_type)
     table.add_row("Storage path", str(profile.file_path))
+    if profile.is_tiered:
+        table.add_row("Hot tier", f"last {profile.hot_days} days")
+        table.add_row("Cold tier", str(profile.cold_dir or "default"))
+    if getattr(profile, "text_index", False) is True:
+        table.add_row("Text index", "enabled")
 
     console.print(table)
 
@@ -2046,6 +2046,8 @@ def cli_compare(
                 "unreliable_tests": result.unreliable_tests,
                 "slower_tests": result.slower_tests,
                 "faster_tests": result.faster_tests,
+                "slower_p95_tests": result.slower_p95_tests,
+                "faster_p95_tests": result.faster_p95_tests,
                 "missing_tests": result.missing_tests,
                 "new_tests": result.new_tests,
                 "base_session": {
@@ -2105,6 +2107,11 @@ def cli_compare(
                 str(len(result.faster_tests)),
                 ", ".join(result.faster_tests[:5]) + ("..." if len(result.faster_tests) > 5 else ""),
             )
+            table.add_row(
+                "Slower Tests (p95)",
+                str(len(result.slower_p95_tests)),
+                ", ".join(result.slower_p95_tests[:5]) + ("..." if len(result.slower_p95_tests) > 5 else ""),
+            )
             table.add_row(
                 "Missing Tests",
                 str(len(result.missing_tests)),
@@ -2149,6 +2156,96 @@ def cli_compare(
             console.print(traceback.format_exc(), style="red")
 
 
+def _print_query_profile(profile: Any, console: Console) -> None:
+    """Render a QueryProfile as rich tables."""
+    summary = Table(title="Query Plan", show_header=False)
+    summary.add_column("Item", style="cyan")
+    summary.add_column("Value")
+    summary.add_row("Pushed to storage", "\n".join(profile.pushed) or "-")
+    summary.add_row("Residual session filters", "\n".join(profile.residual) or "-")
+    summary.add_row("Test filters", "\n".join(profile.test_filters) or "-")
+    summary.add_row("Indexes", ", ".join(profile.indexes) or "-")
+    if profile.analyzed:
+        summary.add_row("Cached", "yes" if profile.cached else "no")
+        summary.add_row("Wall time", f"{profile.wall_time * 1000:.1f} ms")
+        summary.add_row("Sessions scanned / returned", f"{profile.sessions_scanned} / {profile.sessions_returned}")
+        summary.add_row("Results scanned / returned", f"{profile.results_scanned} / {profile.results_returned}")
+    console.print(summary)
+
+    def fmt(value: Optional[int]) -> str:
+        return "?" if value is None else str(value)
+
+    stages = Table(title="Stages" if profile.analyzed else "Stages (estimated)", show_header=True)
+    stages.add_column("Level", style="cyan")
+    stages.add_column("Step")
+    stages.add_column("Rows in", justify="right")
+    stages.add_column("Rows out", justify="right")
+    stages.add_column("Selectivity", justify="right", style="magenta")
+    stages.add_column("Time", justify="right")
+    for stage in profile.stages:
+        selectivity = stage.selectivity
+        stages.add_row(
+            stage.level,
+            stage.name,
+            fmt(stage.rows_in),
+            fmt(stage.rows_out),
+            "?" if selectivity is None else f"{selectivity:.1%}",
+            "-" if stage.seconds is None else f"{stage.seconds * 1000:.2f} ms",
+        )
+    console.print(stages)
+
+
+@app.command("explain")
+def cli_explain(
+    sut: Optional[str] = typer.Option(None, help="System Under Test name"),
+    days: Optional[int] = typer.Option(None, help="Number of days to look back"),
+    test_pattern: Optional[str] = typer.Option(None, help="Test pattern (supports wildcards)"),
+    outcome: Optional[str] = typer.Option(None, help="Filter by test outcome (PASSED, FAILED, etc.)"),
+    limit: Optional[int] = typer.Option(None, help="Maximum number of sessions"),
+    analyze: bool = typer.Option(False, help="Execute the query and report measured rows and timings"),
+    profile: Optional[str] = typer.Option(None, help="Storage profile to use"),
+    format: OutputFormat = typer.Option(OutputFormat.TEXT, help="Output format (text or json)"),
+):
+    """Show how a query is executed: pushdown, indexes and rows per filter.
+
+    Examples:
+        insight dev explain --sut my-service --days 7
+        insight dev explain --sut my-service --outcome FAILED --analyze
+    """
+    console = Console()
+
+    try:
+        query = QueryClass(profile_name=profile)
+        if sut:
+            query = query.for_sut(sut)
+        if days is not None:
+            query = query.in_last_days(days)
+        if test_pattern or outcome:
+            test_filter = query.filter_by_test()
+            if test_pattern:
+                test_filter = test_filter.with_pattern(test_pattern, field_name="nodeid")
+            if outcome:
+                test_filter = test_filter.with_outcome(outcome)
+            query = test_filter.apply()
+        if limit is not None:
+            query = query.limit(limit)
+
+        query_profile = query.explain(analyze=analyze)
+        if format == OutputFormat.JSON:
+            import json
+
+            print(json.dumps(query_profile.to_dict(), indent=2))
+        else:
+            _print_query_profile(query_profile, console)
+    except Exception as e:
+        if format == OutputFormat.JSON:
+            import json
+
+            print(json.dumps({"error": str(e)}))
+        else:
+            console.print(f"[bold red]Error:[/bold red] {str(e)}")
+
+
 @app.command("analyze")
 def cli_analyze(
     sut: Optional[str] = typer.Option(None, help="System Under Test name"),
@@ -38,17 +38,256 @@ Analysis Class:
 from collections import defaultdict
 from datetime import datetime, timedelta
 from statistics import mean, stdev
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
-from pytest_insight.core.insights import TestInsights
+from pytest_insight.core.cofailure import co_failure_clusters
+from pytest_insight.core.insights import reliability_metrics
 from pytest_insight.core.models import (
     TestOutcome,
     TestSession,
 )
-from pytest_insight.core.query import Query
+from pytest_insight.core.query import Query, TimeRangeFilter
+from pytest_insight.core.sketches import CountMinSketch, DDSketch, HyperLogLog, SpaceSaving, hash64
 from pytest_insight.core.storage import BaseStorage, get_storage_instance
-from pytest_insight.utils.utils import NormalizedDatetime
+from pytest_insight.core.timeseries import DailyTotals
+from pytest_insight.utils.utils import create_after_or_equals_filter
+
+# Most recent windows read by trend detection
+_TREND_WINDOWS = 20
+
+
+def _slope(values: List[float]) -> float:
+    """Least-squares slope of values against their positions (0 for fewer than two)."""
+    if len(values) < 2:
+        return 0.0
+
+    # Fast trend calculation using numpy if available
+    try:
+        import numpy as np
+
+        x = np.arange(len(values))
+        A = np.vstack([x, np.ones(len(x))]).T
+        slope, _ = np.linalg.lstsq(A, values, rcond=None)[0]
+        return float(slope)
+    except ImportError:
+        # Fallback to simple calculation if numpy not available
+        x_mean = (len(values) - 1) / 2
+        y_mean = sum(values) / len(values)
+
+        numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(values))
+        denominator = sum((i - x_mean) ** 2 for i in range(len(values)))
+
+        if abs(denominator) < 1e-10:
+            return 0.0
+        return numerator / denominator
+
+
+class _TestStats:
+    """One test's results in a scan."""
+
+    __slots__ = ("durations", "outcome_counts", "failure_times")
+
+    def __init__(self):
+        """Initialize empty stats."""
+        self.durations = DDSketch()  # Durations that are not None
+        self.outcome_counts: Dict[Any, int] = {}
+        # Session start times of the runs while every run so far FAILED, else None
+        self.failure_times: Optional[list] = []
+
+
+class _SessionScan:
+    """Accumulators for the session, test and metrics reports, filled in one pass.
+
+    Sessions starting at or after ``cutoff`` (all sessions when None) are in the
+    window that the reports describe. Reruns and result totals are also kept
+    over every session, for the reliability metrics of Analysis.health_report.
+    """
+
+    def __init__(self, sessions: List[TestSession], cutoff: Optional[datetime] = None):
+        """Scan the sessions."""
+        self.session_count = 0
+        self.failed_sessions = 0  # Sessions with any FAILED test
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_tests = 0
+        self.skipped_tests = 0
+        self.warning_tests = 0
+        self.repeated_warnings = 0  # Warnings of tests that warned before
+        self.outcome_changes = 0  # Runs whose outcome differs from the test's previous run in the session
+        self.durations: List[float] = []  # Durations that are not None
+        self.tests: Dict[str, _TestStats] = {}  # In order of first run
+        self.failure_counts: Dict[str, int] = {}  # In order of first failure
+        self.warning_counts: Dict[str, int] = {}  # In order of first warning
+        self.daily = DailyTotals()  # Per-day totals, for trends over windows of days
+        self.all_tests = 0
+        self.rerun_groups: List[Tuple[str, Any]] = []  # (session ID, rerun group)
+
+        for session in sessions:
+            self.all_tests += len(session.test_results)
+            if getattr(session, "rerun_test_groups", None):
+                self.rerun_groups.extend((session.session_id, group) for group in session.rerun_test_groups)
+            if cutoff is None or session.session_start_time >= cutoff:
+                self._add(session)
+
+    def _add(self, session: TestSession) -> None:
+        """Fold a session of the window into the accumulators."""
+        tests, durations = self.tests, self.durations
+        failure_counts, warning_counts = self.failure_counts, self.warning_counts
+        passed = failed = skipped = warned = repeated = changes = 0
+        duration_sum = 0
+        last_outcomes = {}
+        start_time = session.session_start_time
+
+        for test in session.test_results:
+            nodeid, outcome, duration = test.nodeid, test.outcome, test.duration
+            if outcome == TestOutcome.FAILED:
+                failed += 1
+                failure_counts[nodeid] = failure_counts.get(nodeid, 0) + 1
+            elif outcome == TestOutcome.PASSED:
+                passed += 1
+            elif outcome == TestOutcome.SKIPPED:
+                skipped += 1
+            if duration is not None:
+                durations.append(duration)
+                duration_sum += duration
+
+            if test.has_warning:
+                warned += 1
+                count = warning_counts[nodeid] = warning_counts.get(nodeid, 0) + 1
+                if count > 1:
+                    repeated += 1
+
+            # Outcome changes between runs of a test within the session
+            previous = last_outcomes.get(nodeid, outcome)
+            if previous != outcome:
+                changes += 1
+            last_outcomes[nodeid] = outcome
+
+            stats = tests.get(nodeid)
+            if stats is None:
+                stats = tests[nodeid] = _TestStats()
+            if duration is not None:
+                stats.durations.add(duration)
+            stats.outcome_counts[outcome] = stats.outcome_counts.get(outcome, 0) + 1
+            if stats.failure_times is not None:
+                if outcome == TestOutcome.FAILED:
+                    stats.failure_times.append(start_time)
+                else:
+                    stats.failure_times = None
+
+        self.session_count += 1
+        self.total_tests += len(session.test_results)
+        self.passed_tests += passed
+        self.failed_tests += failed
+        self.skipped_tests += skipped
+        self.warning_tests += warned
+        self.repeated_warnings += repeated
+        self.outcome_changes += changes
+        if failed:
+            self.failed_sessions += 1
+        if start_time:
+            stop_time = getattr(session, "session_stop_time", None)
+            self.daily.add(
+                start_time.date(),
+                sessions=1,
+                failed_sessions=1 if failed else 0,
+                tests=len(session.test_results),
+                failures=failed,
+                warnings=warned,
+                duration=duration_sum,
+                timed_sessions=1 if stop_time else 0,
+                session_seconds=(stop_time - start_time).total_seconds() if stop_time else 0,
+            )
+
+
+class _FleetSummary:
+    """Fixed-memory totals and sketches for the approximate metrics, filled in one pass.
+
+    Unlike _SessionScan, nothing is kept per test: distinct tests are counted by
+    a HyperLogLog, failures per test by a Space-Saving summary and runs per test
+    by a Count-Min sketch, so memory stays the same however many tests the
+    sessions cover. Optionally, total run time per test is kept by a second,
+    duration-weighted Space-Saving summary.
+    """
+
+    def __init__(self, sessions: Iterable[TestSession], capacity: int = 1000, track_durations: bool = False):
+        """Summarize the sessions.
+
+        Args:
+            sessions: Sessions to summarize, read once
+            capacity: Tests tracked by each heavy-hitter summary
+            track_durations: Whether to also rank tests by total run time
+        """
+        self.session_count = 0
+        self.total_tests = 0
+        self.passed_tests = 0
+        self.failed_tests = 0
+        self.skipped_tests = 0
+        self.duration_count = 0
+        self.duration_sum = 0.0
+        self.min_duration: Optional[float] = None
+        self.max_duration: Optional[float] = None
+        self.unique_tests = HyperLogLog()
+        self.failures = SpaceSaving(capacity)
+        self.runs = CountMinSketch()
+        self.durations = SpaceSaving(capacity) if track_durations else None
+
+        for session in sessions:
+            self._add(session)
+
+    def _add(self, session: TestSession) -> None:
+        """Fold a session into the totals and sketches."""
+        unique_tests, failures, runs, durations = self.unique_tests, self.failures, self.runs, self.durations
+        for test in session.test_results:
+            nodeid, outcome, duration = test.nodeid, test.outcome, test.duration
+            hashed = hash64(nodeid)
+            unique_tests.add_hash(hashed)
+            runs.add_hash(hashed)
+            if outcome == TestOutcome.FAILED:
+                self.failed_tests += 1
+                failures.add(nodeid)
+            elif outcome == TestOutcome.PASSED:
+                self.passed_tests += 1
+            elif outcome == TestOutcome.SKIPPED:
+                self.skipped_tests += 1
+            if duration is not None:
+                self.duration_count += 1
+                self.duration_sum += duration
+                if durations is not None:
+                    durations.add(nodeid, duration)
+                if self.min_duration is None or duration < self.min_duration:
+                    self.min_duration = duration
+                if self.max_duration is None or duration > self.max_duration:
+                    self.max_duration = duration
+        self.session_count += 1
+        self.total_tests += len(session.test_results)
+
+
+class _ScanCache:
+    """One-pass scans of a session list, memoized per ``days`` window.
+
+    Analysis shares one cache between its components, so that their reports
+    over the same window read the same scan.
+    """
+
+    def __init__(self, sessions: List[TestSession]):
+        """Initialize an empty cache for the sessions."""
+        self.sessions = sessions
+        self._scans: Dict[Optional[int], _SessionScan] = {}
+
+    def get(self, days: Optional[int] = None) -> _SessionScan:
+        """Get the scan of the sessions of the last ``days`` days (all when None or 0)."""
+        key = days or None
+        scan = self._scans.get(key)
+        if scan is None:
+            scan = self._scans[key] = _SessionScan(self.sessions, _cutoff(key))
+        return scan
+
+
+def _cutoff(days: Optional[int]) -> Optional[datetime]:
+    """Earliest session start time within the last ``days`` days (None: no limit)."""
+    return datetime.now(ZoneInfo("UTC")) - timedelta(days=days) if days else None
 
 
 class AnalysisBase:
@@ -56,7 +295,16 @@ class AnalysisBase:
 
     def __init__(self):
         """Initialize base analysis class."""
-        pass
+        # Set by Analysis to share scans between its components
+        self._scan_cache: Optional[_ScanCache] = None
+
+    def _scan(self, days: Optional[int] = None) -> _SessionScan:
+        """Scan the sessions of the last ``days`` days (all when None or 0) in one pass."""
+        if self._scan_cache is not None:
+            return self._scan_cache.get(days)
+        if getattr(self, "_sessions", None) is None:
+            return _SessionScan(self._get_sessions(days))
+        return _SessionScan(self._sessions, _cutoff(days))
 
     def _filter_sessions_by_days(self, days: Optional[int]) -> List[TestSession]:
         """Filter sessions by the number of days from the most recent session.
@@ -173,6 +421,31 @@ class SessionAnalysis(AnalysisBase):
             query = query.in_last_days(days)
         return query.execute().sessions
 
+    def _stream_sessions(self, days: Optional[int] = None) -> Iterable[TestSession]:
+        """Get sessions to analyze one at a time, for the fixed-memory summaries.
+
+        Sessions read from storage are streamed with iter_sessions and loaded
+        without captured output, so they are never all held in memory at once.
+
+        Args:
+            days: Optional number of days to look back
+        """
+        if self._sessions is not None:
+            return self._get_sessions(days)
+
+        storage = self._query.storage
+        options: Dict[str, Any] = {}
+        if getattr(storage, "supports_projection", False) is True:
+            options["fields"] = ()
+        if days:
+            time_filter = TimeRangeFilter(start=_cutoff(days))
+            if storage.supports_pushdown(time_filter):
+                options["session_filters"] = [time_filter]
+            else:
+                in_range = create_after_or_equals_filter(time_filter.start)
+                return (s for s in storage.iter_sessions(**options) if in_range(s))
+        return storage.iter_sessions(**options)
+
     def failure_rate(self, days: Optional[int] = None) -> float:
         """Calculate session failure rate.
 
@@ -186,17 +459,15 @@ class SessionAnalysis(AnalysisBase):
         Returns:
             Failure rate as float between 0 and 1
         """
-        sessions = self._get_sessions(days)
-        if not sessions:
+        scan = self._scan(days)
+        if not scan.session_count:
             return 0.0
 
-        failed_sessions = sum(
-            1 for session in sessions if any(test.outcome == TestOutcome.FAILED for test in session.test_results)
-        )
+        return scan.failed_sessions / scan.session_count
 
-        return failed_sessions / len(sessions)
-
-    def test_metrics(self, days: Optional[int] = None, chunk_size: int = 1000) -> Dict[str, Any]:
+    def test_metrics(
+        self, days: Optional[int] = None, chunk_size: int = 1000, approximate: bool = False
+    ) -> Dict[str, Any]:
         """Calculate key test metrics for sessions.
 
         Analyzes test metrics while preserving session context to identify:
@@ -204,9 +475,14 @@ class SessionAnalysis(AnalysisBase):
         - Test uniqueness and repetition
         - Unreliable test detection
 
+        With ``approximate``, unique_tests is estimated by a HyperLogLog in fixed
+        memory (relative standard error about 0.8%, reported as
+        unique_tests_error); the other metrics stay exact.
+
         Args:
             days: Optional number of days to look back
-            chunk_size: Number of sessions to process at once for large datasets
+            chunk_size: Unused; sessions are read in a single pass (kept for compatibility)
+            approximate: Whether to count unique tests without a per-test index
 
         Returns:
             Dict containing metrics:
@@ -219,10 +495,14 @@ class SessionAnalysis(AnalysisBase):
             - passed_tests: Number of passed tests
             - skipped_tests: Number of skipped tests
             - avg_tests_per_session: Average tests per session
+            - unique_tests_error: Relative standard error of unique_tests (approximate only)
         """
-        sessions = self._get_sessions(days)
+        if approximate:
+            return self._approximate_test_metrics(days)
 
-        if not sessions:
+        scan = self._scan(days)
+
+        if not scan.session_count:
             return {
                 "total_tests": 0,
                 "unique_tests": 0,
@@ -235,55 +515,42 @@ class SessionAnalysis(AnalysisBase):
                 "avg_tests_per_session": 0,
             }
 
-        # Initialize counters
-        total_tests = 0
-        unique_tests = set()
-        durations = []
-        failed_tests = 0
-        passed_tests = 0
-        skipped_tests = 0
-
-        # Process sessions in chunks for large datasets
-        session_chunks = [sessions[i : i + chunk_size] for i in range(0, len(sessions), chunk_size)]
-
-        session_count = 0
-        for chunk in session_chunks:
-            for session in chunk:
-                # Process each test result
-                for test_result in session.test_results:
-                    total_tests += 1
-                    unique_tests.add(test_result.nodeid)
-
-                    if test_result.duration is not None:
-                        durations.append(test_result.duration)
-
-                    if test_result.outcome == TestOutcome.FAILED:
-                        failed_tests += 1
-                    elif test_result.outcome == TestOutcome.PASSED:
-                        passed_tests += 1
-                    elif test_result.outcome == TestOutcome.SKIPPED:
-                        skipped_tests += 1
-
-                session_count += 1
-
         # Calculate metrics
+        durations = scan.durations
         avg_duration = mean(durations) if durations else 0
         max_duration = max(durations) if durations else 0
         min_duration = min(durations) if durations else 0
-        avg_tests_per_session = total_tests / len(sessions) if sessions else 0
+        avg_tests_per_session = scan.total_tests / scan.session_count
 
         return {
-            "total_tests": total_tests,
-            "unique_tests": len(unique_tests),
+            "total_tests": scan.total_tests,
+            "unique_tests": len(scan.tests),
             "avg_duration": avg_duration,
             "max_duration": max_duration,
             "min_duration": min_duration,
-            "failed_tests": failed_tests,
-            "passed_tests": passed_tests,
-            "skipped_tests": skipped_tests,
+            "failed_tests": scan.failed_tests,
+            "passed_tests": scan.passed_tests,
+            "skipped_tests": scan.skipped_tests,
             "avg_tests_per_session": avg_tests_per_session,
         }
 
+    def _approximate_test_metrics(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """Calculate test_metrics from a fixed-memory summary of the sessions."""
+        summary = _FleetSummary(self._stream_sessions(days))
+        count = summary.duration_count
+        return {
+            "total_tests": summary.total_tests,
+            "unique_tests": round(summary.unique_tests.estimate()),
+            "avg_duration": summary.duration_sum / count if count else 0,
+            "max_duration": summary.max_duration or 0,
+            "min_duration": summary.min_duration or 0,
+            "failed_tests": summary.failed_tests,
+            "passed_tests": summary.passed_tests,
+            "skipped_tests": summary.skipped_tests,
+            "avg_tests_per_session": summary.total_tests / summary.session_count if summary.session_count else 0,
+            "unique_tests_error": summary.unique_tests.relative_error,
+        }
+
     def detect_trends(self, days: Optional[int] = None, window_size: int = 7) -> Dict[str, Any]:
         """Detect significant trends in session data.
 
@@ -312,9 +579,9 @@ class SessionAnalysis(AnalysisBase):
                 - significant: Boolean indicating if change is statistically significant
                 - common_warnings: Most frequent warning types
         """
-        sessions = self._get_sessions(days)
+        scan = self._scan(days)
 
-        if not sessions:
+        if not scan.session_count:
             return {
                 "duration": {
                     "direction": "stable",
@@ -334,33 +601,17 @@ class SessionAnalysis(AnalysisBase):
                 },
             }
 
-        # Sort sessions by start time using NormalizedDatetime to handle timezone differences
-        def get_session_time(session):
-            if hasattr(session, "session_start_time") and session.session_start_time:
-                return NormalizedDatetime(session.session_start_time)
-            elif hasattr(session, "timestamp") and session.timestamp:
-                return NormalizedDatetime(session.timestamp)
-            else:
-                # Default to epoch start if no timestamp available
-                return NormalizedDatetime(datetime.fromtimestamp(0, tz=ZoneInfo("UTC")))
-
-        sessions = sorted(sessions, key=get_session_time)
-
-        # Limit to a reasonable number of sessions for trend analysis
-        MAX_SESSIONS = 100
-        if len(sessions) > MAX_SESSIONS:
-            # Take evenly distributed samples if we have too many sessions
-            step = len(sessions) // MAX_SESSIONS
-            sessions = [sessions[i] for i in range(0, len(sessions), step)][:MAX_SESSIONS]
+        # Totals per window of window_size days, most recent windows only
+        windows = [window for window in scan.daily.windows(window_size, count=_TREND_WINDOWS) if window["sessions"]]
 
         # Analyze duration trends
-        duration_trend = self._analyze_duration_trend(sessions, window_size)
+        duration_trend = self._analyze_duration_trend(windows)
 
         # Analyze failure trends
-        failure_trend = self._analyze_failure_trend(sessions, window_size)
+        failure_trend = self._analyze_failure_trend(windows)
 
         # Analyze warning trends
-        warning_trend = self._analyze_warning_trend(sessions, window_size)
+        warning_trend = self._analyze_warning_trend(windows, scan.warning_counts)
 
         return {
             "duration": duration_trend,
@@ -368,45 +619,25 @@ class SessionAnalysis(AnalysisBase):
             "warnings": warning_trend,
         }
 
-    def _analyze_duration_trend(self, sessions: List[TestSession], window_size: int) -> Dict[str, Any]:
-        """Analyze trends in test execution duration."""
-        # Calculate average duration per session (with a limit on tests per session)
-        MAX_TESTS_PER_SESSION = 1000
-        durations = []
+    def daily_totals(self, days: Optional[int] = None) -> DailyTotals:
+        """Get per-day session totals for querying windows of any size.
 
-        for session in sessions:
-            # Limit the number of tests to process
-            test_results = (
-                session.test_results[:MAX_TESTS_PER_SESSION]
-                if len(session.test_results) > MAX_TESTS_PER_SESSION
-                else session.test_results
-            )
-            session_duration = sum(t.duration for t in test_results)
-            durations.append(session_duration)
-
-        if len(durations) < 2:
-            return {"direction": "stable", "change_percent": 0.0, "significant": False}
-
-        # Fast trend calculation using numpy if available
-        try:
-            import numpy as np
-
-            x = np.arange(len(durations))
-            A = np.vstack([x, np.ones(len(x))]).T
-            slope, _ = np.linalg.lstsq(A, durations, rcond=None)[0]
-        except ImportError:
-            # Fallback to simple calculation if numpy not available
-            x = list(range(len(durations)))
-            x_mean = sum(x) / len(x)
-            y_mean = sum(durations) / len(durations)
-
-            numerator = sum((x[i] - x_mean) * (y - y_mean) for i, y in enumerate(durations))
-            denominator = sum((x[i] - x_mean) ** 2 for i in x)
-
-            if abs(denominator) < 1e-10:
-                slope = 0
-            else:
-                slope = numerator / denominator
+        The totals are built in the same pass as the other session reports and
+        answer the sums over any date range in O(1), e.g.
+        ``daily_totals(90).windows(7)`` for weekly totals.
+
+        Args:
+            days: Optional number of days to look back
+
+        Returns:
+            DailyTotals of the sessions in the period
+        """
+        return self._scan(days).daily
+
+    def _analyze_duration_trend(self, windows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Analyze trends in test execution duration."""
+        # Average total test duration per session in each window
+        slope = _slope([window["duration"] / window["sessions"] for window in windows])
 
         return {
             "direction": ("increasing" if slope > 0.1 else "decreasing" if slope < -0.1 else "stable"),
@@ -414,71 +645,10 @@ class SessionAnalysis(AnalysisBase):
             "significant": False,  # TODO: Implement significance check
         }
 
-    def _analyze_failure_trend(self, sessions: List[TestSession], window_size: int) -> Dict[str, Any]:
+    def _analyze_failure_trend(self, windows: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze trends in test failures while preserving session context."""
-        # Strict limits to prevent excessive computation
-        MAX_TESTS_PER_SESSION = 500
-        MAX_WINDOWS = 20
-
-        # Group sessions by time window (limit number of windows)
-        windows = []
-        current_window = []
-        window_count = 0
-
-        for session in sessions:
-            current_window.append(session)
-            if len(current_window) >= window_size:
-                windows.append(current_window)
-                current_window = []
-                window_count += 1
-                if window_count >= MAX_WINDOWS:
-                    break
-
-        if current_window:
-            windows.append(current_window)
-
-        # Calculate failure rate for each window
-        failure_rates = []
-        for window in windows:
-            failed_sessions = 0
-            for s in window:
-                # Limit tests to process
-                test_results = (
-                    s.test_results[:MAX_TESTS_PER_SESSION]
-                    if len(s.test_results) > MAX_TESTS_PER_SESSION
-                    else s.test_results
-                )
-                if any(t.outcome == TestOutcome.FAILED for t in test_results):
-                    failed_sessions += 1
-
-            failure_rate = failed_sessions / len(window) if window else 0
-            failure_rates.append(failure_rate)
-
-        # Skip correlated failures calculation - it's expensive and not used in the output
-
-        if len(failure_rates) < 2:
-            return {"direction": "stable", "change_percent": 0.0, "significant": False}
-
-        # Fast trend calculation using numpy if available
-        try:
-            import numpy as np
-
-            x = np.arange(len(failure_rates))
-            A = np.vstack([x, np.ones(len(x))]).T
-            slope, _ = np.linalg.lstsq(A, failure_rates, rcond=None)[0]
-        except ImportError:
-            # Fallback to simple calculation
-            x = list(range(len(failure_rates)))
-            x_mean = sum(x) / len(x)
-            y_mean = sum(failure_rates) / len(failure_rates)
-
-            numerator = sum((i - x_mean) * (rate - y_mean) for i, rate in enumerate(failure_rates))
-            denominator = sum((i - x_mean) ** 2 for i in x)
-
-            if abs(denominator) < 1e-10:
-                slope = 0
-            else:
-                slope = numerator / denominator
+        # Rate of sessions with failures in each window
+        slope = _slope([window["failed_sessions"] / window["sessions"] for window in windows])
 
         return {
             "direction": ("worsening" if slope > 0.05 else "improving" if slope < -0.05 else "stable"),
@@ -486,64 +656,13 @@ class SessionAnalysis(AnalysisBase):
             "significant": False,  # TODO: Implement significance check
         }
 
-    def _analyze_warning_trend(self, sessions: List[TestSession], window_size: int) -> Dict[str, Any]:
+    def _analyze_warning_trend(self, windows: List[Dict[str, Any]], warning_counts: Dict[str, int]) -> Dict[str, Any]:
         """Analyze trends in test warnings."""
-        # Strict limits to prevent excessive computation
-        MAX_TESTS_PER_SESSION = 500
-        MAX_WARNINGS_TO_TRACK = 100
-
-        # Track warnings per session
-        warning_counts = []
-        warning_types = defaultdict(int)
-        warning_types_count = 0
-
-        for session in sessions:
-            # Limit tests to process
-            test_results = (
-                session.test_results[:MAX_TESTS_PER_SESSION]
-                if len(session.test_results) > MAX_TESTS_PER_SESSION
-                else session.test_results
-            )
-
-            session_warnings = sum(1 for test in test_results if test.has_warning)
-            warning_counts.append(session_warnings)
-
-            # Track warning types (limited)
-            for test in test_results:
-                if test.has_warning and warning_types_count < MAX_WARNINGS_TO_TRACK:
-                    warning_types[test.nodeid] += 1
-                    warning_types_count += 1
-
-        if len(warning_counts) < 2:
-            return {"direction": "stable", "change_percent": 0.0, "significant": False}
-
-        # Fast trend calculation using numpy if available
-        try:
-            import numpy as np
-
-            x = np.arange(len(warning_counts))
-            A = np.vstack([x, np.ones(len(x))]).T
-            slope, _ = np.linalg.lstsq(A, warning_counts, rcond=None)[0]
-        except ImportError:
-            # Fallback to simple calculation
-            x = list(range(len(warning_counts)))
-            x_mean = sum(x) / len(x)
-            y_mean = sum(warning_counts) / len(warning_counts)
-
-            numerator = sum((i - x_mean) * (count - y_mean) for i, count in enumerate(warning_counts))
-            denominator = sum((i - x_mean) ** 2 for i in x)
-
-            if abs(denominator) < 1e-10:
-                slope = 0
-            else:
-                slope = numerator / denominator
+        # Average warnings per session in each window
+        slope = _slope([window["warnings"] / window["sessions"] for window in windows])
 
         # Find most common warning types (limit to top 5)
-        common_warnings = sorted(
-            ((test, count) for test, count in warning_types.items()),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:5]
+        common_warnings = sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)[:5]
 
         return {
             "direction": ("increasing" if slope > 0.05 else "decreasing" if slope < -0.05 else "stable"),
@@ -594,109 +713,7 @@ class SessionAnalysis(AnalysisBase):
         if not self._sessions:
             return []
 
-        # Extract all test failures from sessions
-        test_failures = {}
-        session_failures = {}
-
-        # Process each session
-        for session in self._sessions:
-            # Record failures in this session
-            session_id = session.session_id
-            session_failures[session_id] = []
-
-            for test_result in session.test_results:
-                if test_result.outcome.is_failed():
-                    test_id = test_result.nodeid
-
-                    # Initialize test entry if not exists
-                    if test_id not in test_failures:
-                        test_failures[test_id] = set()
-
-                    # Record that this test failed in this session
-                    test_failures[test_id].add(session_id)
-                    session_failures[session_id].append(test_id)
-
-        # Find correlations between tests
-        correlations = {}
-        test_ids = list(test_failures.keys())
-
-        # Skip if not enough tests
-        if len(test_ids) < 2:
-            return []
-
-        # Compare each pair of tests
-        for i in range(len(test_ids)):
-            for j in range(i + 1, len(test_ids)):
-                test_a = test_ids[i]
-                test_b = test_ids[j]
-
-                # Get sessions where each test failed
-                sessions_a = test_failures[test_a]
-                sessions_b = test_failures[test_b]
-
-                # Calculate co-occurrence
-                co_failures = sessions_a.intersection(sessions_b)
-
-                # Skip if not enough co-occurrences
-                if len(co_failures) < min_occurrences:
-                    continue
-
-                # Calculate correlation coefficient (Jaccard similarity)
-                correlation = len(co_failures) / len(sessions_a.union(sessions_b))
-
-                # Record if above threshold
-                if correlation >= min_correlation:
-                    pair_key = (test_a, test_b)
-                    correlations[pair_key] = {
-                        "correlation": correlation,
-                        "co_failures": len(co_failures),
-                        "tests": [test_a, test_b],
-                    }
-
-        # Build clusters from correlations
-        clusters = []
-        processed_pairs = set()
-
-        # Sort correlations by strength
-        sorted_correlations = sorted(correlations.items(), key=lambda x: x[1]["correlation"], reverse=True)
-
-        # Process each correlation
-        for (test_a, test_b), data in sorted_correlations:
-            # Skip if already in a cluster
-            if (test_a, test_b) in processed_pairs:
-                continue
-
-            # Start new cluster
-            cluster = {
-                "correlation": data["correlation"],
-                "co_failures": data["co_failures"],
-                "tests": [test_a, test_b],
-            }
-            processed_pairs.add((test_a, test_b))
-
-            # Try to expand cluster
-            for (other_a, other_b), other_data in sorted_correlations:
-                # Skip if already processed
-                if (other_a, other_b) in processed_pairs:
-                    continue
-
-                # Check if connected to cluster
-                if other_a in cluster["tests"] or other_b in cluster["tests"]:
-                    # Add the test not in the cluster
-                    new_test = other_b if other_a in cluster["tests"] else other_a
-                    if new_test not in cluster["tests"]:
-                        cluster["tests"].append(new_test)
-
-                    # Mark as processed
-                    processed_pairs.add((other_a, other_b))
-
-                    # Update correlation (use average)
-                    cluster["correlation"] = (cluster["correlation"] + other_data["correlation"]) / 2
-
-            # Add cluster to results
-            clusters.append(cluster)
-
-        return clusters
+        return co_failure_clusters(self._sessions, min_correlation, min_occurrences)
 
     def health_score(self) -> Dict[str, Any]:
         """
@@ -885,22 +902,37 @@ class SessionAnalysis(AnalysisBase):
             "recently_passing": recently_passing,
         }
 
-    def top_failing_tests(self, days: Optional[int] = None, limit: int = 10) -> Dict[str, Any]:
+    def top_failing_tests(
+        self, days: Optional[int] = None, limit: int = 10, approximate: bool = False, capacity: int = 1000
+    ) -> Dict[str, Any]:
         """Identify tests that fail most frequently across sessions.
 
         This metric helps identify systemic issues or brittle tests by clustering
         failures and ranking tests by their failure frequency.
 
+        With ``approximate``, failures are ranked by a Space-Saving summary of
+        ``capacity`` tests and runs are counted by a Count-Min sketch, so memory
+        does not grow with the number of tests. Every test with more than
+        total_failures / capacity failures is found; each reported failure count
+        overestimates by at most its failures_error, and total_runs overestimates
+        by at most 0.1% of all results with 99% probability. total_failures is exact.
+
         Args:
             days: Optional number of days to look back
             limit: Maximum number of tests to return
+            approximate: Whether to rank failures in fixed memory
+            capacity: Failing tests tracked in approximate mode
 
         Returns:
             Dict containing:
             - top_failing: List of dicts with test nodeids and their failure metrics
+              (plus failures_error in approximate mode)
             - failure_distribution: Distribution of failures across tests
             - total_failures: Total number of test failures
         """
+        if approximate:
+            return self._approximate_top_failing_tests(days, limit, capacity)
+
         sessions = self._get_sessions(days)
 
         # Track failures by test
@@ -952,6 +984,31 @@ class SessionAnalysis(AnalysisBase):
             "total_failures": total_failures,
         }
 
+    def _approximate_top_failing_tests(self, days: Optional[int], limit: int, capacity: int) -> Dict[str, Any]:
+        """Calculate top_failing_tests from a fixed-memory summary of the sessions."""
+        summary = _FleetSummary(self._stream_sessions(days), capacity)
+        total_failures = summary.failed_tests
+
+        top_failing = []
+        for nodeid, failures, error in summary.failures.top(limit):
+            # Both estimates are upper bounds; the rate is capped where they disagree
+            runs = max(summary.runs.estimate(nodeid), failures)
+            top_failing.append(
+                {
+                    "nodeid": nodeid,
+                    "failures": failures,
+                    "total_runs": runs,
+                    "failure_rate": failures / runs,
+                    "failures_error": error,
+                }
+            )
+
+        return {
+            "top_failing": top_failing,
+            "failure_distribution": {test["nodeid"]: test["failures"] / total_failures for test in top_failing},
+            "total_failures": total_failures,
+        }
+
     def regression_rate(self, days: Optional[int] = None) -> Dict[str, Any]:
         """Calculate the regression rate of tests.
 
@@ -1025,52 +1082,78 @@ class SessionAnalysis(AnalysisBase):
             "total_regressions": len(regressed_tests),
         }
 
-    def longest_running_tests(self, days: Optional[int] = None, limit: int = 10) -> Dict[str, Any]:
+    def longest_running_tests(
+        self, days: Optional[int] = None, limit: int = 10, approximate: bool = False, capacity: int = 1000
+    ) -> Dict[str, Any]:
         """Identify the longest running tests across sessions.
 
         This metric helps guide optimization efforts by identifying tests that
-        consume the most execution time.
+        consume the most execution time. Durations are kept in a quantile sketch
+        per test (see pytest_insight.core.sketches), so percentiles are within
+        1% of the exact values and memory grows with unique tests, not runs.
+
+        With ``approximate``, memory does not grow with the number of tests:
+        tests are ranked by total run time (not average duration) with a
+        duration-weighted Space-Saving summary of ``capacity`` tests. Every test
+        with more than total_duration / capacity seconds is found, and each
+        reported total overestimates by at most its duration_errors entry.
+        Averages divide by Count-Min run counts (see top_failing_tests), and
+        percentiles are not tracked.
 
         Args:
             days: Optional number of days to look back
             limit: Maximum number of tests to return
+            approximate: Whether to rank tests by total run time in fixed memory
+            capacity: Tests tracked in approximate mode
 
         Returns:
             Dict containing:
-            - longest_tests: List of dicts with test nodeids and their duration metrics
+            - longest_tests: List of (nodeid, average duration) tuples, longest first
+            - percentiles: p50, p95 and p99 durations of each of the longest tests
+              (exact mode only)
+            - total_durations: Total run time of each of the longest tests
+              (approximate mode only)
+            - duration_errors: Maximum overestimate of each total (approximate mode only)
             - total_duration: Total test execution time
             - avg_duration: Average test duration
         """
-        sessions = self._get_sessions(days)
-
-        # Track durations by test
-        test_durations = defaultdict(list)
+        if approximate:
+            return self._approximate_longest_running_tests(days, limit, capacity)
 
-        # Collect duration data from all sessions
-        for session in sessions:
-            if hasattr(session, "test_results") and session.test_results:
-                for test in session.test_results:
-                    if hasattr(test, "duration") and test.duration is not None:
-                        nodeid = test.nodeid
-                        test_durations[nodeid].append(test.duration)
+        tests = self._scan(days).tests
 
         # Calculate average durations and sort
-        avg_durations = [(nodeid, sum(durations) / len(durations)) for nodeid, durations in test_durations.items()]
+        sketches = [(nodeid, stats.durations) for nodeid, stats in tests.items() if stats.durations.count]
+        avg_durations = [(nodeid, sketch.mean) for nodeid, sketch in sketches]
 
         # Sort by duration (descending) and return top N
         longest_tests = sorted(avg_durations, key=lambda x: x[1], reverse=True)[:limit]
 
         # Calculate overall metrics
-        all_durations = [d for durations in test_durations.values() for d in durations]
-        total_duration = sum(all_durations)
-        avg_duration = total_duration / len(all_durations) if all_durations else 0
+        total_duration = sum(sketch.sum for _, sketch in sketches)
+        duration_count = sum(sketch.count for _, sketch in sketches)
+        avg_duration = total_duration / duration_count if duration_count else 0
 
         return {
             "longest_tests": longest_tests,
+            "percentiles": {nodeid: tests[nodeid].durations.percentiles() for nodeid, _ in longest_tests},
             "total_duration": total_duration,
             "avg_duration": avg_duration,
         }
 
+    def _approximate_longest_running_tests(self, days: Optional[int], limit: int, capacity: int) -> Dict[str, Any]:
+        """Calculate longest_running_tests from a fixed-memory summary of the sessions."""
+        summary = _FleetSummary(self._stream_sessions(days), capacity, track_durations=True)
+        top = summary.durations.top(limit)
+        count = summary.duration_count
+        return {
+            "longest_tests": [(nodeid, total / max(summary.runs.estimate(nodeid), 1)) for nodeid, total, _ in top],
+            "total_durations": {nodeid: total for nodeid, total, _ in top},
+            "duration_errors": {nodeid: error for nodeid, _, error in top},
+            "total_duration": summary.duration_sum,
+            "avg_duration": summary.duration_sum / count if count else 0,
+        }
+
     def test_suite_duration_trend(self, days: Optional[int] = None, window_size: int = 7) -> Dict[str, Any]:
         """Analyze the trend in test suite duration over time.
 
@@ -1079,7 +1162,8 @@ class SessionAnalysis(AnalysisBase):
 
         Args:
             days: Optional number of days to look back
-            window_size: Size of the window for trend analysis
+            window_size: Size of the windows compared (in days): the most recent
+                         window_size days against the window_size days before
 
         Returns:
             Dict containing:
@@ -1102,8 +1186,9 @@ class SessionAnalysis(AnalysisBase):
             key=lambda s: (s.session_start_time if hasattr(s, "session_start_time") else datetime.min),
         )
 
-        # Calculate session durations
+        # Calculate session durations, and their per-day totals
         session_durations = []
+        daily = DailyTotals()
         for session in sorted_sessions:
             if (
                 hasattr(session, "session_start_time")
@@ -1113,6 +1198,7 @@ class SessionAnalysis(AnalysisBase):
             ):
                 duration = (session.session_stop_time - session.session_start_time).total_seconds()
                 timestamp = session.session_start_time
+                daily.add(timestamp.date(), timed_sessions=1, session_seconds=duration)
 
                 session_durations.append(
                     {
@@ -1129,15 +1215,15 @@ class SessionAnalysis(AnalysisBase):
                 "significant": False,
             }
 
-        # Analyze trend
-        if len(session_durations) >= window_size:
-            # Compare recent window to previous window
-            recent_window = session_durations[-window_size:]
-            previous_window = session_durations[-2 * window_size : -window_size]
+        # Compare recent window to previous window, from the per-day totals
+        windows = daily.windows(window_size, count=2)
+        if len(windows) == 2:
+            previous_window, recent_window = windows
 
-            if previous_window:  # Ensure we have enough data for comparison
-                recent_avg = sum(d["duration"] for d in recent_window) / len(recent_window)
-                previous_avg = sum(d["duration"] for d in previous_window) / len(previous_window)
+            # Ensure we have enough data for comparison
+            if previous_window["timed_sessions"] and recent_window["timed_sessions"]:
+                recent_avg = recent_window["session_seconds"] / recent_window["timed_sessions"]
+                previous_avg = previous_window["session_seconds"] / previous_window["timed_sessions"]
 
                 # Calculate percent change
                 if previous_avg > 0:
@@ -1210,7 +1296,7 @@ class TestAnalysis(AnalysisBase):
         """Analyze test stability.
 
         Args:
-            chunk_size: Number of tests to process at once for large datasets
+            chunk_size: Unused; sessions are read in a single pass (kept for compatibility)
 
         Returns:
             Dict of stability metrics including:
@@ -1224,37 +1310,18 @@ class TestAnalysis(AnalysisBase):
         if not sessions:
             return {"unreliable_tests": [], "unstable_tests": []}
 
-        # Track test outcomes across sessions
-        test_history = defaultdict(list)
-
-        # Process sessions in chunks for large datasets
-        session_chunks = [sessions[i : i + chunk_size] for i in range(0, len(sessions), chunk_size)]
-
-        session_count = 0
-        for chunk in session_chunks:
-            for session in chunk:
-                session_timestamp = session.session_start_time
-
-                # Process each test result
-                for test_result in session.test_results:
-                    test_history[test_result.nodeid].append((session_timestamp, test_result.outcome))
-
-                session_count += 1
+        # Outcome counts of each test across sessions
+        tests = self._scan().tests
 
         # Analyze unreliable tests
         unreliable_tests = []
-        for nodeid, outcomes in test_history.items():
+        for nodeid, stats in tests.items():
             # A test is unreliable if it has different outcomes
-            unique_outcomes = set(outcome for _, outcome in outcomes)
-            if len(unique_outcomes) > 1:
+            outcome_counts = stats.outcome_counts
+            if len(outcome_counts) > 1:
                 # Calculate reliability rate
-                outcome_counts = defaultdict(int)
-                for _, outcome in outcomes:
-                    outcome_counts[outcome] += 1
-
-                total_runs = len(outcomes)
-                most_common_outcome = max(outcome_counts.items(), key=lambda x: x[1])[0]
-                most_common_count = outcome_counts[most_common_outcome]
+                total_runs = sum(outcome_counts.values())
+                most_common_count = max(outcome_counts.values())
 
                 reliability_rate = most_common_count / total_runs
 
@@ -1272,19 +1339,16 @@ class TestAnalysis(AnalysisBase):
 
         # Find consistently failing tests (separate from unreliable tests)
         unstable_tests = []
-        for nodeid, outcomes in test_history.items():
-            # Skip tests that are already identified as unreliable
-            if any(test["nodeid"] == nodeid for test in unreliable_tests):
-                continue
-
+        for nodeid, stats in tests.items():
             # A test is unstable if it consistently fails
-            if all(outcome == TestOutcome.FAILED for _, outcome in outcomes) and len(outcomes) >= 2:
+            failure_times = stats.failure_times
+            if failure_times is not None and len(failure_times) >= 2:
                 unstable_tests.append(
                     {
                         "nodeid": nodeid,
-                        "failure_count": len(outcomes),
-                        "first_failure": min(timestamp for timestamp, _ in outcomes),
-                        "last_failure": max(timestamp for timestamp, _ in outcomes),
+                        "failure_count": len(failure_times),
+                        "first_failure": min(failure_times),
+                        "last_failure": max(failure_times),
                     }
                 )
 
@@ -1362,109 +1426,7 @@ class TestAnalysis(AnalysisBase):
         if not self._sessions:
             return []
 
-        # Extract all test failures from sessions
-        test_failures = {}
-        session_failures = {}
-
-        # Process each session
-        for session in self._sessions:
-            # Record failures in this session
-            session_id = session.session_id
-            session_failures[session_id] = []
-
-            for test_result in session.test_results:
-                if test_result.outcome.is_failed():
-                    test_id = test_result.nodeid
-
-                    # Initialize test entry if not exists
-                    if test_id not in test_failures:
-                        test_failures[test_id] = set()
-
-                    # Record that this test failed in this session
-                    test_failures[test_id].add(session_id)
-                    session_failures[session_id].append(test_id)
-
-        # Find correlations between tests
-        correlations = {}
-        test_ids = list(test_failures.keys())
-
-        # Skip if not enough tests
-        if len(test_ids) < 2:
-            return []
-
-        # Compare each pair of tests
-        for i in range(len(test_ids)):
-            for j in range(i + 1, len(test_ids)):
-                test_a = test_ids[i]
-                test_b = test_ids[j]
-
-                # Get sessions where each test failed
-                sessions_a = test_failures[test_a]
-                sessions_b = test_failures[test_b]
-
-                # Calculate co-occurrence
-                co_failures = sessions_a.intersection(sessions_b)
-
-                # Skip if not enough co-occurrences
-                if len(co_failures) < min_occurrences:
-                    continue
-
-                # Calculate correlation coefficient (Jaccard similarity)
-                correlation = len(co_failures) / len(sessions_a.union(sessions_b))
-
-                # Record if above threshold
-                if correlation >= min_correlation:
-                    pair_key = (test_a, test_b)
-                    correlations[pair_key] = {
-                        "correlation": correlation,
-                        "co_failures": len(co_failures),
-                        "tests": [test_a, test_b],
-                    }
-
-        # Build clusters from correlations
-        clusters = []
-        processed_pairs = set()
-
-        # Sort correlations by strength
-        sorted_correlations = sorted(correlations.items(), key=lambda x: x[1]["correlation"], reverse=True)
-
-        # Process each correlation
-        for (test_a, test_b), data in sorted_correlations:
-            # Skip if already in a cluster
-            if (test_a, test_b) in processed_pairs:
-                continue
-
-            # Start new cluster
-            cluster = {
-                "correlation": data["correlation"],
-                "co_failures": data["co_failures"],
-                "tests": [test_a, test_b],
-            }
-            processed_pairs.add((test_a, test_b))
-
-            # Try to expand cluster
-            for (other_a, other_b), other_data in sorted_correlations:
-                # Skip if already processed
-                if (other_a, other_b) in processed_pairs:
-                    continue
-
-                # Check if connected to cluster
-                if other_a in cluster["tests"] or other_b in cluster["tests"]:
-                    # Add the test not in the cluster
-                    new_test = other_b if other_a in cluster["tests"] else other_a
-                    if new_test not in cluster["tests"]:
-                        cluster["tests"].append(new_test)
-
-                    # Mark as processed
-                    processed_pairs.add((other_a, other_b))
-
-                    # Update correlation (use average)
-                    cluster["correlation"] = (cluster["correlation"] + other_data["correlation"]) / 2
-
-            # Add cluster to results
-            clusters.append(cluster)
-
-        return clusters
+        return co_failure_clusters(self._sessions, min_correlation, min_occurrences)
 
     def health_score(self) -> Dict[str, Any]:
         """
@@ -1723,31 +1685,19 @@ class MetricsAnalysis(AnalysisBase):
             - component_scores: Individual scores for each component
             - recommendations: List of improvement recommendations
         """
-        sessions = self._get_sessions(days)
-        if not sessions:
+        scan = self._scan(days)
+        if not scan.session_count:
             return {"overall_score": 0.0, "component_scores": {}, "recommendations": []}
 
         # Calculate component scores while preserving session context
-        stability_score = self._calculate_stability_score(sessions)
-        performance_score = self._calculate_performance_score(sessions)
-        warning_score = self._calculate_warning_score(sessions)
+        stability_score = self._calculate_stability_score(scan)
+        performance_score = self._calculate_performance_score(scan)
+        warning_score = self._calculate_warning_score(scan)
 
         # Calculate additional health metrics
-        total_tests = 0
-        failed_tests = 0
-        total_warnings = 0
-        for session in sessions:
-            for test in session.test_results:
-                total_tests += 1
-                if (
-                    getattr(test, "outcome", None) == getattr(test, "outcome", None).__class__.FAILED
-                    if hasattr(test, "outcome") and hasattr(test.outcome, "__class__")
-                    else False
-                ):
-                    failed_tests += 1
-
-                if getattr(test, "has_warning", False):
-                    total_warnings += 1
+        total_tests = scan.total_tests
+        failed_tests = scan.failed_tests
+        total_warnings = scan.warning_tests
         failure_rate = (failed_tests / total_tests * 100) if total_tests else 0.0
         warning_rate = (total_warnings / total_tests * 100) if total_tests else 0.0
 
@@ -1765,7 +1715,7 @@ class MetricsAnalysis(AnalysisBase):
         )
 
         # Generate recommendations based on scores
-        recommendations = self._generate_recommendations(stability_score, performance_score, warning_score, sessions)
+        recommendations = self._generate_recommendations(stability_score, performance_score, warning_score, scan)
 
         return {
             "overall_score": overall_score,
@@ -1779,38 +1729,15 @@ class MetricsAnalysis(AnalysisBase):
             "recommendations": recommendations,
         }
 
-    def _calculate_stability_score(self, sessions: List[TestSession]) -> float:
+    def _calculate_stability_score(self, scan: _SessionScan) -> float:
         """Calculate stability score based on failures and reliability."""
-        if not sessions:
+        if not scan.session_count or scan.total_tests == 0:
             return 0.0
 
-        total_tests = 0
-        failed_tests = 0
-        unreliable_tests = 0
-
-        # Analyze each session while preserving context
-        for session in sessions:
-            session_outcomes = defaultdict(list)
-
-            for test in session.test_results:
-                total_tests += 1
-                if test.outcome == TestOutcome.FAILED:
-                    failed_tests += 1
-
-                # Track outcomes within session for reliability
-                session_outcomes[test.nodeid].append(test.outcome)
-                if len(session_outcomes[test.nodeid]) > 1:
-                    prev = session_outcomes[test.nodeid][-2]
-                    curr = session_outcomes[test.nodeid][-1]
-                    if prev != curr:
-                        unreliable_tests += 1
-
-        if total_tests == 0:
-            return 0.0
-
-        # Calculate score components
-        failure_ratio = failed_tests / total_tests
-        unreliable_ratio = unreliable_tests / total_tests
+        # Calculate score components; a test whose outcome changes between runs
+        # in the same session counts as unreliable once per change
+        failure_ratio = scan.failed_tests / scan.total_tests
+        unreliable_ratio = scan.outcome_changes / scan.total_tests
 
         # Convert to 0-100 score with penalties
         base_score = 100 * (1 - failure_ratio)
@@ -1818,28 +1745,9 @@ class MetricsAnalysis(AnalysisBase):
 
         return max(0, min(100, base_score - unreliable_penalty))
 
-    def _calculate_performance_score(self, sessions: List[TestSession]) -> float:
+    def _calculate_performance_score(self, scan: _SessionScan) -> float:
         """Calculate performance score based on duration and resource usage."""
-        if not sessions:
-            return 0.0
-
-        durations = []
-
-        # Analyze each session while preserving context
-        for session in sessions:
-            session_durations = []
-            for test in session.test_results:
-                session_durations.append(test.duration)
-                durations.append(test.duration)
-
-            # Look for performance degradation within session
-            if session_durations:
-                session_mean = mean(session_durations)
-                session_stddev = stdev(session_durations) if len(session_durations) > 1 else 0
-
-                # Count tests significantly slower than session average
-                sum(1 for d in session_durations if d > session_mean + 2 * session_stddev)
-
+        durations = scan.durations
         if not durations:
             return 0.0
 
@@ -1852,38 +1760,14 @@ class MetricsAnalysis(AnalysisBase):
 
         return max(0, min(100, consistency_score))
 
-    def _calculate_warning_score(self, sessions: List[TestSession]) -> float:
+    def _calculate_warning_score(self, scan: _SessionScan) -> float:
         """Calculate warning score based on warning patterns."""
-        if not sessions:
-            return 0.0
-
-        total_tests = 0
-        total_warnings = 0
-        repeated_warnings = 0
-
-        # Track warnings while preserving session context
-        warning_history = defaultdict(int)
-
-        for session in sessions:
-            session_warnings = set()
-
-            for test in session.test_results:
-                total_tests += 1
-                if test.has_warning:
-                    total_warnings += 1
-                    session_warnings.add(test.nodeid)
-
-                    # Track repeated warnings
-                    warning_history[test.nodeid] += 1
-                    if warning_history[test.nodeid] > 1:
-                        repeated_warnings += 1
-
-        if total_tests == 0:
+        if not scan.session_count or scan.total_tests == 0:
             return 0.0
 
         # Calculate score with penalties for warning frequency and repetition
-        warning_ratio = total_warnings / total_tests
-        repeat_ratio = repeated_warnings / total_tests if total_tests > 0 else 0
+        warning_ratio = scan.warning_tests / scan.total_tests
+        repeat_ratio = scan.repeated_warnings / scan.total_tests
 
         base_score = 100 * (1 - warning_ratio)
         repeat_penalty = 30 * repeat_ratio  # Up to 30 point penalty for repeated warnings
@@ -1895,14 +1779,14 @@ class MetricsAnalysis(AnalysisBase):
         stability_score: float,
         performance_score: float,
         warning_score: float,
-        sessions: List[TestSession],
+        scan: _SessionScan,
     ) -> List[Dict[str, str]]:
         """Generate improvement recommendations based on scores."""
         recommendations = []
 
         # Analyze stability issues
         if stability_score < 80:
-            failed_patterns = self._analyze_failure_patterns(sessions)
+            failed_patterns = self._analyze_failure_patterns(scan)
             if failed_patterns:
                 recommendations.append(
                     {
@@ -1914,7 +1798,7 @@ class MetricsAnalysis(AnalysisBase):
 
         # Analyze performance issues
         if performance_score < 80:
-            slow_tests = self._find_slow_tests(sessions)
+            slow_tests = self._find_slow_tests(scan)
             if slow_tests:
                 recommendations.append(
                     {
@@ -1926,7 +1810,7 @@ class MetricsAnalysis(AnalysisBase):
 
         # Analyze warning issues
         if warning_score < 80:
-            warning_patterns = self._analyze_warning_patterns(sessions)
+            warning_patterns = self._analyze_warning_patterns(scan)
             if warning_patterns:
                 recommendations.append(
                     {
@@ -1938,60 +1822,29 @@ class MetricsAnalysis(AnalysisBase):
 
         return recommendations
 
-    def _analyze_failure_patterns(self, sessions: List[TestSession]) -> List[str]:
+    def _analyze_failure_patterns(self, scan: _SessionScan) -> List[str]:
         """Analyze common failure patterns while preserving session context."""
-        failure_counts = defaultdict(int)
-
-        for session in sessions:
-            # Track failures within session context
-            session_failures = set()
-
-            for test in session.test_results:
-                if test.outcome == TestOutcome.FAILED:
-                    session_failures.add(test.nodeid)
-                    failure_counts[test.nodeid] += 1
-
         # Return tests with highest failure counts
-        return [test for test, count in sorted(failure_counts.items(), key=lambda x: x[1], reverse=True)]
+        return [test for test, count in sorted(scan.failure_counts.items(), key=lambda x: x[1], reverse=True)]
 
-    def _find_slow_tests(self, sessions: List[TestSession]) -> List[str]:
+    def _find_slow_tests(self, scan: _SessionScan) -> List[str]:
         """Identify consistently slow tests while preserving session context."""
-        test_durations = defaultdict(list)
-
-        for session in sessions:
-            # Track durations within session context
-            session_durations = {}
-
-            for test in session.test_results:
-                test_durations[test.nodeid].append(test.duration)
-                session_durations[test.nodeid] = test.duration
-
         # Calculate average durations and find slow tests
+        overall_mean = mean(scan.durations) if scan.durations else 0
         slow_tests = []
-        for test_id, durations in test_durations.items():
-            avg_duration = mean(durations)
+        for test_id, stats in scan.tests.items():
+            durations = stats.durations
             if len(durations) > 1:
-                stdev(durations)
-                if avg_duration > mean(d for dur in test_durations.values() for d in dur):
+                avg_duration = durations.mean
+                if avg_duration > overall_mean:
                     slow_tests.append((test_id, avg_duration))
 
         return [test for test, _ in sorted(slow_tests, key=lambda x: x[1], reverse=True)]
 
-    def _analyze_warning_patterns(self, sessions: List[TestSession]) -> List[str]:
+    def _analyze_warning_patterns(self, scan: _SessionScan) -> List[str]:
         """Analyze warning patterns while preserving session context."""
-        warning_counts = defaultdict(int)
-
-        for session in sessions:
-            # Track warnings within session context
-            session_warnings = set()
-
-            for test in session.test_results:
-                if test.has_warning:
-                    session_warnings.add(test.nodeid)
-                    warning_counts[test.nodeid] += 1
-
         # Return tests with highest warning counts
-        return [test for test, count in sorted(warning_counts.items(), key=lambda x: x[1], reverse=True)]
+        return [test for test, count in sorted(scan.warning_counts.items(), key=lambda x: x[1], reverse=True)]
 
 
 class Analysis:
@@ -2041,6 +1894,7 @@ class Analysis:
         sessions: Optional[list] = None,
         profile_name: Optional[str] = None,
         storage: Optional[BaseStorage] = None,
+        days: Optional[int] = None,
         **kwargs,
     ):
         """Initialize analysis components.
@@ -2049,6 +1903,8 @@ class Analysis:
             sessions: Optional list of sessions to use
             profile_name: Optional profile name to use
             storage: Optional storage instance to use
+            days: Optional number of days of history to load from storage. Tiered
+                  profiles only read their cold tier when this reaches past the hot tier.
             **kwargs: Additional keyword arguments for Analysis
         """
         self._profile_name = profile_name
@@ -2062,13 +1918,24 @@ class Analysis:
 
         if sessions is not None:
             self._sessions = sessions
+        elif days is not None:
+            cutoff = datetime.now(ZoneInfo("UTC")) - timedelta(days=days)
+            in_range = create_after_or_equals_filter(cutoff)
+            self._sessions = [s for s in self.storage.load_sessions(since=cutoff) if in_range(s)]
         else:
             self._sessions = self.storage.load_sessions()
 
         # Initialize analysis components
-        self.sessions = SessionAnalysis(self.storage, self._sessions, self._profile_name)
-        self.tests = TestAnalysis(self.storage, self._sessions, self._profile_name)
-        self.metrics = MetricsAnalysis(self.storage, self._sessions, self._profile_name)
+        self._init_components(self._profile_name)
+
+    def _init_components(self, profile_name: Optional[str]) -> None:
+        """Create the analysis components, sharing a fresh cache of session scans."""
+        self._scan_cache = _ScanCache(self._sessions)
+        self.sessions = SessionAnalysis(self.storage, self._sessions, profile_name)
+        self.tests = TestAnalysis(self.storage, self._sessions, profile_name)
+        self.metrics = MetricsAnalysis(self.storage, self._sessions, profile_name)
+        for component in (self.sessions, self.tests, self.metrics):
+            component._scan_cache = self._scan_cache
 
     def with_profile(self, profile_name: str) -> "Analysis":
         """Set the storage profile for analysis.
@@ -2085,10 +1952,8 @@ class Analysis:
         self._profile_name = profile_name
         self.storage = get_storage_instance(profile_name=profile_name)
 
-        # Update analysis components with new storage
-        self.sessions = SessionAnalysis(self.storage, self._sessions, profile_name)
-        self.tests = TestAnalysis(self.storage, self._sessions, profile_name)
-        self.metrics = MetricsAnalysis(self.storage, self._sessions, profile_name)
+        # Update analysis components with new storage (dropping memoized scans)
+        self._init_components(profile_name)
 
         return self
 
@@ -2125,7 +1990,10 @@ class Analysis:
         """Generate a comprehensive health report for the test suite.
 
         Combines metrics from all analysis components to provide a complete
-        picture of test suite health.
+        picture of test suite health. All components read one scan of the
+        sessions, memoized per ``days`` window until with_profile() (or a new
+        Analysis from with_query()) changes the input; stability_report() and
+        performance_report() reuse the scan of all sessions.
 
         Args:
             days: Optional number of days to analyze. If None, uses all sessions.
@@ -2137,15 +2005,15 @@ class Analysis:
         session_metrics = self.sessions.test_metrics(days)
         trends = self.sessions.detect_trends(days)
 
-        # Get reliability metrics
-        insights = TestInsights(self._sessions)
-        reliability_metrics = insights.test_reliability_metrics()
+        # Get reliability metrics (over all sessions)
+        scan = self._scan_cache.get(days)
+        reliability = reliability_metrics(scan.rerun_groups, scan.all_tests)
 
         return {
             "health_score": health_score,
             "session_metrics": session_metrics,
             "trends": trends,
-            "reliability_metrics": reliability_metrics,
+            "reliability_metrics": reliability,
             "timestamp": datetime.now(ZoneInfo("UTC")),
         }
 
@@ -2296,109 +2164,7 @@ class Analysis:
         if not self._sessions:
             return []
 
-        # Extract all test failures from sessions
-        test_failures = {}
-        session_failures = {}
-
-        # Process each session
-        for session in self._sessions:
-            # Record failures in this session
-            session_id = session.session_id
-            session_failures[session_id] = []
-
-            for test_result in session.test_results:
-                if test_result.outcome.is_failed():
-                    test_id = test_result.nodeid
-
-                    # Initialize test entry if not exists
-                    if test_id not in test_failures:
-                        test_failures[test_id] = set()
-
-                    # Record that this test failed in this session
-                    test_failures[test_id].add(session_id)
-                    session_failures[session_id].append(test_id)
-
-        # Find correlations between tests
-        correlations = {}
-        test_ids = list(test_failures.keys())
-
-        # Skip if not enough tests
-        if len(test_ids) < 2:
-            return []
-
-        # Compare each pair of tests
-        for i in range(len(test_ids)):
-            for j in range(i + 1, len(test_ids)):
-                test_a = test_ids[i]
-                test_b = test_ids[j]
-
-                # Get sessions where each test failed
-                sessions_a = test_failures[test_a]
-                sessions_b = test_failures[test_b]
-
-                # Calculate co-occurrence
-                co_failures = sessions_a.intersection(sessions_b)
-
-                # Skip if not enough co-occurrences
-                if len(co_failures) < 3:
-                    continue
-
-                # Calculate correlation coefficient (Jaccard similarity)
-                correlation = len(co_failures) / len(sessions_a.union(sessions_b))
-
-                # Record if above threshold
-                if correlation >= 0.7:
-                    pair_key = (test_a, test_b)
-                    correlations[pair_key] = {
-                        "correlation": correlation,
-                        "co_failures": len(co_failures),
-                        "tests": [test_a, test_b],
-                    }
-
-        # Build clusters from correlations
-        clusters = []
-        processed_pairs = set()
-
-        # Sort correlations by strength
-        sorted_correlations = sorted(correlations.items(), key=lambda x: x[1]["correlation"], reverse=True)
-
-        # Process each correlation
-        for (test_a, test_b), data in sorted_correlations:
-            # Skip if already in a cluster
-            if (test_a, test_b) in processed_pairs:
-                continue
-
-            # Start new cluster
-            cluster = {
-                "correlation": data["correlation"],
-                "co_failures": data["co_failures"],
-                "tests": [test_a, test_b],
-            }
-            processed_pairs.add((test_a, test_b))
-
-            # Try to expand cluster
-            for (other_a, other_b), other_data in sorted_correlations:
-                # Skip if already processed
-                if (other_a, other_b) in processed_pairs:
-                    continue
-
-                # Check if connected to cluster
-                if other_a in cluster["tests"] or other_b in cluster["tests"]:
-                    # Add the test not in the cluster
-                    new_test = other_b if other_a in cluster["tests"] else other_a
-                    if new_test not in cluster["tests"]:
-                        cluster["tests"].append(new_test)
-
-                    # Mark as processed
-                    processed_pairs.add((other_a, other_b))
-
-                    # Update correlation (use average)
-                    cluster["correlation"] = (cluster["correlation"] + other_data["correlation"]) / 2
-
-            # Add cluster to results
-            clusters.append(cluster)
-
-        return clusters
+        return co_failure_clusters(self._sessions, min_correlation=0.7, min_occurrences=3)
 
     def identify_slowest_tests(self, limit: int = 5) -> List[tuple]:
         """Identify the slowest tests based on average duration.
@@ -2413,12 +2179,13 @@ class Analysis:
             return []
 
         # Track durations per test
-        test_durations = defaultdict(list)
+        test_durations = defaultdict(DDSketch)
 
         for session in self._sessions:
             # Process regular test results
             for test in session.test_results:
-                test_durations[test.nodeid].append(test.duration)
+                if test.duration is not None:
+                    test_durations[test.nodeid].add(test.duration)
 
             # Process rerun groups if available
             if hasattr(session, "rerun_test_groups") and session.rerun_test_groups:
@@ -2430,15 +2197,13 @@ class Analysis:
                         final_test = rerun_group.tests[-1]
                         final_duration = final_test.duration
 
-                        if nodeid not in test_durations:
-                            test_durations[nodeid] = []
-
                         # Override any previous entry for this test in this session
                         # with the final duration from the rerun group
-                        test_durations[nodeid].append(final_duration)
+                        if final_duration is not None:
+                            test_durations[nodeid].add(final_duration)
 
         # Calculate average duration per test
-        avg_durations = [(nodeid, sum(durations) / len(durations)) for nodeid, durations in test_durations.items()]
+        avg_durations = [(nodeid, sketch.mean) for nodeid, sketch in test_durations.items() if sketch.count]
 
         # Sort by duration (descending) and return top N
         return sorted(avg_durations, key=lambda x: x[1], reverse=True)[:limit]
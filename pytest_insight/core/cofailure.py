@@ -0,0 +1,285 @@
+"""Co-failure analysis for pytest-insight.
+
+Finds clusters of tests that tend to fail in the same sessions. Failures are held
+as a sparse session x test matrix: one bitset of sessions per failing test. Pairs
+are scored by Jaccard similarity of their bitsets (co-failures over sessions where
+either failed), computed with bitwise AND and popcount, and only for pairs that
+can reach the thresholds:
+
+- tests failing in fewer than ``min_occurrences`` sessions are dropped first
+- Jaccard similarity is at most min(|A|, |B|) / max(|A|, |B|), so with tests
+  sorted by failure count each test is only paired with tests whose count is
+  within a factor ``1 / min_correlation`` of its own
+
+Related pairs are then grouped into clusters with union-find.
+
+CoFailureStore keeps raw pairwise co-failure counts instead, updated one
+session at a time, for views that read every edge (dependency graphs).
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from pytest_insight.core.indexes import bits_from_positions, popcount
+from pytest_insight.core.models import TestSession
+
+# Sessions with more distinct failing tests than this are failure storms
+DEFAULT_STORM_SIZE = 200
+
+
+class FailureMatrix:
+    """Sparse session x test failure matrix.
+
+    Attributes:
+        tests: Failing test nodeids, in order of first failure
+        bits: Bitset per test of the sessions it failed in (bit = session number)
+        counts: Number of sessions each test failed in
+        session_count: Number of distinct sessions seen
+    """
+
+    def __init__(self):
+        """Initialize an empty matrix."""
+        self.tests: List[str] = []
+        self.bits: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+        self.session_count = 0
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[TestSession]) -> "FailureMatrix":
+        """Build the matrix from test sessions.
+
+        Sessions sharing a session ID count as one session, and a test failing
+        several times in a session (e.g. reruns) counts once.
+        """
+        session_numbers: Dict[str, int] = {}
+        test_sessions: Dict[str, List[int]] = {}
+        for session in sessions:
+            number = session_numbers.setdefault(session.session_id, len(session_numbers))
+            for test_result in session.test_results:
+                if test_result.outcome.is_failed():
+                    numbers = test_sessions.setdefault(test_result.nodeid, [])
+                    if number not in numbers[-1:]:
+                        numbers.append(number)
+
+        matrix = cls()
+        matrix.session_count = len(session_numbers)
+        for nodeid, numbers in test_sessions.items():
+            # Sessions sharing an ID can make the numbers non-monotonic
+            numbers = sorted(set(numbers))
+            matrix.tests.append(nodeid)
+            matrix.bits[nodeid] = bits_from_positions(numbers)
+            matrix.counts[nodeid] = len(numbers)
+        return matrix
+
+    def correlated_pairs(
+        self, min_correlation: float = 0.7, min_occurrences: int = 3
+    ) -> List[Tuple[str, str, float, int]]:
+        """Find pairs of tests that fail together.
+
+        Args:
+            min_correlation: Minimum Jaccard similarity of the pair's failure sessions
+            min_occurrences: Minimum number of sessions both tests failed in
+
+        Returns:
+            (test_a, test_b, correlation, co_failures) tuples, strongest first; ties
+            keep the order in which the tests first failed
+        """
+        order = {nodeid: i for i, nodeid in enumerate(self.tests)}
+        supported = sorted(
+            (nodeid for nodeid in self.tests if self.counts[nodeid] >= min_occurrences),
+            key=lambda nodeid: (self.counts[nodeid], order[nodeid]),
+        )
+        counts = [self.counts[nodeid] for nodeid in supported]
+
+        pairs = []
+        for i, test_a in enumerate(supported):
+            bits_a, count_a = self.bits[test_a], counts[i]
+            # Partners failing much more often cannot reach min_correlation
+            end = len(supported)
+            if min_correlation > 0:
+                end = bisect_right(counts, count_a / min_correlation * (1 + 1e-9), i + 1)
+            for j in range(i + 1, end):
+                test_b = supported[j]
+                co_failures = popcount(bits_a & self.bits[test_b])
+                if co_failures < min_occurrences:
+                    continue
+                correlation = co_failures / (count_a + counts[j] - co_failures)
+                if correlation >= min_correlation:
+                    if order[test_b] < order[test_a]:
+                        pairs.append((test_b, test_a, correlation, co_failures))
+                    else:
+                        pairs.append((test_a, test_b, correlation, co_failures))
+
+        pairs.sort(key=lambda pair: (-pair[2], order[pair[0]], order[pair[1]]))
+        return pairs
+
+
+def cluster_pairs(pairs: List[Tuple[str, str, float, int]]) -> List[Dict[str, Any]]:
+    """Group correlated pairs into clusters of connected tests (union-find).
+
+    Args:
+        pairs: (test_a, test_b, correlation, co_failures) tuples, strongest first
+
+    Returns:
+        Clusters ordered by their strongest pair, each a dict with:
+        - tests: Member nodeids, in the order their pairs were reached
+        - correlation: Running average of the member pairs' correlations, folded
+          strongest first
+        - co_failures: Co-failure count of the strongest pair
+    """
+    parent: Dict[str, str] = {}
+
+    def find(test: str) -> str:
+        root = parent.setdefault(test, test)
+        while root != parent[root]:
+            parent[root] = parent[parent[root]]
+            root = parent[root]
+        return root
+
+    for test_a, test_b, _, _ in pairs:
+        root_a, root_b = find(test_a), find(test_b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    clusters: Dict[str, Dict[str, Any]] = {}
+    members: Dict[str, set] = {}
+    for test_a, test_b, correlation, co_failures in pairs:
+        root = find(test_a)
+        cluster = clusters.get(root)
+        if cluster is None:
+            clusters[root] = {
+                "correlation": correlation,
+                "co_failures": co_failures,
+                "tests": [test_a, test_b],
+            }
+            members[root] = {test_a, test_b}
+            continue
+        for test in (test_a, test_b):
+            if test not in members[root]:
+                members[root].add(test)
+                cluster["tests"].append(test)
+        cluster["correlation"] = (cluster["correlation"] + correlation) / 2
+    return list(clusters.values())
+
+
+def co_failure_clusters(
+    sessions: Iterable[TestSession], min_correlation: float = 0.7, min_occurrences: int = 3
+) -> List[Dict[str, Any]]:
+    """Identify clusters of tests that tend to fail together.
+
+    Args:
+        sessions: Test sessions to analyze
+        min_correlation: Minimum correlation coefficient to consider tests related
+        min_occurrences: Minimum number of co-occurrences to consider
+
+    Returns:
+        List of co-failure clusters with correlation scores (see cluster_pairs)
+    """
+    matrix = FailureMatrix.from_sessions(sessions)
+    if len(matrix.tests) < 2:
+        return []
+    return cluster_pairs(matrix.correlated_pairs(min_correlation, min_occurrences))
+
+
+class CoFailureStore:
+    """Sparse, symmetric co-failure counts, updated incrementally per session.
+
+    Adding a session with k failing tests costs O(k^2) once; reading the graph
+    afterwards costs O(edges). Sessions are identified by session ID, so feeding
+    the same sessions again (e.g. a re-run query) only adds the new ones.
+
+    A failure storm (a session where more than ``storm_size`` distinct tests
+    failed, typically an infrastructure outage) says little about which tests
+    depend on each other and would add up to storm_size^2 / 2 edges. A storm is
+    therefore recorded as one event: it is counted in ``storms`` and in each
+    test's ``storm_failures``, but not in ``counts`` or ``co_failures``.
+
+    Attributes:
+        storm_size: Failing tests above which a session is a storm (None = no cap)
+        counts: Non-storm sessions each test failed in
+        co_failures: Symmetric adjacency: co_failures[a][b] is the number of
+                     non-storm sessions both a and b failed in
+        storms: Number of storm sessions seen
+        storm_failures: Storm sessions each test failed in
+    """
+
+    def __init__(self, storm_size: Optional[int] = DEFAULT_STORM_SIZE):
+        """Initialize an empty store.
+
+        Args:
+            storm_size: Failing tests above which a session is a storm (None = no cap)
+        """
+        self.storm_size = storm_size
+        self.counts: Dict[str, int] = {}
+        self.co_failures: Dict[str, Dict[str, int]] = {}
+        self.storms = 0
+        self.storm_failures: Dict[str, int] = {}
+        self._session_ids: Set[str] = set()
+
+    def __len__(self):
+        """Get number of sessions added."""
+        return len(self._session_ids)
+
+    def __contains__(self, session_id: str) -> bool:
+        """Check whether a session has been added."""
+        return session_id in self._session_ids
+
+    def add_failures(self, session_id: str, nodeids: Iterable[str]) -> bool:
+        """Record the tests that failed in one session.
+
+        Args:
+            session_id: ID of the session
+            nodeids: Failing test nodeids; repeats (e.g. reruns) count once
+
+        Returns:
+            False if the session had already been added (nothing changes)
+        """
+        if session_id in self._session_ids:
+            return False
+        self._session_ids.add(session_id)
+        failed = list(dict.fromkeys(nodeids))
+
+        if self.storm_size is not None and len(failed) > self.storm_size:
+            self.storms += 1
+            for nodeid in failed:
+                self.storm_failures[nodeid] = self.storm_failures.get(nodeid, 0) + 1
+            return True
+
+        counts, co_failures = self.counts, self.co_failures
+        for nodeid in failed:
+            counts[nodeid] = counts.get(nodeid, 0) + 1
+        for i, test1 in enumerate(failed):
+            neighbours1 = co_failures.setdefault(test1, {})
+            for test2 in failed[i + 1 :]:
+                neighbours1[test2] = neighbours1.get(test2, 0) + 1
+                neighbours2 = co_failures.setdefault(test2, {})
+                neighbours2[test1] = neighbours2.get(test1, 0) + 1
+        return True
+
+    def add_session(self, session: TestSession) -> bool:
+        """Record the FAILED tests of a session (see add_failures)."""
+        return self.add_failures(
+            session.session_id,
+            (
+                test.nodeid
+                for test in session.test_results
+                if test.nodeid and str(getattr(test.outcome, "value", test.outcome)).upper() == "FAILED"
+            ),
+        )
+
+    def update(self, sessions: Iterable[TestSession]) -> int:
+        """Add the sessions not added yet.
+
+        Returns:
+            Number of sessions added
+        """
+        return sum(1 for session in sessions if session.session_id not in self and self.add_session(session))
+
+    def edges(self) -> Iterator[Tuple[str, str, int]]:
+        """Iterate (test1, test2, co_failures) once per pair of tests."""
+        seen: Set[str] = set()
+        for test1, neighbours in self.co_failures.items():
+            seen.add(test1)
+            for test2, count in neighbours.items():
+                if test2 not in seen:
+                    yield test1, test2, count
@@ -3,6 +3,7 @@ from typing import Callable, Dict, List, Optional, Tuple
 
 from pytest_insight.core.models import TestOutcome, TestSession
 from pytest_insight.core.query import Query, QueryResult
+from pytest_insight.core.sketches import DurationSketches
 
 
 class ComparisonError(Exception):
@@ -28,6 +29,10 @@ class ComparisonResult:
         missing_tests: Test nodeids present in base but missing in target
         new_tests: Test nodeids present in target but missing in base
         outcome_changes: All outcome changes with (base_outcome, target_outcome)
+        p95_durations: (base p95, target p95) duration of each common test, over all
+                       matching base and target sessions rather than the two compared
+        slower_p95_tests: Common tests whose p95 duration rose past the slower threshold
+        faster_p95_tests: Common tests whose p95 duration fell past the faster threshold
 
     Note:
         Categories are NOT mutually exclusive. A test can belong to multiple categories:
@@ -54,6 +59,9 @@ class ComparisonResult:
     missing_tests: List[str]  # Test nodeids present in base but missing in target
     new_tests: List[str]  # Test nodeids present in target but missing in base
     outcome_changes: Dict[str, Tuple[TestOutcome, TestOutcome]]  # All outcome changes
+    p95_durations: Dict[str, Tuple[float, float]]  # (base p95, target p95) over all matching sessions
+    slower_p95_tests: List[str]  # Test nodeids whose p95 duration grew in target
+    faster_p95_tests: List[str]  # Test nodeids whose p95 duration shrank in target
 
     def __init__(
         self,
@@ -70,6 +78,9 @@ class ComparisonResult:
         missing_tests,
         new_tests,
         outcome_changes,
+        p95_durations=None,
+        slower_p95_tests=None,
+        faster_p95_tests=None,
     ):
         self.base_results = base_results
         self.target_results = target_results
@@ -83,6 +94,9 @@ class ComparisonResult:
         self.missing_tests = missing_tests
         self.new_tests = new_tests
         self.outcome_changes = outcome_changes
+        self.p95_durations = p95_durations if p95_durations is not None else {}
+        self.slower_p95_tests = slower_p95_tests if slower_p95_tests is not None else []
+        self.faster_p95_tests = faster_p95_tests if faster_p95_tests is not None else []
 
     def has_changes(self) -> bool:
         """Check if any differences were found between sessions."""
@@ -151,9 +165,9 @@ class Comparison:
         self._target_profile = target_profile
 
         if sessions is not None:
-            # If sessions are provided, use them for both queries
-            self.base_query = Query(sessions, profile_name=base_profile)
-            self.target_query = Query(sessions, profile_name=target_profile)
+            # If sessions are provided, execute() runs both queries over them
+            self.base_query = Query(profile_name=base_profile)
+            self.target_query = Query(profile_name=target_profile)
             self._sessions = sessions
         else:
             # Otherwise, create queries with appropriate profiles
@@ -387,6 +401,24 @@ class Comparison:
             elif target_test.duration < base_test.duration * self._faster_threshold:
                 faster_tests.append(nodeid)
 
+        # Compare p95 durations over every matching session, with the same thresholds
+        base_sketches = DurationSketches.from_sessions(base_results.sessions)
+        target_sketches = DurationSketches.from_sessions(target_results.sessions)
+        p95_durations = {}
+        slower_p95_tests = []
+        faster_p95_tests = []
+        for nodeid in common_tests:
+            base_sketch = base_sketches.tests.get(nodeid)
+            target_sketch = target_sketches.tests.get(nodeid)
+            if base_sketch is None or target_sketch is None:
+                continue
+            base_p95, target_p95 = base_sketch.quantile(0.95), target_sketch.quantile(0.95)
+            p95_durations[nodeid] = (base_p95, target_p95)
+            if target_p95 > base_p95 * self._slower_threshold:
+                slower_p95_tests.append(nodeid)
+            elif target_p95 < base_p95 * self._faster_threshold:
+                faster_p95_tests.append(nodeid)
+
         return ComparisonResult(
             base_results=base_results,
             target_results=target_results,
@@ -400,6 +432,9 @@ class Comparison:
             missing_tests=missing_tests,
             new_tests=new_tests,
             outcome_changes=outcome_changes,
+            p95_durations=p95_durations,
+            slower_p95_tests=slower_p95_tests,
+            faster_p95_tests=faster_p95_tests,
         )
 
 
@@ -52,7 +52,14 @@ DEFAULT_CONFIG = {
             "enabled": True,
             "min_correlation": 0.5,  # Minimum correlation to consider a dependency
         },
-    }
+    },
+    "query": {
+        "parallel": {
+            "enabled": True,
+            "threshold": 20000,  # Minimum loaded sessions before filtering in a process pool
+            "workers": 0,  # Worker processes; 0 uses os.cpu_count()
+        },
+    },
 }
 
 
@@ -23,7 +23,7 @@ Example usage:
 """
 
 import importlib.metadata
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from pytest_insight.core.analysis import Analysis, analysis, analysis_with_profile
 from pytest_insight.core.comparison import (
@@ -32,7 +32,7 @@ from pytest_insight.core.comparison import (
     comparison_with_profiles,
 )
 from pytest_insight.core.insights import Insights, insights, insights_with_profile
-from pytest_insight.core.query import Query
+from pytest_insight.core.query import Query, QueryResult
 from pytest_insight.core.storage import (
     create_profile,
     get_active_profile,
@@ -86,6 +86,19 @@ class InsightAPI:
             return Query(profile_name=self._profile_name)
         return query()
 
+    def execute_many(self, queries: List[Query]) -> List[QueryResult]:
+        """
+        Execute several queries with one scan of storage.
+
+        Args:
+            queries: Queries built with query(); queries on the same profile share
+                     a single storage read
+
+        Returns:
+            One QueryResult per query, in the same order
+        """
+        return Query.execute_many(queries)
+
     def compare(self) -> Comparison:
         """
         Create a new Comparison instance for comparing test results.
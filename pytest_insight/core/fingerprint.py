@@ -0,0 +1,251 @@
+"""Error fingerprints and near-duplicate clustering for pytest-insight.
+
+The same failure rarely produces byte-identical tracebacks twice: line numbers,
+memory addresses, temporary paths and generated values change between runs.
+fingerprint_error() normalizes those volatile tokens and hashes the error type,
+the normalized message and the shape of the stack (file and function of each
+frame), so repeats of one failure share a fingerprint.
+
+Fingerprints that still differ slightly (e.g. another value in the message) are
+grouped by cluster_fingerprints() with MinHash signatures and locality-sensitive
+hashing (LSH): only fingerprints that share a band of their signature are ever
+compared, so clustering stays near-linear in the number of distinct fingerprints
+instead of comparing every pair.
+"""
+
+import operator
+import random
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+from pytest_insight.core.sketches import hash64
+
+# Volatile tokens, replaced in this order: (markers, pattern, replacement); a
+# pattern only runs on texts containing one of its markers
+_VOLATILE = (
+    (("0x",), re.compile(r"0x[0-9a-fA-F]+"), "0x?"),
+    (("-",), re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<uuid>"),
+    (("-",), re.compile(r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?"), "<time>"),
+    # Directories of absolute and relative paths (keeps the file name)
+    (("/", "\\"), re.compile(r"(?<![\w.~:/\\-])(?:[A-Za-z]:)?(?:[\w.~-]*[/\\])+(?=[\w.-])"), ""),
+    (("",), re.compile(r"\b\d+(?:\.\d+)?\b"), "N"),
+)
+
+# pytest frame lines ("tests/test_api.py:12: in test_login") and Python ones
+# ('File "/src/api.py", line 40, in login')
+_PYTEST_FRAME = re.compile(r"^([\w./\\~-]+\.py):\d+: in (\S+)", re.MULTILINE)
+_PYTHON_FRAME = re.compile(r'^\s*File "([^"]+)", line \d+, in (\S+)', re.MULTILINE)
+
+# Exception lines: "E   ValueError: bad value", "KeyError: 'id'", "api.py:12: TimeoutError"
+_EXCEPTION = re.compile(
+    r"^(?:E\s+|[\w./\\~-]+\.py:\d+: )?((?:[A-Za-z_]\w*\.)*[A-Z]\w*(?:Error|Exception|Exit|Interrupt|Failed|Timeout))"
+    r"(?::\s*(.*))?$"
+)
+
+# Fingerprints (of different clusters) kept per LSH bucket
+BUCKET_SIZE = 8
+
+# Longest pattern text reported for a fingerprint
+MAX_PATTERN_LENGTH = 100
+
+
+class ErrorFingerprint(NamedTuple):
+    """What identifies one kind of failure, independent of volatile details."""
+
+    key: str  # Hash of the other fields
+    error_type: str  # Innermost exception type, or "Unknown Error"
+    message: str  # Normalized exception message (or first line of the output)
+    frames: Tuple[str, ...]  # "file.py:function" of each frame, outermost first
+
+    @property
+    def pattern(self) -> str:
+        """Get a readable "Type: message" summary, truncated to MAX_PATTERN_LENGTH."""
+        pattern = f"{self.error_type}: {self.message}" if self.message else self.error_type
+        if len(pattern) > MAX_PATTERN_LENGTH:
+            pattern = pattern[: MAX_PATTERN_LENGTH - 3] + "..."
+        return pattern
+
+    def tokens(self) -> FrozenSet[str]:
+        """Get the features compared when clustering: type, frames and message word pairs."""
+        words = self.message.split()
+        tokens = {f"type:{self.error_type}"}
+        tokens.update(f"frame:{frame}" for frame in self.frames)
+        tokens.update(f"word:{first} {second}" for first, second in zip(words, words[1:]))
+        if len(words) == 1:
+            tokens.add(f"word:{words[0]}")
+        return frozenset(tokens)
+
+
+def normalize_error(text: str) -> str:
+    """Replace addresses, UUIDs, timestamps, directories and numbers in an error message."""
+    for markers, pattern, replacement in _VOLATILE:
+        if any(marker in text for marker in markers):
+            text = pattern.sub(replacement, text)
+    return text
+
+
+def _file_name(path: str) -> str:
+    """Get the last component of a path."""
+    return path.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+@lru_cache(maxsize=8192)
+def fingerprint_error(text: str) -> Optional[ErrorFingerprint]:
+    """Fingerprint an error message or traceback (None when it is empty).
+
+    Identical texts are fingerprinted once per process.
+    """
+    if not text or not text.strip():
+        return None
+
+    frames = tuple(
+        f"{_file_name(path)}:{function}"
+        for pattern in (_PYTEST_FRAME, _PYTHON_FRAME)
+        for path, function in pattern.findall(text)
+    )
+
+    lines = text.splitlines()
+    error_type, message = "Unknown Error", ""
+    # The last exception line is the innermost error; pytest ends with a bare
+    # "file.py:12: ValueError" after the "E   ValueError: ..." lines
+    for line in reversed(lines):
+        match = _EXCEPTION.match(line.strip())
+        if not match:
+            continue
+        if error_type == "Unknown Error":
+            error_type = match.group(1)
+        if match.group(1) == error_type and match.group(2):
+            message = match.group(2)
+            break
+    if not message:
+        # pytest's "E   assert ..." explanation, else the first line of the output
+        explanations = [line.strip()[1:] for line in lines if line.startswith("E ")]
+        others = [line for line in lines if line.strip() and not line.lstrip().startswith('File "')]
+        message = (explanations or others or [""])[0].strip()
+    message = " ".join(normalize_error(message).split())
+
+    key = "%016x" % hash64("\n".join((error_type, message, "|".join(frames))))
+    return ErrorFingerprint(key, error_type, message, frames)
+
+
+class MinHasher:
+    """MinHash signatures of token sets.
+
+    The Jaccard similarity of two token sets is estimated by the fraction of
+    signature positions where their signatures agree.
+    """
+
+    # Mersenne prime for the permutations (a * h + b) % PRIME over 31-bit hashes
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """Initialize with ``num_perm`` random permutations."""
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.randrange(1, self.PRIME) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, self.PRIME) for _ in range(num_perm)]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """Get the signature of a non-empty token set."""
+        return self.signatures([tokens])[0]
+
+    def signatures(self, token_sets: Iterable[Iterable[str]], chunk_size: int = 1024) -> List[Tuple[int, ...]]:
+        """Get the signatures of non-empty token sets, in batches of ``chunk_size`` sets."""
+        prime = self.PRIME
+        hash_sets = [[hash64(token) % prime for token in tokens] for tokens in token_sets]
+        # Fast minimum over all permutations and sets of a batch using numpy if available
+        try:
+            import numpy as np
+
+            a = np.array(self.a, dtype=np.uint64)[:, None]
+            b = np.array(self.b, dtype=np.uint64)[:, None]
+            signatures = []
+            for start in range(0, len(hash_sets), chunk_size):
+                chunk = hash_sets[start : start + chunk_size]
+                offsets = np.cumsum([0] + [len(hashes) for hashes in chunk[:-1]])
+                values = np.fromiter((h for hashes in chunk for h in hashes), dtype=np.uint64)
+                permuted = (a * values + b) % np.uint64(prime)
+                signatures.extend(map(tuple, np.minimum.reduceat(permuted, offsets, axis=1).T.tolist()))
+            return signatures
+        except ImportError:
+            # Fallback to one permutation at a time if numpy not available
+            return [
+                tuple(min((a * h + b) % prime for h in hashes) for a, b in zip(self.a, self.b)) for hashes in hash_sets
+            ]
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimate the Jaccard similarity of the token sets behind two signatures."""
+        return sum(map(operator.eq, first, second)) / len(first)
+
+
+def cluster_fingerprints(
+    fingerprints: Iterable[ErrorFingerprint], threshold: float = 0.7, bands: int = 16, num_perm: int = 64
+) -> Dict[str, str]:
+    """Group near-duplicate fingerprints of the same error type.
+
+    Signatures are split into ``bands`` bands. A fingerprint is compared with
+    earlier fingerprints that agreed with it on all of a band (up to
+    BUCKET_SIZE of different clusters per band) and joins the cluster of each
+    whose estimated similarity reaches ``threshold``; each fingerprint thus
+    costs at most ``bands * BUCKET_SIZE`` comparisons.
+    With the defaults, pairs at 0.7 similarity share a band with ~99%
+    probability and pairs at 0.3 with ~12%.
+
+    Args:
+        fingerprints: Fingerprints to cluster (repeats are ignored)
+        threshold: Minimum estimated Jaccard similarity of token sets to merge
+        bands: Number of LSH bands (must divide num_perm)
+        num_perm: MinHash signature length
+
+    Returns:
+        Dict mapping each fingerprint key to the key of its cluster, which is
+        the first fingerprint of the cluster in input order
+    """
+    if num_perm % bands:
+        raise ValueError("bands must divide num_perm")
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm)
+
+    order: Dict[str, int] = {}  # Key -> input position
+    parents: Dict[str, str] = {}
+    # Fingerprints of different clusters with each error type, band and band values
+    buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[str]] = {}
+
+    def find(key: str) -> str:
+        while parents[key] != key:
+            parents[key] = parents[parents[key]]
+            key = parents[key]
+        return key
+
+    unique: Dict[str, ErrorFingerprint] = {}
+    for fingerprint in fingerprints:
+        unique.setdefault(fingerprint.key, fingerprint)
+    signatures = dict(zip(unique, hasher.signatures(fingerprint.tokens() for fingerprint in unique.values())))
+
+    for key, fingerprint in unique.items():
+        order[key] = len(order)
+        parents[key] = key
+        signature = signatures[key]
+        # Clusters already compared with this fingerprint (through another band)
+        checked = set()
+        for band in range(bands):
+            bucket = buckets.setdefault((fingerprint.error_type, band, signature[band * rows : (band + 1) * rows]), [])
+            joined = False
+            for other in bucket:
+                other_root = find(other)
+                if other_root in checked:
+                    joined = joined or other_root == find(key)
+                    continue
+                checked.add(other_root)
+                root = find(key)
+                if root != other_root and hasher.similarity(signature, signatures[other]) >= threshold:
+                    # The earlier fingerprint stays the representative
+                    first, second = sorted((root, other_root), key=order.get)
+                    parents[second] = first
+                    joined = True
+            if not joined and len(bucket) < BUCKET_SIZE:
+                bucket.append(key)
+
+    return {key: find(key) for key in order}
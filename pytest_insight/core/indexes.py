@@ -0,0 +1,398 @@
+"""Secondary indexes over stored test sessions.
+
+Indexes are optional, per-profile structures kept next to a storage file. They
+narrow a query to candidate results; the query engine always verifies candidates
+with the exact filter, so an index never changes query results, only their cost.
+"""
+
+import json
+import os
+import tempfile
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+from pytest_insight.core.models import TestSession
+
+# Captured-output fields covered by the text index
+INDEXED_FIELDS = ("longreprtext", "caplog", "capstdout", "capstderr")
+
+# Shortest literal the text index can answer (one trigram)
+MIN_LITERAL_LENGTH = 3
+
+_NO_DOCS: Set[int] = frozenset()
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch(value: Union[datetime, str]) -> float:
+    """Convert a datetime (or ISO 8601 string) to UTC epoch seconds.
+
+    Naive datetimes are taken to be UTC.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        return (value - _NAIVE_EPOCH).total_seconds()
+    return value.timestamp()
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Get the set of 3-character substrings of a string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def file_stamp(paths: Iterable[Path]) -> List[List]:
+    """Describe the on-disk version of a set of files (path, mtime_ns, size).
+
+    Missing files are skipped. The result is JSON-serializable so it can be
+    persisted with an index and compared by later processes.
+    """
+    stamp = []
+    for path in sorted(str(p) for p in paths):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        stamp.append([path, stat.st_mtime_ns, stat.st_size])
+    return stamp
+
+
+class TextIndex:
+    """Trigram inverted index over captured output and tracebacks.
+
+    Every indexed test result is a document identified by its session ID and its
+    position in the session's test_results. For each field in INDEXED_FIELDS the
+    index maps each trigram to the documents containing it, so the documents that
+    can contain a literal are the intersection of the postings of its trigrams.
+    Candidates are a superset of the true matches (trigrams may appear in a
+    different order); callers verify them with the exact substring check.
+
+    Sessions are added incrementally as they are saved. Replacing or removing a
+    session leaves tombstones that are compacted when the index is saved.
+
+    Attributes:
+        path: Optional file the index is persisted to
+        stamp: file_stamp() of the storage files the index reflects, or None when
+               the index is known to be stale
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize an empty index.
+
+        Args:
+            path: Optional file to persist the index to
+        """
+        self.path = Path(path) if path else None
+        self.stamp: Optional[List[List]] = None
+        self._docs: List[Optional[Tuple[str, int]]] = []
+        self._session_docs: Dict[str, List[int]] = {}
+        self._postings: Dict[str, Dict[str, Set[int]]] = {f: {} for f in INDEXED_FIELDS}
+
+    def __len__(self):
+        """Get number of indexed test results."""
+        return sum(len(docs) for docs in self._session_docs.values())
+
+    def add_session(self, session: TestSession) -> None:
+        """Index the test results of a session, replacing any earlier version."""
+        self.remove_session(session.session_id)
+        doc_ids = []
+        for position, test in enumerate(session.test_results):
+            doc = len(self._docs)
+            self._docs.append((session.session_id, position))
+            doc_ids.append(doc)
+            for field_name in INDEXED_FIELDS:
+                text = getattr(test, field_name, "") or ""
+                if len(text) < MIN_LITERAL_LENGTH:
+                    continue
+                postings = self._postings[field_name]
+                for trigram in _trigrams(text):
+                    postings.setdefault(trigram, set()).add(doc)
+        self._session_docs[session.session_id] = doc_ids
+
+    def remove_session(self, session_id: str) -> None:
+        """Drop a session's test results from query answers."""
+        for doc in self._session_docs.pop(session_id, []):
+            self._docs[doc] = None
+
+    def rebuild(self, sessions: Iterable[TestSession], stamp: Optional[List[List]] = None) -> None:
+        """Replace the index contents with the given sessions."""
+        self._docs = []
+        self._session_docs = {}
+        self._postings = {f: {} for f in INDEXED_FIELDS}
+        for session in sessions:
+            self.add_session(session)
+        self.stamp = stamp
+
+    def candidates(self, field_name: str, literal: str) -> Optional[Dict[str, Set[int]]]:
+        """Find test results whose field may contain a literal substring.
+
+        Args:
+            field_name: One of INDEXED_FIELDS
+            literal: Case-sensitive literal to look for
+
+        Returns:
+            Mapping of session ID to candidate test positions, or None if the
+            index cannot answer (unindexed field or literal too short)
+        """
+        if field_name not in self._postings or len(literal) < MIN_LITERAL_LENGTH:
+            return None
+
+        postings = self._postings[field_name]
+        trigram_docs = sorted((postings.get(t, _NO_DOCS) for t in _trigrams(literal)), key=len)
+        docs = set(trigram_docs[0])
+        for other in trigram_docs[1:]:
+            if not docs:
+                break
+            docs &= other
+
+        result: Dict[str, Set[int]] = {}
+        for doc in docs:
+            entry = self._docs[doc]
+            if entry is not None:
+                result.setdefault(entry[0], set()).add(entry[1])
+        return result
+
+    def to_dict(self) -> Dict:
+        """Serialize the index, compacting away removed documents."""
+        remap = {}
+        docs = []
+        for doc, entry in enumerate(self._docs):
+            if entry is not None:
+                remap[doc] = len(docs)
+                docs.append(list(entry))
+        return {
+            "version": self.VERSION,
+            "stamp": self.stamp,
+            "docs": docs,
+            "postings": {
+                field_name: {
+                    trigram: sorted(remap[d] for d in doc_set if d in remap) for trigram, doc_set in postings.items()
+                }
+                for field_name, postings in self._postings.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, path: Optional[Path] = None) -> "TextIndex":
+        """Create an index from its serialized form."""
+        index = cls(path)
+        if data.get("version") != cls.VERSION:
+            return index
+        index._docs = [(entry[0], entry[1]) for entry in data.get("docs", [])]
+        for doc, (session_id, _) in enumerate(index._docs):
+            index._session_docs.setdefault(session_id, []).append(doc)
+        for field_name, postings in data.get("postings", {}).items():
+            if field_name in index._postings:
+                index._postings[field_name] = {trigram: set(doc_ids) for trigram, doc_ids in postings.items()}
+        index.stamp = data.get("stamp")
+        return index
+
+    @classmethod
+    def load(cls, path: Path) -> "TextIndex":
+        """Load a persisted index; a missing or unreadable file gives a stale, empty index."""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls.from_dict(json.load(f), path)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"Warning: Could not read text index {path}, it will be rebuilt: {e}")
+            return cls(path)
+
+    def save(self) -> None:
+        """Atomically persist the index to its path (if any)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
+            os.replace(temp_name, self.path)
+        except Exception:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+
+class TimeIndex:
+    """Session start times sorted as UTC epoch seconds, for bisect range selection.
+
+    Each entry is the position of a session (or raw record) in the list the
+    index was built from. Entries are ordered by start time, ties broken by
+    session ID, so selecting a time range costs O(log n + k) and yields the
+    positions already in time order.
+    """
+
+    __slots__ = ("epochs", "positions")
+
+    def __init__(self, epochs: List[float], positions: List[int]):
+        """Initialize from parallel, time-ordered lists."""
+        self.epochs = epochs
+        self.positions = positions
+
+    def __len__(self):
+        """Get number of indexed sessions."""
+        return len(self.positions)
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[Union[datetime, str], str]]) -> "TimeIndex":
+        """Build an index from (start time, session ID) pairs in storage order.
+
+        Entries whose start time cannot be parsed are left out.
+        """
+        keyed = []
+        for position, (start_time, session_id) in enumerate(entries):
+            try:
+                keyed.append((to_epoch(start_time), session_id, position))
+            except (TypeError, ValueError, AttributeError):
+                continue
+        keyed.sort()
+        return cls([k[0] for k in keyed], [k[2] for k in keyed])
+
+    def select(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        include_start: bool = True,
+        include_end: bool = True,
+    ) -> List[int]:
+        """Get positions of sessions starting within [start, end], in time order.
+
+        Args:
+            start: Optional lower bound (epoch seconds)
+            end: Optional upper bound (epoch seconds)
+            include_start: Whether the lower bound is inclusive
+            include_end: Whether the upper bound is inclusive
+
+        Returns:
+            Positions of matching sessions, oldest first
+        """
+        lo = 0
+        if start is not None:
+            lo = (bisect_left if include_start else bisect_right)(self.epochs, start)
+        hi = len(self.epochs)
+        if end is not None:
+            hi = (bisect_right if include_end else bisect_left)(self.epochs, end)
+        return self.positions[lo:hi] if lo < hi else []
+
+
+def _categorical_keys(session_data: Any) -> List[Hashable]:
+    """Get the BitmapIndex keys of a raw record or TestSession."""
+    if isinstance(session_data, dict):
+        sut_name = session_data.get("sut_name")
+        tags = session_data.get("session_tags") or {}
+    else:
+        sut_name = getattr(session_data, "sut_name", None)
+        tags = getattr(session_data, "session_tags", None) or {}
+    keys: List[Hashable] = [("sut", sut_name)]
+    if isinstance(tags, dict):
+        keys.extend(("tag", key, value) for key, value in tags.items())
+    return keys
+
+
+def bits_from_positions(positions: List[int]) -> int:
+    """Build a bitset with the given (ascending) bit positions set."""
+    if not positions:
+        return 0
+    buffer = bytearray((positions[-1] >> 3) + 1)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+if hasattr(int, "bit_count"):
+    # Python 3.10+: count set bits in C
+    popcount = int.bit_count
+else:
+
+    def popcount(bits: int) -> int:
+        """Count the set bits of a bitset."""
+        return bin(bits).count("1")
+
+
+def bit_positions(bits: int) -> List[int]:
+    """Get the positions of the set bits of a bitset, lowest first."""
+    digits = bin(bits)[:1:-1]
+    positions = []
+    position = digits.find("1")
+    while position >= 0:
+        positions.append(position)
+        position = digits.find("1", position + 1)
+    return positions
+
+
+class BitmapIndex:
+    """Bitsets of session positions keyed by SUT and by session tag value.
+
+    Bit p of a key's bitset is set when the session at position p of the list
+    the index was built from carries that key. Keys are ``("sut", sut_name)``
+    and ``("tag", tag_key, tag_value)``. Session filters that expose
+    ``index_keys()`` (SUT, tag, and OR groups of them) are answered with
+    bitwise OR within a filter and AND across filters, before any session is
+    decoded. Python ints serve as the bitsets, so sparse keys stay small.
+
+    Sessions are appended as they are saved; any other change to the source
+    list requires a rebuild.
+    """
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, bits: Optional[Dict[Hashable, int]] = None, size: int = 0):
+        """Initialize from key bitsets over ``size`` positions."""
+        self.bits: Dict[Hashable, int] = bits if bits is not None else {}
+        self.size = size
+
+    def __len__(self):
+        """Get number of indexed sessions."""
+        return self.size
+
+    @classmethod
+    def build(cls, sessions_data: Iterable[Any]) -> "BitmapIndex":
+        """Build an index from raw records or TestSessions in storage order."""
+        key_positions: Dict[Hashable, List[int]] = {}
+        size = 0
+        for size, session_data in enumerate(sessions_data, 1):
+            for key in _categorical_keys(session_data):
+                try:
+                    key_positions.setdefault(key, []).append(size - 1)
+                except TypeError:
+                    # Unhashable values never equal a filter's (string) value
+                    continue
+        bits = {key: bits_from_positions(p) for key, p in key_positions.items()}
+        return cls(bits, size)
+
+    def add(self, session_data: Any) -> None:
+        """Index one more session, at the next position."""
+        bit = 1 << self.size
+        self.size += 1
+        for key in _categorical_keys(session_data):
+            try:
+                self.bits[key] = self.bits.get(key, 0) | bit
+            except TypeError:
+                continue
+
+    def select(self, key_groups: Iterable[Iterable[Hashable]]) -> int:
+        """Get the bitset of sessions matching every group of keys.
+
+        Args:
+            key_groups: One group per filter; a session matches a group when
+                        it carries any of the group's keys
+
+        Returns:
+            Bitset of matching positions (see bit_positions)
+        """
+        selected = (1 << self.size) - 1
+        for keys in key_groups:
+            matched = 0
+            for key in keys:
+                matched |= self.bits.get(key, 0)
+            selected &= matched
+            if not selected:
+                break
+        return selected
@@ -9,9 +9,11 @@ The API follows a fluent interface design pattern,
 allowing for intuitive method chaining while preserving session context.
 """
 
-from collections import Counter, defaultdict
+import heapq
+from array import array
+from collections import Counter
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import colorama
 from colorama import Fore, Style
@@ -22,9 +24,446 @@ else:
     # This allows tests to mock Analysis directly
     Analysis = None
 
+from pytest_insight.core.cofailure import CoFailureStore
+from pytest_insight.core.fingerprint import ErrorFingerprint, cluster_fingerprints, fingerprint_error
 from pytest_insight.core.models import TestOutcome
+from pytest_insight.core.sketches import DDSketch
 from pytest_insight.core.storage import get_storage_instance
 
+# Fewest shared sessions a correlation is computed over
+_MIN_SHARED_SESSIONS = 3
+
+# Smallest absolute outcome correlation reported by correlation_analysis
+_MIN_CORRELATION = 0.5
+
+# Tests per block of the correlation matrix, bounding memory to a block x T slice
+_CORRELATION_BLOCK = 256
+
+
+def _pearson(n: float, sx: float, sy: float, sxy: float) -> float:
+    """Pearson coefficient of two 0/1 vectors from their sums over n shared sessions."""
+    denominator = (n * sx - sx * sx) * (n * sy - sy * sy)
+    if denominator <= 0:
+        return 0.0  # No variance in at least one test
+    return (n * sxy - sx * sy) / denominator**0.5
+
+
+def _strongest(pairs: List[Tuple[int, int, float]], top_k: Optional[int]) -> List[Tuple[int, int, float]]:
+    """Order (i, j, corr) pairs by strength, ties by position, keeping the top k."""
+
+    def key(pair):
+        return (-abs(pair[2]), pair[0], pair[1])
+
+    if top_k is not None:
+        return heapq.nsmallest(top_k, pairs, key=key)
+    return sorted(pairs, key=key)
+
+
+def _outcome_correlations(
+    test_matrix: Dict[str, Dict[str, list]], test_ids: List[str], top_k: Optional[int]
+) -> List[Tuple[str, str, float]]:
+    """Correlate outcome vectors pair by pair, over the sessions both tests ran in."""
+    runs = [
+        {s: v for s, v in enumerate(test_matrix[nodeid]["outcomes"]) if v is not None} for nodeid in test_ids
+    ]
+    pairs = []
+    for i, runs1 in enumerate(runs):
+        for j in range(i + 1, len(runs)):
+            runs2 = runs[j]
+            shared = runs1.keys() & runs2.keys()
+            if len(shared) < _MIN_SHARED_SESSIONS:
+                continue
+            sx = sum(runs1[s] for s in shared)
+            sy = sum(runs2[s] for s in shared)
+            sxy = sum(runs1[s] * runs2[s] for s in shared)
+            corr = _pearson(len(shared), sx, sy, sxy)
+            if abs(corr) > _MIN_CORRELATION:
+                pairs.append((i, j, corr))
+    return [(test_ids[i], test_ids[j], corr) for i, j, corr in _strongest(pairs, top_k)]
+
+
+def _outcome_correlations_numpy(
+    np, test_matrix: Dict[str, Dict[str, list]], test_ids: List[str], top_k: Optional[int]
+) -> List[Tuple[str, str, float]]:
+    """Correlate all outcome vectors at once with masked matrix products.
+
+    With X the session x test outcomes (0 where a test did not run) and M the
+    mask of runs, the shared-session sums of every pair are M'M (count), X'M
+    and M'X (sums of each side) and X'X (co-passes); outcomes are 0/1, so the
+    sums of squares equal the sums. Rows are processed in blocks of tests.
+    """
+    if len(test_ids) < 2:
+        return []
+    outcomes = np.array([test_matrix[nodeid]["outcomes"] for nodeid in test_ids], dtype=float).T
+    mask = ~np.isnan(outcomes)
+    values = np.where(mask, outcomes, 0.0)
+    mask = mask.astype(float)
+
+    found_i, found_j, found_corr = [], [], []
+    columns = np.arange(len(test_ids))
+    for start in range(0, len(test_ids) - 1, _CORRELATION_BLOCK):
+        stop = min(start + _CORRELATION_BLOCK, len(test_ids))
+        block_values, block_mask = values[:, start:stop], mask[:, start:stop]
+        n = block_mask.T @ mask
+        sx = block_values.T @ mask
+        sy = block_mask.T @ values
+        sxy = block_values.T @ values
+        denominator = (n * sx - sx * sx) * (n * sy - sy * sy)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.where(denominator > 0, (n * sxy - sx * sy) / np.sqrt(denominator), 0.0)
+        keep = (n >= _MIN_SHARED_SESSIONS) & (np.abs(corr) > _MIN_CORRELATION)
+        keep &= columns[None, :] > columns[start:stop, None]
+        rows, cols = np.nonzero(keep)
+        block_corr = corr[rows, cols]
+        if top_k is not None and len(block_corr) > top_k:
+            best = np.argpartition(-np.abs(block_corr), top_k - 1)[:top_k]
+            rows, cols, block_corr = rows[best], cols[best], block_corr[best]
+        found_i.append(rows + start)
+        found_j.append(cols)
+        found_corr.append(block_corr)
+
+    pairs = list(
+        zip(
+            np.concatenate(found_i).tolist(),
+            np.concatenate(found_j).tolist(),
+            np.concatenate(found_corr).tolist(),
+        )
+    )
+    return [(test_ids[i], test_ids[j], corr) for i, j, corr in _strongest(pairs, top_k)]
+
+
+# Fewest failures of a test checked for seasonal peaks
+_MIN_SEASONAL_FAILURES = 3
+
+# A peak hour has more than this multiple of the test's average failures per hour
+# (and at least 2); likewise for peak days
+_PEAK_HOUR_FACTOR = 2
+_PEAK_DAY_FACTOR = 1.5
+
+# (test code, total failures, hour distribution, day distribution, peak hours, peak days)
+_SeasonalPeaks = Tuple[int, int, List[int], List[int], List[Tuple[int, int, float]], List[Tuple[int, int, float]]]
+
+
+def _peaks(distribution: List[int], total: int, factor: float) -> List[Tuple[int, int, float]]:
+    """Get (bin, count, share) of each bin above ``factor`` times the average count."""
+    average = total / len(distribution)
+    return [
+        (i, count, count / total) for i, count in enumerate(distribution) if count > factor * average and count >= 2
+    ]
+
+
+def _seasonal_peaks(codes: array, week_hours: array, test_count: int) -> List[_SeasonalPeaks]:
+    """Histogram failure events by hour of day and day of week, one event at a time.
+
+    Args:
+        codes: Test code of each failure event
+        week_hours: Hour of the week of each event (see _TestIndex.failure_events)
+        test_count: Number of test codes
+
+    Returns:
+        Tests with peaks, most failures first (ties in code order)
+    """
+    hour_distributions = [[0] * 24 for _ in range(test_count)]
+    day_distributions = [[0] * 7 for _ in range(test_count)]
+    totals = [0] * test_count
+    for code, week_hour in zip(codes, week_hours):
+        day, hour = divmod(week_hour, 24)
+        hour_distributions[code][hour] += 1
+        day_distributions[code][day] += 1
+        totals[code] += 1
+
+    found = []
+    for code, total in enumerate(totals):
+        if total < _MIN_SEASONAL_FAILURES:
+            continue
+        peak_hours = _peaks(hour_distributions[code], total, _PEAK_HOUR_FACTOR)
+        peak_days = _peaks(day_distributions[code], total, _PEAK_DAY_FACTOR)
+        if peak_hours or peak_days:
+            found.append((code, total, hour_distributions[code], day_distributions[code], peak_hours, peak_days))
+    found.sort(key=lambda peaks: peaks[1], reverse=True)
+    return found
+
+
+def _seasonal_peaks_numpy(np, codes: array, week_hours: array, test_count: int) -> List[_SeasonalPeaks]:
+    """Histogram all failure events at once and find peaks with array comparisons.
+
+    One np.bincount over the combined keys code * 168 + hour of the week counts
+    every test's failures per weekday and hour; the 24 hour-of-day and 7
+    weekday bins of each test are its sums over the other axis. Only the rows
+    of tests with peaks are converted back to Python lists.
+    """
+    codes = np.frombuffer(codes, dtype=np.int64)
+    week_hours = np.frombuffer(week_hours, dtype=np.uint8)
+    by_week_hour = np.bincount(codes * 168 + week_hours, minlength=test_count * 168).reshape(test_count, 7, 24)
+    hour_distributions = by_week_hour.sum(axis=1)
+    day_distributions = by_week_hour.sum(axis=2)
+    totals = day_distributions.sum(axis=1)
+
+    enough = (totals >= _MIN_SEASONAL_FAILURES)[:, None]
+    hour_peaks = enough & (hour_distributions >= 2)
+    hour_peaks &= hour_distributions > _PEAK_HOUR_FACTOR * (totals / 24)[:, None]
+    day_peaks = enough & (day_distributions >= 2)
+    day_peaks &= day_distributions > _PEAK_DAY_FACTOR * (totals / 7)[:, None]
+
+    selected = np.flatnonzero(hour_peaks.any(axis=1) | day_peaks.any(axis=1))
+    selected = selected[np.argsort(-totals[selected], kind="stable")]
+
+    found = []
+    for code, total, hour_row, day_row, hour_mask, day_mask in zip(
+        selected.tolist(),
+        totals[selected].tolist(),
+        hour_distributions[selected].tolist(),
+        day_distributions[selected].tolist(),
+        hour_peaks[selected].tolist(),
+        day_peaks[selected].tolist(),
+    ):
+        peak_hours = [(i, count, count / total) for i, (count, peak) in enumerate(zip(hour_row, hour_mask)) if peak]
+        peak_days = [(i, count, count / total) for i, (count, peak) in enumerate(zip(day_row, day_mask)) if peak]
+        found.append((code, total, hour_row, day_row, peak_hours, peak_days))
+    return found
+
+
+# Outcome names (see _outcome_name) counted as failures
+_FAILED_NAMES = ("failed", "error", "FAILED", "ERROR")
+
+
+def _outcome_name(outcome: Any) -> str:
+    """Name of an outcome, enum or string (strings are upper-cased)."""
+    return outcome.value if hasattr(outcome, "value") else str(outcome).upper()
+
+
+def _name_parts(nodeid: Optional[str]) -> Tuple[str, Optional[str]]:
+    """Module and test name prefix of a nodeid (format: path/to/module.py::test_name).
+
+    The prefix is the first two words of a test name with more than two
+    underscore-separated words (``test_login_`` for ``test_login_fails``).
+    """
+    parts = (nodeid or "").split("::")
+    if len(parts) > 1:
+        words = parts[1].split("_")
+        if len(words) > 2:
+            return parts[0], "_".join(words[:2]) + "_"
+    return parts[0], None
+
+
+class _TestRecord:
+    """Everything a test did across the indexed sessions, in session order."""
+
+    __slots__ = ("positions", "outcomes", "start_times", "durations", "days")
+
+    def __init__(self):
+        """Initialize an empty record."""
+        self.positions: List[int] = []  # Position of the session of each run
+        self.outcomes: List[Any] = []
+        self.start_times: List[Any] = []
+        self.durations: List[float] = []
+        self.days: Dict[Any, Counter] = {}  # Session date -> outcome name counts
+
+
+class _TestIndex:
+    """Per-test statistics of a session list, gathered in one pass.
+
+    Holds one _TestRecord per nodeid (in order of first run) plus the totals
+    that TestInsights reports over all results. Sessions are appended in
+    order; any other change to the source list requires a rebuild.
+    """
+
+    def __init__(self, source_id: int):
+        """Initialize an empty index for the list with the given id()."""
+        self.source_id = source_id
+        self.size = 0
+        self.tests: Dict[str, _TestRecord] = {}
+        self.result_count = 0
+        self.passed_count = 0
+        self.outcome_counts: Counter = Counter()
+        self.durations: List[Tuple[str, float]] = []
+        self.total_duration = 0
+        self.modules: Counter = Counter()
+        self.prefixes: Counter = Counter()
+        self.days: set = set()
+        self.rerun_groups: List[Tuple[str, Any]] = []  # (session ID, rerun group)
+        # (nodeid, error message, session ID, start time) per failed run
+        self.failures: List[Tuple[str, str, str, Any]] = []
+        self._fingerprints: List[Optional[ErrorFingerprint]] = []  # Per failure, filled by fingerprints()
+        # Failure events with a start time as columns, filled by failure_events()
+        self._event_codes = array("q")
+        self._event_week_hours = array("B")
+        self._event_tests: List[str] = []  # Nodeid of each test code
+        self._test_codes: Dict[str, int] = {}
+        self._events_seen = 0  # Failures turned into events so far
+        self._outcome_names: Dict[Any, str] = {}
+        self._name_parts: Dict[Any, Tuple[str, Optional[str]]] = {}
+
+    def add_session(self, session) -> None:
+        """Fold one session's results into the index."""
+        position = self.size
+        self.size += 1
+        start = getattr(session, "session_start_time", None)
+        day = start.date() if start else None
+        if day is not None:
+            self.days.add(day)
+        session_id = getattr(session, "session_id", "unknown")
+        if getattr(session, "rerun_test_groups", None):
+            self.rerun_groups.extend((session.session_id, group) for group in session.rerun_test_groups)
+
+        results = session.test_results
+        self.result_count += len(results)
+        tests, names, name_parts = self.tests, self._outcome_names, self._name_parts
+        outcome_counts, modules, prefixes = self.outcome_counts, self.modules, self.prefixes
+        durations, failures = self.durations, self.failures
+        passed_count, total_duration = self.passed_count, self.total_duration
+        for test_result in results:
+            nodeid = getattr(test_result, "nodeid", None)
+            outcome = getattr(test_result, "outcome", None)
+            duration = test_result.duration
+            name = names.get(outcome)
+            if name is None:
+                name = names[outcome] = _outcome_name(outcome)
+            if outcome == "passed":
+                passed_count += 1
+            outcome_counts[outcome] += 1
+            durations.append((nodeid, duration))
+            total_duration += duration
+
+            parts = name_parts.get(nodeid)
+            if parts is None:
+                parts = name_parts[nodeid] = _name_parts(nodeid)
+            modules[parts[0]] += 1
+            if parts[1] is not None:
+                prefixes[parts[1]] += 1
+
+            if not nodeid:
+                continue
+            record = tests.get(nodeid)
+            if record is None:
+                record = tests[nodeid] = _TestRecord()
+            start_time = getattr(test_result, "start_time", None)
+            record.positions.append(position)
+            record.outcomes.append(outcome)
+            record.start_times.append(start_time)
+            record.durations.append(duration)
+            if day is not None:
+                counts = record.days.get(day)
+                if counts is None:
+                    counts = record.days[day] = Counter()
+                counts[name] += 1
+            if name in _FAILED_NAMES:
+                failures.append((nodeid, getattr(test_result, "longreprtext", ""), session_id, start_time))
+        self.passed_count, self.total_duration = passed_count, total_duration
+
+    def failure_events(self) -> Tuple[array, array, List[str]]:
+        """Get the failures with a start time as columns of 64-bit integers.
+
+        Each event is a test code (numbered in order of first failure) and the
+        hour of the week it started in, weekday() * 24 + hour (Monday 0:00 is
+        0), in the start time's own clock. Failures added since the last call
+        are appended.
+
+        Returns:
+            Test codes (signed), hours of the week (unsigned bytes), and the
+            nodeid of each test code
+        """
+        codes, week_hours = self._event_codes, self._event_week_hours
+        tests, test_codes = self._event_tests, self._test_codes
+        for nodeid, _, _, start_time in self.failures[self._events_seen :]:
+            if not isinstance(start_time, datetime):
+                continue
+            code = test_codes.get(nodeid)
+            if code is None:
+                code = test_codes[nodeid] = len(tests)
+                tests.append(nodeid)
+            codes.append(code)
+            week_hours.append(start_time.weekday() * 24 + start_time.hour)
+        self._events_seen = len(self.failures)
+        return codes, week_hours, tests
+
+    def fingerprints(self) -> List[Optional[ErrorFingerprint]]:
+        """Get the error fingerprint of each failure (None without a message).
+
+        Failures added since the last call are fingerprinted; earlier ones keep
+        their fingerprints.
+        """
+        fingerprints = self._fingerprints
+        for _, error_msg, _, _ in self.failures[len(fingerprints) :]:
+            fingerprints.append(fingerprint_error(error_msg) if isinstance(error_msg, str) else None)
+        return fingerprints
+
+
+def _duration_sketch(durations: Iterable[Optional[float]]) -> DDSketch:
+    """Sketch a test's durations, skipping None."""
+    sketch = DDSketch()
+    for duration in durations:
+        if duration is not None:
+            sketch.add(duration)
+    return sketch
+
+
+def reliability_metrics(rerun_groups: Iterable[Tuple[str, Any]], total_tests: int) -> Dict[str, Any]:
+    """Calculate test reliability metrics from rerun groups.
+
+    Args:
+        rerun_groups: (session ID, RerunTestGroup) pairs, in session order
+        total_tests: Number of test results in the sessions
+
+    Returns:
+        Dict in the form of TestInsights.test_reliability_metrics
+    """
+    unstable_tests = {}
+    recovered_tests = 0
+    total_reruns = 0
+
+    for session_id, rerun_group in rerun_groups:
+        total_reruns += 1
+        nodeid = rerun_group.nodeid
+
+        if rerun_group.final_outcome == TestOutcome.PASSED:
+            recovered_tests += 1
+
+        if nodeid not in unstable_tests:
+            unstable_tests[nodeid] = {
+                "reruns": 0,
+                "sessions": set(),
+                "final_outcomes": {},
+            }
+
+        unstable_tests[nodeid]["reruns"] += len(rerun_group.tests) - 1
+        unstable_tests[nodeid]["sessions"].add(session_id)
+
+        # Track final outcomes
+        outcome = rerun_group.final_outcome.value
+        unstable_tests[nodeid]["final_outcomes"][outcome] = (
+            unstable_tests[nodeid]["final_outcomes"].get(outcome, 0) + 1
+        )
+
+    # Calculate recovery rate
+    rerun_recovery_rate = (recovered_tests / total_reruns * 100) if total_reruns > 0 else 100
+
+    # Calculate reliability index (100% minus percentage of unstable tests)
+    reliability_index = 100 - (len(unstable_tests) / total_tests * 100) if total_tests > 0 else 100
+
+    # Calculate health score penalty (1 point for each percent of tests that required reruns)
+    health_score_penalty = (len(unstable_tests) / total_tests * 100) if total_tests > 0 else 0
+
+    # Convert sets to lists for serialization
+    for nodeid, data in unstable_tests.items():
+        data["sessions"] = list(data["sessions"])  # Convert set to list for serialization
+
+    # Sort by number of reruns
+    most_unstable = sorted(
+        [(nodeid, data) for nodeid, data in unstable_tests.items()],
+        key=lambda x: x[1]["reruns"],
+        reverse=True,
+    )
+
+    return {
+        "reliability_index": reliability_index,
+        "unstable_tests": unstable_tests,
+        "rerun_recovery_rate": rerun_recovery_rate,
+        "total_unstable": len(unstable_tests),
+        "health_score_penalty": health_score_penalty,
+        "most_unstable": most_unstable,
+    }
+
 
 class TestInsights:
     """Test-level insights and analytics.
@@ -39,6 +478,29 @@ class TestInsights:
             sessions: List of test sessions to analyze
         """
         self._sessions = sessions
+        self._co_failure_store: Optional[CoFailureStore] = None
+        self._index: Optional[_TestIndex] = None
+
+    def _co_failures(self) -> CoFailureStore:
+        """Get co-failure counts for the sessions, adding only sessions not yet counted."""
+        if self._co_failure_store is None:
+            self._co_failure_store = CoFailureStore()
+        self._co_failure_store.update(self._sessions)
+        return self._co_failure_store
+
+    def _test_index(self) -> _TestIndex:
+        """Get per-test statistics for the sessions, built in one pass on first use.
+
+        Sessions appended to the list since the last call are added; a different
+        or shorter list is indexed from scratch.
+        """
+        sessions = self._sessions
+        index = self._index
+        if index is None or index.source_id != id(sessions) or index.size > len(sessions):
+            index = self._index = _TestIndex(id(sessions))
+        for session in sessions[index.size :]:
+            index.add_session(session)
+        return index
 
     def outcome_distribution(self) -> Dict[str, Any]:
         """Analyze test outcome distribution across all sessions.
@@ -49,13 +511,9 @@ class TestInsights:
             - outcomes: Dict mapping outcomes to counts and percentages
             - most_common: List of most common outcomes
         """
-        outcome_counts = Counter()
-        total_tests = 0
-
-        for session in self._sessions:
-            for test in session.test_results:
-                outcome_counts[test.outcome] += 1
-                total_tests += 1
+        index = self._test_index()
+        outcome_counts = index.outcome_counts
+        total_tests = index.result_count
 
         # Calculate percentages
         outcomes = {}
@@ -82,20 +540,18 @@ class TestInsights:
         """
         reliability_tests = {}
 
-        for session in self._sessions:
-            if hasattr(session, "rerun_test_groups") and session.rerun_test_groups:
-                for rerun_group in session.rerun_test_groups:
-                    nodeid = rerun_group.nodeid
-                    if rerun_group.final_outcome == TestOutcome.PASSED:
-                        if nodeid not in reliability_tests:
-                            reliability_tests[nodeid] = {
-                                "reruns": 0,
-                                "sessions": set(),
-                                "final_outcomes": {},
-                            }
-                        reliability_tests[nodeid]["reruns"] += 1
-                        reliability_tests[nodeid]["sessions"].add(session.session_id)
-                        reliability_tests[nodeid]["final_outcomes"][session.session_id] = rerun_group.final_outcome
+        for session_id, rerun_group in self._test_index().rerun_groups:
+            nodeid = rerun_group.nodeid
+            if rerun_group.final_outcome == TestOutcome.PASSED:
+                if nodeid not in reliability_tests:
+                    reliability_tests[nodeid] = {
+                        "reruns": 0,
+                        "sessions": set(),
+                        "final_outcomes": {},
+                    }
+                reliability_tests[nodeid]["reruns"] += 1
+                reliability_tests[nodeid]["sessions"].add(session_id)
+                reliability_tests[nodeid]["final_outcomes"][session_id] = rerun_group.final_outcome
 
         # Calculate pass rate for each test
         for nodeid, data in reliability_tests.items():
@@ -127,69 +583,8 @@ class TestInsights:
             - total_unstable: Total number of tests requiring reruns
             - health_score_penalty: Penalty to apply to health score based on test instability
         """
-        unstable_tests = {}
-        recovered_tests = 0
-        total_reruns = 0
-
-        for session in self._sessions:
-            if hasattr(session, "rerun_test_groups") and session.rerun_test_groups:
-                for rerun_group in session.rerun_test_groups:
-                    total_reruns += 1
-                    nodeid = rerun_group.nodeid
-
-                    if rerun_group.final_outcome == TestOutcome.PASSED:
-                        recovered_tests += 1
-
-                    if nodeid not in unstable_tests:
-                        unstable_tests[nodeid] = {
-                            "reruns": 0,
-                            "sessions": set(),
-                            "final_outcomes": {},
-                        }
-
-                    unstable_tests[nodeid]["reruns"] += len(rerun_group.tests) - 1
-                    unstable_tests[nodeid]["sessions"].add(session.session_id)
-
-                    # Track final outcomes
-                    outcome = rerun_group.final_outcome.value
-                    unstable_tests[nodeid]["final_outcomes"][outcome] = (
-                        unstable_tests[nodeid]["final_outcomes"].get(outcome, 0) + 1
-                    )
-
-        # Calculate total tests
-        total_tests = 0
-        for session in self._sessions:
-            if hasattr(session, "test_results"):
-                total_tests += len(session.test_results)
-
-        # Calculate recovery rate
-        rerun_recovery_rate = (recovered_tests / total_reruns * 100) if total_reruns > 0 else 100
-
-        # Calculate reliability index (100% minus percentage of unstable tests)
-        reliability_index = 100 - (len(unstable_tests) / total_tests * 100) if total_tests > 0 else 100
-
-        # Calculate health score penalty (1 point for each percent of tests that required reruns)
-        health_score_penalty = (len(unstable_tests) / total_tests * 100) if total_tests > 0 else 0
-
-        # Convert sets to lists for serialization
-        for nodeid, data in unstable_tests.items():
-            data["sessions"] = list(data["sessions"])  # Convert set to list for serialization
-
-        # Sort by number of reruns
-        most_unstable = sorted(
-            [(nodeid, data) for nodeid, data in unstable_tests.items()],
-            key=lambda x: x[1]["reruns"],
-            reverse=True,
-        )
-
-        return {
-            "reliability_index": reliability_index,
-            "unstable_tests": unstable_tests,
-            "rerun_recovery_rate": rerun_recovery_rate,
-            "total_unstable": len(unstable_tests),
-            "health_score_penalty": health_score_penalty,
-            "most_unstable": most_unstable,
-        }
+        index = self._test_index()
+        return reliability_metrics(index.rerun_groups, index.result_count)
 
     def slowest_tests(self, limit: int = 10) -> Dict[str, Any]:
         """Identify the slowest tests across all sessions.
@@ -200,25 +595,24 @@ class TestInsights:
         Returns:
             Dict containing:
             - slowest_tests: List of (nodeid, duration) tuples
+            - percentiles: p50, p95 and p99 durations over all runs of each of those tests
             - avg_duration: Average test duration
             - total_duration: Total test duration
         """
-        test_durations = []
-        total_duration = 0
-        test_count = 0
-
-        for session in self._sessions:
-            for test in session.test_results:
-                test_durations.append((test.nodeid, test.duration))
-                total_duration += test.duration
-                test_count += 1
-
-        # Sort by duration
-        sorted_durations = sorted(test_durations, key=lambda x: x[1], reverse=True)
+        index = self._test_index()
+        total_duration = index.total_duration
+        test_count = index.result_count
         avg_duration = total_duration / test_count if test_count > 0 else 0
 
+        # Same order as sorting by duration, descending, and slicing
+        slowest = heapq.nlargest(limit, index.durations, key=lambda x: x[1])
         return {
-            "slowest_tests": sorted_durations[:limit],
+            "slowest_tests": slowest,
+            "percentiles": {
+                nodeid: _duration_sketch(index.tests[nodeid].durations).percentiles()
+                for nodeid, _ in slowest
+                if nodeid in index.tests
+            },
             "avg_duration": avg_duration,
             "total_duration": total_duration,
         }
@@ -233,24 +627,9 @@ class TestInsights:
             - top_modules: List of most common modules
             - top_prefixes: List of most common prefixes
         """
-        modules = Counter()
-        test_prefixes = Counter()
-
-        for session in self._sessions:
-            for test in session.test_results:
-                # Extract module from nodeid (format: path/to/module.py::test_name)
-                parts = test.nodeid.split("::")
-                if len(parts) > 0:
-                    module = parts[0]
-                    modules[module] += 1
-
-                # Extract test name and prefix
-                if len(parts) > 1:
-                    test_name = parts[1]
-                    words = test_name.split("_")
-                    if len(words) > 2:
-                        prefix = "_".join(words[:2]) + "_"
-                        test_prefixes[prefix] += 1
+        index = self._test_index()
+        modules = index.modules
+        test_prefixes = index.prefixes
 
         return {
             "modules": dict(modules),
@@ -285,16 +664,10 @@ class TestInsights:
                 "error": "Insufficient data for timeline analysis. Need data from multiple sessions.",
             }
 
-        # Group sessions by date
-        date_sessions = {}
-        for session in sessions:
-            session_date = session.session_start_time.date()
-            if session_date not in date_sessions:
-                date_sessions[session_date] = []
-            date_sessions[session_date].append(session)
+        index = self._test_index()
 
         # Sort dates chronologically
-        all_dates = sorted(date_sessions.keys())
+        all_dates = sorted(index.days)
 
         # Limit to most recent days if specified
         if days and days > 0:
@@ -310,59 +683,29 @@ class TestInsights:
                 "error": "Insufficient data for timeline analysis. Need data from multiple dates.",
             }
 
-        # Track stability metrics over time for the most frequently run tests
-        test_run_counts = {}
-        for session in sessions:
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                if nodeid:
-                    if nodeid not in test_run_counts:
-                        test_run_counts[nodeid] = 0
-                    test_run_counts[nodeid] += 1
-
         # Get the top N most frequently run tests
-        top_tests = sorted(test_run_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        top_tests = sorted(index.tests.items(), key=lambda x: len(x[1].outcomes), reverse=True)[:limit]
 
         # Calculate stability for each test on each date
         test_stability_timeline = {}
-        for nodeid, _ in top_tests:
+        for nodeid, record in top_tests:
             test_stability_timeline[nodeid] = {}
             for date in sorted_dates:
-                # Get all results for this test on this date
-                date_results = []
-                for session in date_sessions[date]:
-                    for test_result in session.test_results:
-                        if getattr(test_result, "nodeid", None) == nodeid:
-                            outcome = getattr(test_result, "outcome", None)
-                            # Handle both string and enum outcomes
-                            if hasattr(outcome, "value"):
-                                # It's an enum
-                                result = outcome.value
-                            else:
-                                # It's a string
-                                result = str(outcome).upper()
-                            date_results.append(result)
-
-                # Calculate stability metrics if we have results
-                if date_results:
-                    # Count outcomes
-                    outcome_counts = {}
-                    for result in date_results:
-                        if result not in outcome_counts:
-                            outcome_counts[result] = 0
-                        outcome_counts[result] += 1
+                # Outcome counts (enum value or upper-cased string) for this test on this date
+                date_counts = record.days.get(date)
+                if date_counts:
+                    total_runs = sum(date_counts.values())
 
                     # Calculate stability score (percentage of consistent results)
-                    if date_results:
-                        most_common_count = max(outcome_counts.values())
-                        stability_score = most_common_count / len(date_results)
-
-                        # Store metrics
-                        test_stability_timeline[nodeid][date] = {
-                            "total_runs": len(date_results),
-                            "outcome_counts": outcome_counts,
-                            "stability_score": stability_score,
-                        }
+                    most_common_count = max(date_counts.values())
+                    stability_score = most_common_count / total_runs
+
+                    # Store metrics
+                    test_stability_timeline[nodeid][date] = {
+                        "total_runs": total_runs,
+                        "outcome_counts": dict(date_counts),
+                        "stability_score": stability_score,
+                    }
 
         # Calculate trends for each test
         trends = {}
@@ -417,9 +760,16 @@ class TestInsights:
         This helps identify common failure modes and potentially unstable tests that
         fail with multiple different error patterns.
 
+        Each failure's message is fingerprinted once (see fingerprint_error):
+        volatile tokens such as line numbers, addresses and temporary paths are
+        normalized away, and the error type, message and stack shape are hashed.
+        Near-duplicate fingerprints of the same error type are then merged into
+        one pattern with MinHash LSH (see cluster_fingerprints).
+
         Returns:
             Dict containing:
-            - patterns: List of dicts with pattern, count, and affected_tests
+            - patterns: List of dicts with pattern, count, affected_tests and
+              fingerprints (number of distinct fingerprints merged into the pattern)
             - multi_error_tests: List of tests with multiple error patterns
             - failure_details: Detailed information about each test failure
         """
@@ -427,125 +777,63 @@ class TestInsights:
         if not sessions:
             return {"patterns": [], "multi_error_tests": [], "failure_details": []}
 
-        # Track error patterns and their occurrences
-        error_patterns = {}  # Maps patterns to lists of affected tests
-        error_counts = {}  # Maps patterns to occurrence counts
-        test_to_error_map = {}  # Maps tests to their error patterns
-        failure_details = []  # Detailed information about each failure
+        index = self._test_index()
+        fingerprints = index.fingerprints()
+        clusters = cluster_fingerprints(fingerprint for fingerprint in fingerprints if fingerprint is not None)
 
-        # Common Python exceptions to look for
-        exception_types = [
-            "AssertionError",
-            "ValueError",
-            "TypeError",
-            "KeyError",
-            "IndexError",
-            "AttributeError",
-            "ImportError",
-            "RuntimeError",
-            "NameError",
-            "SyntaxError",
-            "FileNotFoundError",
-            "ZeroDivisionError",
-            "PermissionError",
-            "OSError",
-            "IOError",
-        ]
+        # Per cluster: pattern text, failure count, affected tests and member fingerprints
+        patterns: Dict[str, Dict[str, Any]] = {}
+        test_to_error_map: Dict[str, List[str]] = {}  # Maps tests to their error patterns
+        failure_details = []  # Detailed information about each failure
 
-        # Analyze each session for test failures
-        for session in sessions:
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                outcome = getattr(test_result, "outcome", None)
-
-                # Check if the test failed
-                is_failed = False
-                if hasattr(outcome, "value"):
-                    is_failed = outcome.value in ["failed", "error", "FAILED", "ERROR"]
-                else:
-                    is_failed = str(outcome).upper() in ["FAILED", "ERROR"]
+        # Analyze each test failure, in session order
+        for (nodeid, error_msg, session_id, _), fingerprint in zip(index.failures, fingerprints):
+            # Store failure details for debugging
+            failure_details.append(
+                {
+                    "nodeid": nodeid,
+                    "error_msg": error_msg,
+                    "session_id": session_id,
+                    "fingerprint": fingerprint.key if fingerprint else None,
+                }
+            )
+            if fingerprint is None:
+                continue
 
-                if is_failed and nodeid:
-                    # Get the error message
-                    error_msg = getattr(test_result, "longreprtext", "")
+            cluster = patterns.get(clusters[fingerprint.key])
+            if cluster is None:
+                # The first fingerprint of a cluster names its pattern
+                cluster = patterns[clusters[fingerprint.key]] = {
+                    "pattern": fingerprint.pattern,
+                    "count": 0,
+                    "affected_tests": {},
+                    "fingerprints": set(),
+                }
+            cluster["count"] += 1
+            cluster["affected_tests"][nodeid] = None
+            cluster["fingerprints"].add(fingerprint.key)
 
-                    # Store failure details for debugging
-                    failure_details.append(
-                        {
-                            "nodeid": nodeid,
-                            "error_msg": error_msg,
-                            "session_id": getattr(session, "session_id", "unknown"),
-                        }
-                    )
+            # Map tests to their error patterns
+            test_patterns = test_to_error_map.setdefault(nodeid, [])
+            if cluster["pattern"] not in test_patterns:
+                test_patterns.append(cluster["pattern"])
 
-                    if error_msg:
-                        # Extract meaningful error patterns from the error message
-                        # First, identify the error type
-                        error_type = "Unknown Error"
-                        error_detail = ""
-
-                        # Find the exception type in the error message
-                        for exc_type in exception_types:
-                            if exc_type in error_msg:
-                                error_type = exc_type
-                                # Try to extract the specific error detail
-                                lines = error_msg.split("\n")
-                                for line in lines:
-                                    if exc_type in line:
-                                        # Extract the part after the exception type
-                                        parts = line.split(exc_type + ":", 1)
-                                        if len(parts) > 1:
-                                            error_detail = parts[1].strip()
-                                            break
-                                break
-
-                        # If we couldn't extract a specific detail, use the first non-empty line
-                        if not error_detail and error_msg:
-                            for line in error_msg.split("\n"):
-                                if line.strip() and not line.startswith('  File "'):
-                                    error_detail = line.strip()
-                                    break
-
-                        # Create a meaningful pattern that combines error type and detail
-                        pattern = f"{error_type}: {error_detail}" if error_detail else error_type
-
-                        # Truncate very long patterns
-                        if len(pattern) > 100:
-                            pattern = pattern[:97] + "..."
-
-                        # Count occurrences of each error pattern
-                        if pattern not in error_patterns:
-                            error_patterns[pattern] = []
-                            error_counts[pattern] = 0
-
-                        error_patterns[pattern].append(nodeid)
-                        error_counts[pattern] += 1
-
-                        # Map tests to their error patterns
-                        if nodeid not in test_to_error_map:
-                            test_to_error_map[nodeid] = []
-
-                        if pattern not in test_to_error_map[nodeid]:
-                            test_to_error_map[nodeid].append(pattern)
-
-        # Sort error patterns by frequency
-        sorted_patterns = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-
-        # Format the results
+        # Format the results, most frequent first
         patterns_result = [
             {
-                "pattern": pattern,
-                "count": count,
-                "affected_tests": list(set(error_patterns[pattern])),
+                "pattern": cluster["pattern"],
+                "count": cluster["count"],
+                "affected_tests": list(cluster["affected_tests"]),
+                "fingerprints": len(cluster["fingerprints"]),
             }
-            for pattern, count in sorted_patterns
+            for cluster in sorted(patterns.values(), key=lambda x: x["count"], reverse=True)
         ]
 
         # Find tests with multiple error patterns (potentially unreliable or unstable)
         multi_error_tests = [
-            {"test": test, "patterns": patterns, "pattern_count": len(patterns)}
-            for test, patterns in test_to_error_map.items()
-            if len(patterns) > 1
+            {"test": test, "patterns": test_patterns, "pattern_count": len(test_patterns)}
+            for test, test_patterns in test_to_error_map.items()
+            if len(test_patterns) > 1
         ]
 
         # Sort by number of patterns (most patterns first)
@@ -564,54 +852,24 @@ class TestInsights:
         potential dependency relationships between them. It can help uncover hidden
         dependencies in the test suite that might not be obvious from the code.
 
+        Co-failure counts are kept in a CoFailureStore that only takes in sessions
+        not seen by earlier calls. Failure storms (sessions where more than
+        DEFAULT_STORM_SIZE tests failed) are counted once, not pairwise.
+
         Returns:
             Dict containing:
             - dependencies: List of dicts with test pairs and their dependency metrics
             - test_failures: Dict mapping test nodeids to their failure data
+            - storm_sessions: Number of failure storms left out of the counts
         """
-        sessions = self._sessions
-        if not sessions:
-            return {"dependencies": [], "test_failures": {}}
+        if not self._sessions:
+            return {"dependencies": [], "test_failures": {}, "storm_sessions": 0}
 
-        # Create a matrix of test co-failures
-        test_failures = {}
-        for session in sessions:
-            # Get all failed tests in this session
-            session_failures = []
-            for test in session.test_results:
-                nodeid = getattr(test, "nodeid", None)
-                outcome = getattr(test, "outcome", None)
-
-                # Check if the test failed
-                is_failed = False
-                if hasattr(outcome, "value"):
-                    # It's an enum
-                    is_failed = outcome.value == "FAILED"
-                else:
-                    # It's a string
-                    is_failed = str(outcome).upper() == "FAILED"
-
-                if is_failed and nodeid:
-                    session_failures.append(nodeid)
-
-                    # Track individual test failure counts
-                    if nodeid not in test_failures:
-                        test_failures[nodeid] = {"count": 0, "co_failures": {}}
-                    test_failures[nodeid]["count"] += 1
-
-            # Record co-failures for each pair of failed tests
-            for i, test1 in enumerate(session_failures):
-                for test2 in session_failures[i + 1 :]:
-                    if test1 != test2:
-                        # Update co-failure count for test1
-                        if test2 not in test_failures[test1]["co_failures"]:
-                            test_failures[test1]["co_failures"][test2] = 0
-                        test_failures[test1]["co_failures"][test2] += 1
-
-                        # Update co-failure count for test2
-                        if test1 not in test_failures[test2]["co_failures"]:
-                            test_failures[test2]["co_failures"][test1] = 0
-                        test_failures[test2]["co_failures"][test1] += 1
+        store = self._co_failures()
+        test_failures = {
+            nodeid: {"count": count, "co_failures": dict(store.co_failures.get(nodeid, {}))}
+            for nodeid, count in store.counts.items()
+        }
 
         # Identify significant dependencies
         dependencies = []
@@ -663,7 +921,7 @@ class TestInsights:
         # Sort dependencies by strength
         dependencies.sort(key=lambda x: x["strength"], reverse=True)
 
-        return {"dependencies": dependencies, "test_failures": test_failures}
+        return {"dependencies": dependencies, "test_failures": test_failures, "storm_sessions": store.storms}
 
     def test_health_score(self) -> Dict[str, Any]:
         """Calculate a composite health score for tests.
@@ -691,13 +949,9 @@ class TestInsights:
             }
 
         # Calculate pass rate
-        total_tests = 0
-        passed_tests = 0
-        for session in sessions:
-            for test_result in session.test_results:
-                total_tests += 1
-                if test_result.outcome == "passed":
-                    passed_tests += 1
+        index = self._test_index()
+        total_tests = index.result_count
+        passed_tests = index.passed_count
 
         pass_rate = passed_tests / total_tests if total_tests > 0 else 0
 
@@ -710,21 +964,13 @@ class TestInsights:
         slowest_tests = slowest_tests_data["slowest_tests"]
 
         # Find consistently failing tests
-        test_results_by_nodeid = {}
-        for session in sessions:
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                if not nodeid:
-                    continue
-                if nodeid not in test_results_by_nodeid:
-                    test_results_by_nodeid[nodeid] = []
-                test_results_by_nodeid[nodeid].append(test_result)
+        test_outcomes_by_nodeid = {nodeid: record.outcomes for nodeid, record in index.tests.items()}
 
         consistently_failing = []
-        for nodeid, results in test_results_by_nodeid.items():
-            if len(results) >= 3:  # Only consider tests with at least 3 runs
-                failure_count = sum(1 for r in results if r.outcome != "passed")
-                failure_rate = failure_count / len(results)
+        for nodeid, outcomes in test_outcomes_by_nodeid.items():
+            if len(outcomes) >= 3:  # Only consider tests with at least 3 runs
+                failure_count = sum(1 for outcome in outcomes if outcome != "passed")
+                failure_rate = failure_count / len(outcomes)
                 if failure_rate > 0.9:  # More than 90% failure rate
                     consistently_failing.append(nodeid)
 
@@ -768,12 +1014,11 @@ class TestInsights:
         environment_consistency = env_impact["consistency"]
 
         # Calculate test result consistency (how consistently individual tests pass/fail)
-        if test_results_by_nodeid:
+        if test_outcomes_by_nodeid:
             consistency_scores = []
-            for nodeid, results in test_results_by_nodeid.items():
-                if results:  # Ensure we have outcomes to analyze
+            for nodeid, outcomes in test_outcomes_by_nodeid.items():
+                if outcomes:  # Ensure we have outcomes to analyze
                     # Calculate the proportion of the dominant outcome
-                    outcomes = [getattr(r, "outcome", "unknown") for r in results]
                     outcome_counts = {}
                     for outcome in outcomes:
                         outcome_counts[outcome] = outcome_counts.get(outcome, 0) + 1
@@ -802,11 +1047,17 @@ class TestInsights:
             "consistently_failing": consistently_failing,
         }
 
-    def correlation_analysis(self) -> Dict[str, Any]:
+    def correlation_analysis(self, top_k: Optional[int] = None) -> Dict[str, Any]:
         """Analyze correlations between test outcomes.
 
         This method identifies tests that tend to have correlated outcomes,
         which can help identify hidden dependencies or shared resources.
+        Each pair is correlated over the sessions both tests ran in (at least 3).
+        With NumPy installed all pairs come from blocked matrix products over a
+        masked session x test outcome matrix.
+
+        Args:
+            top_k: Optional maximum number of pairs to return (strongest first)
 
         Returns:
             Dict containing:
@@ -817,90 +1068,45 @@ class TestInsights:
         if not sessions:
             return {"correlations": [], "test_matrix": {}}
 
-        # Create a matrix of test outcomes across sessions
+        # Session x test outcome matrix: 1 = passed, 0 = other, None = did not run
         test_matrix = {}
-        session_ids = []
-
-        # First pass: identify all tests and sessions
-        for i, session in enumerate(sessions):
-            session_ids.append(session.session_id)
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                if nodeid and nodeid not in test_matrix:
-                    test_matrix[nodeid] = {"outcomes": [None] * len(sessions)}
-
-        # Second pass: fill in the outcome matrix
-        for i, session in enumerate(sessions):
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                if nodeid:
-                    # Convert outcome to a numeric value for correlation calculation
-                    outcome = getattr(test_result, "outcome", None)
-                    outcome_value = 1 if outcome == "passed" else 0
-                    test_matrix[nodeid]["outcomes"][i] = outcome_value
+        for nodeid, record in self._test_index().tests.items():
+            outcome_values = [None] * len(sessions)
+            for i, outcome in zip(record.positions, record.outcomes):
+                outcome_values[i] = 1 if outcome in (TestOutcome.PASSED, "passed") else 0
+            test_matrix[nodeid] = {"outcomes": outcome_values}
 
         # Only include tests that appear in at least 3 sessions
-        valid_tests = {}
-        for nodeid, data in test_matrix.items():
-            outcomes = data["outcomes"]
-            valid_outcomes = [o for o in outcomes if o is not None]
-            if len(valid_outcomes) >= 3:
-                valid_tests[nodeid] = valid_outcomes
-
-        # Calculate correlation coefficients between test pairs
-        correlations = []
-        test_ids = list(valid_tests.keys())
-        for i, test1 in enumerate(test_ids):
-            for test2 in test_ids[i + 1 :]:
-                # Get outcome vectors for both tests
-                outcomes1 = valid_tests[test1]
-                outcomes2 = valid_tests[test2]
-
-                # We need to align the vectors to only include sessions where both tests ran
-                # For simplicity, we'll just use sessions where both tests have outcomes
-                min_length = min(len(outcomes1), len(outcomes2))
-                if min_length < 3:
-                    continue  # Skip if we don't have enough common sessions
-
-                # Calculate correlation coefficient
-                try:
-                    # Calculate means
-                    mean1 = sum(outcomes1[:min_length]) / min_length
-                    mean2 = sum(outcomes2[:min_length]) / min_length
-
-                    # Calculate variances and covariance
-                    var1 = sum((x - mean1) ** 2 for x in outcomes1[:min_length]) / min_length
-                    var2 = sum((x - mean2) ** 2 for x in outcomes2[:min_length]) / min_length
-                    cov = sum((outcomes1[i] - mean1) * (outcomes2[i] - mean2) for i in range(min_length)) / min_length
-
-                    # Calculate correlation coefficient
-                    if var1 > 0 and var2 > 0:
-                        corr = cov / (var1**0.5 * var2**0.5)
-                    else:
-                        corr = 0  # No variance in at least one test
-                except Exception:
-                    corr = 0  # Error in calculation
+        test_ids = [
+            nodeid
+            for nodeid, data in test_matrix.items()
+            if len(data["outcomes"]) - data["outcomes"].count(None) >= _MIN_SHARED_SESSIONS
+        ]
 
-                # Only include significant correlations
-                if abs(corr) > 0.5:
-                    # Get short test names for display
-                    test1_short = test1.split("::")[-1] if "::" in test1 else test1
-                    test2_short = test2.split("::")[-1] if "::" in test2 else test2
+        try:
+            import numpy as np
 
-                    correlations.append(
-                        {
-                            "test1": test1,
-                            "test2": test2,
-                            "test1_short": test1_short,
-                            "test2_short": test2_short,
-                            "correlation": corr,
-                            "relationship": "positive" if corr > 0 else "negative",
-                            "strength": abs(corr),
-                        }
-                    )
+            pairs = _outcome_correlations_numpy(np, test_matrix, test_ids, top_k)
+        except ImportError:
+            pairs = _outcome_correlations(test_matrix, test_ids, top_k)
 
-        # Sort by correlation strength
-        correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
+        correlations = []
+        for test1, test2, corr in pairs:
+            # Get short test names for display
+            test1_short = test1.split("::")[-1] if "::" in test1 else test1
+            test2_short = test2.split("::")[-1] if "::" in test2 else test2
+
+            correlations.append(
+                {
+                    "test1": test1,
+                    "test2": test2,
+                    "test1_short": test1_short,
+                    "test2_short": test2_short,
+                    "correlation": corr,
+                    "relationship": "positive" if corr > 0 else "negative",
+                    "strength": abs(corr),
+                }
+            )
 
         return {"correlations": correlations, "test_matrix": test_matrix}
 
@@ -909,6 +1115,9 @@ class TestInsights:
 
         This method identifies tests that tend to fail at specific times of day
         or days of the week, which can help identify time-dependent issues.
+        Failures are read as columnar (test code, hour of the week) events from
+        the shared index; with NumPy installed, every test's histograms come
+        from one np.bincount and peaks are found with array comparisons.
 
         Returns:
             Dict containing:
@@ -930,93 +1139,32 @@ class TestInsights:
                 ],
             }
 
-        # Track timestamps of test failures
-        test_timestamps = defaultdict(list)
-        for session in sessions:
-            for test_result in session.test_results:
-                nodeid = getattr(test_result, "nodeid", None)
-                if not nodeid:
-                    continue
-
-                # Check if the test failed
-                outcome = getattr(test_result, "outcome", None)
-                is_failed = False
-                if hasattr(outcome, "value"):
-                    is_failed = outcome.value in ["failed", "error", "FAILED", "ERROR"]
-                else:
-                    is_failed = str(outcome).upper() in ["FAILED", "ERROR"]
+        # Histogram the failure events of every test at once
+        codes, week_hours, tests = self._test_index().failure_events()
+        try:
+            import numpy as np
 
-                if is_failed:
-                    # Store the timestamp of this failure
-                    start_time = getattr(test_result, "start_time", None)
-                    if start_time:
-                        test_timestamps[nodeid].append(start_time)
+            found = _seasonal_peaks_numpy(np, codes, week_hours, len(tests))
+        except ImportError:
+            found = _seasonal_peaks(codes, week_hours, len(tests))
 
-        # Analyze patterns for tests with sufficient data
+        # Only tests with significant patterns, most failures first
         seasonal_patterns = []
-        for test_id, timestamps in test_timestamps.items():
-            if len(timestamps) < 3:
-                continue
-
-            # Sort timestamps chronologically
-            timestamps.sort()
-
-            # Check for time-of-day patterns
-            hour_distribution = [0] * 24
-            for timestamp in timestamps:
-                hour = timestamp.hour
-                hour_distribution[hour] += 1
-
-            total_failures = len(timestamps)
-
-            # Calculate hourly distribution as percentages
-            [count / total_failures for count in hour_distribution]
-
-            # Check for peaks (hours with significantly more failures)
-            avg_failures_per_hour = total_failures / 24
-            peak_hours = []
-            for hour, count in enumerate(hour_distribution):
-                if (
-                    count > 2 * avg_failures_per_hour and count >= 2
-                ):  # At least twice the average and at least 2 occurrences
-                    peak_hours.append((hour, count, count / total_failures))
-
-            # Check for day-of-week patterns
-            day_distribution = [0] * 7  # Monday to Sunday
-            for timestamp in timestamps:
-                day = timestamp.weekday()
-                day_distribution[day] += 1
-
-            # Calculate day distribution as percentages
-            [count / total_failures for count in day_distribution]
-
-            # Check for peak days
-            avg_failures_per_day = total_failures / 7
-            peak_days = []
-            for day, count in enumerate(day_distribution):
-                if (
-                    count > 1.5 * avg_failures_per_day and count >= 2
-                ):  # At least 1.5x the average and at least 2 occurrences
-                    peak_days.append((day, count, count / total_failures))
-
-            # Only include tests with significant patterns
-            if peak_hours or peak_days:
-                test_short = test_id.split("::")[-1] if "::" in test_id else test_id
-
-                seasonal_patterns.append(
-                    {
-                        "test_id": test_id,
-                        "test_short": test_short,
-                        "total_failures": total_failures,
-                        "peak_hours": peak_hours,
-                        "peak_days": peak_days,
-                        "hour_distribution": hour_distribution,
-                        "day_distribution": day_distribution,
-                    }
-                )
-
-        # Sort by total failures
-        seasonal_patterns.sort(key=lambda x: x["total_failures"], reverse=True)
+        for code, total_failures, hour_distribution, day_distribution, peak_hours, peak_days in found:
+            test_id = tests[code]
+            test_short = test_id.split("::")[-1] if "::" in test_id else test_id
+
+            seasonal_patterns.append(
+                {
+                    "test_id": test_id,
+                    "test_short": test_short,
+                    "total_failures": total_failures,
+                    "peak_hours": peak_hours,
+                    "peak_days": peak_days,
+                    "hour_distribution": hour_distribution,
+                    "day_distribution": day_distribution,
+                }
+            )
 
         # Map day numbers to names for reference
         day_names = [
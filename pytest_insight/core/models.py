@@ -5,13 +5,16 @@ Core models:
 2. TestResult - Single test execution result
 3. TestSession - Collection of test results with metadata
 4. RerunTestGroup - Group of related test reruns
+5. ProjectedTestResult - TestResult loaded with only some of its fields
+6. FilteredSessionView - TestSession exposing a subset of another session's results
 """
 
 import logging
 from dataclasses import dataclass, field
+from dataclasses import fields as dataclass_fields
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +146,123 @@ class TestResult:
         )
 
 
+# TestResult fields a projection always loads; they are small and needed by most queries
+CORE_RESULT_FIELDS = ("nodeid", "outcome", "start_time", "duration")
+
+# TestResult fields a projection may leave out
+PROJECTABLE_RESULT_FIELDS = (
+    "stop_time",
+    "caplog",
+    "capstderr",
+    "capstdout",
+    "longreprtext",
+    "has_warning",
+)
+
+
+class FieldNotLoadedError(AttributeError):
+    """Raised when reading a TestResult field that a projected query did not load."""
+
+
+class _ProjectedField:
+    """Data descriptor for a field that may be missing from a ProjectedTestResult."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise FieldNotLoadedError(
+                f"TestResult field '{self.name}' was not loaded; add it to Query.select() "
+                f"(loaded: {', '.join(obj.loaded_fields)})"
+            ) from None
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+class ProjectedTestResult(TestResult):
+    """A TestResult holding only the fields a query selected.
+
+    CORE_RESULT_FIELDS are always present. Reading any other field that was not
+    selected raises FieldNotLoadedError (an AttributeError, so getattr() with a
+    default and hasattr() treat it as absent). Projected results are read-only
+    views for analysis; they cannot be serialized with to_dict() unless every
+    field was loaded.
+    """
+
+    __test__ = False  # Tell Pytest this is NOT a test class
+
+    stop_time = _ProjectedField("stop_time")
+    caplog = _ProjectedField("caplog")
+    capstderr = _ProjectedField("capstderr")
+    capstdout = _ProjectedField("capstdout")
+    longreprtext = _ProjectedField("longreprtext")
+    has_warning = _ProjectedField("has_warning")
+
+    @property
+    def loaded_fields(self) -> List[str]:
+        """Names of the fields this result holds."""
+        return [name for name in self.__dict__ if not name.startswith("_")]
+
+    def __repr__(self) -> str:
+        """Show only the loaded fields."""
+        values = ", ".join(f"{name}={self.__dict__[name]!r}" for name in self.loaded_fields)
+        return f"{type(self).__name__}({values})"
+
+    @classmethod
+    def from_dict(cls, data: Dict, fields: Collection[str] = ()) -> "ProjectedTestResult":
+        """Create a projected result from a dictionary, skipping unselected fields.
+
+        Args:
+            data: Serialized TestResult
+            fields: Names from PROJECTABLE_RESULT_FIELDS to load in addition to
+                    CORE_RESULT_FIELDS; other names are ignored
+        """
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"Invalid data for TestResult. Expected dict, got {type(data)}"
+            )
+
+        result = cls.__new__(cls)
+        values = result.__dict__
+        start_time = datetime.fromisoformat(data["start_time"])
+        duration = data.get("duration")
+        stop_time = None
+        if duration is None:
+            if not data.get("stop_time"):
+                raise ValueError("Either stop_time or duration must be provided")
+            stop_time = datetime.fromisoformat(data["stop_time"])
+            duration = (stop_time - start_time).total_seconds()
+
+        values["nodeid"] = data["nodeid"]
+        values["outcome"] = TestOutcome.from_str(data["outcome"])
+        values["start_time"] = start_time
+        values["duration"] = duration
+        for name in PROJECTABLE_RESULT_FIELDS:
+            if name not in fields:
+                continue
+            if name == "stop_time":
+                # Same rule as TestResult.__post_init__: duration wins
+                values[name] = stop_time or start_time + timedelta(seconds=duration)
+            elif name == "has_warning":
+                values[name] = data.get(name, False)
+            else:
+                values[name] = data.get(name, "")
+        return result
+
+
+def _result_from_dict(data: Dict, fields: Optional[Collection[str]]) -> TestResult:
+    """Decode a TestResult, projected when fields is not None."""
+    if fields is None:
+        return TestResult.from_dict(data)
+    return ProjectedTestResult.from_dict(data, fields)
+
+
 @dataclass
 class RerunTestGroup:
     """Groups test results for tests that were rerun, chronologically ordered with final result last."""
@@ -179,15 +299,22 @@ class RerunTestGroup:
         return {"nodeid": self.nodeid, "tests": [t.to_dict() for t in self.tests]}
 
     @classmethod
-    def from_dict(cls, data: Dict) -> "RerunTestGroup":
-        """Create RerunTestGroup from dictionary."""
+    def from_dict(
+        cls, data: Dict, fields: Optional[Collection[str]] = None
+    ) -> "RerunTestGroup":
+        """Create RerunTestGroup from dictionary.
+
+        Args:
+            data: Serialized group
+            fields: Optional projection (see ProjectedTestResult.from_dict)
+        """
         if not isinstance(data, dict):
             raise ValueError(
                 f"Invalid data for RerunTestGroup. Expected dict, got {type(data)}"
             )
 
         group = cls(nodeid=data["nodeid"])
-        group.tests = [TestResult.from_dict(t) for t in data["tests"]]
+        group.tests = [_result_from_dict(t, fields) for t in data["tests"]]
         return group
 
 
@@ -241,8 +368,17 @@ class TestSession:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> "TestSession":
-        """Create a TestSession from a dictionary."""
+    def from_dict(
+        cls, data: Dict, fields: Optional[Collection[str]] = None
+    ) -> "TestSession":
+        """Create a TestSession from a dictionary.
+
+        Args:
+            data: Serialized session
+            fields: Optional projection; when given, test results are decoded as
+                    ProjectedTestResult holding only CORE_RESULT_FIELDS and these
+                    fields
+        """
         if not isinstance(data, dict):
             raise ValueError(
                 f"Invalid data for TestSession. Expected dict, got {type(data)}"
@@ -257,11 +393,11 @@ class TestSession:
 
         # Add test results
         for test_data in data.get("test_results", []):
-            session.add_test_result(TestResult.from_dict(test_data))
+            session.add_test_result(_result_from_dict(test_data, fields))
 
         # Add rerun groups
         for group_data in data.get("rerun_test_groups", []):
-            group = RerunTestGroup.from_dict(group_data)
+            group = RerunTestGroup.from_dict(group_data, fields)
             session.add_rerun_group(group)
 
         session.session_tags = data.get("session_tags", {})
@@ -285,3 +421,122 @@ class TestSession:
             )
 
         self.rerun_test_groups.append(group)
+
+
+class _BaseSessionField:
+    """Data descriptor reading a session field through from a view's base session.
+
+    Assigning to the field on the view stores a local value and leaves the base
+    session unchanged.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj.__dict__
+        if self.name in values:
+            return values[self.name]
+        return getattr(values["_base"], self.name)
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.name] = value
+
+
+class _ViewResults:
+    """Data descriptor building a view's test_results list on first access.
+
+    The built list is cached; an assigned list replaces it and detaches the
+    view's results from its base session.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        values = obj.__dict__
+        results = values.get("test_results")
+        if results is None:
+            results = values.get("_results")
+        if results is None:
+            base_results = values["_base"].test_results
+            results = list(map(base_results.__getitem__, values["_positions"]))
+            values["_results"] = results
+        return results
+
+    def __set__(self, obj, value):
+        obj.__dict__["test_results"] = value
+
+
+class FilteredSessionView(TestSession):
+    """A TestSession holding a subset of another session's test results.
+
+    Query results filtered by test-level criteria are views: they keep a
+    reference to the original (base) session and the positions of the matching
+    results in its test_results, instead of copying the session. All session
+    metadata, including testing_system and session_duration, is read from the
+    base session; test_results is built on first access, in the base session's
+    order. A view is a TestSession in every other respect.
+
+    Assigning to a field of the view (or adding results) changes only the view.
+    Views assume the base session's test_results are not reordered or shrunk.
+    """
+
+    __test__ = False  # Tell Pytest this is NOT a test class
+
+    sut_name = _BaseSessionField("sut_name")
+    testing_system = _BaseSessionField("testing_system")
+    session_id = _BaseSessionField("session_id")
+    session_start_time = _BaseSessionField("session_start_time")
+    session_stop_time = _BaseSessionField("session_stop_time")
+    session_duration = _BaseSessionField("session_duration")
+    session_tags = _BaseSessionField("session_tags")
+    rerun_test_groups = _BaseSessionField("rerun_test_groups")
+    test_results = _ViewResults()
+
+    def __init__(self, base: TestSession, positions: Sequence[int]):
+        """Create a view of the results of base at the given positions.
+
+        Args:
+            base: Session to view; a view of a view refers to the original session
+            positions: Indexes into base.test_results, in ascending order
+        """
+        if isinstance(base, FilteredSessionView) and base._tracks_base():
+            positions = [base.positions[p] for p in positions]
+            base = base.base
+        self.__dict__["_base"] = base
+        self.__dict__["_positions"] = positions
+
+    def _tracks_base(self) -> bool:
+        """Check whether test_results still equal the base results at positions."""
+        values = self.__dict__
+        if "test_results" in values:
+            return False
+        cached = values.get("_results")
+        return cached is None or len(cached) == len(values["_positions"])
+
+    def add_test_result(self, result: TestResult) -> None:
+        """Add a test result to this view only."""
+        self.test_results = list(self.test_results)
+        super().add_test_result(result)
+
+    def __eq__(self, other):
+        """Compare field by field with any TestSession, view or not."""
+        if not isinstance(other, TestSession):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name) for f in dataclass_fields(TestSession)
+        )
+
+    __hash__ = None
+
+    @property
+    def base(self) -> TestSession:
+        """The session this view selects results from."""
+        return self.__dict__["_base"]
+
+    @property
+    def positions(self) -> Sequence[int]:
+        """Positions of the selected results in the base session's test_results."""
+        return self.__dict__["_positions"]
@@ -26,6 +26,17 @@ Key Behaviors:
    - Use with_profile() to switch profiles during query building
    - Profiles can be specified at initialization or via environment variables
 
+5. Query Planning:
+   - Session-level filters are recorded as structured predicates (SutFilter, TimeRangeFilter, ...)
+   - Query.plan() pushes predicates the storage backend supports down into storage,
+     which evaluates them on raw records before building TestSession objects
+   - Custom predicates (with_custom_session_filter) always run after loading
+
+6. Aggregation:
+   - group_by(...).agg(...) reduces matching test results to per-group metrics
+     (count, pass rate, mean and p95 duration) in one streaming pass, without
+     building filtered TestSession objects
+
 Examples:
     # Session-level only; returns existing sessions that match criteria
     # Get TestSessions for the last 7 days for all SUTs with 'service' in name
@@ -69,24 +80,55 @@ Examples:
     result2 = query2.with_session_tag("region", "us-east").execute()
 """
 
+import base64
 import dataclasses
 import datetime as dt_module
 import fnmatch
+import hashlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
 # Import the real datetime class for isinstance checks
-from typing import Callable, Dict, List, Optional, Protocol, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+)
 
-from pytest_insight.core.models import TestOutcome, TestResult, TestSession
-from pytest_insight.core.storage import get_storage_instance
-from pytest_insight.utils.utils import (
-    create_after_filter,
-    create_after_or_equals_filter,
-    create_before_filter,
-    create_before_or_equals_filter,
+from pytest_insight.core.indexes import (
+    INDEXED_FIELDS,
+    MIN_LITERAL_LENGTH,
+    TextIndex,
+    to_epoch,
 )
+from pytest_insight.core.models import (
+    CORE_RESULT_FIELDS,
+    PROJECTABLE_RESULT_FIELDS,
+    FilteredSessionView,
+    TestOutcome,
+    TestResult,
+    TestSession,
+)
+from pytest_insight.core.storage import get_storage_instance
 
 
 class InvalidQueryParameterError(Exception):
@@ -104,6 +146,7 @@ class FilterType(Enum):
     REGEX_PATTERN = auto()
     DURATION = auto()
     OUTCOME = auto()
+    WARNING = auto()
     CUSTOM = auto()
 
 
@@ -336,6 +379,27 @@ class OutcomeFilter:
         return cls(outcome=TestOutcome.from_str(outcome_str))
 
 
+@dataclass
+class WarningFilter:
+    """Filter tests by warning presence."""
+
+    has_warning: bool = True
+    field_name = "has_warning"
+
+    def matches(self, test: TestResult) -> bool:
+        """Check if test has (or lacks) a warning."""
+        return bool(test.has_warning) == self.has_warning
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {"type": FilterType.WARNING.name, "has_warning": self.has_warning}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WarningFilter":
+        """Create from dictionary."""
+        return cls(has_warning=bool(data.get("has_warning", True)))
+
+
 @dataclass
 class CustomFilter:
     """Filter tests using a custom predicate."""
@@ -361,6 +425,633 @@ class CustomFilter:
         raise NotImplementedError("Custom filters cannot be deserialized")
 
 
+# Characters that make a pattern a real regular expression rather than a literal
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+def compile_test_filters(
+    filters: List[TestFilter],
+) -> Callable[[TestResult], bool]:
+    """Compile a chain of test filters into a single predicate.
+
+    The returned predicate is equivalent to ``all(f.matches(test) for f in filters)``
+    but evaluates the whole chain in one call, cheapest checks first:
+
+    1. Outcome checks (enum identity; several outcome filters are merged)
+    2. Duration checks (range bounds merged into a single interval)
+    3. Substring checks (including regex patterns that are plain literals)
+    4. Regex searches with precompiled patterns
+    5. Custom predicates
+
+    Args:
+        filters: Test filters to combine with AND logic
+
+    Returns:
+        Callable that takes a TestResult and returns True if all filters match
+    """
+    outcomes = set()
+    min_duration, max_duration = None, None
+    substrings = []
+    regexes = []
+    customs = []
+
+    for test_filter in filters:
+        if isinstance(test_filter, OutcomeFilter):
+            outcomes.add(test_filter.outcome)
+        elif isinstance(test_filter, DurationFilter):
+            if min_duration is None or test_filter.min_seconds > min_duration:
+                min_duration = test_filter.min_seconds
+            if max_duration is None or test_filter.max_seconds < max_duration:
+                max_duration = test_filter.max_seconds
+        elif _literal_pattern(test_filter) is not None:
+            field_name, literal = _literal_pattern(test_filter)
+            substrings.append((_field_getter(field_name), literal))
+        elif isinstance(test_filter, RegexPatternFilter):
+            regexes.append(
+                (
+                    _field_getter(test_filter.field_name),
+                    test_filter._compiled_regex.search,
+                )
+            )
+        else:
+            customs.append(test_filter.matches)
+
+    if len(outcomes) > 1:
+        # A test has exactly one outcome, so conflicting outcome filters never match
+        return lambda test: False
+
+    outcome = outcomes.pop() if outcomes else None
+    substrings = tuple(substrings)
+    regexes = tuple(regexes)
+    customs = tuple(customs)
+
+    def predicate(test: TestResult) -> bool:
+        if outcome is not None:
+            test_outcome = test.outcome
+            if test_outcome is not outcome and (
+                not isinstance(test_outcome, str)
+                or TestOutcome.from_str(test_outcome) is not outcome
+            ):
+                return False
+        if min_duration is not None and not (
+            min_duration <= test.duration <= max_duration
+        ):
+            return False
+        for get_field, literal in substrings:
+            if literal not in str(get_field(test)):
+                return False
+        for get_field, search in regexes:
+            if not search(str(get_field(test))):
+                return False
+        for matches in customs:
+            if not matches(test):
+                return False
+        return True
+
+    return predicate
+
+
+def _literal_pattern(test_filter: TestFilter) -> Optional[Tuple[str, str]]:
+    """Get (field_name, literal) if a filter is a plain substring check."""
+    if isinstance(test_filter, ShellPatternFilter) or (
+        isinstance(test_filter, RegexPatternFilter)
+        and _REGEX_METACHARACTERS.isdisjoint(test_filter.pattern)
+    ):
+        return test_filter.field_name, test_filter.pattern
+    return None
+
+
+def _field_getter(field_name: str) -> Callable[[TestResult], object]:
+    """Build a getter matching RegexPatternFilter's lenient getattr default."""
+    return lambda test: getattr(test, field_name, "")
+
+
+class SessionFilterType(Enum):
+    """Types of session-level filters supported by the query system."""
+
+    SUT = auto()
+    TIME_RANGE = auto()
+    SESSION_TAG = auto()
+    SESSION_ID_PATTERN = auto()
+    RERUNS = auto()
+    WARNINGS = auto()
+    NODEID_CONTAINS = auto()
+    ANY_OF = auto()
+    CUSTOM = auto()
+
+
+class SessionFilter(Protocol):
+    """Protocol defining the interface for session-level filters.
+
+    Structured session filters describe *what* they match instead of hiding it in
+    a closure, so the query planner can hand them to storage backends. Filters
+    with ``pushdown = True`` also implement matches_record(), which evaluates the
+    filter against a raw (serialized) session dictionary before any TestSession
+    object is built. Filters on categorical fields also implement index_keys(),
+    so storages keeping a BitmapIndex can select their sessions with bitset
+    operations instead.
+    """
+
+    pushdown: bool
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if a session matches this filter."""
+        ...
+
+    def to_dict(self) -> Dict:
+        """Convert filter to dictionary for serialization."""
+        ...
+
+
+@dataclass
+class SutFilter:
+    """Filter sessions by exact SUT name."""
+
+    sut_name: str
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if session belongs to the SUT."""
+        return session.sut_name == self.sut_name
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return data.get("sut_name") == self.sut_name
+
+    def index_keys(self) -> Optional[List[Tuple]]:
+        """Get the BitmapIndex keys of matching sessions."""
+        return [("sut", self.sut_name)]
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {"type": SessionFilterType.SUT.name, "sut_name": self.sut_name}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SutFilter":
+        """Create from dictionary."""
+        return cls(sut_name=data["sut_name"])
+
+
+@dataclass
+class TimeRangeFilter:
+    """Filter sessions by start time.
+
+    Either bound may be None (open-ended). Each bound is inclusive unless the
+    corresponding include_* flag is False. Ranges built by the in_last_* methods
+    also record their look-back window, so equivalent relative queries built at
+    different moments can share a cached result.
+
+    Bounds are compared as UTC epoch seconds (naive datetimes are taken to be
+    UTC). Storages that keep a TimeIndex select the range by binary search
+    using time_bounds() instead of calling matches_record per session.
+    """
+
+    start: Optional[dt_module.datetime] = None
+    end: Optional[dt_module.datetime] = None
+    include_start: bool = True
+    include_end: bool = True
+    window: Optional[dt_module.timedelta] = None
+    pushdown = True
+
+    def __post_init__(self):
+        """Convert both bounds to epoch seconds once."""
+        self._start_ts = to_epoch(self.start) if self.start else None
+        self._end_ts = to_epoch(self.end) if self.end else None
+
+    def time_bounds(self) -> Tuple[Optional[float], Optional[float], bool, bool]:
+        """Get (start, end, include_start, include_end) in epoch seconds."""
+        return self._start_ts, self._end_ts, self.include_start, self.include_end
+
+    def _in_range(self, ts: float) -> bool:
+        if self._start_ts is not None:
+            if ts < self._start_ts or (ts == self._start_ts and not self.include_start):
+                return False
+        if self._end_ts is not None:
+            if ts > self._end_ts or (ts == self._end_ts and not self.include_end):
+                return False
+        return True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if session started within the range."""
+        return self._in_range(to_epoch(session.session_start_time))
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return self._in_range(to_epoch(data["session_start_time"]))
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.TIME_RANGE.name,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "include_start": self.include_start,
+            "include_end": self.include_end,
+            "window_seconds": self.window.total_seconds() if self.window else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TimeRangeFilter":
+        """Create from dictionary."""
+        start, end = data.get("start"), data.get("end")
+        window_seconds = data.get("window_seconds")
+        return cls(
+            start=dt_module.datetime.fromisoformat(start) if start else None,
+            end=dt_module.datetime.fromisoformat(end) if end else None,
+            include_start=data.get("include_start", True),
+            include_end=data.get("include_end", True),
+            window=(
+                dt_module.timedelta(seconds=window_seconds)
+                if window_seconds is not None
+                else None
+            ),
+        )
+
+
+@dataclass
+class SessionTagFilter:
+    """Filter sessions by an exact session tag value."""
+
+    tag_key: str
+    tag_value: str
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if session carries the tag."""
+        return session.session_tags.get(self.tag_key) == self.tag_value
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return (data.get("session_tags") or {}).get(self.tag_key) == self.tag_value
+
+    def index_keys(self) -> Optional[List[Tuple]]:
+        """Get the BitmapIndex keys of matching sessions."""
+        return [("tag", self.tag_key, self.tag_value)]
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.SESSION_TAG.name,
+            "tag_key": self.tag_key,
+            "tag_value": self.tag_value,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SessionTagFilter":
+        """Create from dictionary."""
+        return cls(tag_key=data["tag_key"], tag_value=data["tag_value"])
+
+
+@dataclass
+class SessionIdPatternFilter:
+    """Filter sessions by glob pattern on session ID."""
+
+    pattern: str
+    pushdown = True
+
+    def __post_init__(self):
+        """Precompile the glob pattern to a regex once."""
+        self._match = re.compile(fnmatch.translate(os.path.normcase(self.pattern))).match
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if session ID matches the glob pattern."""
+        return self._match(os.path.normcase(session.session_id)) is not None
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return self._match(os.path.normcase(data.get("session_id", ""))) is not None
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.SESSION_ID_PATTERN.name,
+            "pattern": self.pattern,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SessionIdPatternFilter":
+        """Create from dictionary."""
+        return cls(pattern=data["pattern"])
+
+
+@dataclass
+class RerunFilter:
+    """Filter sessions by presence of rerun test groups."""
+
+    has_reruns: bool = True
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if session has (or lacks) reruns."""
+        return bool(session.rerun_test_groups) == self.has_reruns
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return bool(data.get("rerun_test_groups")) == self.has_reruns
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {"type": SessionFilterType.RERUNS.name, "has_reruns": self.has_reruns}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RerunFilter":
+        """Create from dictionary."""
+        return cls(has_reruns=bool(data.get("has_reruns", True)))
+
+
+@dataclass
+class SessionWarningFilter:
+    """Filter sessions by presence of tests with warnings."""
+
+    has_warnings: bool = True
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if any test in the session has a warning."""
+        return any(t.has_warning for t in session.test_results) == self.has_warnings
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return (
+            any(t.get("has_warning") for t in data.get("test_results", []))
+            == self.has_warnings
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.WARNINGS.name,
+            "has_warnings": self.has_warnings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SessionWarningFilter":
+        """Create from dictionary."""
+        return cls(has_warnings=bool(data.get("has_warnings", True)))
+
+
+@dataclass
+class NodeidContainsFilter:
+    """Filter sessions containing at least one test whose nodeid contains a pattern."""
+
+    pattern: str
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if any test nodeid contains the pattern."""
+        return any(self.pattern in t.nodeid for t in session.test_results)
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return any(
+            self.pattern in t.get("nodeid", "") for t in data.get("test_results", [])
+        )
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.NODEID_CONTAINS.name,
+            "pattern": self.pattern,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NodeidContainsFilter":
+        """Create from dictionary."""
+        return cls(pattern=data["pattern"])
+
+
+@dataclass
+class AnyOfFilter:
+    """Combine session filters with OR logic."""
+
+    filters: List[SessionFilter]
+
+    @property
+    def pushdown(self) -> bool:
+        """An OR group can be pushed down only if every member can."""
+        return all(f.pushdown for f in self.filters)
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if any member filter matches."""
+        return any(f.matches(session) for f in self.filters)
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return any(f.matches_record(data) for f in self.filters)
+
+    def index_keys(self) -> Optional[List[Tuple]]:
+        """Get the BitmapIndex keys of every member, if all members have them."""
+        keys = []
+        for member in self.filters:
+            index_keys = getattr(member, "index_keys", None)
+            member_keys = index_keys() if callable(index_keys) else None
+            if member_keys is None:
+                return None
+            keys.extend(member_keys)
+        return keys
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            "type": SessionFilterType.ANY_OF.name,
+            "filters": [f.to_dict() for f in self.filters],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "AnyOfFilter":
+        """Create from dictionary, rebuilding every member filter."""
+        return cls(filters=[deserialize_session_filter(f) for f in data["filters"]])
+
+
+@dataclass
+class _SessionIdSetFilter:
+    """Internal filter keeping sessions whose ID is in a set (index candidates)."""
+
+    session_ids: frozenset
+    pushdown = True
+
+    def matches(self, session: TestSession) -> bool:
+        """Check if the session is a candidate."""
+        return session.session_id in self.session_ids
+
+    def matches_record(self, data: Dict) -> bool:
+        """Check a serialized session."""
+        return data.get("session_id") in self.session_ids
+
+
+@dataclass
+class CustomSessionFilter:
+    """Filter sessions using a custom predicate.
+
+    Custom predicates are opaque to storage, so they always run in the query
+    engine after loading (never pushed down).
+    """
+
+    predicate: Callable[[TestSession], bool]
+    name: str
+    pushdown = False
+
+    def matches(self, session: TestSession) -> bool:
+        """Apply custom predicate."""
+        return self.predicate(session)
+
+    def to_dict(self) -> Dict:
+        """Convert to dictionary with a predicate description."""
+        return {
+            "type": SessionFilterType.CUSTOM.name,
+            "name": self.name,
+            "predicate_repr": repr(self.predicate),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CustomSessionFilter":
+        """Create from dictionary."""
+        raise NotImplementedError("Custom session filters cannot be deserialized")
+
+
+def deserialize_test_filter(data: Dict) -> TestFilter:
+    """Rebuild a built-in test filter from its to_dict() form.
+
+    Raises:
+        InvalidQueryParameterError: If the filter type is unknown or custom
+    """
+    filter_cls = _TEST_FILTER_TYPES.get(data.get("type"))
+    if filter_cls is None:
+        raise InvalidQueryParameterError(
+            f"Cannot deserialize test filter of type {data.get('type')!r}"
+        )
+    return filter_cls.from_dict(data)
+
+
+def deserialize_session_filter(data: Dict) -> SessionFilter:
+    """Rebuild a built-in session filter from its to_dict() form.
+
+    Raises:
+        InvalidQueryParameterError: If the filter type is unknown or custom
+    """
+    filter_cls = _SESSION_FILTER_TYPES.get(data.get("type"))
+    if filter_cls is None:
+        raise InvalidQueryParameterError(
+            f"Cannot deserialize session filter of type {data.get('type')!r}"
+        )
+    return filter_cls.from_dict(data)
+
+
+def _canonical_filter(data: Dict) -> Tuple[str, bool]:
+    """Get the canonical JSON of a serialized session or test filter.
+
+    Relative time windows (in_last_*) are keyed by their length rather than by
+    the moment they were built, and OR groups by their sorted members.
+
+    Returns:
+        (canonical JSON, whether a relative window is involved)
+    """
+    data = dict(data)
+    relative = False
+    filter_type = data["type"]
+    if filter_type == SessionFilterType.TIME_RANGE.name and data.get("window_seconds"):
+        data["start"] = None
+        relative = True
+    elif filter_type == SessionFilterType.ANY_OF.name:
+        members = [_canonical_filter(f) for f in data["filters"]]
+        data["filters"] = sorted(key for key, _ in members)
+        relative = any(rel for _, rel in members)
+    return json.dumps(data, sort_keys=True), relative
+
+
+_TEST_FILTER_TYPES = {
+    FilterType.SHELL_PATTERN.name: ShellPatternFilter,
+    FilterType.REGEX_PATTERN.name: RegexPatternFilter,
+    FilterType.DURATION.name: DurationFilter,
+    FilterType.OUTCOME.name: OutcomeFilter,
+    FilterType.WARNING.name: WarningFilter,
+}
+
+_SESSION_FILTER_TYPES = {
+    SessionFilterType.SUT.name: SutFilter,
+    SessionFilterType.TIME_RANGE.name: TimeRangeFilter,
+    SessionFilterType.SESSION_TAG.name: SessionTagFilter,
+    SessionFilterType.SESSION_ID_PATTERN.name: SessionIdPatternFilter,
+    SessionFilterType.RERUNS.name: RerunFilter,
+    SessionFilterType.WARNINGS.name: SessionWarningFilter,
+    SessionFilterType.NODEID_CONTAINS.name: NodeidContainsFilter,
+    SessionFilterType.ANY_OF.name: AnyOfFilter,
+}
+
+
+# Session fields usable with Query.order_by()
+ORDERABLE_FIELDS = (
+    "session_start_time",
+    "session_stop_time",
+    "session_duration",
+    "sut_name",
+    "session_id",
+)
+# Order used by limit()/after_cursor() without order_by(): latest sessions first
+_DEFAULT_ORDER = ("session_start_time", True)
+_DATETIME_FIELDS = ("session_start_time", "session_stop_time")
+
+
+def _utc_datetime(value: dt_module.datetime) -> dt_module.datetime:
+    """Convert to an aware UTC datetime; naive datetimes are taken as UTC."""
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        return value.replace(tzinfo=dt_module.timezone.utc)
+    return value.astimezone(dt_module.timezone.utc)
+
+
+def _session_order_key(order_field: str) -> Callable[[TestSession], Tuple[Any, str]]:
+    """Build a sort key for an orderable field; ties are broken by session ID."""
+    if order_field in _DATETIME_FIELDS:
+        return lambda s: (_utc_datetime(getattr(s, order_field)), s.session_id)
+    return lambda s: (getattr(s, order_field), s.session_id)
+
+
+def _encode_cursor(order_field: str, descending: bool, session: TestSession) -> str:
+    """Encode the position after ``session`` as an opaque page token."""
+    value, session_id = _session_order_key(order_field)(session)
+    if isinstance(value, dt_module.datetime):
+        value = value.isoformat()
+    payload = {"f": order_field, "d": descending, "v": value, "id": session_id}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def _decode_cursor(token: str) -> Dict[str, Any]:
+    """Decode a page token produced by _encode_cursor.
+
+    Raises:
+        InvalidQueryParameterError: If the token is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        order_field, value = payload["f"], payload["v"]
+        if order_field not in ORDERABLE_FIELDS:
+            raise ValueError(f"unknown order field {order_field}")
+        if order_field in _DATETIME_FIELDS:
+            value = _utc_datetime(dt_module.datetime.fromisoformat(value))
+        return {
+            "field": order_field,
+            "descending": bool(payload["d"]),
+            "key": (value, str(payload["id"])),
+            "token": token,
+        }
+    except (ValueError, KeyError, TypeError, UnicodeError) as e:
+        raise InvalidQueryParameterError(f"Invalid cursor: {e}")
+
+
+@dataclass
+class QueryPlan:
+    """Execution plan for the session-level part of a query.
+
+    Attributes:
+        pushed: Filters the storage backend evaluates while loading
+        residual: Filters the query engine evaluates after loading
+    """
+
+    pushed: List[SessionFilter] = field(default_factory=list)
+    residual: List[SessionFilter] = field(default_factory=list)
+
+
 class QueryResult:
     """Results from a query execution.
 
@@ -369,13 +1060,19 @@ class QueryResult:
     returns sessions containing matching tests, never isolated TestResult objects.
     """
 
-    def __init__(self, sessions: List[TestSession]):
+    def __init__(
+        self, sessions: List[TestSession], next_cursor: Optional[str] = None
+    ):
         """Initialize QueryResult.
 
         Args:
             sessions: List of matching TestSession objects
+            next_cursor: Opaque token for the next page when the query has a
+                         limit and more results exist, else None
         """
         self.sessions = sessions
+        self.next_cursor = next_cursor
+        self.profile: Optional["QueryProfile"] = None  # Set by execute(profile=True)
 
     @property
     def empty(self) -> bool:
@@ -395,6 +1092,241 @@ class QueryResult:
         return bool(self.sessions)
 
 
+def _describe_filter(query_filter: Any) -> str:
+    """Describe a session or test filter for plans, e.g. SutFilter(sut_name='api')."""
+    if isinstance(query_filter, _SessionIdSetFilter):
+        return f"TextIndexCandidates({len(query_filter.session_ids)} sessions)"
+    params = {
+        k: v
+        for k, v in query_filter.to_dict().items()
+        if k not in ("type", "predicate_repr")
+    }
+    args = ", ".join(f"{k}={v!r}" for k, v in params.items() if v is not None)
+    return f"{type(query_filter).__name__}({args})"
+
+
+class StageProfile:
+    """Rows flowing through one step of query execution.
+
+    Rows are sessions for the storage and session-level steps, and test
+    results for test-level steps.
+
+    Attributes:
+        level: "storage", "session", "test" or "page"
+        name: What the step evaluates (a filter description, or the storage read)
+        rows_in: Rows reaching the step, or None if unknown
+        rows_out: Rows passing the step, or None if unknown
+        seconds: Time spent in the step, or None if not measured
+        estimated: Whether the counts are estimates rather than measurements
+    """
+
+    __slots__ = ("level", "name", "rows_in", "rows_out", "seconds", "estimated")
+
+    def __init__(
+        self,
+        level: str,
+        name: str,
+        rows_in: Optional[int] = None,
+        rows_out: Optional[int] = None,
+        seconds: Optional[float] = None,
+        estimated: bool = False,
+    ):
+        """Initialize a stage."""
+        self.level = level
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = rows_out
+        self.seconds = seconds
+        self.estimated = estimated
+
+    @property
+    def selectivity(self) -> Optional[float]:
+        """Fraction of rows passing the step, or None if unknown."""
+        if not self.rows_in or self.rows_out is None:
+            return None
+        return self.rows_out / self.rows_in
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "level": self.level,
+            "name": self.name,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "selectivity": self.selectivity,
+            "seconds": self.seconds,
+            "estimated": self.estimated,
+        }
+
+
+@dataclass
+class QueryProfile:
+    """How a query is (or was) executed, returned by Query.explain().
+
+    Without execution the stages carry estimates where storage can give them
+    cheaply (see BaseStorage.estimate_sessions). After execute(profile=True)
+    every stage holds measured row counts and timings.
+
+    Attributes:
+        pushed: Session filters storage evaluates while loading
+        residual: Session filters the query engine evaluates after loading
+        test_filters: Test-level filters
+        indexes: Access paths used: "time_index" (pushed time range selected by
+                 binary search), "bitmap_index" (pushed SUT and tag filters
+                 answered with bitsets), "text_index" (output searches narrowed
+                 by the trigram index), "storage_order" (pages read in
+                 start-time order, stopping once full)
+        stages: Steps in execution order
+        analyzed: Whether the query was executed
+        cached: Whether the result came from the result cache
+        wall_time: Seconds spent executing, when analyzed
+        sessions_scanned: Sessions the query engine received from storage
+        results_scanned: Test results checked by test-level filters
+        sessions_returned: Sessions in the result
+        results_returned: Test results in the result
+    """
+
+    pushed: List[str] = field(default_factory=list)
+    residual: List[str] = field(default_factory=list)
+    test_filters: List[str] = field(default_factory=list)
+    indexes: List[str] = field(default_factory=list)
+    stages: List[StageProfile] = field(default_factory=list)
+    analyzed: bool = False
+    cached: bool = False
+    wall_time: Optional[float] = None
+    sessions_scanned: Optional[int] = None
+    results_scanned: Optional[int] = None
+    sessions_returned: Optional[int] = None
+    results_returned: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        data = {f.name: getattr(self, f.name) for f in dataclasses.fields(self)}
+        data["stages"] = [stage.to_dict() for stage in self.stages]
+        return data
+
+
+def _counted(
+    rows: Iterable[Any], stage: StageProfile, counter: str = "rows_out"
+) -> Iterator[Any]:
+    """Count the rows a lazy step yields into a stage counter.
+
+    When counting rows_out, the time spent producing them is added to
+    stage.seconds as well.
+    """
+    timed = counter == "rows_out"
+    iterator = iter(rows)
+    while True:
+        started = time.perf_counter()
+        try:
+            row = next(iterator)
+        except StopIteration:
+            if timed:
+                stage.seconds += time.perf_counter() - started
+            return
+        if timed:
+            stage.seconds += time.perf_counter() - started
+        setattr(stage, counter, getattr(stage, counter) + 1)
+        yield row
+
+
+class QueryCache:
+    """Bounded LRU cache of query results.
+
+    Entries are keyed by the storage generation plus a canonical form of the
+    query's filters, so any write through save_session/save_sessions/
+    import_sessions/clear_sessions (or a change to the storage file by another
+    process) makes earlier entries unreachable; they are evicted as new results
+    arrive. Queries with custom predicates, and storage backends that cannot
+    report a generation, are never cached.
+
+    Relative time windows (in_last_*) are keyed by window length and a time
+    bucket of ``window_resolution`` seconds, so equivalent dashboard queries
+    share an entry. A cached relative result can therefore be up to
+    ``window_resolution`` seconds stale at the old edge of the window.
+
+    Cached sessions are shared between hits and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 128, window_resolution: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept before evicting the least
+                         recently used one
+            window_resolution: Seconds for which a relative time window result
+                               may be reused
+
+        Raises:
+            InvalidQueryParameterError: If max_entries or window_resolution is not positive
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise InvalidQueryParameterError("max_entries must be a positive integer")
+        if window_resolution <= 0:
+            raise InvalidQueryParameterError("window_resolution must be positive")
+        self.max_entries = max_entries
+        self.window_resolution = window_resolution
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, QueryResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[QueryResult]:
+        """Look up a cached result, counting a hit or miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Hashable, result: QueryResult) -> None:
+        """Store a result, evicting least recently used entries beyond the bound."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """Get counters for tuning the cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self):
+        """Get number of cached results."""
+        return len(self._entries)
+
+
+_default_query_cache: Optional[QueryCache] = None
+
+
+def get_query_cache() -> QueryCache:
+    """Get the process-wide query cache used by Query.with_cache()."""
+    global _default_query_cache
+    if _default_query_cache is None:
+        _default_query_cache = QueryCache()
+    return _default_query_cache
+
+
 class QueryTestFilter:
     """Builder for test-level filters.
 
@@ -582,13 +1514,8 @@ class QueryTestFilter:
         Returns:
             QueryTestFilter instance for chaining
         """
-
-        def warning_predicate(test: TestResult) -> bool:
-            return bool(test.has_warning) == has_warning
-
-        return self.with_custom_filter(
-            warning_predicate, name=f"warning_filter(has_warning={has_warning})"
-        )
+        self.filters.append(WarningFilter(has_warning))
+        return self
 
     def with_duration_between(
         self, min_seconds: float, max_seconds: float
@@ -683,21 +1610,281 @@ class QueryTestFilter:
     @classmethod
     def from_dict(cls, data: Dict, query: "Query") -> "QueryTestFilter":
         """Create filters from dictionary."""
-        filter_types = {
-            FilterType.SHELL_PATTERN.name: ShellPatternFilter,
-            FilterType.REGEX_PATTERN.name: RegexPatternFilter,
-            FilterType.DURATION.name: DurationFilter,
-            FilterType.OUTCOME.name: OutcomeFilter,
-        }
-
         instance = cls(query)
         for filter_type_data in data["filters"]:
-            filter_type = filter_type_data["type"]
-            filter_cls = filter_types[filter_type]
-            instance.filters.append(filter_cls.from_dict(filter_type_data))
+            instance.filters.append(deserialize_test_filter(filter_type_data))
         return instance
 
 
+def _parallel_settings() -> Tuple[int, int]:
+    """Get (threshold, workers) for parallel filtering from InsightConfig.
+
+    Returns:
+        Minimum number of sessions worth a process pool, and the number of
+        worker processes (fewer than 2 means always run serially)
+    """
+    try:
+        from pytest_insight.core.config import get_config
+    except ImportError:  # Optional TOML reader missing; use the defaults
+        settings = {}
+    else:
+        settings = get_config().get("query.parallel", {}) or {}
+    if not settings.get("enabled", True):
+        return 0, 0
+    workers = int(settings.get("workers", 0) or os.cpu_count() or 1)
+    return int(settings.get("threshold", 20000)), workers
+
+
+# Job shared with forked workers: (session filters, test filters, sessions). Workers
+# inherit it at fork, so sessions are never pickled; only match positions return.
+_parallel_job: Dict[str, Any] = {}
+_parallel_lock = threading.Lock()
+
+
+def _match_range(
+    bounds: Tuple[int, int],
+) -> List[Tuple[int, Optional[List[int]]]]:
+    """Evaluate the parallel job's filters over sessions[start:end] in a worker.
+
+    Returns:
+        (session index, matching test positions) per matching session; the
+        positions are None when there are no test filters (whole session matches)
+    """
+    session_filters, test_filters, sessions = _parallel_job["job"]
+    test_predicate = compile_test_filters(test_filters) if test_filters else None
+    matches = []
+    for index in range(*bounds):
+        session = sessions[index]
+        if session_filters and not all(f.matches(session) for f in session_filters):
+            continue
+        if test_predicate is None:
+            matches.append((index, None))
+            continue
+        positions = [
+            position
+            for position, test in enumerate(session.test_results)
+            if test_predicate(test)
+        ]
+        if positions:
+            matches.append((index, positions))
+    return matches
+
+
+def _filter_key(session_filter: SessionFilter) -> Optional[str]:
+    """Canonical form of a structured session filter, None for custom ones."""
+    if not getattr(session_filter, "pushdown", False):
+        return None
+    return json.dumps(session_filter.to_dict(), sort_keys=True)
+
+
+def _shared_pushdown(queries: List["Query"]) -> List[SessionFilter]:
+    """Session filters one storage scan can apply on behalf of every query.
+
+    These are the pushable filters all queries have in common, plus, when every
+    query has a time range, one range spanning all of them (each query still
+    applies its own exact range afterwards).
+    """
+    storage = queries[0].storage
+    common = None
+    for query in queries:
+        keys = {
+            _filter_key(f): f
+            for f in query._session_filters
+            if not isinstance(f, TimeRangeFilter) and storage.supports_pushdown(f)
+        }
+        keys.pop(None, None)
+        common = keys if common is None else {k: common[k] for k in common if k in keys}
+    shared = list((common or {}).values())
+
+    ranges = []
+    for query in queries:
+        query_ranges = [
+            f for f in query._session_filters if isinstance(f, TimeRangeFilter)
+        ]
+        if not query_ranges:
+            return shared
+        ranges.append(query_ranges[0])
+    starts = [r for r in ranges if r.start is not None]
+    ends = [r for r in ranges if r.end is not None]
+    start = end = None
+    if len(starts) == len(ranges):
+        start = min(starts, key=lambda r: r._start_ts).start
+    if len(ends) == len(ranges):
+        end = max(ends, key=lambda r: r._end_ts).end
+    span = TimeRangeFilter(start=start, end=end)
+    if (start or end) and storage.supports_pushdown(span):
+        shared.append(span)
+    return shared
+
+
+# Keys accepted by Query.group_by()
+GROUP_BY_KEYS = ("nodeid", "sut", "day", "outcome")
+
+# Metrics accepted by GroupedQuery.agg()
+AGGREGATES = ("count", "pass_rate", "failure_rate", "mean_duration", "p95_duration")
+
+
+def _session_day(session: TestSession) -> dt_module.date:
+    """Get the UTC calendar day a session started on (naive times taken as UTC)."""
+    return _utc_datetime(session.session_start_time).date()
+
+
+def _outcome_key(test: TestResult) -> str:
+    """Get a test's outcome as its lowercase string."""
+    outcome = test.outcome
+    if isinstance(outcome, TestOutcome):
+        return outcome.to_str()
+    return str(outcome).lower()
+
+
+class _GroupStats:
+    """Running totals for one group of test results."""
+
+    __slots__ = (
+        "count",
+        "passed",
+        "failed",
+        "duration_count",
+        "duration_total",
+        "durations",
+    )
+
+    def __init__(self, keep_durations: bool):
+        self.count = 0
+        self.passed = 0
+        self.failed = 0
+        self.duration_count = 0
+        self.duration_total = 0.0
+        self.durations: Optional[List[float]] = [] if keep_durations else None
+
+    def add(self, test: TestResult) -> None:
+        """Fold one test result into the totals."""
+        self.count += 1
+        if test.outcome == TestOutcome.PASSED:
+            self.passed += 1
+        elif test.outcome == TestOutcome.FAILED:
+            self.failed += 1
+        if test.duration is not None:
+            self.duration_count += 1
+            self.duration_total += test.duration
+            if self.durations is not None:
+                self.durations.append(test.duration)
+
+    def metric(self, name: str) -> Union[int, float]:
+        """Get the value of one of AGGREGATES."""
+        if name == "count":
+            return self.count
+        if name == "pass_rate":
+            return self.passed / self.count if self.count else 0.0
+        if name == "failure_rate":
+            return self.failed / self.count if self.count else 0.0
+        if name == "mean_duration":
+            if not self.duration_count:
+                return 0.0
+            return self.duration_total / self.duration_count
+        # p95_duration, nearest-rank
+        if not self.durations:
+            return 0.0
+        self.durations.sort()
+        return self.durations[max(0, math.ceil(0.95 * len(self.durations)) - 1)]
+
+
+class GroupedQuery:
+    """Aggregate the test results matched by a query.
+
+    Created by Query.group_by(). Every filter on the query applies; each test
+    result that passes them is folded into its group's running totals as the
+    sessions stream from storage, so no filtered TestSession objects are built.
+
+    Groups:
+        - nodeid: the test's node ID
+        - sut: the session's SUT name
+        - day: the UTC date the session started (a datetime.date), or the
+          date given by the query's ``day_of`` function
+        - outcome: the test's lowercase outcome, e.g. "passed"
+
+    Example:
+        Query().for_sut("api").in_last_days(7).group_by("day").agg("count", "pass_rate")
+        # {date(2023, 1, 1): {"count": 120, "pass_rate": 0.95}, ...}
+    """
+
+    def __init__(
+        self,
+        query: "Query",
+        keys: Tuple[str, ...],
+        day_of: Optional[Callable[[TestSession], dt_module.date]] = None,
+    ):
+        """Initialize with the parent query, the keys to group by and the day function."""
+        self.query = query
+        self.keys = keys
+        self.day_of = day_of or _session_day
+
+    def agg(
+        self, *metrics: str, sessions: Optional[List[TestSession]] = None
+    ) -> Dict[Hashable, Dict[str, Union[int, float]]]:
+        """Compute metrics for each group.
+
+        Args:
+            *metrics: Names from AGGREGATES; all of them when omitted
+            sessions: Optional sessions to aggregate instead of reading storage
+
+        Returns:
+            Mapping of group key (a tuple when grouping by several keys) to a
+            mapping of metric name to value, ordered by group key. Rates are
+            fractions in [0, 1]; durations are in seconds.
+
+        Raises:
+            InvalidQueryParameterError: If a metric is unknown or the query is
+                paginated (aggregations always cover every matching result).
+        """
+        metrics = metrics or AGGREGATES
+        unknown = [m for m in metrics if m not in AGGREGATES]
+        if unknown:
+            raise InvalidQueryParameterError(
+                f"Unknown aggregate(s) {unknown}; expected one of {list(AGGREGATES)}"
+            )
+        if self.query._limit or self.query._cursor:
+            raise InvalidQueryParameterError(
+                "Aggregations cover all matching results; remove limit()/after_cursor()"
+            )
+
+        keep_durations = "p95_duration" in metrics
+        session_keys = [k for k in self.keys if k in ("sut", "day")]
+        groups: Dict[Hashable, _GroupStats] = {}
+
+        # Aggregates read only core fields, so skip decoding captured output
+        source, residual, text_candidates = self.query._source_sessions(
+            sessions, fields=self.query._projection(())
+        )
+        matches = self.query._iter_matches(source, residual, text_candidates)
+        for session, positions in matches:
+            tests = session.test_results
+            if positions is not None:
+                tests = [tests[p] for p in positions]
+            session_values = {}
+            if "sut" in session_keys:
+                session_values["sut"] = session.sut_name
+            if "day" in session_keys:
+                session_values["day"] = self.day_of(session)
+            for test in tests:
+                values = tuple(
+                    session_values[k]
+                    if k in session_values
+                    else (test.nodeid if k == "nodeid" else _outcome_key(test))
+                    for k in self.keys
+                )
+                group = values[0] if len(values) == 1 else values
+                stats = groups.get(group)
+                if stats is None:
+                    stats = groups[group] = _GroupStats(keep_durations)
+                stats.add(test)
+
+        return {
+            group: {name: stats.metric(name) for name in metrics}
+            for group, stats in sorted(groups.items(), key=lambda item: str(item[0]))
+        }
+
+
 class Query:
     """Query class for filtering and retrieving test sessions.
 
@@ -770,10 +1957,15 @@ class Query:
             profile_name: Optional profile name to use for storage configuration.
                          If not provided, will use the active profile.
         """
-        self._session_filters = []  # Session-level filters (SUT, time range, warnings)
+        self._session_filters: List[SessionFilter] = []  # Session-level filters (SUT, time range, warnings)
         self._test_filters = []  # Test-level filters (pattern, duration, outcome)
         self._sessions = []  # Cached sessions from storage
         self._profile_name = profile_name or None  # Storage profile name
+        self._cache: Optional[QueryCache] = None  # Result cache, see with_cache()
+        self._order: Optional[Tuple[str, bool]] = None  # (field, descending)
+        self._limit: Optional[int] = None  # Page size
+        self._cursor: Optional[Dict[str, Any]] = None  # Decoded after_cursor() token
+        self._fields: Optional[Tuple[str, ...]] = None  # TestResult projection, see select()
 
         # Get storage instance from profile
         self.storage = get_storage_instance(profile_name=profile_name)
@@ -782,7 +1974,9 @@ class Query:
     def fred_flintstone(self) -> None:
         pass
 
-    def execute(self, sessions: Optional[List[TestSession]] = None) -> QueryResult:
+    def execute(
+        self, sessions: Optional[List[TestSession]] = None, profile: bool = False
+    ) -> QueryResult:
         """Execute query and return results as QueryResult class instance.
 
         Key aspects:
@@ -804,9 +1998,27 @@ class Query:
            - Session metadata (tags, IDs) is maintained
            - Test relationships are preserved
 
+        4. Ordering and Paging:
+           - order_by(), limit() and after_cursor() return one ordered page
+           - QueryResult.next_cursor continues from the end of a full page
+           - Pages ordered by start time are read from storage in order, stopping
+             as soon as the page is full
+
+        5. Caching:
+           - With with_cache(), results loaded from storage are reused while the
+             storage generation and the filters are unchanged
+           - Explicitly provided sessions are never cached
+
+        6. Profiling:
+           - With profile=True, QueryResult.profile holds a QueryProfile with
+             wall time, rows scanned and the selectivity of every filter
+           - Profiled queries run serially and evaluate test filters one at a
+             time, in the order they were added, so each can be measured
+
         Args:
             sessions: Optional list of sessions to query. If not provided,
                      loads (all) sessions from storage.
+            profile: Whether to measure execution (see explain())
 
         Returns:
             QueryResult containing filtered sessions.
@@ -814,54 +2026,926 @@ class Query:
         Raises:
             InvalidQueryParameterError: If sessions list is empty or contains invalid sessions.
         """
-        if sessions is None:
-            sessions = self.storage.load_sessions()
-        elif not sessions:
-            raise InvalidQueryParameterError("No sessions provided")
-        elif not isinstance(sessions, list) or not all(
-            isinstance(s, TestSession) for s in sessions
+        if profile:
+            return self._execute_profiled(sessions)
+        cache_key, cached = self._cached_result(sessions)
+        if cached is not None:
+            return cached
+
+        descending = (self._order or _DEFAULT_ORDER)[1]
+        ordered_by_storage = self._ordered_by_storage(sessions)
+        sessions, residual, text_candidates = self._source_sessions(
+            sessions, ordered_by_storage, descending, self._projection(self._fields)
+        )
+        matching = None
+        if not ordered_by_storage:
+            matching = self._filter_parallel(sessions, residual)
+        if matching is None:
+            matching = self._filter_sessions(sessions, residual, text_candidates)
+        return self._finish(matching, ordered_by_storage, cache_key)
+
+    def _ordered_by_storage(self, sessions: Optional[List[TestSession]]) -> bool:
+        """Check whether a page can be read from storage in start-time order.
+
+        Storage then yields sessions already ordered by start time, so a page
+        can be filled without loading (or decoding) everything.
+        """
+        paginated = bool(self._order or self._limit or self._cursor)
+        order_field = (self._order or _DEFAULT_ORDER)[0]
+        return paginated and order_field == "session_start_time" and sessions is None
+
+    def explain(
+        self, sessions: Optional[List[TestSession]] = None, analyze: bool = False
+    ) -> QueryProfile:
+        """Describe how the query runs: pushdown, indexes and rows per step.
+
+        Args:
+            sessions: Optional sessions to query instead of storage, as in execute()
+            analyze: Whether to execute the query and report measured rows and
+                     timings (like execute(profile=True)) instead of estimates
+
+        Returns:
+            QueryProfile; use to_dict() or the ``insight dev explain`` command
+            to display it
+
+        Example:
+            query.for_sut("api").in_last_days(7).explain().to_dict()
+        """
+        if analyze:
+            return self.execute(sessions, profile=True).profile
+        ordered_by_storage = self._ordered_by_storage(sessions)
+        if sessions is not None:
+            _, residual, text_candidates = self._source_sessions(sessions)
+            pushed = []
+        else:
+            descending = (self._order or _DEFAULT_ORDER)[1]
+            pushed, residual, text_candidates = self._load_plan(
+                ordered_by_storage, descending
+            )
+        return self._new_profile(
+            pushed, residual, text_candidates, ordered_by_storage, sessions, False
+        )
+
+    def _new_profile(
+        self,
+        pushed: List[SessionFilter],
+        residual: List[SessionFilter],
+        text_candidates: Optional[Dict[str, set]],
+        ordered_by_storage: bool,
+        sessions: Optional[List[TestSession]],
+        analyzed: bool,
+    ) -> QueryProfile:
+        """Build a QueryProfile for a plan, with one stage per execution step.
+
+        Stages are, in order: the storage read, each residual session filter,
+        the text index narrowing (when used), each test filter, and paging.
+        Analyzed profiles start with zero counts, to be measured; others carry
+        estimates where available.
+        """
+        profile = QueryProfile(
+            pushed=[_describe_filter(f) for f in pushed],
+            residual=[_describe_filter(f) for f in residual],
+            test_filters=[_describe_filter(f) for f in self._test_filters],
+            analyzed=analyzed,
+        )
+        time_indexed = getattr(self.storage, "time_indexed", False) is True
+        if time_indexed and any(isinstance(f, TimeRangeFilter) for f in pushed):
+            profile.indexes.append("time_index")
+        bitmap_indexed = getattr(self.storage, "bitmap_indexed", False) is True
+        if bitmap_indexed and any(
+            callable(getattr(type(f), "index_keys", None))
+            and f.index_keys() is not None
+            for f in pushed
+        ):
+            profile.indexes.append("bitmap_index")
+        if text_candidates is not None:
+            profile.indexes.append("text_index")
+        if ordered_by_storage:
+            profile.indexes.append("storage_order")
+
+        def stage(level: str, name: str) -> StageProfile:
+            if analyzed:
+                return StageProfile(level, name, 0, 0, 0.0)
+            return StageProfile(level, name, estimated=True)
+
+        if sessions is not None:
+            read = stage("storage", "provided sessions")
+            read.rows_in = len(sessions)
+            if not analyzed:
+                read.rows_out = len(sessions)
+        else:
+            method = "iter_sessions" if ordered_by_storage else "load_sessions"
+            read = stage("storage", f"{type(self.storage).__name__}.{method}")
+            read.rows_in = self._estimate_sessions(None)
+            if not analyzed:
+                read.rows_out = self._estimate_sessions(pushed)
+        profile.stages.append(read)
+        for session_filter in residual:
+            profile.stages.append(stage("session", _describe_filter(session_filter)))
+        if text_candidates is not None:
+            narrow = stage("test", "TextIndexCandidates")
+            if not analyzed:
+                narrow.rows_out = sum(len(p) for p in text_candidates.values())
+            profile.stages.append(narrow)
+        for test_filter in self._test_filters:
+            profile.stages.append(stage("test", _describe_filter(test_filter)))
+        if self._order or self._limit or self._cursor:
+            order_field, descending = self._order or _DEFAULT_ORDER
+            name = f"order by {order_field} {'desc' if descending else 'asc'}"
+            if self._cursor:
+                name += " after cursor"
+            if self._limit:
+                name += f" limit {self._limit}"
+            page = stage("page", name)
+            page.seconds = None
+            profile.stages.append(page)
+        return profile
+
+    def _estimate_sessions(
+        self, pushed: Optional[List[SessionFilter]]
+    ) -> Optional[int]:
+        """Ask storage how many sessions a read would return (None if unknown)."""
+        estimate = getattr(self.storage, "estimate_sessions", None)
+        count = estimate(pushed or None) if callable(estimate) else None
+        return count if isinstance(count, int) else None
+
+    def _execute_profiled(self, sessions: Optional[List[TestSession]]) -> QueryResult:
+        """Execute serially, measuring each step (see execute(profile=True))."""
+        started = time.perf_counter()
+        cache_key, cached = self._cached_result(sessions)
+        ordered_by_storage = self._ordered_by_storage(sessions)
+        if cached is not None:
+            plan = self.plan()
+            profile = self._new_profile(
+                plan.pushed, plan.residual, None, ordered_by_storage, sessions, True
+            )
+            profile.cached = True
+            result = cached
+        else:
+            source = None
+            if sessions is not None:
+                source, residual, text_candidates = self._source_sessions(sessions)
+                pushed = []
+            else:
+                descending = (self._order or _DEFAULT_ORDER)[1]
+                pushed, residual, text_candidates = self._load_plan(
+                    ordered_by_storage, descending
+                )
+            profile = self._new_profile(
+                pushed, residual, text_candidates, ordered_by_storage, sessions, True
+            )
+            read = profile.stages[0]
+            if source is None:
+                load_started = time.perf_counter()
+                source = self._load(
+                    pushed,
+                    ordered_by_storage,
+                    descending,
+                    self._projection(self._fields),
+                )
+                read.seconds = time.perf_counter() - load_started
+            matching = self._filter_sessions(
+                _counted(source, read), residual, text_candidates, profile
+            )
+            if profile.stages[-1].level == "page":
+                matching = _counted(matching, profile.stages[-1], "rows_in")
+            result = self._finish(matching, ordered_by_storage, cache_key)
+            if profile.stages[-1].level == "page":
+                profile.stages[-1].rows_out = len(result.sessions)
+            if sessions is None:
+                # The read refreshed the storage's index, so counting is now cheap
+                read.rows_in = self._estimate_sessions(None)
+
+        profile.wall_time = time.perf_counter() - started
+        profile.sessions_returned = len(result.sessions)
+        profile.results_returned = sum(len(s.test_results) for s in result.sessions)
+        result.profile = profile
+        return result
+
+    def _filter_parallel(
+        self, sessions: Iterable[TestSession], residual: List[SessionFilter]
+    ) -> Optional[Iterator[TestSession]]:
+        """Evaluate filters over large session lists in a process pool.
+
+        Used automatically when at least ``query.parallel.threshold`` sessions
+        were loaded (see InsightConfig). Sessions are split into index ranges
+        that forked workers filter independently; workers inherit the loaded
+        sessions and send back only match positions, which are merged in the
+        original order, so results are identical to serial filtering. Custom
+        predicates always run serially, as do platforms without fork.
+
+        Forking copies only the calling thread, so a lock held by any other
+        thread (e.g. in a web server, a dashboard or background aging) stays
+        locked forever in the workers. Processes running more than one thread
+        therefore filter serially; spawned workers are not used instead, as
+        they would have to unpickle every session, which costs more than
+        filtering them serially.
+
+        Returns:
+            Matching sessions, or None when the query should run serially
+        """
+        if not isinstance(sessions, list) or not (residual or self._test_filters):
+            return None
+        if any(isinstance(f, CustomFilter) for f in self._test_filters) or any(
+            isinstance(f, CustomSessionFilter) for f in residual
         ):
-            raise InvalidQueryParameterError("Invalid session type")
+            return None
+        if "fork" not in multiprocessing.get_all_start_methods():
+            return None
+        if threading.active_count() != 1:
+            return None
+        threshold, workers = _parallel_settings()
+        if workers < 2 or len(sessions) < max(threshold, 1):
+            return None
+
+        chunk_size = max(1, math.ceil(len(sessions) / (workers * 4)))
+        ranges = [
+            (start, min(start + chunk_size, len(sessions)))
+            for start in range(0, len(sessions), chunk_size)
+        ]
+        with _parallel_lock:
+            _parallel_job["job"] = (residual, self._test_filters, sessions)
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=min(workers, len(ranges)),
+                    mp_context=multiprocessing.get_context("fork"),
+                ) as pool:
+                    parts = list(pool.map(_match_range, ranges))
+            except (BrokenProcessPool, OSError) as e:
+                print(f"Warning: Parallel query failed, filtering serially: {e}")
+                return None
+            finally:
+                _parallel_job.clear()
+
+        def merged() -> Iterator[TestSession]:
+            for matches in parts:
+                for index, positions in matches:
+                    session = sessions[index]
+                    if positions is None:
+                        yield session
+                    else:
+                        yield FilteredSessionView(session, positions)
+
+        return merged()
+
+    def _cached_result(
+        self, sessions: Optional[List[TestSession]]
+    ) -> Tuple[Optional[Hashable], Optional[QueryResult]]:
+        """Look the query up in its result cache.
 
-        # Apply session-level filters
-        filtered_sessions: List[TestSession] = sessions
-        for filter_func in self._session_filters:
-            filtered_sessions = [s for s in filtered_sessions if filter_func(s)]
+        Returns:
+            Tuple of (cache key to store the result under or None, cached result
+            or None)
+        """
+        if sessions is not None or self._cache is None:
+            return None, None
+        cache_key = self.cache_key()
+        if cache_key is None:
+            return None, None
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cache_key, QueryResult(list(cached.sessions), cached.next_cursor)
+        return cache_key, None
+
+    def _finish(
+        self,
+        matching: Iterator[TestSession],
+        ordered_by_storage: bool,
+        cache_key: Optional[Hashable] = None,
+    ) -> QueryResult:
+        """Apply ordering and paging to matching sessions and cache the result.
 
-        # Apply test-level filters
-        if self._test_filters:
-            sessions_with_matching_tests = []
-            for session in filtered_sessions:
-                # Find tests that match all filters, preserving order
-                matching_tests = [
-                    test
-                    for test in session.test_results
-                    if all(
-                        filter_func.matches(test) for filter_func in self._test_filters
+        Args:
+            matching: Sessions passing every filter
+            ordered_by_storage: Whether matching is already in start-time order
+                                (in the query's direction)
+            cache_key: Key to cache the result under, or None
+        """
+        paginated = bool(self._order or self._limit or self._cursor)
+        order_field, descending = self._order or _DEFAULT_ORDER
+        next_cursor = None
+        if not paginated:
+            filtered_sessions = list(matching)
+        else:
+            sort_key = _session_order_key(order_field)
+            if not ordered_by_storage:
+                matching = iter(sorted(matching, key=sort_key, reverse=descending))
+            if self._cursor:
+                after = self._cursor["key"]
+                if descending:
+                    matching = (s for s in matching if sort_key(s) < after)
+                else:
+                    matching = (s for s in matching if sort_key(s) > after)
+            if self._limit:
+                # Read one extra session to know whether another page exists
+                filtered_sessions = list(itertools.islice(matching, self._limit + 1))
+                if len(filtered_sessions) > self._limit:
+                    filtered_sessions = filtered_sessions[: self._limit]
+                    next_cursor = _encode_cursor(
+                        order_field, descending, filtered_sessions[-1]
                     )
+            else:
+                filtered_sessions = list(matching)
+
+        result = QueryResult(filtered_sessions, next_cursor)
+        if cache_key is not None:
+            self._cache.put(cache_key, QueryResult(list(filtered_sessions), next_cursor))
+        return result
+
+    @staticmethod
+    def execute_many(
+        queries: List["Query"], sessions: Optional[List[TestSession]] = None
+    ) -> List[QueryResult]:
+        """Execute several queries with one scan of their storage.
+
+        Queries reading the same storage version are batched: storage is read
+        once, pushing down the session filters the queries share (and a time
+        range covering all of theirs), then every query's own session and test
+        filters are evaluated in a single pass over the loaded sessions. Each
+        query's ordering, paging and result cache still apply.
+
+        Args:
+            queries: Queries to execute
+            sessions: Optional sessions to run every query against instead of
+                      reading storage
+
+        Returns:
+            One QueryResult per query, in the same order, equal to what each
+            query's execute() would return
+
+        Raises:
+            InvalidQueryParameterError: If sessions are given but empty or invalid.
+
+        Example:
+            failed, slow = Query.execute_many([
+                Query().for_sut("api").in_last_days(7).with_outcome("failed"),
+                Query().for_sut("api").in_last_days(7)
+                    .filter_by_test().with_duration_between(10, float("inf")).apply(),
+            ])
+        """
+        results: List[Optional[QueryResult]] = [None] * len(queries)
+        batches: Dict[Hashable, List[Tuple[int, Optional[Hashable]]]] = {}
+        for i, query in enumerate(queries):
+            cache_key, cached = query._cached_result(sessions)
+            if cached is not None:
+                results[i] = cached
+                continue
+            if sessions is not None:
+                batch_key: Hashable = "sessions"
+            else:
+                generation = query.storage.generation()
+                batch_key = (
+                    ("generation", generation)
+                    if generation is not None
+                    else ("storage", id(query.storage))
+                )
+            batches.setdefault(batch_key, []).append((i, cache_key))
+
+        for members in batches.values():
+            batch = [queries[i] for i, _ in members]
+            if sessions is not None:
+                source, _, _ = batch[0]._source_sessions(sessions)
+                shared = []
+            else:
+                storage = batch[0].storage
+                shared = _shared_pushdown(batch)
+                load_options = {}
+                projections = [q._projection(q._fields) for q in batch]
+                if (
+                    getattr(storage, "supports_projection", False) is True
+                    and None not in projections
+                ):
+                    load_options["fields"] = tuple(sorted(set().union(*projections)))
+                if shared:
+                    load_options["session_filters"] = shared
+                source = storage.load_sessions(**load_options)
+
+            shared_keys = {_filter_key(f) for f in shared}
+            plans = [
+                (
+                    [
+                        f
+                        for f in q._session_filters
+                        if _filter_key(f) not in shared_keys
+                    ],
+                    compile_test_filters(q._test_filters) if q._test_filters else None,
+                )
+                for q in batch
+            ]
+            matched: List[List[TestSession]] = [[] for _ in batch]
+            for session in source:
+                for j, (residual, test_predicate) in enumerate(plans):
+                    if residual and not all(f.matches(session) for f in residual):
+                        continue
+                    if test_predicate is None:
+                        matched[j].append(session)
+                        continue
+                    positions = [
+                        p
+                        for p, test in enumerate(session.test_results)
+                        if test_predicate(test)
+                    ]
+                    if positions:
+                        matched[j].append(FilteredSessionView(session, positions))
+
+            for j, (i, cache_key) in enumerate(members):
+                results[i] = batch[j]._finish(iter(matched[j]), False, cache_key)
+        return results
+
+    def _source_sessions(
+        self,
+        sessions: Optional[List[TestSession]],
+        ordered_by_storage: bool = False,
+        descending: bool = True,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[Iterable[TestSession], List[SessionFilter], Optional[Dict[str, set]]]:
+        """Get the sessions a query reads, pushing filters down where possible.
+
+        Args:
+            sessions: Explicitly provided sessions, or None to read from storage
+            ordered_by_storage: Whether storage should yield sessions in start-time
+                                order (only when reading from storage)
+            descending: Start-time direction when ordered_by_storage is set
+            fields: Optional projection hint for storage (see _projection)
+
+        Returns:
+            Tuple of (sessions, residual session filters still to apply, text
+            index candidates or None)
+
+        Raises:
+            InvalidQueryParameterError: If provided sessions are empty or invalid.
+        """
+        if sessions is not None:
+            if not sessions:
+                raise InvalidQueryParameterError("No sessions provided")
+            if not isinstance(sessions, list) or not all(
+                isinstance(s, TestSession) for s in sessions
+            ):
+                raise InvalidQueryParameterError("Invalid session type")
+            # Explicitly provided sessions bypass storage, so every filter runs here
+            return sessions, self._session_filters, None
+
+        pushed, residual, text_candidates = self._load_plan(
+            ordered_by_storage, descending
+        )
+        return (
+            self._load(pushed, ordered_by_storage, descending, fields),
+            residual,
+            text_candidates,
+        )
+
+    def _load_plan(
+        self, ordered_by_storage: bool, descending: bool
+    ) -> Tuple[List[SessionFilter], List[SessionFilter], Optional[Dict[str, set]]]:
+        """Decide which filters storage evaluates for a read from storage.
+
+        Returns:
+            Tuple of (filters to push down, residual session filters, text
+            index candidates or None)
+        """
+        plan = self.plan()
+        pushed = list(plan.pushed)
+        residual = plan.residual
+        # Narrow to sessions the text index says can match output searches
+        text_candidates = self._text_candidates()
+        if text_candidates is not None:
+            candidate_filter = _SessionIdSetFilter(frozenset(text_candidates))
+            if self.storage.supports_pushdown(candidate_filter):
+                pushed.append(candidate_filter)
+            else:
+                residual = residual + [candidate_filter]
+        if self._cursor and ordered_by_storage:
+            cursor_bound = self._cursor_time_bound(descending)
+            if self.storage.supports_pushdown(cursor_bound):
+                pushed.append(cursor_bound)
+        return pushed, residual, text_candidates
+
+    def _load(
+        self,
+        pushed: List[SessionFilter],
+        ordered_by_storage: bool,
+        descending: bool,
+        fields: Optional[Tuple[str, ...]],
+    ) -> Iterable[TestSession]:
+        """Read sessions from storage with the pushed filters (see _load_plan)."""
+        load_options = {}
+        supports_projection = getattr(self.storage, "supports_projection", False)
+        if fields is not None and supports_projection is True:
+            load_options["fields"] = fields
+        if ordered_by_storage:
+            return self.storage.iter_sessions(
+                descending=descending, session_filters=pushed or None, **load_options
+            )
+        if pushed:
+            return self.storage.load_sessions(session_filters=pushed, **load_options)
+        return self.storage.load_sessions(**load_options)
+
+    def _projection(self, fields: Optional[Iterable[str]]) -> Optional[Tuple[str, ...]]:
+        """Widen requested TestResult fields to everything the filters read.
+
+        Args:
+            fields: Fields the caller will read, or None for no projection
+
+        Returns:
+            Sorted projectable fields to load, or None to load every field (no
+            projection requested, or custom predicates that may read anything)
+        """
+        if fields is None:
+            return None
+        if any(isinstance(f, CustomFilter) for f in self._test_filters) or any(
+            isinstance(f, CustomSessionFilter) for f in self._session_filters
+        ):
+            return None
+        needed = set(fields)
+        for test_filter in self._test_filters:
+            field_name = getattr(test_filter, "field_name", None)
+            if field_name:
+                needed.add(field_name)
+        return tuple(sorted(needed & set(PROJECTABLE_RESULT_FIELDS)))
+
+    def _iter_matches(
+        self,
+        sessions: Iterable[TestSession],
+        residual: List[SessionFilter],
+        text_candidates: Optional[Dict[str, set]] = None,
+        profile: Optional[QueryProfile] = None,
+    ) -> Iterator[Tuple[TestSession, Optional[List[int]]]]:
+        """Lazily apply residual session filters and test-level filters.
+
+        Args:
+            sessions: Sessions to filter, in the order they should be returned
+            residual: Session filters not already applied by storage
+            text_candidates: Optional text index answer (session ID to candidate
+                             test positions); only candidates are verified
+            profile: Optional analyzed QueryProfile (see _new_profile) to count
+                     rows and time each filter into
+
+        Yields:
+            (session, positions of matching tests in session.test_results) for
+            each matching session. Without test filters the positions are None
+            (every test matches); with them, sessions without a matching test
+            are skipped.
+        """
+        if profile is not None:
+            yield from self._iter_profiled(sessions, residual, text_candidates, profile)
+            return
+        test_predicate = (
+            compile_test_filters(self._test_filters) if self._test_filters else None
+        )
+        for session in sessions:
+            # Apply remaining session-level filters in a single pass
+            if residual and not all(f.matches(session) for f in residual):
+                continue
+            if test_predicate is None:
+                yield session, None
+                continue
+
+            # Find tests that match all filters, preserving order
+            tests = session.test_results
+            if text_candidates is not None:
+                candidates = sorted(text_candidates.get(session.session_id, ()))
+                positions = [
+                    p for p in candidates if p < len(tests) and test_predicate(tests[p])
                 ]
+            else:
+                positions = [p for p, test in enumerate(tests) if test_predicate(test)]
+            if positions:
+                yield session, positions
+
+    def _iter_profiled(
+        self,
+        sessions: Iterable[TestSession],
+        residual: List[SessionFilter],
+        text_candidates: Optional[Dict[str, set]],
+        profile: QueryProfile,
+    ) -> Iterator[Tuple[TestSession, Optional[List[int]]]]:
+        """_iter_matches evaluating filters one at a time, measuring each."""
+        stages = profile.stages[1:]
+        session_stages = list(zip(residual, stages))
+        stages = stages[len(residual) :]
+        text_stage = stages.pop(0) if text_candidates is not None else None
+        test_stages = list(zip(self._test_filters, stages))
+        profile.sessions_scanned = profile.results_scanned = 0
+
+        for session in sessions:
+            profile.sessions_scanned += 1
+            passed = True
+            for session_filter, stage in session_stages:
+                started = time.perf_counter()
+                passed = session_filter.matches(session)
+                stage.seconds += time.perf_counter() - started
+                stage.rows_in += 1
+                if not passed:
+                    break
+                stage.rows_out += 1
+            if not passed:
+                continue
+            if not test_stages:
+                yield session, None
+                continue
+
+            tests = session.test_results
+            positions = range(len(tests))
+            if text_stage is not None:
+                candidates = sorted(text_candidates.get(session.session_id, ()))
+                text_stage.rows_in += len(tests)
+                positions = [p for p in candidates if p < len(tests)]
+                text_stage.rows_out += len(positions)
+            profile.results_scanned += len(positions)
+            for test_filter, stage in test_stages:
+                if not positions:
+                    break
+                started = time.perf_counter()
+                stage.rows_in += len(positions)
+                positions = [p for p in positions if test_filter.matches(tests[p])]
+                stage.rows_out += len(positions)
+                stage.seconds += time.perf_counter() - started
+            if positions:
+                yield session, positions
+
+    def _filter_sessions(
+        self,
+        sessions: Iterable[TestSession],
+        residual: List[SessionFilter],
+        text_candidates: Optional[Dict[str, set]] = None,
+        profile: Optional[QueryProfile] = None,
+    ) -> Iterator[TestSession]:
+        """Lazily apply residual session filters and test-level filters.
+
+        Yields:
+            Matching sessions; with test filters, FilteredSessionView objects
+            holding only the matching tests
+        """
+        filtered = self._iter_matches(sessions, residual, text_candidates, profile)
+        for session, positions in filtered:
+            if positions is None:
+                yield session
+            else:
+                yield FilteredSessionView(session, positions)
 
-                # If any tests match all filters, create new session with only matching tests
-                if matching_tests:
-                    filtered_session = TestSession(
-                        sut_name=session.sut_name,
-                        session_id=session.session_id,
-                        session_start_time=session.session_start_time,
-                        session_stop_time=session.session_stop_time,
-                        test_results=matching_tests,  # Only matching tests in original order
-                        rerun_test_groups=session.rerun_test_groups,
-                        session_tags=session.session_tags,
-                    )
-                    sessions_with_matching_tests.append(filtered_session)
-            filtered_sessions = sessions_with_matching_tests
+    def _text_candidates(self) -> Optional[Dict[str, set]]:
+        """Ask the storage's text index which results can match output searches.
+
+        Only literal searches on indexed fields (captured output and tracebacks)
+        of at least MIN_LITERAL_LENGTH characters use the index; candidates for
+        several searches are intersected. Candidates are a superset of matches.
+
+        Returns:
+            Mapping of session ID to candidate test positions, or None when the
+            index is unavailable or cannot help with these filters
+        """
+        literals = []
+        for test_filter in self._test_filters:
+            literal = _literal_pattern(test_filter)
+            if (
+                literal is not None
+                and literal[0] in INDEXED_FIELDS
+                and len(literal[1]) >= MIN_LITERAL_LENGTH
+            ):
+                literals.append(literal)
+        if not literals:
+            return None
+
+        index = self.storage.get_text_index()
+        if not isinstance(index, TextIndex):
+            return None
+
+        candidates = None
+        for field_name, literal in literals:
+            found = index.candidates(field_name, literal)
+            if candidates is None:
+                candidates = found
+                continue
+            candidates = {
+                session_id: candidates[session_id] & positions
+                for session_id, positions in found.items()
+                if session_id in candidates and candidates[session_id] & positions
+            }
+        return candidates
+
+    def _cursor_time_bound(self, descending: bool) -> "TimeRangeFilter":
+        """Build an inclusive time bound that skips sessions before the cursor.
+
+        Sessions sharing the cursor's start time are kept; the exact position is
+        resolved by the (start time, session ID) comparison in execute().
+        """
+        cursor_time = self._cursor["key"][0]
+        if descending:
+            return TimeRangeFilter(end=cursor_time)
+        return TimeRangeFilter(start=cursor_time)
 
-        return QueryResult(filtered_sessions)
+    def with_cache(self, cache: Optional[QueryCache] = None) -> "Query":
+        """Reuse results of identical queries against unchanged storage.
+
+        Args:
+            cache: Cache to use. Defaults to the process-wide cache returned by
+                   get_query_cache(), shared by all queries.
+
+        Returns:
+            Query instance for chaining.
+        """
+        self._cache = cache if cache is not None else get_query_cache()
+        return self
+
+    def cache_key(self) -> Optional[Hashable]:
+        """Build the result cache key for this query against its storage.
+
+        The key combines the storage generation with a canonical (order
+        independent) form of the session and test filters.
+
+        Returns:
+            Hashable key, or None if the query cannot be cached (custom
+            predicates, or a storage backend without a generation)
+        """
+        generation = self.storage.generation()
+        if generation is None:
+            return None
+        canonical = self._canonical()
+        if canonical is None:
+            return None
+        key, relative = canonical
+
+        bucket = None
+        if relative:
+            resolution = (self._cache or get_query_cache()).window_resolution
+            bucket = int(time.time() // resolution)
+        return (generation, key, bucket)
+
+    def _canonical(self) -> Optional[Tuple[str, bool]]:
+        """Get the canonical JSON of everything that determines the results.
+
+        Filters are ANDed, so they are sorted; relative windows are keyed by
+        their length (see _canonical_filter).
+
+        Returns:
+            (canonical JSON, whether a relative window is involved), or None for
+            queries with custom predicates
+        """
+        if any(isinstance(f, CustomSessionFilter) for f in self._session_filters):
+            return None
+        if any(isinstance(f, CustomFilter) for f in self._test_filters):
+            return None
+        data = self.to_dict()
+        relative = False
+        for filters_key in ("session_filters", "test_filters"):
+            keys = []
+            for filter_data in data.get(filters_key, []):
+                key, is_relative = _canonical_filter(filter_data)
+                keys.append(key)
+                relative = relative or is_relative
+            data[filters_key] = sorted(keys)
+        return json.dumps(data, sort_keys=True, separators=(",", ":")), relative
+
+    def fingerprint(self) -> Optional[str]:
+        """Get a stable hash identifying this query's filters, ordering and paging.
+
+        Equivalent queries get the same fingerprint regardless of the order
+        filters were added in, in any process. A relative window (in_last_*)
+        is identified by its length, so the same in_last_days(7) query built
+        on different days shares a fingerprint.
+
+        Returns:
+            Hex SHA-256 digest, or None for queries with custom predicates
+        """
+        canonical = self._canonical()
+        if canonical is None:
+            return None
+        return hashlib.sha256(canonical[0].encode("utf-8")).hexdigest()
+
+    def select(self, *fields: str) -> "Query":
+        """Load only some TestResult fields from storage.
+
+        Captured output and tracebacks (caplog, capstdout, capstderr,
+        longreprtext) are often many KB per result. With select(), storage
+        backends that support projection skip them and return
+        ProjectedTestResult objects; reading a field that was not loaded raises
+        FieldNotLoadedError. nodeid, outcome, start_time and duration are always
+        loaded, as is any field a test filter searches. Queries with custom
+        predicates, explicitly provided sessions and backends without
+        projection support return full results.
+
+        Args:
+            *fields: TestResult field names to load in addition to the core ones
+
+        Returns:
+            Query instance for chaining
+
+        Raises:
+            InvalidQueryParameterError: If a field is not a TestResult field.
+
+        Example:
+            query.select("longreprtext").filter_by_test().with_outcome("failed").apply()
+        """
+        known = set(CORE_RESULT_FIELDS) | set(PROJECTABLE_RESULT_FIELDS)
+        unknown = [f for f in fields if f not in known]
+        if unknown:
+            raise InvalidQueryParameterError(
+                f"Unknown TestResult field(s) {unknown}; "
+                f"expected some of {sorted(known)}"
+            )
+        self._fields = tuple(sorted(set(fields)))
+        return self
+
+    def order_by(self, field_name: str, desc: bool = False) -> "Query":
+        """Order results by a session field.
+
+        Ties are broken by session ID, so the order is stable across pages.
+
+        Args:
+            field_name: One of ORDERABLE_FIELDS (session_start_time,
+                        session_stop_time, session_duration, sut_name, session_id)
+            desc: Whether to order descending (e.g. newest first)
+
+        Returns:
+            Query instance for chaining.
+
+        Raises:
+            InvalidQueryParameterError: If the field is not orderable, or does not
+                match a cursor already set with after_cursor()
+        """
+        if field_name not in ORDERABLE_FIELDS:
+            raise InvalidQueryParameterError(
+                f"Cannot order by {field_name!r}. Must be one of: {', '.join(ORDERABLE_FIELDS)}"
+            )
+        self._order = (field_name, bool(desc))
+        self._check_cursor_order()
+        return self
+
+    def limit(self, n: int) -> "Query":
+        """Return at most N sessions.
+
+        Without order_by(), results are ordered newest first. When more sessions
+        match, QueryResult.next_cursor holds a token for the next page.
+
+        Args:
+            n: Maximum number of sessions to return.
+
+        Returns:
+            Query instance for chaining.
+
+        Raises:
+            InvalidQueryParameterError: If n is not a positive integer.
+        """
+        if not isinstance(n, int) or isinstance(n, bool) or n < 1:
+            raise InvalidQueryParameterError("Limit must be a positive integer")
+        self._limit = n
+        return self
+
+    def after_cursor(self, token: str) -> "Query":
+        """Continue after the page that produced a QueryResult.next_cursor token.
+
+        The query must use the same filters and ordering as the query that
+        produced the token.
+
+        Args:
+            token: Opaque cursor from QueryResult.next_cursor.
+
+        Returns:
+            Query instance for chaining.
+
+        Raises:
+            InvalidQueryParameterError: If the token is malformed or was produced
+                with a different ordering
+        """
+        if not isinstance(token, str) or not token:
+            raise InvalidQueryParameterError("Cursor must be a non-empty string")
+        self._cursor = _decode_cursor(token)
+        if self._order is None:
+            self._order = (self._cursor["field"], self._cursor["descending"])
+        self._check_cursor_order()
+        return self
+
+    def _check_cursor_order(self) -> None:
+        """Ensure the cursor was produced by a query with the current ordering."""
+        if self._cursor and self._order != (
+            self._cursor["field"],
+            self._cursor["descending"],
+        ):
+            raise InvalidQueryParameterError(
+                "Cursor was produced with a different ordering than this query"
+            )
 
     def to_dict(self) -> Dict:
-        """Convert query to dictionary."""
-        data = {"version": 1}
+        """Convert query to dictionary.
+
+        Every built-in session and test filter is serialized along with the
+        ordering, page size, cursor and field selection, so from_dict() can
+        rebuild an equivalent query in another process. Custom predicates are
+        described by name only and cannot be rebuilt.
+        """
+        data = {"version": 2}
+        if self._session_filters:
+            data["session_filters"] = [f.to_dict() for f in self._session_filters]
         if self._test_filters:
             data["test_filters"] = [f.to_dict() for f in self._test_filters]
+        if self._order:
+            data["order"] = {"field": self._order[0], "descending": self._order[1]}
+        if self._limit is not None:
+            data["limit"] = self._limit
+        if self._cursor:
+            data["cursor"] = self._cursor["token"]
+        if self._fields is not None:
+            data["fields"] = list(self._fields)
         return data
 
     @classmethod
@@ -870,22 +2954,79 @@ class Query:
         data: Dict,
         profile_name: Optional[str] = None,
     ) -> "Query":
-        """Create query from dictionary."""
-        query = cls(profile_name)
-        filter_map = {
-            FilterType.SHELL_PATTERN.name: ShellPatternFilter,
-            FilterType.REGEX_PATTERN.name: RegexPatternFilter,
-            FilterType.DURATION.name: DurationFilter,
-            FilterType.OUTCOME.name: OutcomeFilter,
-        }
+        """Create query from dictionary.
 
-        if "test_filters" in data:
-            for filter_type_data in data["test_filters"]:
-                filter_type = filter_type_data["type"]
-                filter_cls = filter_map[filter_type]
-                query._test_filters.append(filter_cls.from_dict(filter_type_data))
+        Accepts both the current format and version 1 (test filters only).
+
+        Raises:
+            InvalidQueryParameterError: If the data holds a custom predicate, an
+                unknown filter type or invalid ordering/paging parameters
+        """
+        query = cls(profile_name)
+        for filter_data in data.get("session_filters", []):
+            query._session_filters.append(deserialize_session_filter(filter_data))
+        for filter_data in data.get("test_filters", []):
+            query._test_filters.append(deserialize_test_filter(filter_data))
+        if data.get("order"):
+            query.order_by(data["order"]["field"], desc=data["order"]["descending"])
+        if data.get("limit") is not None:
+            query.limit(data["limit"])
+        if data.get("cursor"):
+            query.after_cursor(data["cursor"])
+        if data.get("fields") is not None:
+            query.select(*data["fields"])
         return query
 
+    def plan(self) -> QueryPlan:
+        """Split session-level filters between storage and the query engine.
+
+        Structured filters are pushed down when the storage backend supports them,
+        so it can skip non-matching sessions before building TestSession objects
+        (or skip whole partitions, such as a tiered profile's cold segments).
+        Custom predicates and anything the backend cannot evaluate stay residual.
+
+        Returns:
+            QueryPlan describing pushed and residual filters
+        """
+        plan = QueryPlan()
+        for session_filter in self._session_filters:
+            if self.storage.supports_pushdown(session_filter):
+                plan.pushed.append(session_filter)
+            else:
+                plan.residual.append(session_filter)
+        return plan
+
+    def group_by(
+        self,
+        *keys: str,
+        day_of: Optional[Callable[[TestSession], dt_module.date]] = None,
+    ) -> GroupedQuery:
+        """Group matching test results for aggregation.
+
+        Args:
+            *keys: One or more of GROUP_BY_KEYS ("nodeid", "sut", "day", "outcome")
+            day_of: Optional function giving the day of a session for the "day"
+                    key (default: the UTC date it started), e.g. to line groups
+                    up with other series bucketed by local date
+
+        Returns:
+            GroupedQuery; call agg() on it to compute metrics
+
+        Raises:
+            InvalidQueryParameterError: If no key or an unknown key is given.
+
+        Example:
+            query.group_by("nodeid").agg("count", "pass_rate", "p95_duration")
+        """
+        if not keys:
+            raise InvalidQueryParameterError("group_by() needs at least one key")
+        unknown = [k for k in keys if k not in GROUP_BY_KEYS]
+        if unknown:
+            raise InvalidQueryParameterError(
+                f"Cannot group by {unknown}; expected one of {list(GROUP_BY_KEYS)}"
+            )
+        return GroupedQuery(self, keys, day_of)
+
     def filter_by_test(self) -> QueryTestFilter:
         """Start building test-level filters.
 
@@ -915,7 +3056,7 @@ class Query:
         """
         if not isinstance(name, str) or not name.strip():
             raise InvalidQueryParameterError("SUT name must be a non-empty string")
-        self._session_filters.append(lambda s: s.sut_name == name)
+        self._session_filters.append(SutFilter(name))
         return self
 
     def in_last_days(self, days: int) -> "Query":
@@ -936,10 +3077,9 @@ class Query:
         """
         if not isinstance(days, int) or days < 0:
             raise InvalidQueryParameterError("Days must be a non-negative integer")
-        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - dt_module.timedelta(
-            days=days
-        )
-        self._session_filters.append(create_after_or_equals_filter(cutoff))
+        window = dt_module.timedelta(days=days)
+        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - window
+        self._session_filters.append(TimeRangeFilter(start=cutoff, window=window))
         return self
 
     def in_last_hours(self, hours: int) -> "Query":
@@ -956,10 +3096,9 @@ class Query:
         """
         if not isinstance(hours, int) or hours < 0:
             raise InvalidQueryParameterError("Hours must be a non-negative integer")
-        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - dt_module.timedelta(
-            hours=hours
-        )
-        self._session_filters.append(create_after_or_equals_filter(cutoff))
+        window = dt_module.timedelta(hours=hours)
+        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - window
+        self._session_filters.append(TimeRangeFilter(start=cutoff, window=window))
         return self
 
     def in_last_minutes(self, minutes: int) -> "Query":
@@ -976,10 +3115,9 @@ class Query:
         """
         if not isinstance(minutes, int) or minutes < 0:
             raise InvalidQueryParameterError("Minutes must be a non-negative integer")
-        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - dt_module.timedelta(
-            minutes=minutes
-        )
-        self._session_filters.append(create_after_or_equals_filter(cutoff))
+        window = dt_module.timedelta(minutes=minutes)
+        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - window
+        self._session_filters.append(TimeRangeFilter(start=cutoff, window=window))
         return self
 
     def in_last_seconds(self, seconds: int) -> "Query":
@@ -996,10 +3134,9 @@ class Query:
         """
         if not isinstance(seconds, int) or seconds < 0:
             raise InvalidQueryParameterError("Seconds must be a non-negative integer")
-        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - dt_module.timedelta(
-            seconds=seconds
-        )
-        self._session_filters.append(create_after_or_equals_filter(cutoff))
+        window = dt_module.timedelta(seconds=seconds)
+        cutoff = dt_module.datetime.now(dt_module.timezone.utc) - window
+        self._session_filters.append(TimeRangeFilter(start=cutoff, window=window))
         return self
 
     def date_range(self, start: dt_module.datetime, end: dt_module.datetime) -> "Query":
@@ -1029,9 +3166,8 @@ class Query:
         if start > end:
             raise InvalidQueryParameterError("Start date must be before end date")
 
-        # We no longer need to check timezone compatibility as our NormalizedDatetime class handles that
-        self._session_filters.append(create_after_or_equals_filter(start))
-        self._session_filters.append(create_before_or_equals_filter(end))
+        # TimeRangeFilter compares UTC epoch seconds, so no timezone alignment is needed here
+        self._session_filters.append(TimeRangeFilter(start=start, end=end))
         return self
 
     def before(self, timestamp: dt_module.datetime) -> "Query":
@@ -1052,7 +3188,7 @@ class Query:
         if not isinstance(timestamp, dt_module.datetime):
             raise InvalidQueryParameterError("Timestamp must be a datetime object")
 
-        self._session_filters.append(create_before_filter(timestamp))
+        self._session_filters.append(TimeRangeFilter(end=timestamp, include_end=False))
         return self
 
     def after(self, timestamp: dt_module.datetime) -> "Query":
@@ -1073,7 +3209,9 @@ class Query:
         if not isinstance(timestamp, dt_module.datetime):
             raise InvalidQueryParameterError("Timestamp must be a datetime object")
 
-        self._session_filters.append(create_after_filter(timestamp))
+        self._session_filters.append(
+            TimeRangeFilter(start=timestamp, include_start=False)
+        )
         return self
 
     def between(self, start: dt_module.datetime, end: dt_module.datetime) -> "Query":
@@ -1097,11 +3235,7 @@ class Query:
         ):
             raise InvalidQueryParameterError("Start and end must be datetime objects")
 
-        # Use both after and before filters together
-        self._session_filters.append(
-            lambda session: session.session_start_time >= start
-            and session.session_start_time <= end
-        )
+        self._session_filters.append(TimeRangeFilter(start=start, end=end))
         return self
 
     def with_outcome(self, outcome: Union[str, TestOutcome]) -> "Query":
@@ -1123,21 +3257,8 @@ class Query:
                 f"Invalid outcome: {outcome_str}. Must be one of: {', '.join(valid_outcomes)}"
             )
 
-        # Create a test filter function
-        def test_filter(test):
-            test_outcome = (
-                test.outcome.value
-                if hasattr(test.outcome, "value")
-                else str(test.outcome)
-            )
-            return test_outcome == outcome_str
-
         # Use filter_by_test to filter at the test level
-        return (
-            self.filter_by_test()
-            .with_custom_filter(test_filter, f"outcome_{outcome_str}")
-            .apply()
-        )
+        return self.filter_by_test().with_outcome(outcome_str).apply()
 
     def with_warning(self, has_warnings: bool = True) -> "Query":
         """Filter sessions by presence of warnings in test results.
@@ -1148,9 +3269,7 @@ class Query:
         Returns:
             Query instance for chaining.
         """
-        self._session_filters.append(
-            lambda s: any(t.has_warning for t in s.test_results) == has_warnings
-        )
+        self._session_filters.append(SessionWarningFilter(has_warnings))
         return self
 
     def with_reruns(self, has_reruns: bool = True) -> "Query":
@@ -1162,7 +3281,7 @@ class Query:
         Returns:
             Query instance for chaining.
         """
-        self._session_filters.append(lambda s: bool(s.rerun_test_groups) == has_reruns)
+        self._session_filters.append(RerunFilter(has_reruns))
         return self
 
     def test_nodeid_contains(self, pattern: str) -> "Query":
@@ -1179,11 +3298,7 @@ class Query:
         """
         if not isinstance(pattern, str) or not pattern.strip():
             raise InvalidQueryParameterError("Test pattern must be a non-empty string")
-        self._session_filters.append(
-            lambda s: any(
-                pattern == t.nodeid or pattern in t.nodeid for t in s.test_results
-            )
-        )
+        self._session_filters.append(NodeidContainsFilter(pattern))
         return self
 
     def with_session_id_pattern(self, pattern: str) -> "Query":
@@ -1206,7 +3321,7 @@ class Query:
             raise InvalidQueryParameterError(
                 "Session ID pattern must be a non-empty string"
             )
-        self._session_filters.append(lambda s: fnmatch.fnmatch(s.session_id, pattern))
+        self._session_filters.append(SessionIdPatternFilter(pattern))
         return self
 
     def with_session_tag(
@@ -1238,18 +3353,16 @@ class Query:
         if not tag_value or not isinstance(tag_value, str):
             raise InvalidQueryParameterError("Tag value must be a non-empty string")
 
-        # Create the new filter
-        def new_filter(s):
-            return s.session_tags.get(tag_key) == tag_value
+        new_filter = SessionTagFilter(tag_key, tag_value)
 
         # If combine_with_or is True and there are existing filters, combine with OR logic
         if combine_with_or and self._session_filters:
-            # Get the last filter
+            # Combine the last filter with the new one using OR
             last_filter = self._session_filters.pop()
-
-            # Create a new filter that combines the last filter with the new one using OR
-            def combined_filter(s):
-                return last_filter(s) or new_filter(s)
+            if isinstance(last_filter, AnyOfFilter):
+                combined_filter = AnyOfFilter(last_filter.filters + [new_filter])
+            else:
+                combined_filter = AnyOfFilter([last_filter, new_filter])
 
             self._session_filters.append(combined_filter)
         else:
@@ -1258,6 +3371,26 @@ class Query:
 
         return self
 
+    def with_custom_session_filter(
+        self, predicate: Callable[[TestSession], bool], name: str
+    ) -> "Query":
+        """Add a custom session-level filter.
+
+        Custom predicates are opaque to storage and always run after loading;
+        prefer the structured filters above so they can be pushed down.
+
+        Args:
+            predicate: Callable that takes a TestSession and returns a boolean
+            name: Name for the filter (used in error messages and plans)
+
+        Returns:
+            Query instance for chaining.
+        """
+        if not callable(predicate):
+            raise InvalidQueryParameterError("Predicate must be callable")
+        self._session_filters.append(CustomSessionFilter(predicate, name))
+        return self
+
     def with_profile(self, profile_name: str) -> "Query":
         """Switch to a different storage profile for this query.
 
@@ -0,0 +1,560 @@
+"""Mergeable duration sketches for pytest-insight.
+
+Percentiles of test durations over months of sessions would need every duration
+if computed exactly. A DDSketch instead counts values in logarithmic buckets, so
+it answers any quantile within a fixed relative error using a few hundred
+counters at most, whatever the number of values. Sketches with the same accuracy
+merge by adding bucket counts: per-day sketches add up to per-month ones, and a
+sketch can be kept current one session at a time.
+
+DurationSketches holds one sketch per test and one per SUT and day. Storages
+persist it next to their data (see BaseStorage.get_duration_sketches).
+
+For summaries over very many tests (fleet-wide rollups), fixed-size sketches
+replace per-test counters, each with a stated error bound:
+
+- HyperLogLog: distinct counts, relative standard error 1.04 / sqrt(2^precision)
+- SpaceSaving: the most frequent (or heaviest) items among ``capacity`` tracked
+  ones; counts overestimate by at most total / capacity
+- CountMinSketch: frequency of any item; overestimates by at most
+  epsilon * total with probability 1 - delta
+
+All three merge, so per-SUT summaries combine into fleet-wide ones.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from pytest_insight.core.models import TestSession
+
+# Relative accuracy of quantile estimates (1%)
+DEFAULT_ALPHA = 0.01
+
+# Buckets kept per sketch; beyond this the lowest buckets are merged
+MAX_BINS = 2048
+
+# Values at or below this many seconds share one bucket (estimated as 0)
+MIN_VALUE = 1e-6
+
+# Quantiles reported by percentiles()
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def percentile_label(quantile: float) -> str:
+    """Get the report key of a quantile, e.g. 0.95 -> "p95"."""
+    return f"p{quantile * 100:g}"
+
+
+class DDSketch:
+    """Quantile sketch with relative accuracy (DDSketch).
+
+    Bucket ``k`` counts the values in (gamma^(k-1), gamma^k], with
+    gamma = (1 + alpha) / (1 - alpha). A quantile is estimated from the bucket
+    holding its rank, which is within a relative error alpha of the true value.
+    Count, sum, minimum and maximum are exact.
+
+    Attributes:
+        alpha: Relative accuracy
+        count: Number of values added
+        sum: Sum of the values
+        min: Smallest value (None when empty)
+        max: Largest value (None when empty)
+        zero_count: Values at or below MIN_VALUE
+        bins: Count per bucket key
+    """
+
+    __slots__ = ("alpha", "count", "sum", "min", "max", "zero_count", "bins", "_gamma", "_log_gamma")
+
+    def __init__(self, alpha: float = DEFAULT_ALPHA):
+        """Initialize an empty sketch.
+
+        Args:
+            alpha: Relative accuracy of quantile estimates, between 0 and 1
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self._gamma = (1 + alpha) / (1 - alpha)
+        self._log_gamma = math.log(self._gamma)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.zero_count = 0
+        self.bins: Dict[int, int] = {}
+
+    def __len__(self):
+        """Get number of values added."""
+        return self.count
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Get the mean of the values (None when empty)."""
+        return self.sum / self.count if self.count else None
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Add a value (``count`` times)."""
+        if value > MIN_VALUE:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            bins = self.bins
+            bins[key] = bins.get(key, 0) + count
+            if len(bins) > MAX_BINS:
+                self._collapse()
+        else:
+            self.zero_count += count
+        self.count += count
+        self.sum += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other: "DDSketch") -> None:
+        """Add the values of another sketch with the same accuracy."""
+        if other.alpha != self.alpha:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        if not other.count:
+            return
+        bins = self.bins
+        for key, count in other.bins.items():
+            bins[key] = bins.get(key, 0) + count
+        if len(bins) > MAX_BINS:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def _collapse(self) -> None:
+        """Merge the lowest buckets so that at most MAX_BINS remain."""
+        keys = sorted(self.bins)
+        excess = keys[: len(keys) - MAX_BINS + 1]
+        target = keys[len(excess)]
+        self.bins[target] += sum(self.bins.pop(key) for key in excess)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the value at quantile q (0 = minimum, 1 = maximum).
+
+        Ranks are nearest-rank, as for Query's p95_duration aggregate: the
+        estimate is for the ceil(q * count)-th smallest value.
+
+        Returns:
+            The estimate, or None if the sketch is empty
+        """
+        if not self.count:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = max(math.ceil(q * self.count) - 1, 0)
+        seen = self.zero_count
+        if seen > rank:
+            return max(self.min, 0.0)
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                # Midpoint (in relative terms) of the bucket's range
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentiles(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """Estimate several quantiles, keyed by percentile_label()."""
+        return {percentile_label(q): self.quantile(q) for q in quantiles}
+
+    def to_list(self) -> List[Any]:
+        """Serialize the sketch (without alpha, which its container records)."""
+        return [self.count, self.sum, self.min, self.max, self.zero_count, sorted(self.bins.items())]
+
+    @classmethod
+    def from_list(cls, data: List[Any], alpha: float = DEFAULT_ALPHA) -> "DDSketch":
+        """Create a sketch from its serialized form."""
+        sketch = cls(alpha)
+        sketch.count, sketch.sum, sketch.min, sketch.max, sketch.zero_count, bins = data
+        sketch.bins = {int(key): count for key, count in bins}
+        return sketch
+
+
+class DurationSketches:
+    """Duration sketches per test and per SUT and day.
+
+    Sessions are added one at a time; durations of None are skipped. Days are
+    ``session_start_time.date()``.
+
+    Attributes:
+        alpha: Relative accuracy of every sketch
+        tests: Sketch of each test's durations, by nodeid
+        daily: Sketch of each SUT's test durations, by (SUT name, day)
+        path: Optional file the sketches are persisted to
+        stamp: file_stamp() of the storage files the sketches reflect, or None
+               when they are known to be stale
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None, alpha: float = DEFAULT_ALPHA):
+        """Initialize without sketches.
+
+        Args:
+            path: Optional file to persist the sketches to
+            alpha: Relative accuracy of quantile estimates
+        """
+        self.path = Path(path) if path else None
+        self.alpha = alpha
+        self.stamp: Optional[List[List]] = None
+        self.tests: Dict[str, DDSketch] = {}
+        self.daily: Dict[Tuple[str, date], DDSketch] = {}
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[TestSession], alpha: float = DEFAULT_ALPHA) -> "DurationSketches":
+        """Sketch the durations of test sessions, in one pass."""
+        sketches = cls(alpha=alpha)
+        for session in sessions:
+            sketches.add_session(session)
+        return sketches
+
+    def __len__(self):
+        """Get number of sketched tests."""
+        return len(self.tests)
+
+    def add_session(self, session: TestSession) -> None:
+        """Add the durations of a session's test results."""
+        tests, alpha = self.tests, self.alpha
+        day_key = (session.sut_name, session.session_start_time.date())
+        day = self.daily.get(day_key)
+        if day is None:
+            day = self.daily[day_key] = DDSketch(alpha)
+        for test in session.test_results:
+            duration = test.duration
+            if duration is None:
+                continue
+            sketch = tests.get(test.nodeid)
+            if sketch is None:
+                sketch = tests[test.nodeid] = DDSketch(alpha)
+            sketch.add(duration)
+            day.add(duration)
+
+    def rebuild(self, sessions: Iterable[TestSession], stamp: Optional[List[List]] = None) -> None:
+        """Replace the sketches with those of the given sessions."""
+        self.tests = {}
+        self.daily = {}
+        for session in sessions:
+            self.add_session(session)
+        self.stamp = stamp
+
+    def merge(self, other: "DurationSketches") -> None:
+        """Add the sketches of another set with the same accuracy."""
+        for mine, theirs in ((self.tests, other.tests), (self.daily, other.daily)):
+            for key, sketch in theirs.items():
+                if key not in mine:
+                    mine[key] = DDSketch(self.alpha)
+                mine[key].merge(sketch)
+
+    def percentiles(
+        self, nodeid: str, quantiles: Iterable[float] = DEFAULT_QUANTILES
+    ) -> Optional[Dict[str, Optional[float]]]:
+        """Estimate duration percentiles of a test (None if it has no durations)."""
+        sketch = self.tests.get(nodeid)
+        return sketch.percentiles(quantiles) if sketch is not None else None
+
+    def slowest(self, limit: int = 10, quantile: float = 0.95) -> List[Tuple[str, float]]:
+        """Get the tests with the highest duration at a quantile.
+
+        Returns:
+            (nodeid, duration) tuples, slowest first
+        """
+        estimates = ((nodeid, sketch.quantile(quantile)) for nodeid, sketch in self.tests.items())
+        return sorted(estimates, key=lambda x: x[1], reverse=True)[:limit]
+
+    def sut_sketch(self, sut_name: str, start: Optional[date] = None, end: Optional[date] = None) -> DDSketch:
+        """Merge the daily sketches of a SUT from start to end (inclusive)."""
+        merged = DDSketch(self.alpha)
+        for (sut, day), sketch in self.daily.items():
+            if sut == sut_name and (start is None or day >= start) and (end is None or day <= end):
+                merged.merge(sketch)
+        return merged
+
+    def to_dict(self) -> Dict:
+        """Serialize the sketches."""
+        daily: Dict[str, Dict[str, List[Any]]] = {}
+        for (sut, day), sketch in self.daily.items():
+            daily.setdefault(sut, {})[day.isoformat()] = sketch.to_list()
+        return {
+            "version": self.VERSION,
+            "stamp": self.stamp,
+            "alpha": self.alpha,
+            "tests": {nodeid: sketch.to_list() for nodeid, sketch in self.tests.items()},
+            "daily": daily,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, path: Optional[Path] = None) -> "DurationSketches":
+        """Create sketches from their serialized form."""
+        if data.get("version") != cls.VERSION:
+            return cls(path)
+        sketches = cls(path, data.get("alpha", DEFAULT_ALPHA))
+        alpha = sketches.alpha
+        sketches.tests = {nodeid: DDSketch.from_list(item, alpha) for nodeid, item in data.get("tests", {}).items()}
+        for sut, days in data.get("daily", {}).items():
+            for day, item in days.items():
+                sketches.daily[(sut, date.fromisoformat(day))] = DDSketch.from_list(item, alpha)
+        sketches.stamp = data.get("stamp")
+        return sketches
+
+    @classmethod
+    def load(cls, path: Path) -> "DurationSketches":
+        """Load persisted sketches; a missing or unreadable file gives stale, empty sketches."""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls.from_dict(json.load(f), path)
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            print(f"Warning: Could not read duration sketches {path}, they will be rebuilt: {e}")
+            return cls(path)
+
+    def save(self) -> None:
+        """Atomically persist the sketches to their path (if any)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, separators=(",", ":"))
+            os.replace(temp_name, self.path)
+        except Exception:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+            raise
+
+
+def hash64(item: Any) -> int:
+    """Get a stable 64-bit hash of an item's string form (unlike hash(), the same in every process)."""
+    return int.from_bytes(hashlib.blake2b(str(item).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """Distinct-count sketch (HyperLogLog) in 2^precision one-byte registers.
+
+    Each item's 64-bit hash picks a register by its leading ``precision`` bits;
+    the register keeps the longest run of leading zeros seen in the remaining
+    bits. The harmonic mean of the registers estimates the number of distinct
+    items with relative standard error 1.04 / sqrt(2^precision), about 0.8% at
+    the default precision of 14 (16 KiB). Small counts use linear counting.
+    """
+
+    def __init__(self, precision: int = 14):
+        """Initialize an empty sketch.
+
+        Args:
+            precision: Bits of hash selecting a register, from 4 to 18
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    @property
+    def relative_error(self) -> float:
+        """Get the relative standard error of estimate()."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def add(self, item: Any) -> None:
+        """Add an item."""
+        self.add_hash(hash64(item))
+
+    def add_hash(self, hashed: int) -> None:
+        """Add an item by its hash64()."""
+        bits = 64 - self.precision
+        register = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    def merge(self, other: "HyperLogLog") -> None:
+        """Add the items of another sketch with the same precision."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+
+    def estimate(self) -> float:
+        """Estimate the number of distinct items added."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return estimate
+
+
+class SpaceSaving:
+    """Heavy hitters (Space-Saving): the top items of a stream in ``capacity`` counters.
+
+    A new item, once every counter is taken, replaces the item with the smallest
+    count and inherits that count as its error. Every item whose true total
+    exceeds total / capacity is tracked, and a tracked item's count overestimates
+    its true total by at most its error (itself at most total / capacity).
+    Increments can be weighted, e.g. by duration for the most time-consuming tests.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """Initialize with no tracked items.
+
+        Args:
+            capacity: Number of items tracked
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[Hashable, float] = {}
+        self.errors: Dict[Hashable, float] = {}
+        # (count, item) entries; stale entries are skipped when popped
+        self._heap: List[Tuple[float, Hashable]] = []
+
+    def __len__(self):
+        """Get number of tracked items."""
+        return len(self.counts)
+
+    @property
+    def max_error(self) -> float:
+        """Get the largest possible overestimate of any reported count."""
+        return self.total / self.capacity
+
+    def add(self, item: Hashable, weight: float = 1) -> None:
+        """Add an occurrence (or ``weight``) of an item."""
+        self.total += weight
+        counts = self.counts
+        if item in counts:
+            counts[item] += weight
+        elif len(counts) < self.capacity:
+            counts[item] = weight
+            self.errors[item] = 0
+        else:
+            evicted, floor = self._pop_min()
+            del counts[evicted], self.errors[evicted]
+            counts[item] = floor + weight
+            self.errors[item] = floor
+        self._push(item)
+
+    def _push(self, item: Hashable) -> None:
+        """Record an item's current count in the heap."""
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, item) for item, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[Hashable, float]:
+        """Remove and return the tracked item with the smallest count."""
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def merge(self, other: "SpaceSaving") -> None:
+        """Add another summary's items (errors add up; the top ``capacity`` are kept)."""
+        total = self.total + other.total
+        counts, errors = dict(self.counts), dict(self.errors)
+        # Untracked items may have had up to the smallest tracked count
+        floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+        for item in counts:
+            if item not in other.counts:
+                counts[item] += other_floor
+                errors[item] += other_floor
+        for item, count in other.counts.items():
+            if item in counts:
+                counts[item] += count
+                errors[item] += other.errors[item]
+            else:
+                counts[item] = count + floor
+                errors[item] = other.errors[item] + floor
+        kept = heapq.nlargest(self.capacity, counts.items(), key=lambda entry: entry[1])
+        self.counts = dict(kept)
+        self.errors = {item: errors[item] for item in self.counts}
+        self.total = total
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def top(self, limit: int = 10) -> List[Tuple[Hashable, float, float]]:
+        """Get the items with the highest counts.
+
+        Returns:
+            (item, count, error) tuples, highest count first; the true count is
+            between count - error and count
+        """
+        top = heapq.nlargest(limit, self.counts.items(), key=lambda entry: entry[1])
+        return [(item, count, self.errors[item]) for item, count in top]
+
+
+class CountMinSketch:
+    """Frequencies of arbitrary items (Count-Min) in ``depth`` rows of ``width`` counters.
+
+    An item's estimate is the smallest of its counters, one per row. It never
+    underestimates, and overestimates by at most epsilon * total with
+    probability 1 - delta, where width = ceil(e / epsilon) and
+    depth = ceil(ln(1 / delta)).
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01):
+        """Initialize empty counters.
+
+        Args:
+            epsilon: Error bound relative to the total count
+            delta: Probability of exceeding the error bound
+        """
+        if not (0 < epsilon < 1 and 0 < delta < 1):
+            raise ValueError("epsilon and delta must be between 0 and 1")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.total = 0
+        self.rows = [[0] * self.width for _ in range(self.depth)]
+
+    def _columns(self, hashed: int) -> List[int]:
+        """Get an item's counter in each row (double hashing of its hash64())."""
+        first, second = hashed >> 32, (hashed & 0xFFFFFFFF) | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """Add occurrences of an item."""
+        self.add_hash(hash64(item), count)
+
+    def add_hash(self, hashed: int, count: int = 1) -> None:
+        """Add occurrences of an item by its hash64()."""
+        self.total += count
+        for row, column in zip(self.rows, self._columns(hashed)):
+            row[column] += count
+
+    def estimate(self, item: Hashable) -> int:
+        """Estimate the occurrences of an item (never below the true count)."""
+        return min(row[column] for row, column in zip(self.rows, self._columns(hash64(item))))
+
+    @property
+    def max_error(self) -> float:
+        """Get the overestimate that is exceeded with probability at most delta."""
+        return self.epsilon * self.total
+
+    def merge(self, other: "CountMinSketch") -> None:
+        """Add the counts of another sketch with the same dimensions."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge sketches with different dimensions")
+        self.total += other.total
+        for row, other_row in zip(self.rows, other.rows):
+            for column, count in enumerate(other_row):
+                if count:
+                    row[column] += count
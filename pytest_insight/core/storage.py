@@ -1,16 +1,42 @@
+import atexit
 import getpass
+import gzip
+import heapq
+import itertools
 import json
 import os
 import shutil
 import tempfile
+import threading
 import uuid
-from datetime import datetime
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import filelock
 
+from pytest_insight.core.indexes import (
+    BitmapIndex,
+    TextIndex,
+    TimeIndex,
+    bit_positions,
+    file_stamp,
+)
 from pytest_insight.core.models import TestSession
+from pytest_insight.core.sketches import DurationSketches
 from pytest_insight.utils.constants import DEFAULT_STORAGE_PATH
 
 
@@ -26,6 +52,9 @@ class StorageProfile:
         last_modified: Optional[datetime] = None,
         created_by: Optional[str] = None,
         last_modified_by: Optional[str] = None,
+        hot_days: Optional[int] = None,
+        cold_dir: Optional[str] = None,
+        text_index: bool = False,
     ):
         """Initialize a storage profile.
 
@@ -37,9 +66,17 @@ class StorageProfile:
             last_modified: Timestamp when the profile was last modified
             created_by: Username of the person who created the profile
             last_modified_by: Username of the person who last modified the profile
+            hot_days: Optional size of the hot tier in days. When set, sessions older than this
+                are aged into compressed cold-tier archive segments (json profiles only).
+            cold_dir: Optional directory for cold-tier segments. Defaults to a directory next to file_path.
+            text_index: Whether to maintain a full-text index over captured output and
+                tracebacks, used to speed up output/error searches (json profiles only).
         """
         self.name = name
         self.storage_type = storage_type
+        self.hot_days = hot_days
+        self.cold_dir = cold_dir
+        self.text_index = text_index
 
         # Set timestamps and user info
         current_time = datetime.now()
@@ -70,8 +107,16 @@ class StorageProfile:
             ),
             "created_by": self.created_by,
             "last_modified_by": self.last_modified_by,
+            "hot_days": self.hot_days,
+            "cold_dir": self.cold_dir,
+            "text_index": self.text_index,
         }
 
+    @property
+    def is_tiered(self) -> bool:
+        """Whether this profile splits its sessions into hot and cold tiers."""
+        return self.hot_days is not None
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "StorageProfile":
         """Create profile from dictionary."""
@@ -110,6 +155,9 @@ class StorageProfile:
             last_modified=last_modified,
             created_by=data.get("created_by"),
             last_modified_by=data.get("last_modified_by"),
+            hot_days=data.get("hot_days"),
+            cold_dir=data.get("cold_dir"),
+            text_index=bool(data.get("text_index", False)),
         )
 
 
@@ -244,6 +292,65 @@ class ProfileManager:
         self._save_profiles()
         return profile
 
+    def set_tiering(
+        self, name: str, hot_days: Optional[int], cold_dir: Optional[str] = None
+    ) -> StorageProfile:
+        """Configure hot/cold storage tiering for a profile.
+
+        Args:
+            name: Name of the profile to configure
+            hot_days: Number of days kept in the hot tier, or None to disable tiering
+            cold_dir: Optional directory for cold-tier archive segments
+
+        Returns:
+            The updated profile
+
+        Raises:
+            ValueError: If profile does not exist or the tiering settings are invalid
+        """
+        if name not in self.profiles:
+            raise ValueError(f"Profile '{name}' does not exist")
+
+        profile = self.profiles[name]
+        if hot_days is not None:
+            if not isinstance(hot_days, int) or hot_days < 1:
+                raise ValueError("hot_days must be a positive integer")
+            if profile.storage_type.lower() != "json":
+                raise ValueError(
+                    f"Tiering is only supported for json profiles, not '{profile.storage_type}'"
+                )
+
+        profile.hot_days = hot_days
+        profile.cold_dir = cold_dir if hot_days is not None else None
+        self._save_profiles()
+        return profile
+
+    def set_text_index(self, name: str, enabled: bool) -> StorageProfile:
+        """Enable or disable the full-text output index for a profile.
+
+        Args:
+            name: Name of the profile to configure
+            enabled: Whether to maintain the index
+
+        Returns:
+            The updated profile
+
+        Raises:
+            ValueError: If profile does not exist or is not a json profile
+        """
+        if name not in self.profiles:
+            raise ValueError(f"Profile '{name}' does not exist")
+
+        profile = self.profiles[name]
+        if enabled and profile.storage_type.lower() != "json":
+            raise ValueError(
+                f"Text indexes are only supported for json profiles, not '{profile.storage_type}'"
+            )
+
+        profile.text_index = bool(enabled)
+        self._save_profiles()
+        return profile
+
     def get_profile(self, name: Optional[str] = None) -> StorageProfile:
         """Get a profile by name.
 
@@ -486,9 +593,193 @@ class ProfileManager:
             return False
 
 
+def _record_matches(session_data: Dict, session_filters: List[Any]) -> bool:
+    """Evaluate pushed-down session filters against a raw session record."""
+    return all(f.matches_record(session_data) for f in session_filters)
+
+
+def _split_time_filter(
+    session_filters: Optional[List[Any]],
+) -> Tuple[Optional[Any], Optional[List[Any]]]:
+    """Separate the first filter with time_bounds() from the other filters."""
+    for i, session_filter in enumerate(session_filters or []):
+        if callable(getattr(type(session_filter), "time_bounds", None)):
+            return session_filter, session_filters[:i] + session_filters[i + 1 :]
+    return None, session_filters
+
+
+def _index_keys(session_filter: Any) -> Optional[List[Hashable]]:
+    """Get a filter's BitmapIndex keys, or None if the index cannot answer it."""
+    if not callable(getattr(type(session_filter), "index_keys", None)):
+        return None
+    keys = session_filter.index_keys()
+    if not isinstance(keys, list):
+        return None
+    try:
+        hash(tuple(keys))
+    except TypeError:
+        return None
+    return keys
+
+
+def _select_indexed(
+    session_filters: Optional[List[Any]],
+    time_index: Optional[TimeIndex],
+    get_bitmap_index: Callable[[], Optional[BitmapIndex]],
+    time_ordered: bool = False,
+) -> Tuple[Optional[List[int]], Optional[List[Any]]]:
+    """Select the positions of matching sessions with the available indexes.
+
+    A pushed time range is selected from the TimeIndex and filters with
+    index_keys() from the BitmapIndex (built only when such a filter is present).
+
+    Args:
+        session_filters: Pushed-down session filters
+        time_index: Optional TimeIndex over the stored sessions
+        get_bitmap_index: Returns the BitmapIndex over the same sessions, or None
+                          if there is none
+        time_ordered: Return positions in start-time order (requires time_index)
+                      instead of storage order
+
+    Returns:
+        (positions, filters left to check per session); positions is None when
+        no index applied and every stored session remains a candidate
+    """
+    time_filter, remaining = None, session_filters
+    if time_index is not None:
+        time_filter, remaining = _split_time_filter(session_filters)
+    key_groups, unindexed = [], []
+    for session_filter in remaining or []:
+        keys = _index_keys(session_filter)
+        if keys is None:
+            unindexed.append(session_filter)
+        else:
+            key_groups.append(keys)
+    bitmap_index = get_bitmap_index() if key_groups else None
+    if bitmap_index is None:
+        unindexed, key_groups = remaining, []
+
+    positions = None
+    if time_filter is not None:
+        positions = time_index.select(*time_filter.time_bounds())
+    elif time_ordered:
+        positions = time_index.positions
+    if key_groups:
+        members = bit_positions(bitmap_index.select(key_groups))
+        if positions is None:
+            return members, unindexed
+        member_set = set(members)
+        positions = [p for p in positions if p in member_set]
+    if positions is not None and not time_ordered:
+        positions = sorted(positions)
+    return positions, unindexed
+
+
+def _time_entry(session_data: Any) -> Tuple[Any, str]:
+    """Get the (start time, session ID) of a raw record or TestSession."""
+    if isinstance(session_data, dict):
+        return session_data.get("session_start_time"), session_data.get("session_id", "")
+    return (
+        getattr(session_data, "session_start_time", None),
+        getattr(session_data, "session_id", ""),
+    )
+
+
+def _session_sort_key(session: TestSession) -> Tuple[datetime, str]:
+    """Order sessions by UTC start time, breaking ties by session ID."""
+    return (_as_utc(session.session_start_time), session.session_id)
+
+
+def _record_sort_key(session_data: Dict) -> Tuple[datetime, str]:
+    """Order raw session records the same way as _session_sort_key."""
+    start_time = session_data.get("session_start_time")
+    if isinstance(start_time, str):
+        start_time = datetime.fromisoformat(start_time)
+    return (_as_utc(start_time), session_data.get("session_id", ""))
+
+
+def _iter_records_ordered(
+    sessions_data: List[Any],
+    descending: bool,
+    session_filters: Optional[List[Any]],
+    source: Any,
+    time_index: Optional[TimeIndex] = None,
+    fields: Optional[Collection[str]] = None,
+    get_bitmap_index: Callable[[], Optional[BitmapIndex]] = lambda: None,
+) -> Iterator[TestSession]:
+    """Yield raw records as TestSessions in start-time order, decoding lazily.
+
+    With a TimeIndex over sessions_data the records come out of the index already
+    ordered, and a pushed time range is selected by binary search; SUT and tag
+    filters are answered by the BitmapIndex, if any. Test results are projected
+    to ``fields`` when given (see TestSession.from_dict).
+    """
+    if time_index is not None:
+        positions, session_filters = _select_indexed(
+            session_filters, time_index, get_bitmap_index, time_ordered=True
+        )
+        if descending:
+            positions = reversed(positions)
+        records = [
+            d
+            for d in (sessions_data[p] for p in positions)
+            if isinstance(d, dict)
+            and (not session_filters or _record_matches(d, session_filters))
+        ]
+    else:
+        records = [
+            d
+            for d in sessions_data
+            if isinstance(d, dict)
+            and (not session_filters or _record_matches(d, session_filters))
+        ]
+        records.sort(key=_record_sort_key, reverse=descending)
+    for session_data in records:
+        try:
+            session = TestSession.from_dict(session_data, fields)
+        except Exception as e:
+            print(f"Failed to load session from {source}: {e}")
+            continue
+        yield session
+
+
+# Per-path count of writes made by this process, so storage generations change
+# even when a rewrite keeps the file's size and lands within its mtime resolution
+_write_counts: Dict[str, int] = {}
+_memory_storage_ids = itertools.count(1)
+
+# Start-time index of the most recently read version of each JSON storage file
+_time_indexes: Dict[str, Tuple[Hashable, TimeIndex]] = {}
+
+# SUT/tag bitmap index of the most recent version of each JSON storage file
+_bitmap_indexes: Dict[str, Tuple[Hashable, BitmapIndex]] = {}
+
+
+def _record_write(path: Path) -> None:
+    """Note that this process wrote to a storage path."""
+    key = str(path)
+    _write_counts[key] = _write_counts.get(key, 0) + 1
+
+
+def _path_generation(path: Path) -> Hashable:
+    """Describe the current on-disk version of a path."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return (str(path), _write_counts.get(str(path), 0), None, None)
+    return (str(path), _write_counts.get(str(path), 0), stat.st_mtime_ns, stat.st_size)
+
+
 class BaseStorage:
     """Abstract interface for persisting test session data."""
 
+    # Optional full-text index over captured output, kept by file-backed storages
+    text_index: Optional[TextIndex] = None
+
+    # File the duration sketches are persisted to (None: sketched on request)
+    sketches_path: Optional[Path] = None
+    _duration_sketches: Optional[DurationSketches] = None
+
     def save_session(self, test_session: TestSession) -> None:
         """Persist a test session."""
         raise NotImplementedError(
@@ -515,6 +806,176 @@ class BaseStorage:
             f"{self.__class__.__name__} does not implement the load_sessions method...did you mean to call it on the {self.__class__.__name__} class?"
         )
 
+    def supports_pushdown(self, session_filter: Any) -> bool:
+        """Check whether this backend can evaluate a session filter while loading.
+
+        Backends that return True accept the filter in
+        ``load_sessions(session_filters=[...])`` and must only return sessions
+        matching every filter passed that way. The base implementation supports
+        no pushdown, so the query engine evaluates all filters itself.
+
+        Args:
+            session_filter: A structured session filter from the query planner
+
+        Returns:
+            True if the filter can be pushed down to this backend
+        """
+        return False
+
+    # Whether load_sessions()/iter_sessions() accept a ``fields`` projection hint:
+    # the TestResult fields (beyond CORE_RESULT_FIELDS) the caller will read.
+    # Backends that decode records themselves can then skip the heavy capture
+    # fields and return ProjectedTestResult objects.
+    supports_projection = False
+
+    # Whether a pushed time range is selected with a TimeIndex (binary search)
+    # rather than checked against every stored session
+    time_indexed = False
+
+    # Whether pushed SUT and tag filters are answered with a BitmapIndex
+    # rather than checked against every stored session
+    bitmap_indexed = False
+
+    def estimate_sessions(
+        self, session_filters: Optional[List[Any]] = None
+    ) -> Optional[int]:
+        """Estimate how many sessions a load would read, without reading any.
+
+        Used by Query.explain(). Only the pushed filters the storage's indexes
+        answer are taken into account, so the estimate is an upper bound on the
+        sessions returned.
+
+        Args:
+            session_filters: Pushed-down session filters
+
+        Returns:
+            Estimated session count, or None if it cannot be known cheaply
+        """
+        return None
+
+    def generation(self) -> Optional[Hashable]:
+        """Get a token identifying the current version of the stored data.
+
+        The token identifies the storage location and changes whenever its
+        contents change (save_session, save_sessions, import_sessions,
+        clear_sessions), so it can key caches of derived results. The base
+        implementation returns None, meaning the version is unknown and
+        results must not be cached.
+
+        Returns:
+            Hashable generation token, or None if unknown
+        """
+        return None
+
+    def get_text_index(self) -> Optional[TextIndex]:
+        """Get the full-text index, rebuilding it first if the data has changed.
+
+        Returns:
+            An up-to-date TextIndex, or None if this storage keeps no index
+        """
+        index = self.text_index
+        if index is None:
+            return None
+        stamp = file_stamp(self._data_files())
+        if index.stamp != stamp:
+            index.rebuild(self.load_sessions(), stamp)
+            index.save()
+        return index
+
+    def get_duration_sketches(self) -> DurationSketches:
+        """Get duration sketches (per test, per SUT and day) of the stored sessions.
+
+        Storages with a sketches_path persist the sketches there and keep them
+        current as sessions are saved, rebuilding them in one pass after other
+        changes. Other storages sketch their sessions on every call.
+
+        Returns:
+            Up-to-date DurationSketches
+        """
+        sketches = self._persisted_duration_sketches()
+        if sketches is None:
+            return DurationSketches.from_sessions(self.load_sessions())
+        stamp = file_stamp(self._data_files())
+        if sketches.stamp != stamp:
+            sketches.rebuild(self.load_sessions(), stamp)
+            sketches.save()
+        return sketches
+
+    def _persisted_duration_sketches(self) -> Optional[DurationSketches]:
+        """Get the persisted duration sketches, loading them on first use."""
+        if self._duration_sketches is None and self.sketches_path is not None:
+            self._duration_sketches = DurationSketches.load(self.sketches_path)
+        return self._duration_sketches
+
+    def _data_files(self) -> List[Path]:
+        """List the files holding this storage's sessions."""
+        return []
+
+    def _persisted_indexes(self) -> List[Any]:
+        """Get the structures kept next to the data files (text index, duration sketches).
+
+        Duration sketches only count once they have been written, so storages
+        whose sketches were never requested do not start keeping them on save.
+        """
+        indexes = [] if self.text_index is None else [self.text_index]
+        if self._duration_sketches is not None or (self.sketches_path is not None and self.sketches_path.exists()):
+            indexes.append(self._persisted_duration_sketches())
+        return indexes
+
+    def _fresh_indexes(self) -> List[Any]:
+        """Get the persisted indexes that reflect the current data files."""
+        indexes = self._persisted_indexes()
+        if not indexes:
+            return []
+        stamp = file_stamp(self._data_files())
+        return [index for index in indexes if index.stamp is not None and index.stamp == stamp]
+
+    def _index_saved_sessions(
+        self, fresh: List[Any], sessions: List[TestSession]
+    ) -> None:
+        """Incrementally index sessions appended by a write.
+
+        Indexes that were already stale before the write (not in ``fresh``, see
+        _fresh_indexes) are left stale and rebuilt in full the next time they
+        are requested.
+        """
+        stamp = None
+        for index in self._persisted_indexes():
+            if not any(index is current for current in fresh):
+                index.stamp = None
+                continue
+            for session in sessions:
+                index.add_session(session)
+            if stamp is None:
+                stamp = file_stamp(self._data_files())
+            index.stamp = stamp
+            index.save()
+
+    def iter_sessions(
+        self,
+        descending: bool = True,
+        session_filters: Optional[List[Any]] = None,
+    ) -> Iterator[TestSession]:
+        """Iterate sessions ordered by start time, ties broken by session ID.
+
+        Consumers may stop early (e.g. once a page of results is full). The base
+        implementation loads and sorts everything; backends that can order raw
+        records only build TestSession objects for what is actually consumed.
+
+        Args:
+            descending: Yield the newest sessions first (default) or the oldest
+            session_filters: Optional pushed-down session filters (see
+                             supports_pushdown)
+
+        Yields:
+            TestSession objects in start-time order
+        """
+        if session_filters:
+            sessions = self.load_sessions(session_filters=session_filters)
+        else:
+            sessions = self.load_sessions()
+        yield from sorted(sessions, key=_session_sort_key, reverse=descending)
+
     def clear_sessions(
         self, sessions_to_clear: Optional[List[TestSession]] = None
     ) -> int:
@@ -553,21 +1014,84 @@ class InMemoryStorage(BaseStorage):
         """Initialize storage with optional sessions."""
         super().__init__()
         self._sessions = sessions if sessions is not None else []
+        self._storage_id = next(_memory_storage_ids)
+        self._writes = 0
+        self._time_index: Optional[Tuple[Hashable, TimeIndex]] = None
+        self._bitmap_index: Optional[Tuple[Hashable, BitmapIndex]] = None
+
+    def supports_pushdown(self, session_filter: Any) -> bool:
+        """Any structured (non-custom) session filter can be evaluated in place."""
+        return bool(getattr(session_filter, "pushdown", False))
 
-    def load_sessions(self, **kwargs) -> List[TestSession]:
+    def load_sessions(
+        self, session_filters: Optional[List[Any]] = None, **kwargs
+    ) -> List[TestSession]:
         """Get all stored sessions.
 
         Args:
+            session_filters: Optional pushed-down session filters to apply
             **kwargs: Additional parameters (ignored in memory storage)
 
         Returns:
             List of TestSession objects
         """
-        return self._sessions.copy()
+        sessions = self._sessions
+        positions, session_filters = self._select_indexed(session_filters)
+        if positions is not None:
+            sessions = [sessions[p] for p in positions]
+        if session_filters:
+            return [s for s in sessions if all(f.matches(s) for f in session_filters)]
+        return sessions.copy()
+
+    time_indexed = True
+    bitmap_indexed = True
+
+    def estimate_sessions(
+        self, session_filters: Optional[List[Any]] = None
+    ) -> Optional[int]:
+        """Count the sessions the TimeIndex and BitmapIndex select."""
+        positions, _ = self._select_indexed(session_filters)
+        return len(self._sessions) if positions is None else len(positions)
+
+    def _select_indexed(
+        self, session_filters: Optional[List[Any]]
+    ) -> Tuple[Optional[List[int]], Optional[List[Any]]]:
+        """Select positions in storage order (see _select_indexed)."""
+        time_filter, _ = _split_time_filter(session_filters)
+        return _select_indexed(
+            session_filters,
+            self._get_time_index() if time_filter is not None else None,
+            self._get_bitmap_index,
+        )
+
+    def _get_time_index(self) -> TimeIndex:
+        """Get the start-time index, rebuilding it after writes."""
+        key = (self._writes, len(self._sessions))
+        if self._time_index is None or self._time_index[0] != key:
+            self._time_index = (key, TimeIndex.build(map(_time_entry, self._sessions)))
+        return self._time_index[1]
+
+    def _get_bitmap_index(self) -> BitmapIndex:
+        """Get the SUT/tag bitmap index, rebuilding it after writes other than saves."""
+        key = (self._writes, len(self._sessions))
+        if self._bitmap_index is None or self._bitmap_index[0] != key:
+            self._bitmap_index = (key, BitmapIndex.build(self._sessions))
+        return self._bitmap_index[1]
+
+    def generation(self) -> Optional[Hashable]:
+        """Identify this instance and the number of writes made through it."""
+        return ("memory", self._storage_id, self._writes)
 
     def save_session(self, session: TestSession) -> None:
-        """Save a test session."""
+        """Save a test session, extending a current bitmap index in place."""
+        current = self._bitmap_index
+        if current is not None and current[0] != (self._writes, len(self._sessions)):
+            current = None
         self._sessions.append(session)
+        self._writes += 1
+        if current is not None:
+            current[1].add(session)
+            self._bitmap_index = ((self._writes, len(self._sessions)), current[1])
 
     def clear_sessions(
         self, sessions_to_clear: Optional[List[TestSession]] = None
@@ -583,6 +1107,7 @@ class InMemoryStorage(BaseStorage):
         """
         # Get current sessions count
         initial_count = len(self._sessions)
+        self._writes += 1
 
         if sessions_to_clear is None:
             # Clear all sessions
@@ -603,7 +1128,10 @@ class JSONStorage(BaseStorage):
     """Storage for test sessions using JSON files."""
 
     def __init__(
-        self, file_path: Optional[Path] = None, profile_name: Optional[str] = None
+        self,
+        file_path: Optional[Path] = None,
+        profile_name: Optional[str] = None,
+        text_index: bool = False,
     ):
         """Initialize storage with optional custom file path.
 
@@ -611,19 +1139,141 @@ class JSONStorage(BaseStorage):
             file_path: Optional custom path for session storage.
                       If not provided, uses ~/.pytest_insight/sessions.json
             profile_name: Optional profile name for this storage instance.
+            text_index: Whether to maintain a full-text index over captured output,
+                        stored next to the file as ``<name>.textidx.json``.
         """
         super().__init__()
         self.file_path = Path(file_path) if file_path else DEFAULT_STORAGE_PATH
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize file if it doesn't exist
-        if not self.file_path.exists():
+        created = not self.file_path.exists()
+        if created:
             self._write_json_safely([])
 
+        self.sketches_path = _sketches_path(self.file_path)
+        if text_index:
+            self.text_index = TextIndex.load(_text_index_path(self.file_path))
+            if created:
+                # Nothing to index yet, so saves can be indexed incrementally
+                self.text_index.rebuild([], file_stamp(self._data_files()))
+                self.text_index.save()
+
+    def _data_files(self) -> List[Path]:
+        """The sessions live in a single JSON file."""
+        return [self.file_path]
+
+    def supports_pushdown(self, session_filter: Any) -> bool:
+        """Structured filters are evaluated on raw JSON records before decoding."""
+        return bool(getattr(session_filter, "pushdown", False))
+
+    supports_projection = True
+
+    def generation(self) -> Optional[Hashable]:
+        """Identify the storage file's current version.
+
+        Combines the file's mtime and size, which also catch writes from other
+        processes, with this process's write count for the file.
+        """
+        return ("json", _path_generation(self.file_path))
+
+    def iter_sessions(
+        self,
+        descending: bool = True,
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[TestSession]:
+        """Iterate sessions in start-time order, decoding records only as consumed.
+
+        Records are filtered and ordered in their raw form, so reading the latest
+        N sessions builds N TestSession objects rather than one per stored session.
+        """
+        generation = self.generation()
+        try:
+            data = self._read_json_safely()
+        except json.JSONDecodeError:
+            return
+        sessions_data = data.get("sessions", []) if isinstance(data, dict) else data
+        if not isinstance(sessions_data, list):
+            return
+        yield from _iter_records_ordered(
+            sessions_data,
+            descending,
+            session_filters,
+            self.file_path,
+            self._get_time_index(sessions_data, generation),
+            fields,
+            lambda: self._get_bitmap_index(sessions_data, generation),
+        )
+
+    time_indexed = True
+    bitmap_indexed = True
+
+    def estimate_sessions(
+        self, session_filters: Optional[List[Any]] = None
+    ) -> Optional[int]:
+        """Count sessions with the indexes of the last read, if still current."""
+        cached = _time_indexes.get(str(self.file_path))
+        if cached is None or cached[0][0] != self.generation():
+            return None
+        positions, _ = _select_indexed(
+            session_filters, cached[1], self._current_bitmap_index
+        )
+        return len(cached[1]) if positions is None else len(positions)
+
+    def _current_bitmap_index(self) -> Optional[BitmapIndex]:
+        """Get the cached bitmap index if it reflects the file's current version."""
+        cached = _bitmap_indexes.get(str(self.file_path))
+        if cached is None or cached[0][0] != self.generation():
+            return None
+        return cached[1]
+
+    def _get_bitmap_index(
+        self, sessions_data: List[Any], generation: Hashable
+    ) -> BitmapIndex:
+        """Get the SUT/tag bitmap index for the file version sessions_data came from.
+
+        Args:
+            sessions_data: Raw session records as read from the file
+            generation: generation() taken before the file was read
+
+        Returns:
+            BitmapIndex over positions in sessions_data
+        """
+        path_key = str(self.file_path)
+        version = (generation, len(sessions_data))
+        cached = _bitmap_indexes.get(path_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        bitmap_index = BitmapIndex.build(sessions_data)
+        _bitmap_indexes[path_key] = (version, bitmap_index)
+        return bitmap_index
+
+    def _get_time_index(self, sessions_data: List[Any], generation: Hashable) -> TimeIndex:
+        """Get the start-time index for the file version sessions_data was read from.
+
+        Args:
+            sessions_data: Raw session records as read from the file
+            generation: generation() taken before the file was read
+
+        Returns:
+            TimeIndex over positions in sessions_data
+        """
+        path_key = str(self.file_path)
+        version = (generation, len(sessions_data))
+        cached = _time_indexes.get(path_key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        time_index = TimeIndex.build(map(_time_entry, sessions_data))
+        _time_indexes[path_key] = (version, time_index)
+        return time_index
+
     def load_sessions(
         self,
         chunk_size: int = 1000,
         use_streaming: bool = False,
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
         **kwargs,
     ) -> List[TestSession]:
         """Load all test sessions from storage.
@@ -631,6 +1281,11 @@ class JSONStorage(BaseStorage):
         Args:
             chunk_size: Number of sessions to load at once (for large files)
             use_streaming: Whether to use streaming parser for large files (requires ijson)
+            session_filters: Optional pushed-down session filters. They are checked
+                             against each raw record, and only matching records are
+                             turned into TestSession objects.
+            fields: Optional projection hint. Test results then hold only
+                    CORE_RESULT_FIELDS and these fields (ProjectedTestResult).
 
         Returns:
             List of TestSession objects
@@ -642,6 +1297,10 @@ class JSONStorage(BaseStorage):
                 import importlib.util
 
                 if importlib.util.find_spec("ijson") is not None:
+                    if session_filters or fields is not None:
+                        return self._load_sessions_streaming(
+                            chunk_size, session_filters, fields
+                        )
                     return self._load_sessions_streaming(chunk_size)
                 else:
                     print(
@@ -653,6 +1312,7 @@ class JSONStorage(BaseStorage):
                 )
                 # Fall back to regular loading if import check fails
 
+        generation = self.generation()
         try:
             # Use _read_json_safely to get data from storage file
             data = self._read_json_safely()
@@ -678,6 +1338,21 @@ class JSONStorage(BaseStorage):
             )
             return []
 
+        # Select a pushed time range by binary search over the start-time index,
+        # and SUT/tag filters with the bitmap index
+        time_filter, _ = _split_time_filter(session_filters)
+        positions, session_filters = _select_indexed(
+            session_filters,
+            (
+                self._get_time_index(sessions_data, generation)
+                if time_filter is not None
+                else None
+            ),
+            lambda: self._get_bitmap_index(sessions_data, generation),
+        )
+        if positions is not None:
+            sessions_data = [sessions_data[p] for p in positions]
+
         total_sessions = len(sessions_data)
 
         # Process sessions in chunks to avoid memory issues with large files
@@ -688,7 +1363,11 @@ class JSONStorage(BaseStorage):
                 try:
                     # Handle both dictionary and TestSession objects
                     if isinstance(session_data, dict):
-                        session = TestSession.from_dict(session_data)
+                        if session_filters and not _record_matches(
+                            session_data, session_filters
+                        ):
+                            continue
+                        session = TestSession.from_dict(session_data, fields)
                         sessions.append(session)
                     elif isinstance(session_data, TestSession):
                         sessions.append(session_data)
@@ -701,11 +1380,18 @@ class JSONStorage(BaseStorage):
 
         return sessions
 
-    def _load_sessions_streaming(self, chunk_size: int = 1000) -> List[TestSession]:
+    def _load_sessions_streaming(
+        self,
+        chunk_size: int = 1000,
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[TestSession]:
         """Load sessions using a streaming JSON parser for large files.
 
         Args:
             chunk_size: Number of sessions to process at once
+            session_filters: Optional pushed-down session filters
+            fields: Optional projection hint (see load_sessions)
 
         Returns:
             List of TestSession objects
@@ -738,8 +1424,13 @@ class JSONStorage(BaseStorage):
 
                 for session_data in ijson.items(f, prefix):
                     try:
+                        if session_filters and not _record_matches(
+                            session_data, session_filters
+                        ):
+                            continue
+
                         # Create session object
-                        session = TestSession.from_dict(session_data)
+                        session = TestSession.from_dict(session_data, fields)
                         current_chunk.append(session)
 
                         # Process in chunks
@@ -768,6 +1459,9 @@ class JSONStorage(BaseStorage):
         """
 
         try:
+            fresh = self._fresh_indexes()
+            bitmap_index = self._current_bitmap_index()
+
             # Load existing sessions
             sessions = self.load_sessions()
 
@@ -776,6 +1470,14 @@ class JSONStorage(BaseStorage):
 
             # Save all sessions
             self._write_json_safely([s.to_dict() for s in sessions])
+            self._index_saved_sessions(fresh, [session])
+            if bitmap_index is not None and len(bitmap_index) == len(sessions) - 1:
+                # Every stored record was rewritten in place, so extend the index
+                bitmap_index.add(session)
+                _bitmap_indexes[str(self.file_path)] = (
+                    (self.generation(), len(sessions)),
+                    bitmap_index,
+                )
         except Exception as e:
             print(f"Warning: Failed to save session to {self.file_path}: {e}")
 
@@ -1020,6 +1722,10 @@ class JSONStorage(BaseStorage):
 
                     # Move temp file to target location
                     shutil.move(temp_file.name, self.file_path)
+                    _record_write(self.file_path)
+                    # Callers that know what changed re-index incrementally
+                    for index in self._persisted_indexes():
+                        index.stamp = None
                 except Exception as e:
                     # Clean up temp file on error
                     os.unlink(temp_file.name)
@@ -1056,6 +1762,505 @@ class JSONStorage(BaseStorage):
             return []
 
 
+def _as_utc(dt: datetime) -> datetime:
+    """Return a timezone-aware UTC datetime; naive datetimes are assumed to be UTC."""
+    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+# Tiered storages that started a background aging pass in this process
+_aging_storages: "weakref.WeakSet[TieredStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _wait_for_aging() -> None:
+    """Let running aging passes finish before the interpreter exits.
+
+    Aging threads are daemons so they never keep a process alive on their own,
+    but killing one mid-pass leaves aged sessions in both tiers.
+    """
+    for storage in list(_aging_storages):
+        storage.wait_for_aging()
+
+
+class TieredStorage(BaseStorage):
+    """Hot/cold tiered storage for profiles with long histories.
+
+    The hot tier is a regular JSONStorage file holding the sessions of the last
+    ``hot_days`` days. Older sessions are aged into the cold tier: gzip-compressed
+    JSON archive segments, one per calendar month (UTC), stored in ``cold_dir``.
+
+    Reads only open cold segments when the requested time range reaches into them,
+    so "last N days" queries inside the hot window never pay for the full history.
+    Aging runs in a background thread after each write, and can also be triggered
+    explicitly with age_sessions().
+    """
+
+    SEGMENT_PREFIX = "segment-"
+    SEGMENT_SUFFIX = ".json.gz"
+
+    def __init__(
+        self,
+        file_path: Optional[Path] = None,
+        hot_days: int = 30,
+        cold_dir: Optional[Path] = None,
+        background_aging: bool = True,
+        text_index: bool = False,
+    ):
+        """Initialize tiered storage.
+
+        Args:
+            file_path: Path of the hot-tier JSON file
+            hot_days: Number of days of sessions kept in the hot tier
+            cold_dir: Optional directory for cold-tier segments. Defaults to
+                      ``<file stem>_cold`` next to the hot-tier file.
+            background_aging: Whether writes trigger aging in a background thread
+            text_index: Whether to maintain a full-text index over captured output
+                        in both tiers, stored next to the hot-tier file
+        """
+        super().__init__()
+        if not isinstance(hot_days, int) or hot_days < 1:
+            raise ValueError("hot_days must be a positive integer")
+
+        self.hot = JSONStorage(file_path)
+        self.file_path = self.hot.file_path
+        # Sketches cover both tiers, so the hot tier keeps none of its own
+        self.hot.sketches_path = None
+        self.sketches_path = _sketches_path(self.file_path)
+        self.hot_days = hot_days
+        self.cold_dir = (
+            Path(cold_dir)
+            if cold_dir
+            else self.file_path.with_name(f"{self.file_path.stem}_cold")
+        )
+        self.cold_dir.mkdir(parents=True, exist_ok=True)
+        self.background_aging = background_aging
+        if text_index:
+            self.text_index = TextIndex.load(_text_index_path(self.file_path))
+            if self.text_index.stamp is None and not self._segment_paths():
+                # Index a new (or hot-only) store now so saves can be indexed incrementally
+                self.text_index.rebuild(
+                    self.hot.load_sessions(), file_stamp(self._data_files())
+                )
+                self.text_index.save()
+
+        self._lock = threading.RLock()
+        self._aging_thread: Optional[threading.Thread] = None
+
+    def hot_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        """Get the oldest start time that still belongs in the hot tier."""
+        now = _as_utc(now) if now else datetime.now(timezone.utc)
+        return now - timedelta(days=self.hot_days)
+
+    def reaches_cold_tier(self, since: Optional[datetime]) -> bool:
+        """Check whether a time range starting at ``since`` needs the cold tier.
+
+        Every cold session was older than the hot cutoff when it was aged, so a
+        range starting inside the hot window can never match a cold session.
+        """
+        return since is None or _as_utc(since) < self.hot_cutoff()
+
+    def supports_pushdown(self, session_filter: Any) -> bool:
+        """Structured filters are evaluated on raw records in both tiers."""
+        return bool(getattr(session_filter, "pushdown", False))
+
+    supports_projection = True
+
+    def generation(self) -> Optional[Hashable]:
+        """Identify the current version of both tiers."""
+        return (
+            "tiered",
+            _path_generation(self.file_path),
+            _write_counts.get(str(self.cold_dir), 0),
+            tuple(_path_generation(segment) for segment in self._segment_paths()),
+        )
+
+    def load_sessions(
+        self,
+        since: Optional[datetime] = None,
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
+        **kwargs,
+    ) -> List[TestSession]:
+        """Load sessions, reading the cold tier only when needed.
+
+        Args:
+            since: Optional lower bound on session start time. When the bound falls
+                   inside the hot window, cold segments are not read. Sessions older
+                   than ``since`` may still be returned; callers filter precisely.
+            session_filters: Optional pushed-down session filters. Lower bounds of
+                   time-range filters narrow ``since`` (partition pruning).
+            fields: Optional projection hint (see JSONStorage.load_sessions)
+            **kwargs: Passed through to the hot-tier JSONStorage
+
+        Returns:
+            List of TestSession objects, cold-tier sessions first
+        """
+        since = self._narrow_since(since, session_filters)
+        with self._lock:
+            hot_sessions = self.hot.load_sessions(
+                session_filters=session_filters, fields=fields, **kwargs
+            )
+            if not self.reaches_cold_tier(since):
+                return hot_sessions
+            # An interrupted aging pass can leave a session in both tiers
+            hot_ids = {s.session_id for s in hot_sessions}
+            return (
+                self._load_cold_sessions(since, session_filters, fields, hot_ids)
+                + hot_sessions
+            )
+
+    def iter_sessions(
+        self,
+        descending: bool = True,
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[TestSession]:
+        """Iterate sessions in start-time order, opening cold segments lazily.
+
+        Every cold session is older than the hot cutoff, so hot sessions inside
+        the hot window are ordered on their own; only hot sessions not yet aged
+        are merged with the cold tier. Walking newest-first therefore never opens
+        a cold segment until the hot window is exhausted, and older segments are
+        only read as iteration reaches them.
+        """
+        since = self._narrow_since(None, session_filters)
+        with self._lock:
+            hot_sessions = self.hot.load_sessions(
+                session_filters=session_filters, fields=fields
+            )
+        cutoff = self.hot_cutoff()
+        recent, unaged = [], []
+        for session in hot_sessions:
+            if _as_utc(session.session_start_time) >= cutoff:
+                recent.append(session)
+            else:
+                unaged.append(session)
+        recent.sort(key=_session_sort_key, reverse=descending)
+        unaged.sort(key=_session_sort_key, reverse=descending)
+
+        older: Iterator[TestSession] = iter(unaged)
+        if self.reaches_cold_tier(since):
+            hot_ids = {s.session_id for s in hot_sessions}
+            older = heapq.merge(
+                unaged,
+                self._iter_cold_sessions(
+                    since, descending, session_filters, hot_ids, fields
+                ),
+                key=_session_sort_key,
+                reverse=descending,
+            )
+        if descending:
+            yield from recent
+            yield from older
+        else:
+            yield from older
+            yield from recent
+
+    def _data_files(self) -> List[Path]:
+        """The hot-tier file plus every cold segment."""
+        return [self.file_path] + self._segment_paths()
+
+    def save_session(self, session: TestSession) -> None:
+        """Save a session to the hot tier and schedule aging."""
+        with self._write_lock():
+            fresh = self._fresh_indexes()
+            self.hot.save_session(session)
+            self._index_saved_sessions(fresh, [session])
+        self._schedule_aging()
+
+    def save_sessions(self, sessions: List[TestSession]) -> None:
+        """Replace all stored sessions (both tiers) and schedule aging."""
+        with self._write_lock():
+            for segment in self._segment_paths():
+                segment.unlink()
+            self.hot.save_sessions(sessions)
+            self._index_saved_sessions([], sessions)
+        self._schedule_aging()
+
+    def import_sessions(
+        self, import_path: str, merge_strategy: str = "skip_existing"
+    ) -> Dict[str, int]:
+        """Import sessions into the hot tier; old sessions are aged afterwards.
+
+        See JSONStorage.import_sessions for the merge strategies.
+        """
+        with self._write_lock():
+            stats = self.hot.import_sessions(import_path, merge_strategy)
+            self._index_saved_sessions([], [])
+        self._schedule_aging()
+        return stats
+
+    def clear_sessions(
+        self, sessions_to_clear: Optional[List[TestSession]] = None
+    ) -> int:
+        """Remove stored sessions from both tiers.
+
+        Args:
+            sessions_to_clear: Optional list of TestSession objects to remove.
+                              If None, removes all sessions.
+
+        Returns:
+            Number of sessions removed
+        """
+        with self._write_lock():
+            removed = self.hot.clear_sessions(sessions_to_clear)
+            ids_to_clear = (
+                None
+                if sessions_to_clear is None
+                else {s.session_id for s in sessions_to_clear}
+            )
+
+            for segment in self._segment_paths():
+                segment_data = self._read_segment(segment)
+                if ids_to_clear is None:
+                    removed += len(segment_data)
+                    segment.unlink()
+                    continue
+
+                remaining = [
+                    d for d in segment_data if d.get("session_id") not in ids_to_clear
+                ]
+                if len(remaining) != len(segment_data):
+                    removed += len(segment_data) - len(remaining)
+                    self._write_segment(segment, remaining)
+            self._index_saved_sessions([], [])
+            return removed
+
+    def get_last_session(self) -> Optional[TestSession]:
+        """Get the most recent session, consulting the cold tier only if the hot tier is empty."""
+        sessions = self.hot.load_sessions() or self._load_cold_sessions(None)
+        return max(sessions, key=lambda s: s.session_start_time) if sessions else None
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writes to the tiers across threads and pytest processes.
+
+        Saving to the hot tier and aging both read, modify and rewrite the hot
+        file, so they hold a lock file in the cold directory for the whole
+        read-modify-write rather than only while the file is replaced.
+        """
+        with filelock.FileLock(str(self.cold_dir / "tiers.lock"), timeout=60):
+            with self._lock:
+                yield
+
+    def age_sessions(self, now: Optional[datetime] = None) -> int:
+        """Move hot-tier sessions older than the hot window into cold segments.
+
+        Args:
+            now: Optional reference time (defaults to the current UTC time)
+
+        Returns:
+            Number of sessions moved to the cold tier
+        """
+        cutoff = self.hot_cutoff(now)
+        with self._write_lock():
+            fresh_indexes = self._fresh_indexes()
+            hot_sessions = self.hot.load_sessions()
+            keep, aged = [], []
+            for session in hot_sessions:
+                if _as_utc(session.session_start_time) < cutoff:
+                    aged.append(session)
+                else:
+                    keep.append(session)
+
+            if not aged:
+                return 0
+
+            by_segment: Dict[Path, List[TestSession]] = {}
+            for session in aged:
+                by_segment.setdefault(
+                    self._segment_path_for(session.session_start_time), []
+                ).append(session)
+
+            for segment, sessions in by_segment.items():
+                new_ids = {s.session_id for s in sessions}
+                existing = [
+                    d
+                    for d in self._read_segment(segment)
+                    if d.get("session_id") not in new_ids
+                ]
+                self._write_segment(segment, existing + [s.to_dict() for s in sessions])
+
+            # Only rewrite the hot tier once the cold segments are safely on disk;
+            # if this pass is interrupted in between, reads skip the cold copies
+            self.hot.save_sessions(keep)
+            # Aging moves sessions without changing them, so the index stays valid
+            self._index_saved_sessions(fresh_indexes, [])
+            return len(aged)
+
+    def wait_for_aging(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background aging pass has finished."""
+        thread = self._aging_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _schedule_aging(self) -> None:
+        """Start a background aging pass unless one is already running."""
+        if not self.background_aging:
+            return
+        if self._aging_thread is not None and self._aging_thread.is_alive():
+            return
+
+        self._aging_thread = threading.Thread(
+            target=self._age_in_background, name="pytest-insight-aging", daemon=True
+        )
+        _aging_storages.add(self)
+        self._aging_thread.start()
+
+    def _age_in_background(self) -> None:
+        """Run an aging pass, reporting (not raising) failures."""
+        try:
+            self.age_sessions()
+        except Exception as e:
+            print(f"Warning: Failed to age sessions into {self.cold_dir}: {e}")
+
+    def _segment_path_for(self, start_time: datetime) -> Path:
+        """Get the cold segment path for a session start time."""
+        month = _as_utc(start_time).strftime("%Y-%m")
+        return self.cold_dir / f"{self.SEGMENT_PREFIX}{month}{self.SEGMENT_SUFFIX}"
+
+    def _segment_paths(self) -> List[Path]:
+        """List cold segment files, oldest month first."""
+        return sorted(self.cold_dir.glob(f"{self.SEGMENT_PREFIX}*{self.SEGMENT_SUFFIX}"))
+
+    def _segment_month(self, segment: Path) -> str:
+        """Extract the YYYY-MM month key from a segment file name."""
+        return segment.name[len(self.SEGMENT_PREFIX) : -len(self.SEGMENT_SUFFIX)]
+
+    @staticmethod
+    def _narrow_since(
+        since: Optional[datetime], session_filters: Optional[List[Any]]
+    ) -> Optional[datetime]:
+        """Tighten a lower time bound using the lower bounds of pushed filters."""
+        for session_filter in session_filters or []:
+            if getattr(session_filter, "start", None) is not None:
+                start = _as_utc(session_filter.start)
+                since = start if since is None or start > _as_utc(since) else since
+        return since
+
+    def _iter_cold_sessions(
+        self,
+        since: Optional[datetime],
+        descending: bool,
+        session_filters: Optional[List[Any]],
+        skip_ids: set,
+        fields: Optional[Collection[str]] = None,
+    ) -> Iterator[TestSession]:
+        """Yield cold-tier sessions in order, reading one segment at a time.
+
+        Sessions listed in ``skip_ids`` (already read from the hot tier, e.g. when
+        aging ran mid-iteration) are not yielded twice.
+        """
+        since_month = _as_utc(since).strftime("%Y-%m") if since else None
+        segments = self._segment_paths()
+        if descending:
+            segments.reverse()
+        for segment in segments:
+            if since_month and self._segment_month(segment) < since_month:
+                if descending:
+                    break
+                continue
+            with self._lock:
+                sessions_data = self._read_segment(segment)
+            for session in _iter_records_ordered(
+                sessions_data, descending, session_filters, segment, fields=fields
+            ):
+                if session.session_id not in skip_ids:
+                    yield session
+
+    def _load_cold_sessions(
+        self,
+        since: Optional[datetime],
+        session_filters: Optional[List[Any]] = None,
+        fields: Optional[Collection[str]] = None,
+        skip_ids: Collection[str] = (),
+    ) -> List[TestSession]:
+        """Load cold-tier sessions from segments whose month can contain ``since`` or later.
+
+        Sessions listed in ``skip_ids`` (already read from the hot tier) are skipped.
+        """
+        since_month = _as_utc(since).strftime("%Y-%m") if since else None
+        sessions = []
+        for segment in self._segment_paths():
+            if since_month and self._segment_month(segment) < since_month:
+                continue
+            for session_data in self._read_segment(segment):
+                if session_data.get("session_id") in skip_ids:
+                    continue
+                if session_filters and not _record_matches(
+                    session_data, session_filters
+                ):
+                    continue
+                try:
+                    sessions.append(TestSession.from_dict(session_data, fields))
+                except Exception as e:
+                    print(f"Failed to load session from {segment}: {e}")
+        return sessions
+
+    def _read_segment(self, segment: Path) -> List[Dict]:
+        """Read the raw session dictionaries stored in a cold segment."""
+        if not segment.exists():
+            return []
+        try:
+            with gzip.open(segment, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not read cold segment {segment}: {e}")
+            return []
+        return data.get("sessions", []) if isinstance(data, dict) else data
+
+    def _write_segment(self, segment: Path, sessions_data: List[Dict]) -> None:
+        """Atomically write a cold segment, removing it when empty."""
+        _record_write(self.cold_dir)
+        if not sessions_data:
+            if segment.exists():
+                segment.unlink()
+            return
+
+        lock = filelock.FileLock(f"{segment}.lock", timeout=30)
+        with lock:
+            fd, temp_name = tempfile.mkstemp(
+                dir=str(self.cold_dir), suffix=self.SEGMENT_SUFFIX
+            )
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                    fileobj=raw, mode="wb"
+                ) as f:
+                    f.write(json.dumps({"sessions": sessions_data}).encode("utf-8"))
+                shutil.move(temp_name, segment)
+            except Exception:
+                if os.path.exists(temp_name):
+                    os.unlink(temp_name)
+                raise
+        try:
+            os.unlink(f"{segment}.lock")
+        except OSError:
+            pass
+
+
+def _text_index_path(file_path: Path) -> Path:
+    """Get the text index file kept next to a storage file."""
+    return file_path.with_name(f"{file_path.stem}.textidx.json")
+
+
+def _sketches_path(file_path: Path) -> Path:
+    """Get the duration sketches file kept next to a storage file."""
+    return file_path.with_name(f"{file_path.stem}.sketches.json")
+
+
+def _json_storage_for_profile(profile: StorageProfile) -> BaseStorage:
+    """Create the file-backed storage for a json profile, honoring tiering and index settings."""
+    hot_days = getattr(profile, "hot_days", None)
+    text_index = getattr(profile, "text_index", False) is True
+    if isinstance(hot_days, int):
+        return TieredStorage(
+            profile.file_path, hot_days, profile.cold_dir, text_index=text_index
+        )
+    return JSONStorage(profile.file_path, text_index=text_index)
+
+
 def get_storage_instance(
     profile_name: Optional[str] = None,
 ) -> BaseStorage:
@@ -1078,7 +2283,7 @@ def get_storage_instance(
         try:
             profile = profile_manager.get_profile(profile_name)
             if profile.storage_type.lower() == "json":
-                return JSONStorage(profile.file_path)
+                return _json_storage_for_profile(profile)
             elif profile.storage_type.lower() == "memory":
                 return InMemoryStorage()
             else:
@@ -1093,7 +2298,7 @@ def get_storage_instance(
             profile_manager._save_profiles()  # Explicitly save the profiles to disk
 
             if new_profile.storage_type.lower() == "json":
-                return JSONStorage(new_profile.file_path)
+                return _json_storage_for_profile(new_profile)
             elif new_profile.storage_type.lower() == "memory":
                 return InMemoryStorage()
             else:
@@ -1106,7 +2311,7 @@ def get_storage_instance(
         try:
             profile = profile_manager.get_profile(env_profile)
             if profile.storage_type.lower() == "json":
-                return JSONStorage(profile.file_path)
+                return _json_storage_for_profile(profile)
             elif profile.storage_type.lower() == "memory":
                 return InMemoryStorage()
             else:
@@ -1120,7 +2325,7 @@ def get_storage_instance(
     # Step 3: Use active profile
     profile = profile_manager.get_active_profile()
     if profile.storage_type.lower() == "json":
-        return JSONStorage(profile.file_path)
+        return _json_storage_for_profile(profile)
     elif profile.storage_type.lower() == "memory":
         return InMemoryStorage()
     else:
@@ -1146,7 +2351,12 @@ def get_profile_manager() -> ProfileManager:
 
 
 def create_profile(
-    name: str, storage_type: str = "json", file_path: Optional[str] = None
+    name: str,
+    storage_type: str = "json",
+    file_path: Optional[str] = None,
+    hot_days: Optional[int] = None,
+    cold_dir: Optional[str] = None,
+    text_index: bool = False,
 ) -> StorageProfile:
     """Create a new storage profile.
 
@@ -1154,6 +2364,9 @@ def create_profile(
         name: Unique name for the profile
         storage_type: Type of storage (json, memory, etc.)
         file_path: Optional custom path for storage
+        hot_days: Optional hot-tier size in days; enables hot/cold tiering
+        cold_dir: Optional directory for cold-tier archive segments
+        text_index: Whether to maintain a full-text index over captured output
 
     Returns:
         The created profile
@@ -1171,6 +2384,10 @@ def create_profile(
     print(f"Creating profile '{name}' at {current_time.isoformat()} by {creator}")
 
     profile = profile_manager._create_profile(name, storage_type, file_path)
+    if hot_days is not None:
+        profile = profile_manager.set_tiering(name, hot_days, cold_dir)
+    if text_index:
+        profile = profile_manager.set_text_index(name, True)
     return profile
 
 
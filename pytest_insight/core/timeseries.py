@@ -0,0 +1,165 @@
+"""Per-day session totals with prefix sums for pytest-insight.
+
+DailyTotals buckets sessions by the date they started on and keeps running
+(prefix) sums of each total over a dense run of days, from the first day with
+a session to the last. The totals of any date range are then the difference of
+two prefix sums, so a trend over windows of any size costs O(1) per window
+after one pass over the sessions, and interactive views can re-query ranges
+without touching the sessions again.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pytest_insight.core.models import TestOutcome, TestSession
+
+# Totals kept per day
+FIELDS = (
+    "sessions",  # Sessions started on the day
+    "failed_sessions",  # Sessions with any FAILED test
+    "tests",  # Test results
+    "failures",  # FAILED test results
+    "warnings",  # Test results with warnings
+    "duration",  # Sum of test durations (seconds)
+    "timed_sessions",  # Sessions with a start and a stop time
+    "session_seconds",  # Sum of their wall-clock durations
+)
+
+
+class DailyTotals:
+    """Per-day session totals, answering date-range sums in O(1).
+
+    Days are ``session_start_time.date()``. Sessions can be added at any time;
+    prefix sums are rebuilt on the first query after a change.
+    """
+
+    def __init__(self):
+        """Initialize with no days."""
+        self._days: Dict[date, List[float]] = {}
+        self._span: Optional[Tuple[date, List[List[float]]]] = None
+
+    @classmethod
+    def from_sessions(cls, sessions: Iterable[TestSession]) -> "DailyTotals":
+        """Total the sessions by day, in one pass."""
+        totals = cls()
+        for session in sessions:
+            totals.add_session(session)
+        return totals
+
+    def __len__(self):
+        """Get number of days from the first to the last day with sessions."""
+        if not self._days:
+            return 0
+        return (self.last_day - self.first_day).days + 1
+
+    @property
+    def first_day(self) -> Optional[date]:
+        """Get the first day with sessions."""
+        return min(self._days) if self._days else None
+
+    @property
+    def last_day(self) -> Optional[date]:
+        """Get the last day with sessions."""
+        return max(self._days) if self._days else None
+
+    def add(self, day: date, **counts: float) -> None:
+        """Add counts to the totals of a day.
+
+        Args:
+            day: Date the counts belong to
+            **counts: Amounts to add, keyed by field name (see FIELDS)
+        """
+        row = self._days.get(day)
+        if row is None:
+            row = self._days[day] = [0] * len(FIELDS)
+        for field, amount in counts.items():
+            row[FIELDS.index(field)] += amount
+        self._span = None
+
+    def add_session(self, session: TestSession) -> None:
+        """Add a session to the totals of the day it started on."""
+        failures = warnings = 0
+        duration = 0
+        for test in session.test_results:
+            if test.outcome == TestOutcome.FAILED:
+                failures += 1
+            if test.has_warning:
+                warnings += 1
+            if test.duration is not None:
+                duration += test.duration
+        start, stop = session.session_start_time, getattr(session, "session_stop_time", None)
+        timed = bool(start and stop)
+        self.add(
+            start.date(),
+            sessions=1,
+            failed_sessions=1 if failures else 0,
+            tests=len(session.test_results),
+            failures=failures,
+            warnings=warnings,
+            duration=duration,
+            timed_sessions=1 if timed else 0,
+            session_seconds=(stop - start).total_seconds() if timed else 0,
+        )
+
+    def _prefix_sums(self) -> Tuple[date, List[List[float]]]:
+        """Get the first day and, per field, sums over the days before each day."""
+        if self._span is None:
+            first = self.first_day
+            prefix = [[0] * (len(self) + 1) for _ in FIELDS]
+            for offset in range(len(self)):
+                row = self._days.get(first + timedelta(days=offset))
+                for field, sums in enumerate(prefix):
+                    sums[offset + 1] = sums[offset] + (row[field] if row else 0)
+            self._span = (first, prefix)
+        return self._span
+
+    def totals(self, start: Optional[date] = None, end: Optional[date] = None) -> Dict[str, float]:
+        """Sum each field over the days from start to end, inclusive.
+
+        Args:
+            start: First day (default: the first day with sessions)
+            end: Last day (default: the last day with sessions)
+
+        Returns:
+            Dict mapping each of FIELDS to its total over the range
+        """
+        if not self._days:
+            return dict.fromkeys(FIELDS, 0)
+        first, prefix = self._prefix_sums()
+        lo = 0 if start is None else min(max((start - first).days, 0), len(self))
+        hi = len(self) if end is None else min(max((end - first).days + 1, 0), len(self))
+        hi = max(hi, lo)
+        return {field: sums[hi] - sums[lo] for field, sums in zip(FIELDS, prefix)}
+
+    def windows(self, size: int, count: Optional[int] = None, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Sum each field over consecutive windows of days.
+
+        Windows end on ``end`` (default: the last day with sessions) and step
+        back ``size`` days at a time until the first day with sessions; the
+        oldest window may be shorter.
+
+        Args:
+            size: Days per window (at least 1)
+            count: Optional maximum number of (most recent) windows
+            end: Last day of the most recent window
+
+        Returns:
+            Windows oldest first, each a dict with ``start`` and ``end`` dates
+            plus the totals of FIELDS over them
+        """
+        if not self._days:
+            return []
+        size = max(1, size)
+        first = self.first_day
+        end = self.last_day if end is None else end
+        windows = []
+        while end >= first and (count is None or len(windows) < count):
+            start = max(first, end - timedelta(days=size - 1))
+            windows.append({"start": start, "end": end, **self.totals(start, end)})
+            end = start - timedelta(days=1)
+        windows.reverse()
+        return windows
+
+    def series(self) -> List[Dict[str, Any]]:
+        """Get the totals of every day from the first to the last day with sessions."""
+        return self.windows(1)
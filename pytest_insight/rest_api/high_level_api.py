@@ -11,11 +11,11 @@ import json
 import logging
 import os
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from statistics import mean, stdev
 from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi import Path as FastAPIPath
 from fastapi import Query as FastAPIQuery
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,12 +29,16 @@ from pytest_insight.core.comparison import ComparisonError
 from pytest_insight.core.core_api import InsightAPI
 from pytest_insight.core.models import (
     TestOutcome,
+    TestSession,
 )
+from pytest_insight.core.query import InvalidQueryParameterError, Query
 from pytest_insight.core.storage import (
     create_profile,
     get_profile_manager,
     get_storage_instance,
 )
+from pytest_insight.core.timeseries import DailyTotals
+from pytest_insight.utils.utils import create_after_or_equals_filter
 
 # Create FastAPI app for metrics visualization and REST API
 app = FastAPI(
@@ -301,9 +305,23 @@ async def search():
         "unreliable_tests_count",
         "avg_test_duration",
         "test_count_by_outcome",
+        "test_count",
+        "warning_count",
+        "session_failure_rate",
     ]
 
 
+# Grafana targets answered from per-day totals, summed over windows of days
+WINDOWED_TARGETS = {
+    "test_count": ("Test Count", lambda window: window["tests"]),
+    "warning_count": ("Warning Count", lambda window: window["warnings"]),
+    "session_failure_rate": (
+        "Session Failure Rate (%)",
+        lambda window: window["failed_sessions"] / window["sessions"] * 100,
+    ),
+}
+
+
 class GrafanaQuery(BaseModel):
     """Model for Grafana SimpleJSON/Infinity query request."""
 
@@ -318,6 +336,15 @@ class GrafanaQuery(BaseModel):
     adhocFilters: Optional[List[Dict[str, Any]]] = None
 
 
+def _session_date(session: TestSession) -> date:
+    """Get the date a session started on, in the timezone it was recorded in.
+
+    Every daily Grafana series buckets sessions by this date (as DailyTotals
+    does), so datapoints of different targets line up.
+    """
+    return session.session_start_time.date()
+
+
 @app.post("/query", tags=["grafana"])
 async def query(query_request: GrafanaQuery):
     """Query metrics for Grafana.
@@ -330,7 +357,7 @@ async def query(query_request: GrafanaQuery):
         try:
             from_str = query_request.range.get("from")
             from_dt = datetime.fromisoformat(from_str.replace("Z", "+00:00"))
-            days = (datetime.now() - from_dt).days + 1
+            days = (datetime.now(from_dt.tzinfo) - from_dt).days + 1
         except (ValueError, TypeError):
             # If we can't parse the date, default to 7 days
             days = 7
@@ -339,9 +366,9 @@ async def query(query_request: GrafanaQuery):
     storage = get_storage_instance()
     all_sessions = storage.load_sessions()
 
-    # Apply time filter
-    cutoff = datetime.now() - timedelta(days=days)
-    sessions = [s for s in all_sessions if s.session_start_time >= cutoff]
+    # Apply time filter (sessions may carry any timezone, or none)
+    in_range = create_after_or_equals_filter(datetime.now(timezone.utc) - timedelta(days=days))
+    sessions = [s for s in all_sessions if in_range(s)]
 
     if not sessions:
         return []
@@ -352,11 +379,15 @@ async def query(query_request: GrafanaQuery):
     # Group sessions by day for time series
     sessions_by_day = {}
     for session in sorted(sessions, key=lambda s: s.session_start_time):
-        day = session.session_start_time.date()
+        day = _session_date(session)
         if day not in sessions_by_day:
             sessions_by_day[day] = []
         sessions_by_day[day].append(session)
 
+    # Days per datapoint of windowed targets, from the panel's interval
+    window_days = max(1, (query_request.intervalMs or 0) // 86_400_000)
+    daily_by_sut = {}
+
     # Process each target in the request
     results = []
     for target_obj in query_request.targets:
@@ -375,7 +406,18 @@ async def query(query_request: GrafanaQuery):
             continue
 
         # Generate metrics based on target
-        if target == "health_score":
+        if target in WINDOWED_TARGETS:
+            if sut not in daily_by_sut:
+                daily_by_sut[sut] = DailyTotals.from_sessions(filtered_sessions)
+            label, value = WINDOWED_TARGETS[target]
+            datapoints = []
+            for window in daily_by_sut[sut].windows(window_days):
+                if window["sessions"]:
+                    timestamp = int(datetime.combine(window["start"], datetime.min.time()).timestamp() * 1000)
+                    datapoints.append([value(window), timestamp])
+            results.append({"target": label, "datapoints": datapoints})
+
+        elif target == "health_score":
             datapoints = []
             for day, day_sessions in sessions_by_day.items():
                 day_analysis = Analysis(sessions=day_sessions)
@@ -405,35 +447,14 @@ async def query(query_request: GrafanaQuery):
                 datapoints.append([score, timestamp])
             results.append({"target": "Performance Score", "datapoints": datapoints})
 
-        elif target == "pass_rate":
-            datapoints = []
-            for day, day_sessions in sessions_by_day.items():
-                passed = 0
-                total = 0
-                for session in day_sessions:
-                    for test in session.test_results:
-                        total += 1
-                        if test.outcome == TestOutcome.PASSED:
-                            passed += 1
-                pass_rate = (passed / total * 100) if total > 0 else 0
-                timestamp = int(datetime.combine(day, datetime.min.time()).timestamp() * 1000)
-                datapoints.append([pass_rate, timestamp])
-            results.append({"target": "Pass Rate (%)", "datapoints": datapoints})
-
-        elif target == "failure_rate":
+        elif target in ("pass_rate", "failure_rate"):
+            daily = Query().group_by("day", day_of=_session_date).agg(target, sessions=filtered_sessions)
             datapoints = []
-            for day, day_sessions in sessions_by_day.items():
-                failed = 0
-                total = 0
-                for session in day_sessions:
-                    for test in session.test_results:
-                        total += 1
-                        if test.outcome == TestOutcome.FAILED:
-                            failed += 1
-                failure_rate = (failed / total * 100) if total > 0 else 0
+            for day, metrics in daily.items():
                 timestamp = int(datetime.combine(day, datetime.min.time()).timestamp() * 1000)
-                datapoints.append([failure_rate, timestamp])
-            results.append({"target": "Failure Rate (%)", "datapoints": datapoints})
+                datapoints.append([metrics[target] * 100, timestamp])
+            label = "Pass Rate (%)" if target == "pass_rate" else "Failure Rate (%)"
+            results.append({"target": label, "datapoints": datapoints})
 
         elif target == "unreliable_tests_count":
             datapoints = []
@@ -446,15 +467,11 @@ async def query(query_request: GrafanaQuery):
             results.append({"target": "Unreliable Tests Count", "datapoints": datapoints})
 
         elif target == "avg_test_duration":
+            daily = Query().group_by("day", day_of=_session_date).agg("mean_duration", sessions=filtered_sessions)
             datapoints = []
-            for day, day_sessions in sessions_by_day.items():
-                durations = []
-                for session in day_sessions:
-                    for test in session.test_results:
-                        durations.append(test.duration)
-                avg_duration = sum(durations) / len(durations) if durations else 0
+            for day, metrics in daily.items():
                 timestamp = int(datetime.combine(day, datetime.min.time()).timestamp() * 1000)
-                datapoints.append([avg_duration, timestamp])
+                datapoints.append([metrics["mean_duration"], timestamp])
             results.append({"target": "Average Test Duration (s)", "datapoints": datapoints})
 
         elif target == "test_count_by_outcome":
@@ -517,27 +534,42 @@ def sessions_to_timeseries(sessions, metric_fn, metric_name):
 # Query Endpoints
 @app.get("/api/sessions", response_model=List[TestSessionResponse], tags=["query"])
 async def get_sessions(
+    response: Response,
     sut: Optional[str] = FastAPIQuery(None, description="System Under Test name"),
     days: int = FastAPIQuery(7, description="Number of days to include"),
-    limit: int = FastAPIQuery(100, description="Maximum number of sessions to return"),
+    limit: int = FastAPIQuery(100, description="Maximum number of sessions to return", gt=0),
+    cursor: Optional[str] = FastAPIQuery(
+        None, description="Continue after a previous page (value of its X-Next-Cursor header)"
+    ),
     profile: Optional[str] = FastAPIQuery(None, description="Storage profile to use"),
 ):
-    """Get test sessions filtered by SUT and time range."""
+    """Get the latest test sessions filtered by SUT and time range.
+
+    Sessions are returned newest first, one page at a time. When more sessions
+    match, the response carries an X-Next-Cursor header to pass as ``cursor``.
+    """
     api = InsightAPI(profile_name=profile)
     query = api.query()
 
-    if sut:
-        query = query.filter_by_sut(sut)
+    try:
+        if sut:
+            query = query.for_sut(sut)
+        query = query.in_last_days(days).limit(limit)
+        if cursor:
+            query = query.after_cursor(cursor)
+    except InvalidQueryParameterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    query = query.filter_by_date_range(days=days)
-    sessions = query.get_sessions()
+    result = query.execute()
+    if result.next_cursor:
+        response.headers["X-Next-Cursor"] = result.next_cursor
 
     # Convert to response format
     results = []
-    for session in sessions[:limit]:
+    for session in result.sessions:
         results.append(
             {
-                "id": session.id,
+                "id": session.session_id,
                 "sut_name": session.sut_name,
                 "session_start_time": session.session_start_time,
                 "session_duration": session.session_duration,
@@ -550,13 +582,11 @@ async def get_sessions(
                 "error_tests": sum(1 for t in session.test_results if t.outcome == TestOutcome.ERROR),
                 "test_results": [
                     {
-                        "name": test.name,
+                        "name": test.nodeid.split("::")[-1],
                         "outcome": (test.outcome.name if hasattr(test.outcome, "name") else str(test.outcome)),
                         "duration": test.duration,
                         "nodeid": test.nodeid,
-                        "markers": test.markers,
-                        "reruns": test.reruns,
-                        "error_message": test.error_message,
+                        "error_message": test.longreprtext,
                     }
                     for test in session.test_results
                 ],
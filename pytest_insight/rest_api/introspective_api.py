@@ -10,12 +10,12 @@ import re
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple, Type, get_type_hints
 
-from fastapi import APIRouter, FastAPI, Request
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 # Get version directly from package metadata to avoid circular imports
 __version__ = importlib.metadata.version("pytest-insight")
@@ -25,6 +25,7 @@ from pytest_insight.core.comparison import Comparison
 
 # Import API classes for introspection
 from pytest_insight.core.core_api import InsightAPI
+from pytest_insight.core.query import InvalidQueryParameterError
 from pytest_insight.core.query import Query as PyTestQuery
 from pytest_insight.core.storage import get_storage_instance
 
@@ -87,7 +88,12 @@ def create_parameter_model(method: Callable, prefix: str = "") -> Type[BaseModel
         field_definitions[name] = (param_type, Field(default, **field_info))
 
     model_name = f"{prefix}{method.__name__.capitalize()}Params"
-    return create_model(model_name, **field_definitions)
+    # Methods may take non-JSON objects (e.g. a QueryCache); allow them in the model
+    return create_model(
+        model_name,
+        __config__=ConfigDict(arbitrary_types_allowed=True),
+        **field_definitions,
+    )
 
 
 # ---- API Categorization ----
@@ -255,6 +261,29 @@ def create_query_router() -> APIRouter:
         results = query.execute()
         return {"results": results}
 
+    class SerializedQuery(BaseModel):
+        query: Dict[str, Any] = Field(
+            ..., description="Query in Query.to_dict() form"
+        )
+        profile_name: Optional[str] = Field(None, description="Storage profile name")
+
+    @router.post("/run")
+    async def run_serialized_query(params: SerializedQuery):
+        """Execute a serialized query next to the data, caching by fingerprint."""
+        # Sessions are returned as JSON, so every test result field is loaded
+        data = {k: v for k, v in params.query.items() if k != "fields"}
+        try:
+            query = PyTestQuery.from_dict(data, profile_name=params.profile_name)
+        except (InvalidQueryParameterError, KeyError, TypeError, ValueError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid query: {e}")
+
+        result = query.with_cache().execute()
+        return {
+            "fingerprint": query.fingerprint(),
+            "sessions": [session.to_dict() for session in result.sessions],
+            "next_cursor": result.next_cursor,
+        }
+
     @router.get("/available_suts")
     async def get_available_suts(profile_name: Optional[str] = None):
         """Get a list of available SUTs for the specified profile."""
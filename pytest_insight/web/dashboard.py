@@ -14,9 +14,11 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from pytest_insight.core.cofailure import CoFailureStore
 from pytest_insight.core.core_api import InsightAPI
 from pytest_insight.core.models import TestOutcome
 from pytest_insight.core.storage import get_active_profile, list_profiles
+from pytest_insight.core.timeseries import DailyTotals
 from pytest_insight.utils.utils import NormalizedDatetime
 
 
@@ -414,6 +416,14 @@ def display_stability_trends(api: InsightAPI, sut: Optional[str], days: int):
     """Display stability trends for the selected SUT and time range."""
     try:
         st.header("Stability Trends")
+        window_days = st.number_input(
+            "Trend Window (days)",
+            min_value=1,
+            max_value=max(days, 1),
+            value=1,
+            step=1,
+            help="Days per data point; each point totals the window ending on its date",
+        )
 
         # Get sessions for the selected SUT and time range
         sessions = []
@@ -470,40 +480,20 @@ def display_stability_trends(api: InsightAPI, sut: Optional[str], days: int):
                 },
             }
 
-            # Group sessions by date
-            sessions_by_date = {}
-            for session in sessions:
-                if hasattr(session, "session_start_time") and session.session_start_time:
-                    # Get the date part only
-                    date_key = session.session_start_time.date().isoformat()
-                    if date_key not in sessions_by_date:
-                        sessions_by_date[date_key] = []
-                    sessions_by_date[date_key].append(session)
-
-            # Calculate metrics for each date
-            for date_key, date_sessions in sorted(sessions_by_date.items()):
-                # Calculate failure rate
-                total_tests = 0
-                failed_tests = 0
-                total_duration = 0
-
-                for session in date_sessions:
-                    if not (hasattr(session, "test_results") and session.test_results):
-                        continue
-
-                    for test in session.test_results:
-                        total_tests += 1
-                        if hasattr(test, "outcome") and test.outcome == TestOutcome.FAILED:
-                            failed_tests += 1
-                        if hasattr(test, "duration") and test.duration:
-                            total_duration += test.duration
+            # Per-day totals, summed over windows of the selected size
+            daily = DailyTotals.from_sessions(sessions)
+            for window in daily.windows(window_days):
+                if not window["sessions"]:
+                    continue
+                date_key = window["end"].isoformat()
+                total_tests = window["tests"]
 
                 # Add failure rate data point
-                failure_rate = failed_tests / total_tests if total_tests > 0 else 0
+                failure_rate = window["failures"] / total_tests if total_tests > 0 else 0
                 trends["failure_trend"]["data_points"].append({"date": date_key, "rate": failure_rate})
 
                 # Add duration data point
-                avg_duration = total_duration / total_tests if total_tests > 0 else 0
+                avg_duration = window["duration"] / total_tests if total_tests > 0 else 0
                 trends["duration_trend"]["data_points"].append({"date": date_key, "duration": avg_duration})
 
             # Determine trend direction
@@ -1490,51 +1480,36 @@ def display_test_impact_analysis(api: InsightAPI, sut: Optional[str], days: int)
                     co_failing_groups.append(group)
                     assigned_tests.update(group["tests"])
 
-            # Create a matrix to track co-failures for visualization
+            # Count co-failures sparsely; failure storms are counted once, not pairwise
             test_nodeids = list(test_stats.keys())
-            co_failures = {}
-
-            # Initialize the co-failure matrix
-            for test_id in test_nodeids:
-                co_failures[test_id] = {}
-                for other_id in test_nodeids:
-                    if test_id != other_id:
-                        co_failures[test_id][other_id] = 0
-
-            # Fill the co-failure matrix by analyzing session failures
+            co_failure_store = CoFailureStore()
             for session_id, failed_tests in session_failures.items():
-                if len(failed_tests) > 1:  # Only consider sessions with multiple failures
-                    for i, test1 in enumerate(failed_tests):
-                        for test2 in failed_tests[i + 1 :]:
-                            if test1 in co_failures and test2 in co_failures[test1]:
-                                co_failures[test1][test2] += 1
-                            if test2 in co_failures and test1 in co_failures[test2]:
-                                co_failures[test2][test1] += 1
+                co_failure_store.add_failures(session_id, failed_tests)
 
             # Identify significant co-failure relationships
             significant_co_failures = []
-            for test1, others in co_failures.items():
-                for test2, count in others.items():
-                    if count > 0:
-                        # Calculate correlation strength as a percentage of failures
-                        test1_failures = test_stats[test1]["failures"]
-                        test2_failures = test_stats[test2]["failures"]
-
-                        if test1_failures > 0 and test2_failures > 0:
-                            correlation_pct1 = (count / test1_failures) * 100
-                            correlation_pct2 = (count / test2_failures) * 100
-                            avg_correlation = (correlation_pct1 + correlation_pct2) / 2
-
-                            significant_co_failures.append(
-                                {
-                                    "test1": test1,
-                                    "test2": test2,
-                                    "co_failures": count,
-                                    "test1_failures": test1_failures,
-                                    "test2_failures": test2_failures,
-                                    "correlation_pct": avg_correlation,
-                                }
-                            )
+            for test1, test2, count in co_failure_store.edges():
+                if test1 not in test_stats or test2 not in test_stats:
+                    continue
+                # Calculate correlation strength as a percentage of failures
+                test1_failures = test_stats[test1]["failures"]
+                test2_failures = test_stats[test2]["failures"]
+
+                if test1_failures > 0 and test2_failures > 0:
+                    correlation_pct1 = (count / test1_failures) * 100
+                    correlation_pct2 = (count / test2_failures) * 100
+                    avg_correlation = (correlation_pct1 + correlation_pct2) / 2
+
+                    significant_co_failures.append(
+                        {
+                            "test1": test1,
+                            "test2": test2,
+                            "co_failures": count,
+                            "test1_failures": test1_failures,
+                            "test2_failures": test2_failures,
+                            "correlation_pct": avg_correlation,
+                        }
+                    )
 
             # Sort by correlation percentage
             significant_co_failures.sort(key=lambda x: x["correlation_pct"], reverse=True)
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 import pytest
 
+import pytest_insight.core.analysis as analysis_module
 from pytest_insight.core.analysis import Analysis
 from pytest_insight.core.models import TestOutcome, TestResult, TestSession
 from pytest_insight.core.query import Query
@@ -386,3 +387,76 @@ class Test_Analysis:
         # Test analysis_with_profile function
         analysis_with_profile("test_profile")
         mock_analysis.assert_called_with(profile_name="test_profile")
+
+    def test_co_failures(self, get_test_time, json_storage):
+        """Tests failing together are clustered; rare failures are pruned."""
+        failing = {
+            "a": [0, 1, 2, 3],
+            "b": [0, 1, 2, 3],
+            "c": [0, 1, 2, 3, 4],
+            "d": [5, 6, 7],
+            "e": [5, 6, 7],
+            "rare": [0, 1],
+        }
+        sessions = [
+            TestSession(
+                sut_name="api-service",
+                session_id=f"session-{i}",
+                session_start_time=get_test_time(i * 60),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_{name}",
+                        outcome=TestOutcome.FAILED if i in failed_in else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 60),
+                        duration=1.0,
+                    )
+                    for name, failed_in in failing.items()
+                ],
+            )
+            for i in range(8)
+        ]
+        analysis = Analysis(storage=json_storage, sessions=sessions)
+
+        expected = [
+            {"correlation": 0.85, "co_failures": 4, "tests": ["test_a", "test_b", "test_c"]},
+            {"correlation": 1.0, "co_failures": 3, "tests": ["test_d", "test_e"]},
+        ]
+        clusters = analysis.tests.co_failures()
+        assert [c["tests"] for c in clusters] == [e["tests"] for e in expected]
+        for cluster, cluster_expected in zip(clusters, expected):
+            assert cluster["correlation"] == pytest.approx(cluster_expected["correlation"])
+            assert cluster["co_failures"] == cluster_expected["co_failures"]
+        assert analysis.sessions.co_failures() == clusters
+        assert analysis.identify_unreliable_tests() == clusters
+        assert analysis.tests.co_failures(min_occurrences=4) == clusters[:1]
+        assert analysis.tests.co_failures(min_correlation=0.9)[0]["tests"] == ["test_a", "test_b"]
+
+    def test_reports_share_memoized_scans(self, analysis_sessions, json_storage, monkeypatch):
+        """Reports read one scan per days window; with_profile drops the memoized scans."""
+        scans = []
+        original_init = analysis_module._SessionScan.__init__
+
+        def counting_init(scan, sessions, cutoff=None):
+            scans.append(cutoff)
+            original_init(scan, sessions, cutoff)
+
+        monkeypatch.setattr(analysis_module._SessionScan, "__init__", counting_init)
+        analysis = Analysis(storage=json_storage, sessions=analysis_sessions)
+
+        report = analysis.health_report()
+        analysis.stability_report()
+        performance = analysis.performance_report()
+        assert len(scans) == 1
+        assert performance["session_metrics"] == report["session_metrics"]
+        assert report["session_metrics"]["total_tests"] == sum(len(s.test_results) for s in analysis_sessions)
+        assert report["reliability_metrics"]["total_unstable"] == 0
+
+        analysis.health_report(days=7)
+        analysis.sessions.failure_rate(days=7)
+        assert len(scans) == 2 and scans[1] is not None
+
+        monkeypatch.setattr(analysis_module, "get_storage_instance", lambda profile_name=None: json_storage)
+        analysis.with_profile("other")
+        analysis.health_report()
+        assert len(scans) == 3
@@ -0,0 +1,67 @@
+"""Tests for co-failure counting and clustering."""
+
+from pytest_insight.core.cofailure import CoFailureStore
+from pytest_insight.core.insights import Insights
+from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+
+
+def _session(session_id, start_time, failed, passed=()):
+    return TestSession(
+        sut_name="api",
+        session_id=session_id,
+        session_start_time=start_time,
+        session_duration=10,
+        test_results=[
+            TestResult(nodeid=nodeid, outcome=outcome, start_time=start_time, duration=1.0)
+            for names, outcome in ((failed, TestOutcome.FAILED), (passed, TestOutcome.PASSED))
+            for nodeid in names
+        ],
+    )
+
+
+class TestCoFailureStore:
+    """Tests for the incremental co-failure store."""
+
+    def test_counts_are_symmetric_and_incremental(self, get_test_time):
+        """Sessions are counted once each, pairs in both directions, storms as one event."""
+        store = CoFailureStore(storm_size=3)
+        sessions = [
+            _session("s1", get_test_time(), ["a", "b", "c", "a"], passed=["d"]),
+            _session("s2", get_test_time(60), ["a", "b"]),
+        ]
+        assert store.update(sessions) == 2
+        assert store.update(sessions) == 0
+        assert store.add_failures("storm", ["a", "b", "c", "d"])
+        assert not store.add_failures("storm", ["a"])
+
+        assert len(store) == 3 and "s1" in store
+        assert store.counts == {"a": 2, "b": 2, "c": 1}
+        assert store.co_failures["a"]["b"] == store.co_failures["b"]["a"] == 2
+        assert store.co_failures["c"] == {"a": 1, "b": 1}
+        assert sorted(store.edges()) == [("a", "b", 2), ("a", "c", 1), ("b", "c", 1)]
+        assert store.storms == 1 and store.storm_failures["d"] == 1
+
+    def test_dependency_graph_reads_new_sessions_only(self, monkeypatch, get_test_time):
+        """dependency_graph keeps its counts between calls and skips failure storms."""
+        sessions = [_session(f"s{i}", get_test_time(i * 60), ["x::a", "x::b"]) for i in range(3)]
+        sessions.append(_session("storm", get_test_time(300), [f"x::t{i}" for i in range(300)] + ["x::a"]))
+
+        class MockAnalysis:
+            def __init__(self, storage=None):
+                self._sessions = sessions
+
+        monkeypatch.setattr("pytest_insight.core.analysis.Analysis", MockAnalysis)
+        tests = Insights().tests
+
+        graph = tests.dependency_graph()
+        assert graph["storm_sessions"] == 1
+        assert graph["test_failures"]["x::a"] == {"count": 3, "co_failures": {"x::b": 3}}
+        assert [(d["test1"], d["test2"], d["co_failure_count"]) for d in graph["dependencies"]] == [
+            ("x::a", "x::b", 3),
+            ("x::b", "x::a", 3),
+        ]
+
+        sessions.append(_session("s9", get_test_time(600), ["x::a"]))
+        graph = tests.dependency_graph()
+        assert graph["test_failures"]["x::a"]["count"] == 4
+        assert len(tests._co_failures()) == 5
@@ -122,6 +122,32 @@ class Test_Comparison:
         assert "test_api.py::test_get" in comparison.slower_tests
         assert "test_api.py::test_post" in comparison.faster_tests
 
+    def test_p95_changes_cover_all_matching_sessions(self, get_test_time):
+        """p95 durations compare every matching session, not just the latest pair."""
+
+        def session(sut, i, duration):
+            start = get_test_time(i * 60)
+            return TestSession(
+                sut_name=sut,
+                session_id=f"{'base' if sut == 'v1' else 'target'}-{i}",
+                session_start_time=start,
+                session_duration=10.0,
+                test_results=[
+                    TestResult(nodeid="test_api.py::test_get", outcome=TestOutcome.PASSED, start_time=start, duration=duration)
+                ],
+            )
+
+        # The base's latest run is fast, but one of its runs took 10s
+        sessions = [session("v1", i, duration) for i, duration in enumerate([1.0, 10.0, 1.0, 1.0, 1.0])]
+        sessions += [session("v2", i, 2.0) for i in range(5, 10)]
+        comparison = Comparison(sessions=sessions).between_suts("v1", "v2").execute()
+
+        assert comparison.slower_tests == ["test_api.py::test_get"]
+        assert comparison.faster_p95_tests == ["test_api.py::test_get"]
+        assert comparison.slower_p95_tests == []
+        base_p95, target_p95 = comparison.p95_durations["test_api.py::test_get"]
+        assert base_p95 == pytest.approx(10.0, rel=0.01) and target_p95 == pytest.approx(2.0, rel=0.01)
+
     def test_reliability_detection(self, base_session, target_session):
         """Test reliability test detection."""
         comparison = Comparison().execute([base_session, target_session])
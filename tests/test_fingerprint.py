@@ -0,0 +1,130 @@
+"""Tests for error fingerprints and near-duplicate clustering."""
+
+from datetime import timedelta
+
+from pytest_insight.core import insights
+from pytest_insight.core.fingerprint import MinHasher, cluster_fingerprints, fingerprint_error, normalize_error
+from pytest_insight.core.insights import Insights
+from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+
+PYTEST_FAILURE = """tests/test_api.py:{line}: in test_upload
+    store("/tmp/pytest-of-ci/pytest-{run}/upload0/data.json")
+src/api.py:40: in store
+    raise ValueError(f"cannot write {{path}} from {{client!r}}")
+E   ValueError: cannot write /tmp/pytest-of-ci/pytest-{run}/upload0/data.json from <Client at 0x{address}>
+
+src/api.py:40: ValueError"""
+
+TIMEOUT = (
+    "E   TimeoutError: gave up waiting for the {service} service after N retries while calling the charge endpoint"
+)
+
+
+def test_fingerprint_ignores_volatile_tokens():
+    """Line numbers, temporary paths and addresses do not change a fingerprint."""
+    first = fingerprint_error(PYTEST_FAILURE.format(line=12, run=3, address="7f3a1b"))
+    second = fingerprint_error(PYTEST_FAILURE.format(line=15, run=48, address="55d0e2"))
+
+    assert first == second
+    assert first.error_type == "ValueError"
+    assert first.frames == ("test_api.py:test_upload", "api.py:store")
+    assert first.pattern == "ValueError: cannot write data.json from <Client at 0x?>"
+
+    assert fingerprint_error("E   KeyError: 'id'").key != fingerprint_error("E   KeyError: 'name'").key
+    assert fingerprint_error("E       assert 5 == 4\n\ntests/test_a.py:3: AssertionError").message == "assert N == N"
+    assert fingerprint_error("Something broke").error_type == "Unknown Error"
+    assert fingerprint_error("") is None
+    assert normalize_error("at 2024-03-01T10:00:00Z id 123e4567-e89b-12d3-a456-426614174000") == "at <time> id <uuid>"
+
+
+def test_clusters_merge_near_duplicates_of_one_error_type():
+    """Near-duplicate messages share a cluster; other messages and error types do not."""
+    payments = fingerprint_error(TIMEOUT.format(service="payments"))
+    billing = fingerprint_error(TIMEOUT.format(service="billing"))
+    other_type = fingerprint_error(TIMEOUT.format(service="payments").replace("TimeoutError", "ConnectionError"))
+    unrelated = fingerprint_error("E   TimeoutError: lock on the session table was not released")
+
+    hasher = MinHasher()
+    assert hasher.similarity(hasher.signature(payments.tokens()), hasher.signature(billing.tokens())) > 0.7
+
+    clusters = cluster_fingerprints([payments, billing, other_type, unrelated, payments])
+    assert clusters == {
+        payments.key: payments.key,
+        billing.key: payments.key,
+        other_type.key: other_type.key,
+        unrelated.key: unrelated.key,
+    }
+
+
+def test_error_patterns_group_fingerprints(monkeypatch, get_test_time):
+    """error_patterns reports one pattern per cluster and fingerprints each failure once."""
+    messages = [
+        PYTEST_FAILURE.format(line=12, run=1, address="aa"),
+        PYTEST_FAILURE.format(line=13, run=2, address="bb"),
+        TIMEOUT.format(service="payments"),
+        TIMEOUT.format(service="billing"),
+        "",
+    ]
+    sessions = [
+        TestSession(
+            sut_name="api",
+            session_id=f"session-{i}",
+            session_start_time=get_test_time(i * 60),
+            session_duration=1,
+            test_results=[
+                TestResult(
+                    nodeid=f"test_api.py::test_{i % 2}",
+                    outcome=TestOutcome.FAILED,
+                    start_time=get_test_time(i * 60),
+                    duration=1.0,
+                    longreprtext=message,
+                )
+            ],
+        )
+        for i, message in enumerate(messages)
+    ]
+
+    class MockAnalysis:
+        def __init__(self, storage=None):
+            self._sessions = sessions
+
+    monkeypatch.setattr("pytest_insight.core.analysis.Analysis", MockAnalysis)
+    fingerprinted = []
+
+    def counting_fingerprint_error(text):
+        fingerprinted.append(text)
+        return fingerprint_error(text)
+
+    monkeypatch.setattr(insights, "fingerprint_error", counting_fingerprint_error)
+    tests = Insights().tests
+
+    result = tests.error_patterns()
+    assert [(p["pattern"][:12], p["count"], p["fingerprints"]) for p in result["patterns"]] == [
+        ("ValueError: ", 2, 1),
+        ("TimeoutError", 2, 2),
+    ]
+    assert result["patterns"][0]["affected_tests"] == ["test_api.py::test_0", "test_api.py::test_1"]
+    assert [len(test["patterns"]) for test in result["multi_error_tests"]] == [2, 2]
+    assert result["failure_details"][-1]["fingerprint"] is None
+    assert len(fingerprinted) == 5
+
+    # Sessions appended later are fingerprinted on their own
+    sessions.append(
+        TestSession(
+            sut_name="api",
+            session_id="session-5",
+            session_start_time=get_test_time() + timedelta(days=1),
+            session_duration=1,
+            test_results=[
+                TestResult(
+                    nodeid="test_api.py::test_2",
+                    outcome=TestOutcome.FAILED,
+                    start_time=get_test_time() + timedelta(days=1),
+                    duration=1.0,
+                    longreprtext=TIMEOUT.format(service="orders"),
+                )
+            ],
+        )
+    )
+    assert [p["count"] for p in tests.error_patterns()["patterns"]] == [3, 2]
+    assert len(fingerprinted) == 6
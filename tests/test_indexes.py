@@ -0,0 +1,247 @@
+"""Tests for secondary indexes over stored sessions."""
+
+from datetime import timedelta, timezone
+
+from pytest_insight.core.indexes import (
+    BitmapIndex,
+    TextIndex,
+    TimeIndex,
+    bit_positions,
+    to_epoch,
+)
+from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+from pytest_insight.core.query import Query
+from pytest_insight.core.storage import InMemoryStorage, JSONStorage, _bitmap_indexes
+
+
+def _session(session_id, start_time, errors):
+    return TestSession(
+        sut_name="api",
+        session_id=session_id,
+        session_start_time=start_time,
+        session_duration=10,
+        test_results=[
+            TestResult(
+                nodeid=f"tests/test_api.py::test_{i}",
+                outcome=TestOutcome.FAILED if error else TestOutcome.PASSED,
+                start_time=start_time,
+                duration=1.0,
+                longreprtext=error,
+                caplog="retrying connection" if i % 2 else "",
+            )
+            for i, error in enumerate(errors)
+        ],
+    )
+
+
+class TestTextIndex:
+    """Tests for the trigram text index."""
+
+    def test_candidates_are_a_superset_of_matches(self, get_test_time):
+        """Candidates contain every match; short literals cannot be answered."""
+        index = TextIndex()
+        index.add_session(_session("s1", get_test_time(), ["ConnectionResetError: peer", "", "Reset"]))
+        index.add_session(_session("s2", get_test_time(60), ["AssertionError", "ResetConnection"]))
+
+        assert index.candidates("longreprtext", "ConnectionResetError") == {"s1": {0}}
+        assert index.candidates("longreprtext", "Reset") == {"s1": {0, 2}, "s2": {1}}
+        assert index.candidates("longreprtext", "Nope") == {}
+        assert index.candidates("longreprtext", "Re") is None
+        assert index.candidates("nodeid", "test") is None
+
+        # Replacing a session drops its old documents
+        index.add_session(_session("s1", get_test_time(), ["fine"]))
+        assert index.candidates("longreprtext", "Reset") == {"s2": {1}}
+
+    def test_round_trip_compacts_removed_documents(self, tmp_path, get_test_time):
+        """Saved indexes reload with the same answers."""
+        index = TextIndex(tmp_path / "idx.json")
+        index.add_session(_session("s1", get_test_time(), ["ValueError"]))
+        index.add_session(_session("s2", get_test_time(), ["KeyError", "ValueError"]))
+        index.remove_session("s1")
+        index.stamp = [["file", 1, 2]]
+        index.save()
+
+        loaded = TextIndex.load(tmp_path / "idx.json")
+        assert loaded.stamp == [["file", 1, 2]]
+        assert loaded.candidates("longreprtext", "ValueError") == {"s2": {1}}
+        assert len(loaded) == 2
+
+
+def test_query_uses_text_index_for_output_searches(tmp_path, mocker, get_test_time):
+    """Output searches only decode candidate sessions and stay exact."""
+    storage = JSONStorage(tmp_path / "sessions.json", text_index=True)
+    for i in range(6):
+        storage.save_session(
+            _session(
+                f"run-{i}",
+                get_test_time(i * 60),
+                ["ConnectionResetError by peer" if i in (1, 4) else "AssertionError", ""],
+            )
+        )
+    # Saves update the index incrementally
+    assert storage.text_index.stamp is not None
+    rebuild_spy = mocker.spy(storage.text_index, "rebuild")
+    from_dict_spy = mocker.spy(TestSession, "from_dict")
+
+    query = Query()
+    query.storage = storage
+    result = query.filter_by_test().with_error_containing("ConnectionResetError").apply().execute()
+
+    assert [s.session_id for s in result] == ["run-1", "run-4"]
+    assert [len(s.test_results) for s in result] == [1, 1]
+    assert from_dict_spy.call_count == 2
+    rebuild_spy.assert_not_called()
+
+    # Writes that bypass incremental indexing trigger a rebuild on the next search
+    storage.save_sessions(storage.load_sessions()[:2])
+    query = Query()
+    query.storage = storage
+    result = query.filter_by_test().with_error_containing("ConnectionResetError").apply().execute()
+    assert [s.session_id for s in result] == ["run-1"]
+    rebuild_spy.assert_called_once()
+
+
+def test_tiered_text_index_survives_aging(tmp_path, get_test_time):
+    """Aging moves sessions between tiers without invalidating the index."""
+    from datetime import datetime, timedelta, timezone
+
+    from pytest_insight.core.storage import TieredStorage
+
+    storage = TieredStorage(tmp_path / "hot.json", hot_days=7, background_aging=False, text_index=True)
+    now = datetime.now(timezone.utc)
+    storage.save_session(_session("old", now - timedelta(days=30), ["TimeoutError"]))
+    storage.save_session(_session("new", now - timedelta(days=1), ["TimeoutError"]))
+    storage.age_sessions()
+
+    assert storage.text_index.stamp is not None
+    assert storage.get_text_index().candidates("longreprtext", "Timeout") == {
+        "old": {0},
+        "new": {0},
+    }
+
+
+class TestTimeIndex:
+    """Tests for the sorted start-time index."""
+
+    def test_select_honors_bound_inclusivity(self, get_test_time):
+        """Ranges are selected by bisect, in time order, with ties by session ID."""
+        base = get_test_time()
+        index = TimeIndex.build(
+            [
+                (base + timedelta(minutes=2), "c"),
+                (base, "b"),
+                (base.isoformat(), "a"),
+                ("not a time", "bad"),
+                (base + timedelta(minutes=1), "d"),
+            ]
+        )
+        start, end = to_epoch(base), to_epoch(base + timedelta(minutes=2))
+
+        assert len(index) == 4
+        assert index.select() == [2, 1, 4, 0]
+        assert index.select(start, end) == [2, 1, 4, 0]
+        assert index.select(start, end, include_start=False, include_end=False) == [4]
+        assert index.select(end=start) == [2, 1]
+        assert index.select(start=end + 1) == []
+
+    def test_storage_time_pushdown_matches_full_scan(self, tmp_path, get_test_time):
+        """Index-selected time ranges equal a per-session scan for every storage."""
+        base = get_test_time()
+        sessions = [_session(f"s{i}", base + timedelta(hours=i * 7 % 24), []) for i in range(24)]
+        json_storage = JSONStorage(str(tmp_path / "sessions.json"))
+        for session in sessions:
+            json_storage.save_session(session)
+        storages = [json_storage, InMemoryStorage(list(sessions))]
+
+        aware_start = (base + timedelta(hours=5)).replace(tzinfo=timezone.utc)
+        queries = [
+            lambda q: q.date_range(aware_start, aware_start + timedelta(hours=10)),
+            lambda q: q.after(base + timedelta(hours=5)).before(base + timedelta(hours=15)),
+            lambda q: q.before(base + timedelta(hours=3)),
+        ]
+
+        def run(build, storage, **kwargs):
+            query = Query()
+            query.storage = storage
+            return build(query).execute(**kwargs).sessions
+
+        for build in queries:
+            expected = {s.session_id for s in run(build, json_storage, sessions=sessions)}
+            assert expected
+            for storage in storages:
+                assert {s.session_id for s in run(build, storage)} == expected
+            ordered = run(lambda q: build(q).order_by("session_start_time"), json_storage)
+            starts = [s.session_start_time for s in ordered]
+            assert starts == sorted(starts)
+
+
+class TestBitmapIndex:
+    """Tests for the SUT/tag bitmap index."""
+
+    def test_select_combines_groups(self, get_test_time):
+        """Keys in a group are ORed, groups are ANDed, and appends extend the bitsets."""
+        index = BitmapIndex.build(
+            [
+                {"sut_name": "api", "session_tags": {"env": "prod"}},
+                {"sut_name": "web", "session_tags": {"env": "staging"}},
+                {"sut_name": "api", "session_tags": {"env": "staging", "bad": ["x"]}},
+                "not a record",
+            ]
+        )
+        assert len(index) == 4
+        assert bit_positions(index.select([[("sut", "api")]])) == [0, 2]
+        staging_or_prod = [("tag", "env", "staging"), ("tag", "env", "prod")]
+        assert bit_positions(index.select([staging_or_prod])) == [0, 1, 2]
+        assert bit_positions(index.select([[("sut", "api")], [("tag", "env", "staging")]])) == [2]
+        assert index.select([[("sut", "missing")]]) == 0
+        assert bit_positions(index.select([])) == [0, 1, 2, 3]
+
+        index.add(TestSession(sut_name="web", session_id="s", session_start_time=get_test_time(), session_duration=0))
+        assert bit_positions(index.select([[("sut", "web")]])) == [1, 4]
+
+    def test_storage_tag_pushdown_matches_full_scan(self, tmp_path, get_test_time):
+        """Bitmap-selected SUT and tag filters equal a per-session scan, before and after saves."""
+        base = get_test_time()
+        sessions = []
+        for i in range(30):
+            session = _session(f"s{i}", base + timedelta(hours=i * 7 % 24), [])
+            session.sut_name = f"sut{i % 4}"
+            session.session_tags = {"env": ["prod", "staging", "dev"][i % 3], "region": f"r{i % 2}"}
+            sessions.append(session)
+        json_storage = JSONStorage(str(tmp_path / "sessions.json"))
+        memory_storage = InMemoryStorage()
+        for session in sessions[:20]:
+            json_storage.save_session(session)
+            memory_storage.save_session(session)
+
+        queries = [
+            lambda q: q.for_sut("sut1"),
+            lambda q: q.with_session_tag("env", "prod").with_session_tag("env", "dev", combine_with_or=True),
+            lambda q: q.for_sut("sut2").with_session_tag("region", "r0").in_last_days(100000),
+            lambda q: q.with_session_tag("env", "staging").with_custom_session_filter(
+                lambda s: s.session_id != "s4", "not_s4"
+            ),
+        ]
+
+        def run(build, storage, **kwargs):
+            query = Query()
+            query.storage = storage
+            return [s.session_id for s in build(query).execute(**kwargs).sessions]
+
+        for saved in (20, 30):
+            if saved == 30:
+                for session in sessions[20:]:
+                    json_storage.save_session(session)
+                    memory_storage.save_session(session)
+                # Saves extend the bitmap index instead of dropping it
+                assert len(_bitmap_indexes[str(json_storage.file_path)][1]) == 30
+                assert memory_storage._bitmap_index[0][1] == 30
+            for build in queries:
+                expected = run(build, json_storage, sessions=sessions[:saved])
+                assert expected
+                assert run(build, json_storage) == expected
+                assert run(build, memory_storage) == expected
+                pushed = [f for f in build(Query())._session_filters if f.pushdown]
+                loaded = json_storage.load_sessions(session_filters=pushed)
+                assert set(expected) <= {s.session_id for s in loaded}
@@ -1,9 +1,10 @@
 """Tests for the insights module."""
 
-from datetime import datetime, timedelta
+import sys
+from datetime import datetime, timedelta, timezone
 
 import pytest
-from pytest_insight.core.insights import Insights
+from pytest_insight.core.insights import Insights, _TestIndex
 from pytest_insight.core.models import (
     RerunTestGroup,
     TestOutcome,
@@ -517,3 +518,204 @@ class TestInsightsModuleTests:
         # Test insights_with_profile function
         insights_with_profile("test_profile")
         mock_insights_class.assert_called_with(profile_name="test_profile")
+
+    @pytest.mark.parametrize("with_numpy", [True, False])
+    def test_correlation_analysis_uses_shared_sessions(self, monkeypatch, with_numpy):
+        """Pairs are correlated over the sessions both tests ran in, with or without NumPy."""
+        if not with_numpy:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        pattern = [True, False, True, True, False, False]
+        runs = {
+            "test_a": {i: passed for i, passed in enumerate(pattern)},
+            "test_same": {i: passed for i, passed in enumerate(pattern)},
+            "test_opposite": {i: not passed for i, passed in enumerate(pattern)},
+            # Shares sessions 2-5 with test_a and agrees on them
+            "test_shifted": {i: (pattern[i] if i < len(pattern) else i % 2 == 0) for i in range(2, 8)},
+            # Never runs alongside test_a
+            "test_disjoint": {i: i % 2 == 0 for i in range(6, 12)},
+        }
+        now = datetime.now()
+        sessions = [
+            TestSession(
+                sut_name="api",
+                session_id=f"session-{i}",
+                session_start_time=now + timedelta(minutes=i),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_module.py::{name}",
+                        outcome=TestOutcome.PASSED if by_session[i] else TestOutcome.FAILED,
+                        start_time=now,
+                        duration=1.0,
+                    )
+                    for name, by_session in runs.items()
+                    if i in by_session
+                ],
+            )
+            for i in range(12)
+        ]
+
+        class MockAnalysis:
+            def __init__(self, storage=None):
+                self._sessions = sessions
+
+        monkeypatch.setattr("pytest_insight.core.analysis.Analysis", MockAnalysis)
+        insights = Insights()
+
+        result = insights.tests.correlation_analysis()
+        found = {(c["test1_short"], c["test2_short"]): c["correlation"] for c in result["correlations"]}
+        assert found[("test_a", "test_same")] == pytest.approx(1.0)
+        assert found[("test_a", "test_opposite")] == pytest.approx(-1.0)
+        assert found[("test_a", "test_shifted")] == pytest.approx(1.0)
+        assert not any("test_disjoint" in pair and "test_a" in pair for pair in found)
+        assert result["test_matrix"]["test_module.py::test_a"]["outcomes"][:3] == [1, 0, 1]
+        strengths = [c["strength"] for c in result["correlations"]]
+        assert strengths == sorted(strengths, reverse=True)
+
+        top = insights.tests.correlation_analysis(top_k=2)["correlations"]
+        assert top == result["correlations"][:2]
+
+    @pytest.mark.parametrize("with_numpy", [True, False])
+    def test_seasonal_patterns_from_failure_events(self, monkeypatch, with_numpy):
+        """Hour and weekday peaks come from the failure events, with or without NumPy."""
+        if not with_numpy:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        monday = datetime(2026, 3, 2, 9, 0, tzinfo=timezone(timedelta(hours=-5)))
+        failures = {
+            # Mondays at 9:00 in its own clock (14:00 UTC)
+            "test_nightly": [monday + timedelta(weeks=week) for week in range(4)],
+            # Spread over hours and days: no peaks
+            "test_spread": [monday + timedelta(days=day, hours=2 * day) for day in range(7)],
+            # Too few failures
+            "test_rare": [monday, monday],
+        }
+        sessions = [
+            TestSession(
+                sut_name="api",
+                session_id=f"session-{name}-{i}",
+                session_start_time=start,
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_module.py::{name}",
+                        outcome=TestOutcome.FAILED,
+                        start_time=start,
+                        duration=1.0,
+                    )
+                ],
+            )
+            for name, starts in failures.items()
+            for i, start in enumerate(starts)
+        ]
+
+        class MockAnalysis:
+            def __init__(self, storage=None):
+                self._sessions = sessions
+
+        monkeypatch.setattr("pytest_insight.core.analysis.Analysis", MockAnalysis)
+        tests = Insights().tests
+
+        patterns = tests.seasonal_patterns()["patterns"]
+        assert [p["test_short"] for p in patterns] == ["test_nightly"]
+        assert patterns[0]["peak_hours"] == [(9, 4, 1.0)]
+        assert patterns[0]["peak_days"] == [(0, 4, 1.0)]
+        assert sum(patterns[0]["hour_distribution"]) == 4 and len(patterns[0]["day_distribution"]) == 7
+
+        # Appended failures extend the events
+        sessions.extend(
+            TestSession(
+                sut_name="api",
+                session_id=f"session-late-{i}",
+                session_start_time=monday,
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid="test_module.py::test_spread",
+                        outcome=TestOutcome.FAILED,
+                        start_time=monday,
+                        duration=1.0,
+                    )
+                ],
+            )
+            for i in range(3)
+        )
+        patterns = tests.seasonal_patterns()["patterns"]
+        assert [(p["test_short"], p["total_failures"]) for p in patterns] == [("test_spread", 10), ("test_nightly", 4)]
+        assert patterns[0]["peak_hours"] == [(9, 4, 0.4)]
+
+    def test_insight_methods_share_one_scan(self, monkeypatch):
+        """Test insights read one per-test index, extended as sessions are appended."""
+        day = datetime(2026, 3, 2, 9, 0)
+        outcomes = [
+            (TestOutcome.PASSED, TestOutcome.FAILED),
+            (TestOutcome.PASSED, TestOutcome.PASSED),
+            (TestOutcome.FAILED, TestOutcome.PASSED),
+        ]
+        sessions = [
+            TestSession(
+                sut_name="api",
+                session_id=f"session-{i}",
+                session_start_time=day + timedelta(days=i // 2),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_module.py::test_{name}_case",
+                        outcome=outcome,
+                        start_time=day + timedelta(days=i // 2),
+                        duration=duration,
+                        longreprtext="AssertionError: boom" if outcome == TestOutcome.FAILED else "",
+                    )
+                    for name, outcome, duration in zip(("api", "db"), outcomes[i], (1.0, 2.0 + i))
+                ],
+            )
+            for i in range(3)
+        ]
+
+        class MockAnalysis:
+            def __init__(self, storage=None):
+                self._sessions = sessions
+
+        monkeypatch.setattr("pytest_insight.core.analysis.Analysis", MockAnalysis)
+        tests = Insights().tests
+
+        scanned = []
+        add_session = _TestIndex.add_session
+
+        def counting_add_session(index, session):
+            scanned.append(session.session_id)
+            add_session(index, session)
+
+        monkeypatch.setattr(_TestIndex, "add_session", counting_add_session)
+
+        assert tests.outcome_distribution()["outcomes"][TestOutcome.FAILED]["count"] == 2
+        assert tests.slowest_tests(limit=1)["slowest_tests"] == [("test_module.py::test_db_case", 4.0)]
+        assert tests.test_patterns()["prefixes"] == {"test_api_": 3, "test_db_": 3}
+        timeline = tests.stability_timeline()
+        assert timeline["dates"] == [day.date(), (day + timedelta(days=1)).date()]
+        assert timeline["timeline"]["test_module.py::test_api_case"][day.date()] == {
+            "total_runs": 2,
+            "outcome_counts": {"PASSED": 2},
+            "stability_score": 1.0,
+        }
+        assert timeline["trends"]["test_module.py::test_api_case"]["direction"] == "stable"
+        assert [f["session_id"] for f in tests.error_patterns()["failure_details"]] == ["session-0", "session-2"]
+        assert scanned == ["session-0", "session-1", "session-2"]
+
+        sessions.append(
+            TestSession(
+                sut_name="api",
+                session_id="session-3",
+                session_start_time=day + timedelta(days=2),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid="test_module.py::test_api_case",
+                        outcome=TestOutcome.FAILED,
+                        start_time=day + timedelta(days=2),
+                        duration=1.0,
+                    )
+                ],
+            )
+        )
+        assert tests.outcome_distribution()["total_tests"] == 7
+        assert scanned[3:] == ["session-3"]
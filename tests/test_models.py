@@ -4,6 +4,9 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from pytest_insight.core.models import (
+    FieldNotLoadedError,
+    FilteredSessionView,
+    ProjectedTestResult,
     RerunTestGroup,
     TestOutcome,
     TestResult,
@@ -135,6 +138,46 @@ class Test_TestResult:
         assert result.longreprtext == test_result.longreprtext
         assert result.has_warning == test_result.has_warning
 
+    def test_projected_test_result_from_dict(self, get_test_time):
+        """Projected results hold core and selected fields; others raise."""
+        full = TestResult(
+            nodeid="test_api.py::test_get",
+            outcome=TestOutcome.FAILED,
+            start_time=get_test_time(),
+            stop_time=get_test_time(5),
+            caplog="x" * 4096,
+            longreprtext="AssertionError",
+        )
+
+        result = ProjectedTestResult.from_dict(full.to_dict(), ["longreprtext", "stop_time"])
+
+        assert isinstance(result, TestResult)
+        assert result.nodeid == full.nodeid
+        assert result.outcome == TestOutcome.FAILED
+        assert result.duration == full.duration
+        assert result.stop_time == full.stop_time
+        assert result.longreprtext == "AssertionError"
+        with pytest.raises(FieldNotLoadedError, match="caplog"):
+            result.caplog
+        assert getattr(result, "capstdout", None) is None
+        assert "caplog" not in repr(result)
+
+        session_data = TestSession(
+            sut_name="api",
+            session_id="s1",
+            session_start_time=get_test_time(),
+            session_duration=5,
+            test_results=[full],
+        ).to_dict()
+        session = TestSession.from_dict(session_data, fields=())
+        assert isinstance(session.test_results[0], ProjectedTestResult)
+        assert session.test_results[0].loaded_fields == [
+            "nodeid",
+            "outcome",
+            "start_time",
+            "duration",
+        ]
+
     def test_test_result_timing_calculations(self, get_test_time):
         """Test timing calculations for test results."""
         now = get_test_time()
@@ -334,6 +377,57 @@ class Test_TestSession:
         )
 
 
+    def test_filtered_session_view(self, get_test_time):
+        """A view reads metadata from its base session and selects results by position."""
+        tests = [
+            TestResult(
+                nodeid=f"test_api.py::test_{i}",
+                outcome=TestOutcome.FAILED if i % 2 else TestOutcome.PASSED,
+                start_time=get_test_time(i),
+                duration=1.0,
+            )
+            for i in range(5)
+        ]
+        session = TestSession(
+            sut_name="api",
+            testing_system={"host": "ci-1"},
+            session_id="run-1",
+            session_start_time=get_test_time(),
+            session_duration=30,
+            session_tags={"env": "prod"},
+            test_results=tests,
+        )
+
+        view = FilteredSessionView(session, [1, 3])
+        assert isinstance(view, TestSession)
+        assert view.base is session
+        assert view.testing_system == {"host": "ci-1"}
+        assert view.session_duration == 30
+        assert view.session_stop_time == session.session_stop_time
+        assert view.test_results == [tests[1], tests[3]]
+        assert view.to_dict()["test_results"] == [tests[1].to_dict(), tests[3].to_dict()]
+        assert view == TestSession(
+            sut_name="api",
+            testing_system={"host": "ci-1"},
+            session_id="run-1",
+            session_start_time=get_test_time(),
+            session_duration=30,
+            session_tags={"env": "prod"},
+            test_results=[tests[1], tests[3]],
+        )
+
+        # Views of views refer to the original session
+        narrower = FilteredSessionView(view, [1])
+        assert narrower.base is session and list(narrower.positions) == [3]
+
+        # Writes stay local to the view
+        view.session_tags = {"env": "staging"}
+        view.add_test_result(tests[0])
+        assert session.session_tags == {"env": "prod"}
+        assert len(session.test_results) == 5 and len(view.test_results) == 3
+        assert FilteredSessionView(view, [2]).test_results == [tests[0]]
+
+
 class Test_RerunTestGroup:
     """Test the RerunTestGroup model."""
 
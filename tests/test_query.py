@@ -1,3 +1,4 @@
+import threading
 import uuid
 
 import pytest
@@ -773,3 +774,690 @@ def test_outcome_based_filtering(get_test_time, monkeypatch):
     assert len(result) == 1
     assert result.sessions[0].session_id == "passed-tests-run"
     assert len(result.sessions[0].test_results) == 2
+
+
+def test_query_plan_pushes_structured_session_filters(tmp_path, mocker, get_test_time):
+    """Structured session filters are pushed to storage; custom predicates stay residual."""
+    from pytest_insight.core.query import (
+        AnyOfFilter,
+        CustomSessionFilter,
+        SutFilter,
+        TimeRangeFilter,
+    )
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api" if i % 2 else "web",
+                session_id=f"run-{i}",
+                session_tags={"env": "prod" if i < 4 else "dev"},
+                session_start_time=get_test_time(i * 3600),
+                session_duration=60,
+            )
+            for i in range(8)
+        ]
+    )
+
+    query = Query()
+    query.storage = storage
+    query.for_sut("api").after(get_test_time(3600)).with_session_tag(
+        "env", "prod"
+    ).with_session_tag("env", "dev", combine_with_or=True).with_custom_session_filter(
+        lambda s: s.session_id != "run-5", "not-run-5"
+    )
+
+    plan = query.plan()
+    assert [type(f) for f in plan.pushed] == [SutFilter, TimeRangeFilter, AnyOfFilter]
+    assert [type(f) for f in plan.residual] == [CustomSessionFilter]
+
+    # Only records passing the pushed filters are decoded into TestSession objects
+    from_dict_spy = mocker.spy(TestSession, "from_dict")
+    result = query.execute()
+    assert [s.session_id for s in result.sessions] == ["run-3", "run-7"]
+    assert from_dict_spy.call_count == 3
+
+    # Explicit session lists bypass storage, so every filter is evaluated in the query
+    explicit = query.execute(sessions=storage.load_sessions())
+    assert [s.session_id for s in explicit.sessions] == ["run-3", "run-7"]
+
+
+def test_tiered_storage_prunes_cold_tier_from_pushed_time_filters(tmp_path, mocker):
+    """A pushed time filter inside the hot window never opens cold segments."""
+    import datetime as dt_module
+
+    from pytest_insight.core.storage import TieredStorage
+
+    now = dt_module.datetime.now(dt_module.timezone.utc)
+    storage = TieredStorage(tmp_path / "hot.json", hot_days=7, background_aging=False)
+    for session_id, age_days in (("recent", 1), ("old", 60)):
+        storage.save_session(
+            TestSession(
+                sut_name="api",
+                session_id=session_id,
+                session_start_time=now - dt_module.timedelta(days=age_days),
+                session_duration=60,
+            )
+        )
+    storage.age_sessions()
+    cold_spy = mocker.spy(storage, "_load_cold_sessions")
+
+    query = Query()
+    query.storage = storage
+    assert [s.session_id for s in query.in_last_days(3).execute()] == ["recent"]
+    cold_spy.assert_not_called()
+
+    query = Query()
+    query.storage = storage
+    assert [s.session_id for s in query.in_last_days(90).execute()] == [
+        "old",
+        "recent",
+    ]
+    cold_spy.assert_called_once()
+
+
+def test_compiled_test_filters_match_filter_chain(get_test_time):
+    """The fused predicate agrees with evaluating each filter and checks cheap fields first."""
+    from pytest_insight.core.query import (
+        CustomFilter,
+        DurationFilter,
+        OutcomeFilter,
+        RegexPatternFilter,
+        ShellPatternFilter,
+        compile_test_filters,
+    )
+
+    tests = [
+        TestResult(
+            nodeid=f"tests/test_{name}.py::test_{i}",
+            outcome=outcome,
+            start_time=get_test_time(i),
+            duration=duration,
+            caplog="timeout waiting for db" if i % 2 else "",
+        )
+        for i, (name, outcome, duration) in enumerate(
+            [
+                ("api", TestOutcome.FAILED, 2.0),
+                ("api", "failed", 0.5),
+                ("web", TestOutcome.FAILED, 3.0),
+                ("api", TestOutcome.PASSED, 4.0),
+                ("api", TestOutcome.FAILED, 20.0),
+                ("api", TestOutcome.FAILED, 5.0),
+            ]
+        )
+    ]
+    custom_calls = []
+
+    def custom(test):
+        custom_calls.append(test.nodeid)
+        return True
+
+    filters = [
+        ShellPatternFilter(pattern="test_api", field_name="nodeid"),
+        RegexPatternFilter(pattern="timeout", field_name="caplog"),
+        RegexPatternFilter(pattern=r"test_\d+$"),
+        DurationFilter(min_seconds=1.0, max_seconds=30.0),
+        DurationFilter(min_seconds=0.0, max_seconds=10.0),
+        OutcomeFilter(outcome=TestOutcome.FAILED),
+        CustomFilter(predicate=custom, name="tracked"),
+    ]
+    predicate = compile_test_filters(filters)
+
+    expected = [t for t in tests if all(f.matches(t) for f in filters)]
+    custom_calls.clear()
+    assert [t for t in tests if predicate(t)] == expected
+    assert [t.nodeid for t in expected] == ["tests/test_api.py::test_5"]
+    # Custom predicates only see tests that passed every cheaper check
+    assert custom_calls == ["tests/test_api.py::test_5"]
+
+    # Conflicting outcomes can never match
+    conflicting = compile_test_filters(
+        [OutcomeFilter(outcome=TestOutcome.FAILED), OutcomeFilter(outcome=TestOutcome.PASSED)]
+    )
+    assert not any(conflicting(t) for t in tests)
+    assert all(compile_test_filters([])(t) for t in tests)
+
+
+def test_query_cache_hits_until_storage_changes(tmp_path, get_test_time):
+    """Identical queries are served from the cache until the storage is written."""
+    from pytest_insight.core.query import QueryCache
+    from pytest_insight.core.storage import InMemoryStorage, JSONStorage
+
+    def make_session(i):
+        return TestSession(
+            sut_name="api",
+            session_id=f"run-{i}",
+            session_start_time=get_test_time(i * 60),
+            session_duration=10,
+        )
+
+    cache = QueryCache(max_entries=2)
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions([make_session(i) for i in range(3)])
+
+    def run_query(store=storage):
+        query = Query()
+        query.storage = store
+        return query.with_cache(cache).for_sut("api").in_last_days(100000).execute()
+
+    assert len(run_query()) == 3
+    assert len(run_query()) == 3
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # Writes change the storage generation, so the next lookup misses
+    storage.save_session(make_session(3))
+    assert len(run_query()) == 4
+    assert cache.stats()["misses"] == 2
+
+    export_path = tmp_path / "export.json"
+    JSONStorage(file_path=tmp_path / "other.json").save_sessions([make_session(4)])
+    JSONStorage(file_path=tmp_path / "other.json").export_sessions(str(export_path))
+    storage.import_sessions(str(export_path))
+    assert len(run_query()) == 5
+    assert cache.stats()["misses"] == 3
+
+    # Bounded size with LRU eviction
+    memory = InMemoryStorage([make_session(0)])
+    assert len(run_query(memory)) == 1
+    memory.save_session(make_session(1))
+    assert len(run_query(memory)) == 2
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 3
+
+    # Custom predicates are never cached
+    query = Query()
+    query.storage = storage
+    query.with_cache(cache).with_custom_session_filter(lambda s: True, "all")
+    assert query.cache_key() is None
+
+
+def test_query_pagination_with_cursor(tmp_path, mocker, get_test_time):
+    """limit/order_by/after_cursor page through results without decoding everything."""
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api" if i % 3 else "web",
+                session_id=f"run-{i:02d}",
+                # Pairs of sessions share a start time to exercise tie-breaking
+                session_start_time=get_test_time((i // 2) * 60),
+                session_duration=60 - i,
+            )
+            for i in range(20)
+        ]
+    )
+
+    def new_query():
+        query = Query()
+        query.storage = storage
+        return query.for_sut("api")
+
+    expected = sorted(
+        (s for s in storage.load_sessions() if s.sut_name == "api"),
+        key=lambda s: (s.session_start_time, s.session_id),
+        reverse=True,
+    )
+
+    # Latest 5 sessions decode only the records needed to fill the page (+1)
+    from_dict_spy = mocker.spy(TestSession, "from_dict")
+    page = new_query().limit(5).execute()
+    assert from_dict_spy.call_count == 6
+    assert [s.session_id for s in page] == [s.session_id for s in expected[:5]]
+
+    seen = [s.session_id for s in page]
+    while page.next_cursor:
+        page = new_query().limit(5).after_cursor(page.next_cursor).execute()
+        seen.extend(s.session_id for s in page)
+    assert seen == [s.session_id for s in expected]
+
+    # Other fields sort in memory, ascending or descending
+    page = new_query().order_by("session_duration").limit(4).execute()
+    assert [s.session_duration for s in page] == sorted(
+        s.session_duration for s in expected
+    )[:4]
+    rest = new_query().order_by("session_duration").after_cursor(page.next_cursor).execute()
+    assert len(page) + len(rest) == len(expected)
+    assert rest.next_cursor is None
+
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().order_by("session_id", desc=True).after_cursor(page.next_cursor)
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().after_cursor("not-a-cursor")
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().limit(0)
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().order_by("nodeid")
+
+
+def test_group_by_aggregates_without_building_sessions(tmp_path, mocker, get_test_time):
+    """group_by().agg() matches a manual reduction over execute() results."""
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    outcomes = [TestOutcome.PASSED, TestOutcome.FAILED, TestOutcome.PASSED, TestOutcome.SKIPPED]
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api" if i % 2 else "web",
+                session_id=f"run-{i}",
+                session_start_time=get_test_time(i * 43200),  # two sessions a day
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=outcomes[(i + j) % len(outcomes)],
+                        start_time=get_test_time(i * 43200),
+                        duration=float(i + j),
+                    )
+                    for j in range(5)
+                ],
+            )
+            for i in range(8)
+        ]
+    )
+
+    def new_query():
+        query = Query()
+        query.storage = storage
+        return query.filter_by_test().with_duration_between(1.0, 9.0).apply()
+
+    expected = {}
+    for session in new_query().execute():
+        for test in session.test_results:
+            expected.setdefault(test.nodeid, []).append(test)
+
+    init_spy = mocker.spy(TestSession, "__init__")
+    by_nodeid = new_query().group_by("nodeid").agg()
+    # Only the sessions decoded from storage are built; no filtered copies
+    assert init_spy.call_count == 8
+
+    assert list(by_nodeid) == sorted(expected)
+    for nodeid, tests in expected.items():
+        durations = sorted(t.duration for t in tests)
+        assert by_nodeid[nodeid] == {
+            "count": len(tests),
+            "pass_rate": sum(t.outcome == TestOutcome.PASSED for t in tests) / len(tests),
+            "failure_rate": sum(t.outcome == TestOutcome.FAILED for t in tests) / len(tests),
+            "mean_duration": sum(durations) / len(durations),
+            # Nearest-rank p95 of fewer than 20 values is the maximum
+            "p95_duration": durations[-1],
+        }
+
+    by_day = new_query().for_sut("api").group_by("day", "outcome").agg("count")
+    assert {day for day, _ in by_day} == {get_test_time(i * 43200).date() for i in range(8)}
+    assert sum(m["count"] for m in by_day.values()) == sum(
+        len(s.test_results) for s in new_query().for_sut("api").execute()
+    )
+
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().group_by("session_id")
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().group_by("sut").agg("median")
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().limit(2).group_by("sut").agg()
+
+
+def test_select_projects_test_result_fields(tmp_path, get_test_time):
+    """select() skips unselected capture fields but keeps what filters read."""
+    from pytest_insight.core.models import FieldNotLoadedError, ProjectedTestResult
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api",
+                session_id=f"run-{i}",
+                session_start_time=get_test_time(i * 60),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=TestOutcome.FAILED if j % 2 else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 60),
+                        duration=1.0,
+                        caplog="DEBUG " * 500,
+                        longreprtext="Timeout" if j % 2 else "",
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(3)
+        ]
+    )
+
+    def new_query():
+        query = Query()
+        query.storage = storage
+        return query
+
+    full = new_query().filter_by_test().with_error_containing("Timeout").apply().execute()
+    projected = new_query().select().filter_by_test().with_error_containing("Timeout").apply()
+    projected = projected.execute()
+
+    assert [s.session_id for s in projected] == [s.session_id for s in full]
+    for session, full_session in zip(projected, full):
+        for test, full_test in zip(session.test_results, full_session.test_results):
+            assert isinstance(test, ProjectedTestResult)
+            assert (test.nodeid, test.outcome, test.duration) == (
+                full_test.nodeid,
+                full_test.outcome,
+                full_test.duration,
+            )
+            # Searched by the filter, so loaded; caplog was never selected
+            assert test.longreprtext == "Timeout"
+            with pytest.raises(FieldNotLoadedError):
+                test.caplog
+
+    ordered = new_query().select("caplog").order_by("session_start_time").limit(2).execute()
+    assert all(t.caplog for s in ordered for t in s.test_results)
+
+    with pytest.raises(InvalidQueryParameterError):
+        new_query().select("session_id")
+
+
+def test_execute_many_shares_one_storage_scan(tmp_path, mocker, get_test_time):
+    """execute_many() returns each query's execute() result from a single load."""
+    from pytest_insight.core.core_api import InsightAPI
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api" if i % 3 else "web",
+                session_id=f"run-{i:02d}",
+                session_start_time=get_test_time(i * 3600),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=TestOutcome.FAILED if (i + j) % 4 == 0 else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 3600),
+                        duration=float(j),
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(12)
+        ]
+    )
+    since = get_test_time(3 * 3600)
+
+    def build():
+        queries = []
+        for _ in range(4):
+            query = Query()
+            query.storage = storage
+            queries.append(query.for_sut("api").date_range(since, get_test_time(11 * 3600)))
+        queries[1].with_outcome(TestOutcome.FAILED)
+        queries[2].filter_by_test().with_duration_between(2.0, 3.0).apply().limit(2)
+        queries[3] = Query()
+        queries[3].storage = storage
+        queries[3].after(get_test_time(6 * 3600)).with_session_id_pattern("run-1*")
+        return queries
+
+    expected = [q.execute() for q in build()]
+    load_spy = mocker.spy(storage, "load_sessions")
+    results = InsightAPI().execute_many(build())
+
+    assert load_spy.call_count == 1
+    # Every query has a time range, so one range spanning them all is pushed down
+    (span,) = load_spy.call_args.kwargs["session_filters"]
+    assert (span.start, span.end) == (since, None)
+    for result, single in zip(results, expected):
+        assert [s.session_id for s in result] == [s.session_id for s in single]
+        assert [[t.nodeid for t in s.test_results] for s in result] == [
+            [t.nodeid for t in s.test_results] for s in single
+        ]
+        assert result.next_cursor == single.next_cursor
+    assert results[2].next_cursor is not None
+
+
+def test_parallel_execution_matches_serial(monkeypatch, get_test_time):
+    """Above the configured threshold filters run in worker processes, same results."""
+    from pytest_insight.core.config import get_config
+    from pytest_insight.core.storage import InMemoryStorage
+
+    storage = InMemoryStorage(
+        [
+            TestSession(
+                sut_name="api" if i % 2 else "web",
+                session_id=f"run-{i:03d}",
+                session_start_time=get_test_time(i * 60),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=TestOutcome.FAILED if (i + j) % 5 == 0 else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 60),
+                        duration=float(j),
+                    )
+                    for j in range(6)
+                ],
+            )
+            for i in range(200)
+        ]
+    )
+
+    def run(build, sessions=None):
+        query = Query()
+        query.storage = storage
+        return build(query).execute(sessions).sessions
+
+    builds = [
+        lambda q: q.for_sut("api"),
+        lambda q: q.filter_by_test().with_outcome(TestOutcome.FAILED).apply(),
+        lambda q: q.with_session_id_pattern("run-1*").filter_by_test().with_duration_between(2, 4).apply(),
+    ]
+    expected = [run(build) for build in builds]
+
+    parallel = {"parallel": {"enabled": True, "threshold": 50, "workers": 2}}
+    monkeypatch.setitem(get_config()._config, "query", parallel)
+    used_pool = []
+    original = Query._filter_parallel
+
+    def spy(self, sessions, residual):
+        result = original(self, sessions, residual)
+        used_pool.append(result is not None)
+        return result
+
+    monkeypatch.setattr(Query, "_filter_parallel", spy)
+    for build, serial in zip(builds, expected):
+        parallel = run(build)
+        assert [s.session_id for s in parallel] == [s.session_id for s in serial]
+        assert [[t.nodeid for t in s.test_results] for s in parallel] == [
+            [t.nodeid for t in s.test_results] for s in serial
+        ]
+    assert used_pool == [False, True, True]  # for_sut() is pushed down to storage
+
+    # Session-only filters return the given session objects themselves
+    by_sut = run(builds[0], storage.load_sessions())
+    assert len(by_sut) == len(expected[0])
+    assert all(a is b for a, b in zip(by_sut, expected[0]))
+    assert used_pool[-1]
+
+    # Custom predicates cannot leave the process, so they run serially
+    used_pool.clear()
+    run(lambda q: q.filter_by_test().with_custom_filter(lambda t: t.duration > 3, "slow").apply())
+    assert used_pool == [False]
+
+    # Forking while another thread runs could deadlock the workers
+    used_pool.clear()
+    release = threading.Event()
+    other = threading.Thread(target=release.wait)
+    other.start()
+    try:
+        assert [s.session_id for s in run(builds[1])] == [s.session_id for s in expected[1]]
+    finally:
+        release.set()
+        other.join()
+    assert used_pool == [False]
+
+
+def test_query_serialization_round_trip(get_test_time):
+    """Every built-in filter survives to_dict/from_dict; fingerprints are canonical."""
+    import json
+
+    from pytest_insight.core.storage import InMemoryStorage
+
+    storage = InMemoryStorage(
+        [
+            TestSession(
+                sut_name="api" if i % 2 else "web",
+                session_id=f"run-{i:02d}",
+                session_tags={"env": "prod" if i % 3 else "staging"},
+                session_start_time=get_test_time(i * 60),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=TestOutcome.FAILED if (i + j) % 4 == 0 else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 60),
+                        duration=float(j),
+                        has_warning=j == 1,
+                        longreprtext="AssertionError" if (i + j) % 4 == 0 else "",
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(12)
+        ]
+    )
+
+    def new_query():
+        query = Query()
+        query.storage = storage
+        return query
+
+    queries = [
+        new_query().for_sut("api").date_range(get_test_time(60), get_test_time(600)),
+        new_query().in_last_days(100000).with_reruns(False).with_warning(),
+        new_query()
+        .with_session_tag("env", "prod")
+        .with_session_tag("env", "staging", combine_with_or=True)
+        .with_session_id_pattern("run-0*")
+        .test_nodeid_contains("test_1"),
+        new_query()
+        .filter_by_test()
+        .with_pattern("test_[12]", field_name="nodeid", use_regex=True)
+        .with_duration_between(1.0, 3.0)
+        .with_warning()
+        .apply(),
+        new_query()
+        .with_outcome(TestOutcome.FAILED)
+        .filter_by_test()
+        .with_error_containing("Assertion")
+        .apply()
+        .select("longreprtext")
+        .order_by("session_id")
+        .limit(3),
+    ]
+    for query in queries:
+        data = json.loads(json.dumps(query.to_dict()))
+        restored = Query.from_dict(data)
+        restored.storage = storage
+        assert restored.to_dict() == data
+        assert restored.fingerprint() == query.fingerprint()
+        expected = query.execute()
+        result = restored.execute()
+        assert [s.session_id for s in result] == [s.session_id for s in expected]
+        assert [[t.nodeid for t in s.test_results] for s in result] == [
+            [t.nodeid for t in s.test_results] for s in expected
+        ]
+        assert result.next_cursor == expected.next_cursor
+
+    # Cursors carry over, so a serialized query can fetch the next page
+    page = queries[-1].execute()
+    next_page = Query.from_dict({**queries[-1].to_dict(), "cursor": page.next_cursor})
+    next_page.storage = storage
+    assert next_page.execute().sessions
+
+    # Filter order does not matter, and relative windows hash by their length
+    a = new_query().for_sut("api").in_last_days(7).with_session_tag("env", "prod")
+    b = new_query().with_session_tag("env", "prod").in_last_days(7).for_sut("api")
+    assert a.fingerprint() == b.fingerprint()
+    assert a.fingerprint() != new_query().for_sut("web").in_last_days(7).fingerprint()
+    assert len({q.fingerprint() for q in queries}) == len(queries)
+
+    # Version 1 data (test filters only) is still accepted
+    v1 = {"version": 1, "test_filters": [{"type": "OUTCOME", "outcome": "FAILED"}]}
+    assert Query.from_dict(v1).to_dict()["test_filters"] == v1["test_filters"]
+
+    # Custom predicates have no structured form
+    custom = new_query().with_custom_session_filter(lambda s: True, "all")
+    assert custom.fingerprint() is None
+    with pytest.raises(InvalidQueryParameterError):
+        Query.from_dict(custom.to_dict())
+
+
+def test_explain_and_profiled_execution(tmp_path, get_test_time):
+    """explain() reports the plan; execute(profile=True) measures every filter."""
+    from pytest_insight.core.storage import JSONStorage
+
+    storage = JSONStorage(file_path=tmp_path / "sessions.json")
+    storage.save_sessions(
+        [
+            TestSession(
+                sut_name="api" if i % 2 else "web",
+                session_id=f"run-{i:02d}",
+                session_start_time=get_test_time(i * 60),
+                session_duration=10,
+                test_results=[
+                    TestResult(
+                        nodeid=f"test_mod.py::test_{j}",
+                        outcome=TestOutcome.FAILED if j == 0 else TestOutcome.PASSED,
+                        start_time=get_test_time(i * 60),
+                        duration=float(j),
+                    )
+                    for j in range(4)
+                ],
+            )
+            for i in range(20)
+        ]
+    )
+
+    def new_query():
+        query = Query()
+        query.storage = storage
+        return (
+            query.date_range(get_test_time(0), get_test_time(9 * 60))
+            .with_custom_session_filter(lambda s: s.sut_name == "api", "api_only")
+            .filter_by_test()
+            .with_outcome(TestOutcome.FAILED)
+            .with_duration_between(0.0, 1.0)
+            .apply()
+        )
+
+    plan = new_query().explain()
+    assert not plan.analyzed
+    assert len(plan.pushed) == 1 and plan.pushed[0].startswith("TimeRangeFilter(")
+    assert plan.residual == ["CustomSessionFilter(name='api_only')"]
+    assert plan.indexes == ["time_index"]
+    assert [s.level for s in plan.stages] == ["storage", "session", "test", "test"]
+    assert all(s.estimated for s in plan.stages)
+
+    result = new_query().execute(profile=True)
+    profile = result.profile
+    assert profile.analyzed and not profile.cached
+    assert [s.session_id for s in result] == [s.session_id for s in new_query().execute()]
+    read, by_sut, by_outcome, by_duration = profile.stages
+    assert (read.rows_in, read.rows_out) == (20, 10)
+    assert (by_sut.rows_in, by_sut.rows_out, by_sut.selectivity) == (10, 5, 0.5)
+    assert (by_outcome.rows_in, by_outcome.rows_out) == (20, 5)
+    assert (by_duration.rows_in, by_duration.rows_out) == (5, 5)
+    assert profile.sessions_scanned == 10 and profile.results_scanned == 20
+    assert profile.sessions_returned == 5 and profile.results_returned == 5
+    assert profile.wall_time > 0
+    assert new_query().explain(analyze=True).to_dict()["stages"][1]["selectivity"] == 0.5
+
+    # Pages read in start-time order stop early; the page stage shows how early
+    paged = Query()
+    paged.storage = storage
+    profile = paged.for_sut("api").limit(3).explain(analyze=True)
+    assert profile.indexes == ["bitmap_index", "storage_order"]
+    assert profile.stages[0].rows_out == 4
+    assert (profile.stages[-1].rows_in, profile.stages[-1].rows_out) == (4, 3)
@@ -0,0 +1,211 @@
+"""Tests for mergeable duration sketches."""
+
+import math
+import random
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+from pytest_insight.core.analysis import SessionAnalysis
+from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+from pytest_insight.core.sketches import CountMinSketch, DDSketch, DurationSketches, HyperLogLog, SpaceSaving
+from pytest_insight.core.storage import InMemoryStorage, JSONStorage, TieredStorage
+
+
+def _session(session_id, start_time, durations, sut="api"):
+    return TestSession(
+        sut_name=sut,
+        session_id=session_id,
+        session_start_time=start_time,
+        session_duration=10,
+        test_results=[
+            TestResult(nodeid=f"test_api.py::test_{i}", outcome=TestOutcome.PASSED, start_time=start_time, duration=d)
+            for i, d in enumerate(durations)
+        ],
+    )
+
+
+class TestDDSketch:
+    """Tests for DDSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Estimates stay within alpha of the nearest-rank values, also after merging."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(0, 2) for _ in range(5000)] + [0.0] * 10
+        whole, first, second = DDSketch(), DDSketch(), DDSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i % 2 else second).add(value)
+        first.merge(second)
+
+        ordered = sorted(values)
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[math.ceil(q * len(ordered)) - 1]
+            assert whole.quantile(q) == pytest.approx(exact, rel=0.01)
+            assert first.quantile(q) == whole.quantile(q)
+        assert whole.quantile(0.001) == 0.0
+        assert (whole.quantile(0), whole.quantile(1)) == (0.0, max(values))
+        assert whole.count == first.count == len(values) and whole.mean == pytest.approx(sum(values) / len(values))
+        assert len(whole.bins) < 1000
+        assert DDSketch().quantile(0.5) is None
+
+        restored = DDSketch.from_list(whole.to_list())
+        assert restored.percentiles() == whole.percentiles()
+        with pytest.raises(ValueError):
+            whole.merge(DDSketch(alpha=0.05))
+
+
+class TestDurationSketches:
+    """Tests for per-test and per-SUT/day sketches and their persistence."""
+
+    def test_tests_and_days(self, tmp_path, get_test_time):
+        """Sketches are kept per test and per SUT and day, and round-trip through a file."""
+        day0 = get_test_time()
+        sketches = DurationSketches.from_sessions(
+            [
+                _session("s1", day0, [1.0, 5.0]),
+                _session("s2", day0 + timedelta(hours=1), [2.0]),
+                _session("s3", day0 + timedelta(days=1), [3.0, 6.0], sut="web"),
+            ]
+        )
+
+        assert len(sketches) == 2 and sketches.tests["test_api.py::test_1"].count == 2
+        assert sketches.percentiles("test_api.py::test_0")["p50"] == pytest.approx(2.0, rel=0.01)
+        assert sketches.percentiles("unknown") is None
+        assert [nodeid for nodeid, _ in sketches.slowest(1)] == ["test_api.py::test_1"]
+        assert sketches.sut_sketch("api").count == 3
+        assert sketches.sut_sketch("web", start=day0.date()).max == 6.0
+        assert sketches.sut_sketch("api", end=day0.date() - timedelta(days=1)).count == 0
+
+        sketches.path = tmp_path / "sketches.json"
+        sketches.save()
+        loaded = DurationSketches.load(sketches.path)
+        assert loaded.to_dict() == sketches.to_dict()
+
+    def test_storage_keeps_sketches_current(self, tmp_path, mocker, get_test_time):
+        """Saves update persisted sketches incrementally; other writes trigger a rebuild."""
+        storage = JSONStorage(tmp_path / "sessions.json")
+        storage.save_session(_session("s1", get_test_time(), [1.0]))
+        assert not storage.sketches_path.exists()
+
+        assert storage.get_duration_sketches().tests["test_api.py::test_0"].count == 1
+        assert storage.sketches_path.exists()
+
+        # A new storage instance (e.g. the next pytest run) extends the file in place
+        storage = JSONStorage(tmp_path / "sessions.json")
+        storage.save_session(_session("s2", get_test_time(60), [3.0]))
+        rebuild_spy = mocker.spy(DurationSketches, "rebuild")
+        sketches = JSONStorage(tmp_path / "sessions.json").get_duration_sketches()
+        assert sketches.tests["test_api.py::test_0"].count == 2
+        rebuild_spy.assert_not_called()
+
+        storage.save_sessions(storage.load_sessions()[:1])
+        assert storage.get_duration_sketches().tests["test_api.py::test_0"].count == 1
+        rebuild_spy.assert_called_once()
+
+        memory = InMemoryStorage([_session("m", get_test_time(), [2.0])])
+        assert memory.get_duration_sketches().tests["test_api.py::test_0"].max == 2.0
+
+    def test_tiered_sketches_cover_both_tiers(self, tmp_path, get_test_time):
+        """Tiered storages keep one set of sketches across aging."""
+        from datetime import datetime, timezone
+
+        storage = TieredStorage(tmp_path / "hot.json", hot_days=7, background_aging=False)
+        now = datetime.now(timezone.utc)
+        storage.save_session(_session("old", now - timedelta(days=30), [4.0]))
+        assert storage.get_duration_sketches().tests["test_api.py::test_0"].count == 1
+
+        storage.save_session(_session("new", now - timedelta(days=1), [2.0]))
+        storage.age_sessions()
+        sketches = storage.get_duration_sketches()
+        assert sketches.stamp is not None
+        assert sketches.tests["test_api.py::test_0"].count == 2
+        assert storage.hot.sketches_path is None
+
+
+class TestFleetSketches:
+    """Tests for the distinct-count and heavy-hitter sketches."""
+
+    def test_distinct_counts_within_error(self):
+        """HyperLogLog estimates stay within a few standard errors, also after merging."""
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(30000):
+            first.add(f"test_{i}.py::test")
+            second.add(f"test_{i + 20000}.py::test")
+        assert first.estimate() == pytest.approx(30000, rel=4 * first.relative_error)
+        first.merge(second)
+        assert first.estimate() == pytest.approx(50000, rel=4 * first.relative_error)
+
+        small = HyperLogLog()
+        for item in ["a", "b", "c", "a"]:
+            small.add(item)
+        assert round(small.estimate()) == 3 and HyperLogLog().estimate() == 0
+        with pytest.raises(ValueError):
+            small.merge(HyperLogLog(precision=10))
+
+    def test_heavy_hitters_and_frequencies(self):
+        """Space-Saving finds the frequent items with bounded overestimates; Count-Min never underestimates."""
+        rng = random.Random(3)
+        stream = [f"hot_{i}" for i in range(5) for _ in range(200 * (i + 1))]
+        stream += [f"cold_{rng.randrange(5000)}" for _ in range(5000)]
+        rng.shuffle(stream)
+        exact = Counter(stream)
+
+        top, frequencies = SpaceSaving(capacity=50), CountMinSketch(epsilon=0.01)
+        halves = SpaceSaving(capacity=50), SpaceSaving(capacity=50)
+        for i, item in enumerate(stream):
+            top.add(item)
+            frequencies.add(item)
+            halves[i % 2].add(item)
+
+        assert len(top) == 50 and top.total == len(stream)
+        for summary in (top, halves[0]):
+            if summary is halves[0]:
+                summary.merge(halves[1])
+            assert [item for item, _, _ in summary.top(5)] == [f"hot_{i}" for i in range(4, -1, -1)]
+            for item, count, error in summary.top(5):
+                assert count - error <= exact[item] <= count and error <= summary.max_error
+        for item in ("hot_0", "cold_1"):
+            assert exact.get(item, 0) <= frequencies.estimate(item) <= exact.get(item, 0) + frequencies.max_error
+
+        weighted = SpaceSaving(capacity=2)
+        for item, weight in [("a", 1.5), ("b", 0.5), ("c", 3.0)]:
+            weighted.add(item, weight)
+        assert weighted.top(1) == [("c", 3.5, 0.5)]
+
+    def test_approximate_analysis_matches_exact(self, get_test_time):
+        """Approximate metrics agree with the exact ones and state their error bounds."""
+        sessions = [_session(f"s{i}", get_test_time(i * 60), [1.0 + i, 2.0, 3.0]) for i in range(5)]
+        for session in sessions[:3]:
+            session.test_results[0].outcome = TestOutcome.FAILED
+        sessions[0].test_results[1].outcome = TestOutcome.FAILED
+        analysis = SessionAnalysis(sessions=sessions)
+
+        exact, approximate = analysis.test_metrics(), analysis.test_metrics(approximate=True)
+        assert approximate.pop("unique_tests_error") < 0.01
+        assert approximate == exact
+
+        exact = analysis.top_failing_tests(limit=2)
+        approximate = analysis.top_failing_tests(limit=2, approximate=True)
+        assert [test.pop("failures_error") for test in approximate["top_failing"]] == [0, 0]
+        assert approximate == exact
+
+    def test_approximate_analysis_streams_from_storage(self, tmp_path, mocker, get_test_time):
+        """Without a session list, approximate metrics stream sessions instead of loading them all."""
+        storage = JSONStorage(tmp_path / "sessions.json")
+        storage.save_sessions(
+            [_session(f"s{i}", get_test_time(i * 60), [float(i % 3), 10.0 if i < 2 else 0.5]) for i in range(6)]
+        )
+        analysis = SessionAnalysis()
+        analysis._query.storage = storage
+        load_spy = mocker.spy(storage, "load_sessions")
+
+        assert analysis.test_metrics(approximate=True)["total_tests"] == 12
+        assert analysis.top_failing_tests(approximate=True)["total_failures"] == 0
+
+        slowest = analysis.longest_running_tests(limit=1, approximate=True, capacity=2)
+        assert slowest["longest_tests"] == [("test_api.py::test_1", 22.0 / 6)]
+        assert slowest["total_durations"] == {"test_api.py::test_1": 22.0}
+        assert slowest["total_duration"] == 28.0
+        assert analysis.test_metrics(days=1, approximate=True)["total_tests"] == 0
+        load_spy.assert_not_called()
@@ -1419,3 +1419,169 @@ def test_get_profile_metadata(tmp_path):
         # Test getting metadata for a non-existent profile
         nonexistent_metadata = get_profile_metadata("nonexistent")
         assert "error" in nonexistent_metadata
+
+
+class TestTieredStorage:
+    """Tests for hot/cold tiered storage."""
+
+    @staticmethod
+    def _session(session_id, start_time):
+        return TestSession(
+            sut_name="tiered-sut",
+            session_id=session_id,
+            session_start_time=start_time,
+            session_duration=30,
+            test_results=[],
+        )
+
+    @pytest.fixture
+    def tiered_storage(self, tmp_path):
+        from pytest_insight.core.storage import TieredStorage
+
+        return TieredStorage(
+            tmp_path / "hot.json", hot_days=7, background_aging=False
+        )
+
+    def test_age_sessions_moves_old_sessions_to_cold_segments(self, tiered_storage):
+        """Sessions older than the hot window end up in compressed cold segments."""
+        from datetime import timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        tiered_storage.save_session(self._session("recent", now - timedelta(days=1)))
+        tiered_storage.save_session(self._session("old", now - timedelta(days=40)))
+
+        assert tiered_storage.age_sessions() == 1
+
+        assert [s.session_id for s in tiered_storage.hot.load_sessions()] == ["recent"]
+        segments = list(tiered_storage.cold_dir.glob("segment-*.json.gz"))
+        assert len(segments) == 1
+        assert {s.session_id for s in tiered_storage.load_sessions()} == {
+            "recent",
+            "old",
+        }
+
+    def test_iter_sessions_reads_cold_segments_lazily(self, tiered_storage, mocker):
+        """Newest-first iteration only opens cold segments once the hot tier is used up."""
+        from datetime import timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        for session_id, age_days in (("new", 1), ("mid", 3), ("old", 40), ("older", 80)):
+            tiered_storage.save_session(
+                self._session(session_id, now - timedelta(days=age_days))
+            )
+        tiered_storage.age_sessions()
+        # Saved after aging, so it sits in the hot tier despite its age
+        tiered_storage.save_session(self._session("late", now - timedelta(days=60)))
+        read_spy = mocker.spy(tiered_storage, "_read_segment")
+
+        sessions = tiered_storage.iter_sessions(descending=True)
+        assert [next(sessions).session_id for _ in range(2)] == ["new", "mid"]
+        read_spy.assert_not_called()
+
+        assert [s.session_id for s in sessions] == ["old", "late", "older"]
+        assert [s.session_id for s in tiered_storage.iter_sessions(descending=False)] == [
+            "older",
+            "late",
+            "old",
+            "mid",
+            "new",
+        ]
+
+    def test_load_skips_cold_tier_inside_hot_window(self, tiered_storage, mocker):
+        """A time range inside the hot window never reads cold segments."""
+        from datetime import timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        tiered_storage.save_session(self._session("old", now - timedelta(days=40)))
+        tiered_storage.age_sessions()
+
+        cold_spy = mocker.spy(tiered_storage, "_load_cold_sessions")
+        assert tiered_storage.load_sessions(since=now - timedelta(days=3)) == []
+        cold_spy.assert_not_called()
+
+        sessions = tiered_storage.load_sessions(since=now - timedelta(days=60))
+        assert [s.session_id for s in sessions] == ["old"]
+        cold_spy.assert_called_once()
+
+    def test_clear_sessions_covers_both_tiers(self, tiered_storage):
+        """Clearing removes sessions from the hot file and the cold segments."""
+        from datetime import timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        old = self._session("old", now - timedelta(days=40))
+        tiered_storage.save_session(self._session("recent", now))
+        tiered_storage.save_session(old)
+        tiered_storage.age_sessions()
+
+        assert tiered_storage.clear_sessions([old]) == 1
+        assert [s.session_id for s in tiered_storage.load_sessions()] == ["recent"]
+        assert tiered_storage.clear_sessions() == 1
+        assert tiered_storage.load_sessions() == []
+
+    def test_interrupted_aging_does_not_duplicate_sessions(self, tiered_storage, mocker):
+        """A session left in both tiers by an interrupted aging pass is read once."""
+        from datetime import timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        tiered_storage.save_session(self._session("s1", now - timedelta(days=40)))
+        mocker.patch.object(
+            tiered_storage.hot, "save_sessions", side_effect=OSError("disk full")
+        )
+        with pytest.raises(OSError):
+            tiered_storage.age_sessions()
+
+        assert [s.session_id for s in tiered_storage.load_sessions()] == ["s1"]
+        assert [s.session_id for s in tiered_storage.iter_sessions()] == ["s1"]
+
+        # The next pass finishes the move without duplicating the cold copy
+        mocker.stopall()
+        assert tiered_storage.age_sessions() == 1
+        assert [s.session_id for s in tiered_storage.load_sessions()] == ["s1"]
+
+    def test_background_aging_after_save(self, tmp_path):
+        """Saving a session schedules aging in a background thread."""
+        from datetime import timedelta, timezone
+
+        from pytest_insight.core.storage import TieredStorage
+
+        storage = TieredStorage(tmp_path / "hot.json", hot_days=7)
+        storage.save_session(
+            self._session("old", datetime.now(timezone.utc) - timedelta(days=30))
+        )
+        storage.wait_for_aging(timeout=10)
+
+        assert storage.hot.load_sessions() == []
+        assert [s.session_id for s in storage.load_sessions()] == ["old"]
+
+    def test_tiered_profile_round_trip_and_storage_instance(self, tmp_path, mocker):
+        """Tiering settings persist with the profile and select TieredStorage."""
+        from pytest_insight.core.storage import (
+            ProfileManager,
+            StorageProfile,
+            TieredStorage,
+        )
+
+        profile_manager = ProfileManager(config_path=tmp_path / "profiles.json")
+        profile_manager._create_profile(
+            "tiered-profile", "json", str(tmp_path / "tiered.json")
+        )
+        profile_manager.set_tiering(
+            "tiered-profile", 14, str(tmp_path / "cold-segments")
+        )
+
+        restored = StorageProfile.from_dict(
+            profile_manager.get_profile("tiered-profile").to_dict()
+        )
+        assert restored.hot_days == 14
+        assert restored.is_tiered
+
+        mocker.patch(
+            "pytest_insight.core.storage.get_profile_manager",
+            return_value=profile_manager,
+        )
+        storage = get_storage_instance("tiered-profile")
+        assert isinstance(storage, TieredStorage)
+        assert storage.cold_dir == tmp_path / "cold-segments"
+
+        with pytest.raises(ValueError, match="positive integer"):
+            profile_manager.set_tiering("tiered-profile", 0)
@@ -0,0 +1,89 @@
+"""Tests for per-day session totals."""
+
+from datetime import timedelta
+
+from pytest_insight.core.analysis import SessionAnalysis
+from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+from pytest_insight.core.timeseries import DailyTotals
+
+
+def _session(session_id, start_time, outcomes, warnings=0, seconds=10):
+    return TestSession(
+        sut_name="api",
+        session_id=session_id,
+        session_start_time=start_time,
+        session_stop_time=start_time + timedelta(seconds=seconds),
+        session_duration=seconds,
+        test_results=[
+            TestResult(
+                nodeid=f"test_api.py::test_{i}",
+                outcome=outcome,
+                start_time=start_time,
+                duration=1.5,
+                has_warning=i < warnings,
+            )
+            for i, outcome in enumerate(outcomes)
+        ],
+    )
+
+
+class TestDailyTotals:
+    """Tests for DailyTotals."""
+
+    def test_range_totals_and_windows(self, get_test_time):
+        """Ranges and windows are summed over days, including days without sessions."""
+        day0 = get_test_time()
+        totals = DailyTotals.from_sessions(
+            [
+                _session("s1", day0, [TestOutcome.PASSED, TestOutcome.FAILED], warnings=1),
+                _session("s2", day0 + timedelta(hours=1), [TestOutcome.PASSED]),
+                _session("s3", day0 + timedelta(days=3), [TestOutcome.FAILED] * 3, seconds=30),
+            ]
+        )
+        first = day0.date()
+
+        assert len(totals) == 4
+        assert (totals.first_day, totals.last_day) == (first, first + timedelta(days=3))
+        assert totals.totals() == {
+            "sessions": 3,
+            "failed_sessions": 2,
+            "tests": 6,
+            "failures": 4,
+            "warnings": 1,
+            "duration": 9.0,
+            "timed_sessions": 3,
+            "session_seconds": 50.0,
+        }
+        assert totals.totals(first + timedelta(days=1), first + timedelta(days=2))["sessions"] == 0
+        assert totals.totals(end=first)["tests"] == 3
+        assert totals.totals(first - timedelta(days=5), first + timedelta(days=9))["tests"] == 6
+
+        assert [(w["start"], w["end"], w["failures"]) for w in totals.windows(2)] == [
+            (first, first + timedelta(days=1), 1),
+            (first + timedelta(days=2), first + timedelta(days=3), 3),
+        ]
+        assert [w["sessions"] for w in totals.windows(3)] == [2, 1]
+        assert [w["sessions"] for w in totals.windows(1, count=2)] == [0, 1]
+        assert [w["sessions"] for w in totals.series()] == [2, 0, 0, 1]
+
+        # Adding more sessions invalidates the prefix sums
+        totals.add_session(_session("s4", day0 + timedelta(days=1), [TestOutcome.FAILED]))
+        assert [w["failed_sessions"] for w in totals.series()] == [1, 1, 0, 1]
+        assert DailyTotals().windows(7) == [] and DailyTotals().totals()["tests"] == 0
+
+    def test_session_trends_use_day_windows(self, get_test_time):
+        """detect_trends reads the per-day totals of the sessions in the period."""
+        start = get_test_time() - timedelta(days=20)
+        sessions = [
+            _session(f"s{day}", start + timedelta(days=day), [TestOutcome.FAILED] * (day >= 10) + [TestOutcome.PASSED])
+            for day in range(20)
+        ]
+        analysis = SessionAnalysis(sessions=sessions)
+
+        daily = analysis.daily_totals()
+        assert len(daily) == 20 and daily.totals()["failed_sessions"] == 10
+
+        trends = analysis.detect_trends(window_size=5)
+        assert trends["failures"]["direction"] == "worsening"
+        assert trends["duration"]["direction"] == "increasing"
+        assert trends["warnings"]["direction"] == "stable"
@@ -325,3 +325,80 @@ class TestAPIEndpoints:
             self.mock_profile_manager.get_active_profile.assert_called_once()
             mock_api.query.assert_called_once()
             mock_query.execute.assert_called_once()
+
+
+def test_get_sessions_pages_with_cursor_header():
+    """/api/sessions returns the latest sessions one page at a time."""
+    from datetime import datetime, timedelta, timezone
+
+    from pytest_insight.core.models import TestSession
+    from pytest_insight.core.query import Query
+    from pytest_insight.core.storage import InMemoryStorage
+
+    now = datetime.now(timezone.utc)
+    storage = InMemoryStorage(
+        [
+            TestSession(
+                sut_name="api",
+                session_id=f"run-{i}",
+                session_start_time=now - timedelta(hours=i),
+                session_duration=10,
+            )
+            for i in range(5)
+        ]
+    )
+
+    def make_query():
+        query = Query()
+        query.storage = storage
+        return query
+
+    with patch("pytest_insight.rest_api.high_level_api.InsightAPI") as mock_api_class:
+        mock_api_class.return_value.query.side_effect = make_query
+
+        first = client.get("/api/sessions?sut=api&limit=3")
+        assert first.status_code == 200
+        assert [s["id"] for s in first.json()] == ["run-0", "run-1", "run-2"]
+
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get("/api/sessions", params={"sut": "api", "limit": 3, "cursor": cursor})
+        assert [s["id"] for s in second.json()] == ["run-3", "run-4"]
+        assert "X-Next-Cursor" not in second.headers
+
+        assert client.get("/api/sessions?cursor=bogus").status_code == 400
+
+
+def test_grafana_daily_targets_share_local_days():
+    """Daily Grafana series bucket a non-UTC session on the same (local) day."""
+    from datetime import datetime, timedelta, timezone
+
+    from pytest_insight.core.models import TestOutcome, TestResult, TestSession
+    from pytest_insight.core.storage import InMemoryStorage
+
+    # 22:00 at UTC-5 is already the next day in UTC
+    local = timezone(timedelta(hours=-5))
+    start = datetime.now(local).replace(hour=22, minute=0, second=0, microsecond=0) - timedelta(days=2)
+    session = TestSession(
+        sut_name="api",
+        session_id="evening-run",
+        session_start_time=start,
+        session_duration=10,
+        test_results=[
+            TestResult(nodeid="test_api.py::test_a", outcome=TestOutcome.PASSED, start_time=start, duration=1.0),
+            TestResult(nodeid="test_api.py::test_b", outcome=TestOutcome.FAILED, start_time=start, duration=3.0),
+        ],
+    )
+    targets = ["pass_rate", "failure_rate", "avg_test_duration", "health_score", "test_count_by_outcome", "test_count"]
+
+    with patch(
+        "pytest_insight.rest_api.high_level_api.get_storage_instance",
+        return_value=InMemoryStorage([session]),
+    ):
+        response = client.post("/query", json={"targets": [{"target": t} for t in targets]})
+
+    assert response.status_code == 200
+    series = {s["target"]: s["datapoints"] for s in response.json()}
+    assert series["Pass Rate (%)"][0][0] == 50.0
+    assert series["Average Test Duration (s)"][0][0] == 2.0
+    expected = int(datetime.combine(start.date(), datetime.min.time()).timestamp() * 1000)
+    assert {points[0][1] for points in series.values()} == {expected}
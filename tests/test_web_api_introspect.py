@@ -63,3 +63,16 @@ def test_invalid_query_input():
     # Should still succeed but results may be empty or error handled
     assert resp.status_code == 200
     assert "results" in resp.json()
+
+
+def test_run_serialized_query():
+    query = {"version": 2, "session_filters": [{"type": "SUT", "sut_name": "no-such-sut"}]}
+    resp = client.post("/api/operations/query/run", json={"query": query})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["sessions"] == []
+    assert len(data["fingerprint"]) == 64
+
+    custom = {"version": 2, "session_filters": [{"type": "CUSTOM", "name": "all"}]}
+    resp = client.post("/api/operations/query/run", json={"query": custom})
+    assert resp.status_code == 400